@@ -14,7 +14,10 @@ from .fitness import ContinuousPeaks, CustomFitness, FlipFlop, FourPeaks, Knapsa
 from .gridsearch import GridSearchMixin
 
 # noinspection PyUnresolvedReferences
-from .opt_probs import ContinuousOpt, DiscreteOpt, FlipFlopOpt, KnapsackOpt, MaxKColorOpt, QueensOpt, TSPOpt
+from .kernels import available_kernel_backends, get_kernel_backend, set_kernel_backend
+
+# noinspection PyUnresolvedReferences
+from .opt_probs import ContinuousOpt, DiscreteOpt, EvaluationStats, FlipFlopOpt, KnapsackOpt, MaxKColorOpt, QueensOpt, TSPOpt
 
 # noinspection PyUnresolvedReferences
 from .runners import GARunner, MIMICRunner, NNGSRunner, RHCRunner, SARunner, SKMLPRunner, build_data_filename
@@ -24,14 +27,21 @@ from .samples import plot_synthetic_dataset, SyntheticData
 
 # noinspection PyUnresolvedReferences
 from .algorithms import (
+    Adam,
     ArithDecay,
     ChangeOneMutator,
+    CurveBuffer,
     CustomSchedule,
     DiscreteMutator,
     ExpDecay,
     GeomDecay,
+    Momentum,
     OnePointCrossOver,
+    PhaseProfiler,
+    RMSProp,
+    SGD,
     ShiftOneMutator,
+    StagnationRestart,
     SwapMutator,
     TSPCrossOver,
     UniformCrossOver,
@@ -10,8 +10,15 @@ from .mimic import mimic
 from .rhc import random_hill_climb
 from .sa import simulated_annealing
 
+from .curve_buffer import CurveBuffer
+from .phase_profiler import PhaseProfiler
+
+from .restarts import StagnationRestart
+
 from .crossovers import UniformCrossOver, TSPCrossOver, OnePointCrossOver
 
 from .decay import ArithDecay, CustomSchedule, ExpDecay, GeomDecay
 
 from .mutators import ChangeOneMutator, DiscreteMutator, ShiftOneMutator, SwapMutator
+
+from .optimizers import Adam, Momentum, RMSProp, SGD
@@ -0,0 +1,84 @@
+"""Class for enforcing the wall-clock, fitness evaluation and target fitness stopping criteria of optimization algorithms."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+
+class RunBudget:
+    """
+    Wall-clock and fitness evaluation budget of an algorithm's run, and the fitness at which it can stop early.
+
+    The clock starts when the budget is created, at the start of the run. Algorithms check exhausted once per
+    iteration, after the iteration's evaluations, so a run may exceed its budget by up to one iteration.
+    Algorithms that accept a target fitness check target_reached at the same point.
+
+    Parameters
+    ----------
+    max_time : float | None
+        Maximum number of seconds the run may take, or None for no limit.
+    max_fevals : int | None
+        Maximum number of fitness evaluations the run may make, or None for no limit.
+    target_fitness : float | None, optional, default=None
+        Fitness at which the run stops, as returned by the algorithm (i.e. not adjusted by the maximization factor),
+        or None to not stop at any fitness. A maximization problem reaches it when its fitness is at least
+        target_fitness, and a minimization problem when its fitness is at most target_fitness.
+    """
+
+    def __init__(self, max_time: float | None, max_fevals: int | None, target_fitness: float | None = None):
+        if max_time is not None and (isinstance(max_time, bool) or not isinstance(max_time, (int, float)) or max_time <= 0):
+            raise ValueError(f"max_time must be a positive number or None. Got {max_time}")
+        if max_fevals is not None and (isinstance(max_fevals, bool) or not isinstance(max_fevals, (int, np.integer)) or max_fevals <= 0):
+            raise ValueError(f"max_fevals must be a positive integer or None. Got {max_fevals}")
+        if target_fitness is not None and (isinstance(target_fitness, bool) or not isinstance(target_fitness, (int, float, np.number))):
+            raise ValueError(f"target_fitness must be a number or None. Got {target_fitness}")
+
+        self.deadline: float | None = None if max_time is None else perf_counter() + max_time
+        self.max_fevals: int | None = None if max_fevals is None else int(max_fevals)
+        self.target_fitness: float | None = target_fitness
+
+    @property
+    def bounded(self) -> bool:
+        """Whether the run is limited in time or in fitness evaluations."""
+        return self.deadline is not None or self.max_fevals is not None
+
+    def exhausted(self, problem: Any) -> bool:
+        """
+        Return whether the run has used up its budget.
+
+        Parameters
+        ----------
+        problem : optimization object
+            The problem being optimized, whose fitness_evaluations counter is checked against max_fevals.
+
+        Returns
+        -------
+        bool
+            True if the run has made max_fevals evaluations or taken max_time seconds, False otherwise.
+        """
+        if self.max_fevals is not None and problem.fitness_evaluations >= self.max_fevals:
+            return True
+
+        return self.deadline is not None and perf_counter() >= self.deadline
+
+    def target_reached(self, problem: Any, fitness: float) -> bool:
+        """
+        Return whether a fitness reaches the target fitness.
+
+        Parameters
+        ----------
+        problem : optimization object
+            The problem being optimized, whose maximization factor gives the direction of the comparison.
+        fitness : float
+            Fitness to compare, multiplied by the problem's maximization factor, as returned by `problem.get_fitness()`.
+
+        Returns
+        -------
+        bool
+            True if a target fitness was given and the fitness reaches it, False otherwise.
+        """
+        return self.target_fitness is not None and fitness >= problem.get_maximize() * self.target_fitness
@@ -0,0 +1,33 @@
+"""Helper functions for invoking the state fitness callbacks of optimization algorithms."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from typing import Callable
+
+
+def get_next_callback_iteration(state_fitness_callback: Callable | None, iteration: int) -> int | float:
+    """
+    Return the next iteration at which an algorithm must call its state fitness callback.
+
+    Callbacks with a next_callback_iteration method (such as the one runners pass to algorithms) only need to be
+    called at the iteration it returns, or when the algorithm is done, so the iterations in between can skip the
+    call entirely. Other callbacks are called at every iteration.
+
+    Parameters
+    ----------
+    state_fitness_callback : Callable | None
+        The algorithm's state fitness callback.
+    iteration : int
+        The current iteration number.
+
+    Returns
+    -------
+    int | float
+        The next iteration at which to call the callback.
+    """
+    next_callback_iteration = getattr(state_fitness_callback, "next_callback_iteration", None)
+    if next_callback_iteration is None:
+        return iteration + 1
+
+    return next_callback_iteration(iteration)
@@ -0,0 +1,31 @@
+"""Helper functions for moving optimization problems to the states chosen by optimization algorithms."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from typing import Any
+
+import numpy as np
+
+
+def accept_state(problem: Any, state: np.ndarray, fitness: float) -> None:
+    """
+    Move an optimization problem to a state whose fitness an algorithm has just evaluated.
+
+    Problems with an _accept_state method (such as the ones derived from _OptProb) reuse the fitness instead of
+    evaluating the state again. Other problems are moved with set_state, which evaluates it.
+
+    Parameters
+    ----------
+    problem : Any
+        The optimization problem.
+    state : np.ndarray
+        The state to move the problem to.
+    fitness : float
+        Fitness of state, as returned by the problem's eval_fitness.
+    """
+    _accept_state = getattr(problem, "_accept_state", None)
+    if _accept_state is None:
+        problem.set_state(state)
+    else:
+        _accept_state(state, fitness)
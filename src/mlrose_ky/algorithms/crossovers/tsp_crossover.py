@@ -13,6 +13,7 @@ from typing import Any, Sequence
 import numpy as np
 
 from mlrose_ky.algorithms.crossovers._crossover_base import _CrossOverBase
+from mlrose_ky.kernels import get_kernel
 
 
 class TSPCrossOver(_CrossOverBase):
@@ -27,7 +28,7 @@ class TSPCrossOver(_CrossOverBase):
     _CrossOverBase : Abstract base class for crossover operations.
     """
 
-    def __init__(self, opt_prob: Any):
+    def __init__(self, opt_prob: Any, kernel_backend: str = None):
         """
         Initialize the TSPCrossOver with the given optimization problem.
 
@@ -35,9 +36,14 @@ class TSPCrossOver(_CrossOverBase):
         ----------
         opt_prob : Any
             An instance of the optimization problem related to the genetic algorithm.
+        kernel_backend : str, optional
+            Backend of the kernel that fills the offspring (see `mlrose_ky.kernels`), e.g. 'numba'. If None, the
+            backend set with `set_kernel_backend` is used.
         """
         super().__init__(opt_prob)
 
+        self.kernel_backend: str | None = kernel_backend
+
     def mate(self, p1: Sequence[int], p2: Sequence[int]) -> np.ndarray:
         """
         Perform the crossover (mating) between two parent sequences to produce offspring.
@@ -78,10 +84,7 @@ class TSPCrossOver(_CrossOverBase):
         """
         if self._length > 1:
             n = 1 + np.random.randint(self._length - 1)
-            child = np.array([0] * self._length)
-            child[:n] = p1[:n]
-            unvisited = [city for city in p2 if city not in p1[:n]]
-            child[n:] = unvisited
+            child = get_kernel("tsp_mate_fill", self.kernel_backend)(np.asarray(p1), np.asarray(p2), n)
         else:
             child = np.copy(p1 if np.random.randint(2) == 0 else p2)
 
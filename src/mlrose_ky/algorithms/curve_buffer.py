@@ -0,0 +1,163 @@
+"""Class for recording the fitness curve of an optimization algorithm in a growable, preallocated array."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import math
+
+import numpy as np
+
+DECIMATION_MODES = ("all", "every", "change", "log")
+
+
+class CurveBuffer:
+    """
+    Growable buffer of (fitness, fitness evaluations) curve points, with optional decimation.
+
+    Points are written to a preallocated array whose capacity doubles when it is full, so appending a point
+    costs amortized O(1), and view returns the recorded points without copying them. Algorithms pass that view
+    to their state_fitness_callback on every iteration, instead of converting a list of points to a new array.
+
+    Decimation controls which of the appended points are recorded:
+
+    - 'all' records every point.
+    - 'every' records the first point and every `every`-th point after it.
+    - 'change' records a point when its fitness differs from the last recorded point's.
+    - 'log' records points at logarithmically spaced positions, each about `factor` times the previous one.
+
+    Whatever the decimation, to_array also includes the last appended point, so the returned curve always ends with
+    the final fitness of the run.
+
+    Parameters
+    ----------
+    capacity : int, optional, default=1024
+        Initial number of points the buffer can hold before growing.
+    decimation : str, optional, default='all'
+        Which points to record, one of 'all', 'every', 'change' and 'log'.
+    every : int, optional, default=10
+        Spacing of the recorded points when decimation is 'every'.
+    factor : float, optional, default=1.1
+        Ratio between the positions of consecutive recorded points when decimation is 'log'.
+    """
+
+    def __init__(self, capacity: int = 1024, decimation: str = "all", every: int = 10, factor: float = 1.1):
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got {capacity}.")
+        if decimation not in DECIMATION_MODES:
+            raise ValueError(f"decimation must be one of {DECIMATION_MODES}, got {decimation}.")
+        if isinstance(every, bool) or not isinstance(every, int) or every < 1:
+            raise ValueError(f"every must be a positive integer, got {every}.")
+        if not isinstance(factor, (int, float)) or factor <= 1:
+            raise ValueError(f"factor must be a number greater than 1, got {factor}.")
+
+        self.decimation: str = decimation
+        self.every: int = every
+        self.factor: float = float(factor)
+
+        self._initial_capacity: int = capacity
+        self._points: np.ndarray = np.empty((capacity, 2), dtype=np.float64)
+        self._positions: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self._size: int = 0
+        self._n_appended: int = 0
+        self._next_log_position: int = 1
+        self._last_point: tuple[float, float] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def n_appended(self) -> int:
+        """Number of points appended, whether or not they were recorded."""
+        return self._n_appended
+
+    def empty_like(self) -> "CurveBuffer":
+        """Return an empty buffer with the same initial capacity and decimation, however much this buffer has grown."""
+        return CurveBuffer(capacity=self._initial_capacity, decimation=self.decimation, every=self.every, factor=self.factor)
+
+    def clear(self):
+        """Remove all points, keeping the allocated capacity."""
+        self._size = 0
+        self._n_appended = 0
+        self._next_log_position = 1
+        self._last_point = None
+
+    def append(self, fitness: float, fitness_evaluations: float):
+        """
+        Append a curve point, recording it unless the decimation skips it.
+
+        Parameters
+        ----------
+        fitness : float
+            Fitness of the point.
+        fitness_evaluations : float
+            Number of fitness evaluations at the point.
+        """
+        self._n_appended += 1
+        position = self._n_appended
+        self._last_point = (fitness, fitness_evaluations)
+
+        if self.decimation == "every":
+            record = (position - 1) % self.every == 0
+        elif self.decimation == "change":
+            record = self._size == 0 or fitness != self._points[self._size - 1, 0]
+        elif self.decimation == "log":
+            record = position >= self._next_log_position
+            if record:
+                self._next_log_position = max(position + 1, math.ceil(position * self.factor))
+        else:
+            record = True
+
+        if record:
+            if self._size == len(self._points):
+                self._grow()
+
+            self._points[self._size] = fitness, fitness_evaluations
+            self._positions[self._size] = position
+            self._size += 1
+
+    def _grow(self):
+        """Double the capacity of the buffer."""
+        capacity = 2 * len(self._points)
+        points = np.empty((capacity, 2), dtype=np.float64)
+        points[: self._size] = self._points[: self._size]
+        positions = np.empty(capacity, dtype=np.int64)
+        positions[: self._size] = self._positions[: self._size]
+        self._points, self._positions = points, positions
+
+    def view(self) -> np.ndarray:
+        """
+        Return a read-only view of the recorded points, without copying them.
+
+        The view holds the points recorded when it was taken, and does not include points appended afterwards. It
+        shares the buffer's storage only until the buffer grows: from then on, it refers to the old storage, which
+        is no longer written to. Call view again to get the points recorded since.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only array of shape (n, 2) with the fitness and fitness evaluations of each recorded point.
+        """
+        points = self._points[: self._size]
+        points.flags.writeable = False
+        return points
+
+    def positions(self) -> np.ndarray:
+        """Return a read-only view of the 1-based positions, among all appended points, of the recorded points."""
+        positions = self._positions[: self._size]
+        positions.flags.writeable = False
+        return positions
+
+    def to_array(self) -> np.ndarray:
+        """
+        Return a copy of the recorded points, followed by the last appended point if it was not recorded.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n, 2) with the fitness and fitness evaluations of each point.
+        """
+        points = self._points[: self._size].copy()
+        if self._last_point is not None and (self._size == 0 or self._positions[self._size - 1] != self._n_appended):
+            points = np.vstack([points, self._last_point])
+
+        return points
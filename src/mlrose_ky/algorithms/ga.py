@@ -7,9 +7,17 @@ from typing import Callable, Any, Optional
 
 import numpy as np
 
+from mlrose_ky.algorithms._budget import RunBudget
+from mlrose_ky.algorithms._callbacks import get_next_callback_iteration
+from mlrose_ky.algorithms._state import accept_state
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
+from mlrose_ky.algorithms.phase_profiler import PhaseProfiler
 from mlrose_ky.decorators import short_name
 
 
+GA_PHASES = ("initialize", "bookkeeping", "mate_probs", "select", "reproduce", "survivors", "evaluate", "best_child")
+
+
 @short_name("ga")
 def genetic_alg(
     problem: Any,
@@ -27,6 +35,11 @@ def genetic_alg(
     callback_user_info: dict = None,
     hamming_factor: float = 0.0,
     hamming_decay_factor: float = None,
+    curve_buffer: CurveBuffer = None,
+    profiler: PhaseProfiler = None,
+    max_time: float = None,
+    max_fevals: int = None,
+    target_fitness: float = None,
 ) -> tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use a standard genetic algorithm to find the optimum for a given optimization problem.
@@ -86,7 +99,8 @@ def genetic_alg(
         - attempt: int
           The current number of consecutive unsuccessful attempts to find a better state.
         - done: bool
-          True if the algorithm is about to terminate (max attempts reached, max iterations reached, or `problem.can_stop()` returns True);
+          True if the algorithm is about to terminate (max attempts, max iterations, max time, max fitness evaluations or
+          target fitness reached, or `problem.can_stop()` returns True);
           False otherwise.
         - state: np.ndarray
           The current state vector.
@@ -113,6 +127,29 @@ def genetic_alg(
         Decay factor for the `hamming_factor` over iterations.
         If specified, `hamming_factor` is multiplied by this value each iteration.
 
+    curve_buffer: CurveBuffer, default: None
+        Buffer the fitness curve is recorded in when `curve` is `True`, e.g. to decimate the curve of a long run
+        (see `CurveBuffer`). The buffer is cleared at the start of the run. If `None`, every point is recorded in a
+        new buffer.
+
+    profiler: PhaseProfiler, default: None
+        If specified, the time spent in each phase of the run is accumulated in this profiler (see `PhaseProfiler`),
+        which is started at the beginning of the run. Profiling is opt-in, since it adds a clock read per phase.
+
+    max_time: float, default: None
+        Maximum number of seconds the run may take, checked once per iteration. If `None`, the run is not limited
+        in time.
+
+    max_fevals: int, default: None
+        Maximum number of fitness evaluations the run may make, checked once per iteration, so the last iteration
+        may exceed it. If `None`, the number of evaluations is not limited.
+
+    target_fitness: float, default: None
+        Fitness at which to stop, e.g. the known optimum of the problem. The run stops at the end of the iteration in
+        which the best fitness found reaches it: for a maximization problem when the fitness is at least
+        `target_fitness`, and for a minimization problem when it is at most `target_fitness`. If `None`, the run
+        does not stop at any fitness.
+
     Returns
     -------
     best_state : np.ndarray
@@ -164,15 +201,21 @@ def genetic_alg(
         raise ValueError(f"hamming_decay_factor must be between 0 and 1 (inclusive). Got {hamming_decay_factor}")
     if callback_user_info is not None and not isinstance(callback_user_info, dict):
         raise TypeError(f"callback_user_info must be a dict. Got {type(callback_user_info).__name__}")
+    budget = RunBudget(max_time, max_fevals, target_fitness)
 
     # Set random seed for reproducibility
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
     # Initialize the optimization problem
-    fitness_curve = []
+    if profiler is not None:
+        profiler.start(GA_PHASES)
+    fitness_curve = curve_buffer if curve_buffer is not None else CurveBuffer()
+    fitness_curve.clear()
     problem.reset()
     problem.random_pop(pop_size)
+    if profiler is not None:
+        profiler.record("initialize")
 
     # Initial callback invocation (iteration 0)
     if state_fitness_callback is not None:
@@ -185,14 +228,14 @@ def genetic_alg(
             state=problem.get_state(),
             fitness=problem.get_adjusted_fitness(),
             fitness_evaluations=problem.fitness_evaluations,
-            curve=np.asarray(fitness_curve) if curve else None,
+            curve=fitness_curve.view() if curve else None,
             user_data=callback_user_info,
         )
         if not continue_iterating:
             # Early termination as per callback request
             best_state = problem.get_state()
             best_fitness = problem.get_maximize() * problem.get_fitness()
-            return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
+            return best_state, best_fitness, fitness_curve.to_array() if curve else None
 
     # Determine Hamming distance function if needed
     get_hamming_distance_func: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None
@@ -218,26 +261,48 @@ def genetic_alg(
         if breeding_pop_size < 0:
             breeding_pop_size = 0  # Ensure breeding_pop_size is not negative
 
+    # Problems that can reproduce a whole generation at once (e.g. ContinuousOpt) do so after its parents are selected
+    reproduce_batch: Optional[Callable[[np.ndarray, np.ndarray, float], np.ndarray]] = getattr(problem, "reproduce_batch", None)
+
     attempts = 0
     iters = 0
+    next_callback_iteration = get_next_callback_iteration(state_fitness_callback, 0)
     while attempts < max_attempts and iters < max_iters:
         iters += 1
         problem.current_iteration += 1
+        if profiler is not None:
+            profiler.record("bookkeeping")
 
         # Calculate mating probabilities based on fitness
         problem.eval_mate_probs()
+        if profiler is not None:
+            profiler.record("mate_probs")
 
         # Create next generation
         next_gen = []
+        batch_parents = []
         for _ in range(breeding_pop_size):
             # Select parents
             parent_1, parent_2 = _genetic_alg_select_parents(
                 pop_size=pop_size, problem=problem, hamming_factor=hamming_factor, get_hamming_distance_func=get_hamming_distance_func
             )
-
-            # Create offspring through reproduction and mutation
-            child = problem.reproduce(parent_1, parent_2, mutation_prob)
-            next_gen.append(child)
+            if profiler is not None:
+                profiler.record("select")
+
+            # Create offspring through reproduction and mutation, or in a single batch if the problem supports it
+            if reproduce_batch is None:
+                child = problem.reproduce(parent_1, parent_2, mutation_prob)
+                next_gen.append(child)
+                if profiler is not None:
+                    profiler.record("reproduce")
+            else:
+                batch_parents.append((parent_1, parent_2))
+
+        if batch_parents:
+            parents_1, parents_2 = (np.array(parents) for parents in zip(*batch_parents))
+            next_gen.extend(reproduce_batch(parents_1, parents_2, mutation_prob))
+            if profiler is not None:
+                profiler.record("reproduce")
 
         # Fill the remaining population with elites and dregs
         if survivors_size > 0:
@@ -252,54 +317,66 @@ def genetic_alg(
 
         # Ensure the next generation has the correct population size
         next_gen = np.array(next_gen[:pop_size])
+        if profiler is not None:
+            profiler.record("survivors")
         problem.set_population(next_gen)
+        if profiler is not None:
+            profiler.record("evaluate")
 
         # Evaluate the best child in the new generation
         next_state = problem.best_child()
         next_fitness = problem.eval_fitness(next_state)
+        if profiler is not None:
+            profiler.record("best_child")
 
         # If the best child is an improvement, update the current state
         if next_fitness > problem.get_fitness():
-            problem.set_state(next_state)
+            accept_state(problem, next_state, next_fitness)
             attempts = 0  # Reset attempts since improvement was found
         else:
             attempts += 1  # Increment attempts since no improvement
 
         # Record fitness curve if requested
         if curve:
-            fitness_curve.append((problem.get_adjusted_fitness(), problem.fitness_evaluations))
+            fitness_curve.append(problem.get_adjusted_fitness(), problem.fitness_evaluations)
+        budget_exhausted = budget.exhausted(problem)
+        target_reached = budget.target_reached(problem, problem.get_fitness())
 
         # Invoke callback function
         if state_fitness_callback is not None:
-            max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop()
-            continue_iterating = state_fitness_callback(
-                iteration=iters,
-                attempt=attempts,
-                done=max_attempts_reached,
-                state=problem.get_state(),
-                fitness=problem.get_adjusted_fitness(),
-                fitness_evaluations=problem.fitness_evaluations,
-                curve=np.asarray(fitness_curve) if curve else None,
-                user_data=callback_user_info,
+            max_attempts_reached = (
+                attempts == max_attempts or iters == max_iters or problem.can_stop() or budget_exhausted or target_reached
             )
-            # Break out if callback requests termination
-            if not continue_iterating:
-                break
+            if max_attempts_reached or iters >= next_callback_iteration:
+                continue_iterating = state_fitness_callback(
+                    iteration=iters,
+                    attempt=attempts,
+                    done=max_attempts_reached,
+                    state=problem.get_state(),
+                    fitness=problem.get_adjusted_fitness(),
+                    fitness_evaluations=problem.fitness_evaluations,
+                    curve=fitness_curve.view() if curve else None,
+                    user_data=callback_user_info,
+                )
+                next_callback_iteration = get_next_callback_iteration(state_fitness_callback, iters)
+                # Break out if callback requests termination
+                if not continue_iterating:
+                    break
 
         # Decay hamming factor if specified
         if hamming_decay_factor is not None and hamming_factor > 0.0:
             hamming_factor *= hamming_decay_factor
             hamming_factor = max(min(hamming_factor, 1.0), 0.0)
 
-        # Check if the problem signals to stop
-        if problem.can_stop():
+        # Check if the problem signals to stop, the budget is used up or the target fitness is reached
+        if problem.can_stop() or budget_exhausted or target_reached:
             break
 
     # Prepare the final best state and fitness
     best_state = problem.get_state()
     best_fitness = problem.get_maximize() * problem.get_fitness()
 
-    return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
+    return best_state, best_fitness, fitness_curve.to_array() if curve else None
 
 
 def _get_hamming_distance_default(population: np.ndarray, p1: np.ndarray) -> np.ndarray:
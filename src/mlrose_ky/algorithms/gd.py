@@ -7,6 +7,10 @@ from typing import Callable, Any
 
 import numpy as np
 
+from mlrose_ky.algorithms._budget import RunBudget
+from mlrose_ky.algorithms._callbacks import get_next_callback_iteration
+from mlrose_ky.algorithms._state import accept_state
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
 from mlrose_ky.decorators import short_name
 from mlrose_ky.neural.utils import flatten_weights
 
@@ -21,6 +25,10 @@ def gradient_descent(
     random_state: int = None,
     state_fitness_callback: Callable = None,
     callback_user_info: dict = None,
+    optimizer: Any = None,
+    curve_buffer: CurveBuffer = None,
+    max_time: float = None,
+    max_fevals: int = None,
 ) -> tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use gradient descent to find the optimal weights for a neural network.
@@ -59,7 +67,8 @@ def gradient_descent(
         - attempt: int
           The current number of consecutive unsuccessful attempts to find a better state.
         - done: bool
-          True if the algorithm is about to terminate (max attempts reached, max iterations reached, or `problem.can_stop()` returns True);
+          True if the algorithm is about to terminate (max attempts, max iterations, max time or max fitness evaluations reached,
+          or `problem.can_stop()` returns True);
           False otherwise.
         - state: np.ndarray
           The current state vector.
@@ -77,6 +86,24 @@ def gradient_descent(
     callback_user_info: dict, default: None
         Dictionary of user-managed data passed as the `user_data` parameter of the callback function.
 
+    optimizer: optimizer object, default: None
+        Update rule used to turn the gradient of the loss into a step, e.g. `mlrose_ky.Adam()`,
+        `mlrose_ky.Momentum()` or `mlrose_ky.RMSProp()`. The optimizer is reset at the start of the run.
+        If `None`, the fixed learning rate updates returned by `problem.calculate_updates()` are used.
+
+    curve_buffer: CurveBuffer, default: None
+        Buffer the fitness curve is recorded in when `curve` is `True`, e.g. to decimate the curve of a long run
+        (see `CurveBuffer`). The buffer is cleared at the start of the run. If `None`, every point is recorded in a
+        new buffer.
+
+    max_time: float, default: None
+        Maximum number of seconds the run may take, checked once per iteration. If `None`, the run is not limited
+        in time.
+
+    max_fevals: int, default: None
+        Maximum number of fitness evaluations the run may make, checked once per iteration, so the last iteration
+        may exceed it. If `None`, the number of evaluations is not limited.
+
     Returns
     -------
     best_state: np.ndarray
@@ -106,13 +133,18 @@ def gradient_descent(
         raise ValueError(f"max_iters must be a positive integer greater than 0 or np.inf. Got {max_iters}")
     if callback_user_info is not None and not isinstance(callback_user_info, dict):
         raise TypeError(f"callback_user_info must be a dict. Got {type(callback_user_info).__name__}")
+    budget = RunBudget(max_time, max_fevals)
 
     # Set random seed for reproducibility
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
+    if optimizer is not None:
+        optimizer.reset()
+
     # Initialize the optimization problem
-    fitness_curve = []
+    fitness_curve = curve_buffer if curve_buffer is not None else CurveBuffer()
+    fitness_curve.clear()
     if init_state is None:
         problem.reset()
     else:
@@ -129,7 +161,7 @@ def gradient_descent(
             state=problem.get_state(),
             fitness=problem.get_adjusted_fitness(),
             fitness_evaluations=problem.fitness_evaluations,
-            curve=np.asarray(fitness_curve) if curve else None,
+            curve=fitness_curve.view() if curve else None,
             user_data=callback_user_info,
         )
 
@@ -139,11 +171,15 @@ def gradient_descent(
 
     attempts = 0
     iters = 0
+    next_callback_iteration = get_next_callback_iteration(state_fitness_callback, 0)
     while attempts < max_attempts and iters < max_iters:
         iters += 1
 
         # Calculate the gradient updates
-        updates = flatten_weights(problem.calculate_updates())
+        if optimizer is None:
+            updates = flatten_weights(problem.calculate_updates())
+        else:
+            updates = optimizer.step(problem.calculate_gradient())
 
         # Update the state (weights) using the calculated gradients
         next_state = problem.update_state(updates)
@@ -158,24 +194,27 @@ def gradient_descent(
 
         # Record fitness curve if requested
         if curve:
-            fitness_curve.append((problem.get_adjusted_fitness(), problem.fitness_evaluations))
+            fitness_curve.append(problem.get_adjusted_fitness(), problem.fitness_evaluations)
+        budget_exhausted = budget.exhausted(problem)
 
         # Invoke callback function
         if state_fitness_callback is not None:
-            max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop()
-            continue_iterating = state_fitness_callback(
-                iteration=iters,
-                attempt=attempts,
-                done=max_attempts_reached,
-                state=problem.get_state(),
-                fitness=problem.get_adjusted_fitness(),
-                fitness_evaluations=problem.fitness_evaluations,
-                curve=np.asarray(fitness_curve) if curve else None,
-                user_data=callback_user_info,
-            )
-            # Break out if callback requests termination
-            if not continue_iterating:
-                break
+            max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop() or budget_exhausted
+            if max_attempts_reached or iters >= next_callback_iteration:
+                continue_iterating = state_fitness_callback(
+                    iteration=iters,
+                    attempt=attempts,
+                    done=max_attempts_reached,
+                    state=problem.get_state(),
+                    fitness=problem.get_adjusted_fitness(),
+                    fitness_evaluations=problem.fitness_evaluations,
+                    curve=fitness_curve.view() if curve else None,
+                    user_data=callback_user_info,
+                )
+                next_callback_iteration = get_next_callback_iteration(state_fitness_callback, iters)
+                # Break out if callback requests termination
+                if not continue_iterating:
+                    break
 
         # Update best state and best fitness if current is better
         if problem.get_maximize() * next_fitness > problem.get_maximize() * best_fitness:
@@ -183,10 +222,10 @@ def gradient_descent(
             best_state = next_state
 
         # Update the problem's current state
-        problem.set_state(next_state)
+        accept_state(problem, next_state, next_fitness)
 
-        # Check if the problem signals to stop
-        if problem.can_stop():
+        # Check if the problem signals to stop, or the budget is used up
+        if problem.can_stop() or budget_exhausted:
             break
 
-    return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
+    return best_state, best_fitness, fitness_curve.to_array() if curve else None
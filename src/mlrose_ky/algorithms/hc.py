@@ -7,6 +7,11 @@ from typing import Callable, Any
 
 import numpy as np
 
+from mlrose_ky.algorithms._budget import RunBudget
+from mlrose_ky.algorithms._callbacks import get_next_callback_iteration
+from mlrose_ky.algorithms._state import accept_state
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
+from mlrose_ky.algorithms.restarts import StagnationRestart
 from mlrose_ky.decorators import short_name
 
 
@@ -19,6 +24,10 @@ def hill_climb(
     random_state: int = None,
     state_fitness_callback: Callable = None,
     callback_user_info: dict = None,
+    curve_buffer: CurveBuffer = None,
+    max_time: float = None,
+    max_fevals: int = None,
+    restart_controller: StagnationRestart = None,
 ) -> tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use standard hill climbing to find the optimum for a given optimization problem.
@@ -53,7 +62,8 @@ def hill_climb(
         - attempt: None
           Not used in `hill_climb`, included for compatibility.
         - done: bool
-          True if the algorithm is about to terminate (max iterations reached or `problem.can_stop()` returns True); False otherwise.
+          True if the algorithm is about to terminate (max iterations, max time or max fitness evaluations reached, or
+          `problem.can_stop()` returns True); False otherwise.
         - state: np.ndarray
           The current state vector.
         - fitness: float
@@ -68,6 +78,27 @@ def hill_climb(
     callback_user_info: dict, default: None
         Dictionary of user-managed data passed as the `user_data` parameter of the callback function.
 
+    curve_buffer: CurveBuffer, default: None
+        Buffer the fitness curve is recorded in when `curve` is `True`, e.g. to decimate the curve of a long run
+        (see `CurveBuffer`). The buffer is cleared at the start of the run. If `None`, every point is recorded in a
+        new buffer.
+
+    max_time: float, default: None
+        Maximum number of seconds the run may take, checked once per iteration. If `None`, the run is not limited
+        in time.
+
+    max_fevals: int, default: None
+        Maximum number of fitness evaluations the run may make, checked once per iteration, so the last iteration
+        may exceed it. If `None`, the number of evaluations is not limited.
+
+    restart_controller: StagnationRestart, default: None
+        Controller that restarts the search from a perturbation of the best state found once it stagnates (see
+        `StagnationRestart`). Hill climbing restarts as soon as it reaches a local optimum,
+        rather than after the controller's `patience`, so the run continues until `max_iters`, the time or
+        evaluation budget, or the controller's `max_restarts` is reached. A controller with an unlimited
+        `max_restarts` therefore requires a finite `max_iters`, `max_time` or `max_fevals`. If `None`, the search
+        is not restarted.
+
     Returns
     -------
     best_state: np.ndarray
@@ -89,7 +120,7 @@ def hill_climb(
     - The `state_fitness_callback` function is also called before the optimization loop starts (iteration 0)
       with the initial state and fitness values.
     - The hill climbing algorithm moves to the neighbor with the highest fitness that improves upon the current state.
-      If no neighbor improves upon the current state, the algorithm terminates.
+      If no neighbor improves upon the current state, the algorithm terminates, unless a `restart_controller` restarts it.
 
     References
     ----------
@@ -102,6 +133,9 @@ def hill_climb(
         raise ValueError(f"init_state must have the same length as the problem. Expected {problem.get_length()}, got {len(init_state)}")
     if callback_user_info is not None and not isinstance(callback_user_info, dict):
         raise TypeError(f"callback_user_info must be a dict. Got {type(callback_user_info).__name__}")
+    budget = RunBudget(max_time, max_fevals)
+    if restart_controller is not None:
+        restart_controller.check_termination(max_iters, budget)
 
     # Set random seed
     if isinstance(random_state, int) and random_state > 0:
@@ -110,13 +144,16 @@ def hill_climb(
     best_fitness = -np.inf
     best_state = None
 
-    fitness_curve = []
+    fitness_curve = curve_buffer if curve_buffer is not None else CurveBuffer()
+    fitness_curve.clear()
 
     # Initialize optimization problem
     if init_state is None:
         problem.reset()
     else:
         problem.set_state(init_state)
+    if restart_controller is not None:
+        restart_controller.start(problem)
 
     # Initial callback invocation
     if state_fitness_callback is not None:
@@ -129,14 +166,15 @@ def hill_climb(
             done=False,
             state=problem.get_state(),
             fitness=problem.get_adjusted_fitness(),
-            curve=np.asarray(fitness_curve) if curve else None,
+            curve=fitness_curve.view() if curve else None,
             user_data=callback_user_info,
         )
         if not continue_iterating:
-            return problem.get_state(), float(best_fitness), np.asarray(fitness_curve) if curve else None
+            return problem.get_state(), float(best_fitness), fitness_curve.to_array() if curve else None
 
     # Main optimization loop
     iters = 0
+    next_callback_iteration = get_next_callback_iteration(state_fitness_callback, 0)
     while iters < max_iters:
         iters += 1
         problem.current_iteration += 1
@@ -148,42 +186,52 @@ def hill_climb(
 
         # If curve is True, append current fitness and evaluations to fitness_curve
         if curve:
-            fitness_curve.append((problem.get_adjusted_fitness(), problem.fitness_evaluations))
+            fitness_curve.append(problem.get_adjusted_fitness(), problem.fitness_evaluations)
+        budget_exhausted = budget.exhausted(problem)
 
         # Invoke callback
         if state_fitness_callback is not None:
-            max_attempts_reached = iters == max_iters or problem.can_stop()
-            continue_iterating = state_fitness_callback(
-                iteration=iters,
-                attempt=None,
-                done=max_attempts_reached,
-                state=problem.get_state(),
-                fitness=problem.get_adjusted_fitness(),
-                curve=np.asarray(fitness_curve) if curve else None,
-                user_data=callback_user_info,
-            )
-            # Break out if requested
-            if not continue_iterating:
-                break
+            max_attempts_reached = iters == max_iters or problem.can_stop() or budget_exhausted
+            if max_attempts_reached or next_fitness <= problem.get_fitness() or iters >= next_callback_iteration:
+                continue_iterating = state_fitness_callback(
+                    iteration=iters,
+                    attempt=None,
+                    done=max_attempts_reached,
+                    state=problem.get_state(),
+                    fitness=problem.get_adjusted_fitness(),
+                    curve=fitness_curve.view() if curve else None,
+                    user_data=callback_user_info,
+                )
+                next_callback_iteration = get_next_callback_iteration(state_fitness_callback, iters)
+                # Break out if requested
+                if not continue_iterating:
+                    break
 
         # If the best neighbor is an improvement, move to that state
         current_fitness = problem.get_fitness()
         if next_fitness > current_fitness:
-            problem.set_state(next_state)
+            accept_state(problem, next_state, next_fitness)
+        elif restart_controller is not None and restart_controller.can_restart:
+            # Local optimum reached; restart from a perturbation of the best state
+            restart_controller.restart(problem)
         else:
             # No improvement found; terminate
             break
 
-        # Check if the problem signals to stop
-        if problem.can_stop():
+        # Check if the problem signals to stop, or the budget is used up
+        if problem.can_stop() or budget_exhausted:
             break
 
-    # Update best state and best fitness if current is better
-    current_fitness = problem.get_fitness()
-    if current_fitness > best_fitness:
-        best_fitness = current_fitness
-        best_state = problem.get_state()
+    # Update best state and best fitness if current is better, or take the best state found across restarts
+    if restart_controller is not None:
+        restart_controller.update(problem)
+        best_state, best_fitness = restart_controller.best_state, restart_controller.best_fitness
+    else:
+        current_fitness = problem.get_fitness()
+        if current_fitness > best_fitness:
+            best_fitness = current_fitness
+            best_state = problem.get_state()
 
     best_fitness *= problem.get_maximize()
 
-    return best_state, float(best_fitness), np.asarray(fitness_curve) if curve else None
+    return best_state, float(best_fitness), fitness_curve.to_array() if curve else None
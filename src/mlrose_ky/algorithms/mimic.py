@@ -7,9 +7,17 @@ from typing import Callable, Any
 
 import numpy as np
 
+from mlrose_ky.algorithms._budget import RunBudget
+from mlrose_ky.algorithms._callbacks import get_next_callback_iteration
+from mlrose_ky.algorithms._state import accept_state
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
+from mlrose_ky.algorithms.phase_profiler import PhaseProfiler
 from mlrose_ky.decorators import short_name
 
 
+MIMIC_PHASES = ("initialize", "bookkeeping", "find_top_pct", "mutual_info", "eval_node_probs", "sample_pop", "evaluate", "best_child")
+
+
 @short_name("mimic")
 def mimic(
     problem: Any,
@@ -22,6 +30,10 @@ def mimic(
     random_state: int = None,
     state_fitness_callback: Callable = None,
     callback_user_info: dict = None,
+    curve_buffer: CurveBuffer = None,
+    profiler: PhaseProfiler = None,
+    max_time: float = None,
+    max_fevals: int = None,
 ) -> tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use MIMIC (Mutual-Information Maximizing Input Clustering) to find the optimum
@@ -72,7 +84,8 @@ def mimic(
         - attempt: int
           The current number of consecutive unsuccessful attempts to find a better state.
         - done: bool
-          True if the algorithm is about to terminate (max attempts reached, max iterations reached, or `problem.can_stop()` returns True);
+          True if the algorithm is about to terminate (max attempts, max iterations, max time or max fitness evaluations reached,
+          or `problem.can_stop()` returns True);
           False otherwise.
         - state: np.ndarray
           The current state vector.
@@ -90,6 +103,23 @@ def mimic(
     callback_user_info: dict, default: None
         Dictionary of user-managed data passed as the `user_data` parameter of the callback function.
 
+    curve_buffer: CurveBuffer, default: None
+        Buffer the fitness curve is recorded in when `curve` is `True`, e.g. to decimate the curve of a long run
+        (see `CurveBuffer`). The buffer is cleared at the start of the run. If `None`, every point is recorded in a
+        new buffer.
+
+    profiler: PhaseProfiler, default: None
+        If specified, the time spent in each phase of the run is accumulated in this profiler (see `PhaseProfiler`),
+        which is started at the beginning of the run. Profiling is opt-in, since it adds a clock read per phase.
+
+    max_time: float, default: None
+        Maximum number of seconds the run may take, checked once per iteration. If `None`, the run is not limited
+        in time.
+
+    max_fevals: int, default: None
+        Maximum number of fitness evaluations the run may make, checked once per iteration, so the last iteration
+        may exceed it. If `None`, the number of evaluations is not limited.
+
     Returns
     -------
     best_state: np.ndarray
@@ -138,15 +168,21 @@ def mimic(
         problem.noise = noise
     if callback_user_info is not None and not isinstance(callback_user_info, dict):
         raise TypeError(f"callback_user_info must be a dict. Got {type(callback_user_info).__name__}")
+    budget = RunBudget(max_time, max_fevals)
 
     # Set random seed for reproducibility
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
     # Initialize the optimization problem
-    fitness_curve = []
+    if profiler is not None:
+        profiler.start(MIMIC_PHASES)
+    fitness_curve = curve_buffer if curve_buffer is not None else CurveBuffer()
+    fitness_curve.clear()
     problem.reset()
     problem.random_pop(pop_size)
+    if profiler is not None:
+        profiler.record("initialize")
 
     # Initial callback invocation (iteration 0)
     if state_fitness_callback is not None:
@@ -159,41 +195,56 @@ def mimic(
             state=problem.get_state(),
             fitness=problem.get_adjusted_fitness(),
             fitness_evaluations=problem.fitness_evaluations,
-            curve=np.asarray(fitness_curve) if curve else None,
+            curve=fitness_curve.view() if curve else None,
             user_data=callback_user_info,
         )
         if not continue_iterating:
             # Early termination as per callback request
             best_state = problem.get_state().astype(int)
             best_fitness = problem.get_maximize() * problem.get_fitness()
-            return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
+            return best_state, best_fitness, fitness_curve.to_array() if curve else None
 
     # Main optimization loop
     attempts = 0
     iters = 0
+    next_callback_iteration = get_next_callback_iteration(state_fitness_callback, 0)
     while attempts < max_attempts and iters < max_iters:
         iters += 1
         problem.current_iteration += 1
+        if profiler is not None:
+            profiler.record("bookkeeping")
 
         # Select the top 'keep_pct' percent of the population
         problem.find_top_pct(keep_pct)
+        if profiler is not None:
+            profiler.record("find_top_pct")
 
         # Update probability estimates based on the selected samples
-        problem.eval_node_probs()
+        if profiler is not None:
+            problem.eval_node_probs(profiler=profiler)
+            profiler.record("eval_node_probs")
+        else:
+            problem.eval_node_probs()
 
         # Generate a new population using the updated probabilities
         new_sample = problem.sample_pop(pop_size)
+        if profiler is not None:
+            profiler.record("sample_pop")
         problem.set_population(new_sample)
+        if profiler is not None:
+            profiler.record("evaluate")
 
         # Identify the best state in the new population
         next_state = problem.best_child()
         next_fitness = problem.eval_fitness(next_state)
+        if profiler is not None:
+            profiler.record("best_child")
 
         # Check if the new state is better than the current state
         current_fitness = problem.get_fitness()
         if next_fitness > current_fitness:
             # Improvement found; update state and reset attempts
-            problem.set_state(next_state)
+            accept_state(problem, next_state, next_fitness)
             attempts = 0
         else:
             # No improvement; increment attempts
@@ -201,31 +252,34 @@ def mimic(
 
         # Record fitness curve if requested
         if curve:
-            fitness_curve.append((problem.get_adjusted_fitness(), problem.fitness_evaluations))
+            fitness_curve.append(problem.get_adjusted_fitness(), problem.fitness_evaluations)
+        budget_exhausted = budget.exhausted(problem)
 
         # Invoke callback function
         if state_fitness_callback is not None:
-            max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop()
-            continue_iterating = state_fitness_callback(
-                iteration=iters,
-                attempt=attempts,
-                done=max_attempts_reached,
-                state=problem.get_state(),
-                fitness=problem.get_adjusted_fitness(),
-                fitness_evaluations=problem.fitness_evaluations,
-                curve=np.asarray(fitness_curve) if curve else None,
-                user_data=callback_user_info,
-            )
-            # Break out if callback requests termination
-            if not continue_iterating:
-                break
-
-        # Check if the problem signals to stop
-        if problem.can_stop():
+            max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop() or budget_exhausted
+            if max_attempts_reached or iters >= next_callback_iteration:
+                continue_iterating = state_fitness_callback(
+                    iteration=iters,
+                    attempt=attempts,
+                    done=max_attempts_reached,
+                    state=problem.get_state(),
+                    fitness=problem.get_adjusted_fitness(),
+                    fitness_evaluations=problem.fitness_evaluations,
+                    curve=fitness_curve.view() if curve else None,
+                    user_data=callback_user_info,
+                )
+                next_callback_iteration = get_next_callback_iteration(state_fitness_callback, iters)
+                # Break out if callback requests termination
+                if not continue_iterating:
+                    break
+
+        # Check if the problem signals to stop, or the budget is used up
+        if problem.can_stop() or budget_exhausted:
             break
 
     # Prepare the final best state and fitness
     best_state = problem.get_state().astype(int)
     best_fitness = problem.get_maximize() * problem.get_fitness()
 
-    return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
+    return best_state, best_fitness, fitness_curve.to_array() if curve else None
@@ -8,6 +8,7 @@ from typing import Any
 import numpy as np
 
 from mlrose_ky.algorithms.mutators._mutator_base import _MutatorBase
+from mlrose_ky.kernels import get_kernel
 
 
 class DiscreteMutator(_MutatorBase):
@@ -23,17 +24,23 @@ class DiscreteMutator(_MutatorBase):
         The optimization problem instance associated with the mutation operations.
     _max_val : int
         The maximum allowable value for any gene in the chromosome.
+    kernel_backend : str | None
+        Backend of the kernel that mutates the genes.
 
     Parameters
     ----------
     opt_prob : Any
         An instance of an optimization problem that the mutator will operate on.
+    kernel_backend : str, optional
+        Backend of the kernel that mutates the genes (see `mlrose_ky.kernels`), e.g. 'numba'. If None, the backend
+        set with `set_kernel_backend` is used.
     """
 
-    def __init__(self, opt_prob: Any):
+    def __init__(self, opt_prob: Any, kernel_backend: str = None):
         super().__init__(opt_prob)
 
         self._max_val: int = opt_prob.max_val
+        self.kernel_backend: str | None = kernel_backend
 
     def mutate(self, child: np.ndarray, mutation_probability: float) -> np.ndarray:
         """
@@ -60,9 +67,8 @@ class DiscreteMutator(_MutatorBase):
         if self._max_val == 2:
             child[mutation_indices] = 1 - child[mutation_indices]
         else:
-            for index in mutation_indices:
-                possible_values = list(range(self._max_val))
-                possible_values.remove(child[index])
-                child[index] = np.random.choice(possible_values)
+            # Shifting a gene by a random offset in [1, max_val) modulo max_val draws uniformly among its other values
+            offsets = np.random.randint(1, self._max_val, size=len(mutation_indices))
+            child = get_kernel("discrete_mutate", self.kernel_backend)(child, mutation_indices, offsets, self._max_val)
 
         return child
@@ -0,0 +1,9 @@
+"""Classes for defining gradient-based update rules for gradient descent."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from .adam import Adam
+from .momentum import Momentum
+from .rmsprop import RMSProp
+from .sgd import SGD
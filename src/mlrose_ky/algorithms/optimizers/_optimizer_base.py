@@ -0,0 +1,96 @@
+"""Optimizer base class for gradient descent update rules."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+
+
+class _OptimizerBase(ABC):
+    """
+    Base class for gradient descent optimizers.
+
+    An optimizer converts the gradient of the loss with respect to the (flattened) state into the update
+    that is added to the state at each step. Optimizers may keep state between steps, such as running
+    averages of the gradient, which is cleared by :meth:`reset`.
+
+    Parameters
+    ----------
+    learning_rate : float
+        Step size applied to the gradient. Must be greater than 0.
+    """
+
+    def __init__(self, learning_rate: float):
+        if learning_rate <= 0:
+            raise ValueError(f"learning_rate must be greater than 0, got {learning_rate}.")
+
+        self.learning_rate: float = learning_rate
+
+    def __str__(self):
+        params = ", ".join(f"{k}={v}" for k, v in self._get_params().items())
+        return f"{self.__class__.__name__}({params})"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self._get_params() == other._get_params()
+
+    def _get_params(self) -> dict[str, Any]:
+        """Return the hyperparameters of the optimizer."""
+        return {"learning_rate": self.learning_rate}
+
+    @staticmethod
+    def _zeros_like(state: np.ndarray | None, gradient: np.ndarray) -> np.ndarray:
+        """Return a zeroed buffer shaped like gradient, reusing state if it already has that shape."""
+        if state is None or state.shape != gradient.shape:
+            return np.zeros_like(gradient, dtype=float)
+
+        return state
+
+    def reset(self):
+        """Clear any state kept between steps, so that the optimizer can be reused for a new run."""
+
+    @abstractmethod
+    def step(self, gradient: np.ndarray) -> np.ndarray:
+        """
+        Calculate the update for the current step.
+
+        Parameters
+        ----------
+        gradient : np.ndarray
+            Gradient of the loss with respect to the flattened state.
+
+        Returns
+        -------
+        np.ndarray
+            Update to be added to the state.
+        """
+
+    def get_info__(self, t: int = None, prefix: str = "") -> dict:
+        """
+        Retrieve a dictionary containing the configuration of the optimizer.
+
+        Parameters
+        ----------
+        t : int | None, optional
+            Unused. Present for compatibility with the decay schedules.
+        prefix : str, optional
+            A prefix to append to each dictionary key, enhancing integration with other data structures.
+
+        Returns
+        -------
+        dict
+            A dictionary detailing the optimizer settings.
+        """
+        full_prefix = f"{prefix}__optimizer_" if len(prefix) else "optimizer_"
+
+        info = {f"{full_prefix}type": self.__class__.__name__.lower()}
+        info.update({f"{full_prefix}{k}": v for k, v in self._get_params().items()})
+
+        return info
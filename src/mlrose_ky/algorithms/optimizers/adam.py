@@ -0,0 +1,90 @@
+"""Class for defining the Adam gradient descent update rule."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from typing import Any
+
+import numpy as np
+
+from mlrose_ky.algorithms.optimizers._optimizer_base import _OptimizerBase
+
+
+class Adam(_OptimizerBase):
+    """
+    Adam update rule (Kingma and Ba, 2014), using the formula:
+
+    .. math::
+
+        m_{t} = \\beta_{1} m_{t-1} + (1 - \\beta_{1}) g_{t}, \\qquad
+        v_{t} = \\beta_{2} v_{t-1} + (1 - \\beta_{2}) g_{t}^{2}
+
+        \\Delta w_{t} = -\\eta \\frac{\\sqrt{1 - \\beta_{2}^{t}}}{1 - \\beta_{1}^{t}} \\frac{m_{t}}{\\sqrt{v_{t}} + \\epsilon}
+
+    where :math:`\\eta` is the learning rate and :math:`g_{t}` is the gradient at step `t`. This is the same
+    formulation as used by scikit-learn's ``MLPClassifier(solver='adam')``.
+
+    Parameters
+    ----------
+    learning_rate : float, default=0.001
+        Step size applied to the scaled gradient. Must be greater than 0.
+    beta_1 : float, default=0.9
+        Decay rate of the first moment estimate. Must be between 0 and 1, exclusive of 1.
+    beta_2 : float, default=0.999
+        Decay rate of the second moment estimate. Must be between 0 and 1, exclusive of 1.
+    epsilon : float, default=1e-8
+        Value added to the denominator for numerical stability. Must be greater than 0.
+    """
+
+    def __init__(self, learning_rate: float = 0.001, beta_1: float = 0.9, beta_2: float = 0.999, epsilon: float = 1e-8):
+        super().__init__(learning_rate)
+
+        if not (0 <= beta_1 < 1):
+            raise ValueError(f"beta_1 must be between 0 and 1, exclusive of 1, got {beta_1}.")
+        if not (0 <= beta_2 < 1):
+            raise ValueError(f"beta_2 must be between 0 and 1, exclusive of 1, got {beta_2}.")
+        if epsilon <= 0:
+            raise ValueError(f"epsilon must be greater than 0, got {epsilon}.")
+
+        self.beta_1: float = beta_1
+        self.beta_2: float = beta_2
+        self.epsilon: float = epsilon
+        self.t: int = 0
+        self.first_moment: np.ndarray | None = None
+        self.second_moment: np.ndarray | None = None
+
+    def _get_params(self) -> dict[str, Any]:
+        return {"learning_rate": self.learning_rate, "beta_1": self.beta_1, "beta_2": self.beta_2, "epsilon": self.epsilon}
+
+    def reset(self):
+        """Clear the moment estimates and step count, so that the optimizer can be reused for a new run."""
+        self.t = 0
+        self.first_moment = None
+        self.second_moment = None
+
+    def step(self, gradient: np.ndarray) -> np.ndarray:
+        """
+        Calculate the update for the current step.
+
+        Parameters
+        ----------
+        gradient : np.ndarray
+            Gradient of the loss with respect to the flattened state.
+
+        Returns
+        -------
+        np.ndarray
+            Update to be added to the state.
+        """
+        self.t += 1
+        self.first_moment = self._zeros_like(self.first_moment, gradient)
+        self.second_moment = self._zeros_like(self.second_moment, gradient)
+
+        self.first_moment *= self.beta_1
+        self.first_moment += (1 - self.beta_1) * gradient
+        self.second_moment *= self.beta_2
+        self.second_moment += (1 - self.beta_2) * np.square(gradient)
+
+        learning_rate = self.learning_rate * np.sqrt(1 - self.beta_2**self.t) / (1 - self.beta_1**self.t)
+
+        return -learning_rate * self.first_moment / (np.sqrt(self.second_moment) + self.epsilon)
@@ -0,0 +1,72 @@
+"""Class for defining the momentum gradient descent update rule."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from typing import Any
+
+import numpy as np
+
+from mlrose_ky.algorithms.optimizers._optimizer_base import _OptimizerBase
+
+
+class Momentum(_OptimizerBase):
+    """
+    Gradient descent with momentum, using the formula:
+
+    .. math::
+
+        v_{t} = \\mu v_{t-1} - \\eta \\, g_{t}, \\qquad \\Delta w_{t} = v_{t}
+
+    where :math:`\\mu` is the momentum, :math:`\\eta` is the learning rate and :math:`g_{t}` is the
+    gradient at step `t`. With Nesterov momentum, the update is :math:`\\mu v_{t} - \\eta \\, g_{t}` instead.
+
+    Parameters
+    ----------
+    learning_rate : float, default=0.1
+        Step size applied to the gradient. Must be greater than 0.
+    momentum : float, default=0.9
+        Fraction of the previous update carried over into the current one. Must be between 0 and 1.
+    nesterov : bool, default=False
+        Whether to use Nesterov momentum.
+    """
+
+    def __init__(self, learning_rate: float = 0.1, momentum: float = 0.9, nesterov: bool = False):
+        super().__init__(learning_rate)
+
+        if not (0 <= momentum <= 1):
+            raise ValueError(f"momentum must be between 0 and 1, got {momentum}.")
+
+        self.momentum: float = momentum
+        self.nesterov: bool = nesterov
+        self.velocity: np.ndarray | None = None
+
+    def _get_params(self) -> dict[str, Any]:
+        return {"learning_rate": self.learning_rate, "momentum": self.momentum, "nesterov": self.nesterov}
+
+    def reset(self):
+        """Clear the velocity, so that the optimizer can be reused for a new run."""
+        self.velocity = None
+
+    def step(self, gradient: np.ndarray) -> np.ndarray:
+        """
+        Calculate the update for the current step.
+
+        Parameters
+        ----------
+        gradient : np.ndarray
+            Gradient of the loss with respect to the flattened state.
+
+        Returns
+        -------
+        np.ndarray
+            Update to be added to the state.
+        """
+        self.velocity = self._zeros_like(self.velocity, gradient)
+        self.velocity *= self.momentum
+        self.velocity -= self.learning_rate * gradient
+
+        if self.nesterov:
+            return self.momentum * self.velocity - self.learning_rate * gradient
+
+        return self.velocity.copy()
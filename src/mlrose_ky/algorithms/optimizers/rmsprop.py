@@ -0,0 +1,71 @@
+"""Class for defining the RMSProp gradient descent update rule."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from typing import Any
+
+import numpy as np
+
+from mlrose_ky.algorithms.optimizers._optimizer_base import _OptimizerBase
+
+
+class RMSProp(_OptimizerBase):
+    """
+    RMSProp update rule, using the formula:
+
+    .. math::
+
+        s_{t} = \\rho s_{t-1} + (1 - \\rho) g_{t}^{2}, \\qquad \\Delta w_{t} = -\\frac{\\eta \\, g_{t}}{\\sqrt{s_{t}} + \\epsilon}
+
+    where :math:`\\rho` is the decay rate of the running average of squared gradients, :math:`\\eta` is the
+    learning rate and :math:`g_{t}` is the gradient at step `t`.
+
+    Parameters
+    ----------
+    learning_rate : float, default=0.001
+        Step size applied to the scaled gradient. Must be greater than 0.
+    rho : float, default=0.9
+        Decay rate of the running average of squared gradients. Must be between 0 and 1, exclusive of 1.
+    epsilon : float, default=1e-8
+        Value added to the denominator for numerical stability. Must be greater than 0.
+    """
+
+    def __init__(self, learning_rate: float = 0.001, rho: float = 0.9, epsilon: float = 1e-8):
+        super().__init__(learning_rate)
+
+        if not (0 <= rho < 1):
+            raise ValueError(f"rho must be between 0 and 1, exclusive of 1, got {rho}.")
+        if epsilon <= 0:
+            raise ValueError(f"epsilon must be greater than 0, got {epsilon}.")
+
+        self.rho: float = rho
+        self.epsilon: float = epsilon
+        self.mean_square: np.ndarray | None = None
+
+    def _get_params(self) -> dict[str, Any]:
+        return {"learning_rate": self.learning_rate, "rho": self.rho, "epsilon": self.epsilon}
+
+    def reset(self):
+        """Clear the running average of squared gradients, so that the optimizer can be reused for a new run."""
+        self.mean_square = None
+
+    def step(self, gradient: np.ndarray) -> np.ndarray:
+        """
+        Calculate the update for the current step.
+
+        Parameters
+        ----------
+        gradient : np.ndarray
+            Gradient of the loss with respect to the flattened state.
+
+        Returns
+        -------
+        np.ndarray
+            Update to be added to the state.
+        """
+        self.mean_square = self._zeros_like(self.mean_square, gradient)
+        self.mean_square *= self.rho
+        self.mean_square += (1 - self.rho) * np.square(gradient)
+
+        return -self.learning_rate * gradient / (np.sqrt(self.mean_square) + self.epsilon)
@@ -0,0 +1,50 @@
+"""Class for defining the plain gradient descent update rule."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+
+from mlrose_ky.algorithms.optimizers._optimizer_base import _OptimizerBase
+
+
+class SGD(_OptimizerBase):
+    """
+    Plain gradient descent update rule, using the formula:
+
+    .. math::
+
+        \\Delta w_{t} = -\\eta \\, g_{t}
+
+    where :math:`\\eta` is the learning rate and :math:`g_{t}` is the gradient at step `t`.
+
+    Parameters
+    ----------
+    learning_rate : float, default=0.1
+        Step size applied to the gradient. Must be greater than 0.
+
+    Examples
+    --------
+    >>> optimizer = SGD(learning_rate=0.5)
+    >>> optimizer.step(np.array([1.0, -2.0]))
+    array([-0.5,  1. ])
+    """
+
+    def __init__(self, learning_rate: float = 0.1):
+        super().__init__(learning_rate)
+
+    def step(self, gradient: np.ndarray) -> np.ndarray:
+        """
+        Calculate the update for the current step.
+
+        Parameters
+        ----------
+        gradient : np.ndarray
+            Gradient of the loss with respect to the flattened state.
+
+        Returns
+        -------
+        np.ndarray
+            Update to be added to the state.
+        """
+        return -self.learning_rate * gradient
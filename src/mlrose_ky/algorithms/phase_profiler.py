@@ -0,0 +1,96 @@
+"""Class for timing the phases of an optimization algorithm's iterations."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from time import perf_counter_ns
+
+
+class PhaseProfiler:
+    """
+    Opt-in profiler that accumulates the time an algorithm spends in each phase of its iterations.
+
+    Algorithms that accept a profiler (`genetic_alg` and `mimic`) call start at the beginning of a run, then record
+    each phase as it ends: the time since the previous phase ended is added to the phase's total, measured with
+    `time.perf_counter_ns`, so timing a phase costs a single clock read. The totals are cumulative over the run, and
+    can be read at any point, e.g. from the algorithm's state_fitness_callback. Runners created with
+    `profile_phases=True` add them to their run statistics as 'Time_<phase>' columns.
+
+    The phases recorded by the algorithms are:
+
+    - genetic_alg: 'initialize', 'bookkeeping', 'mate_probs', 'select', 'reproduce', 'survivors', 'evaluate' and 'best_child'.
+    - mimic: 'initialize', 'bookkeeping', 'find_top_pct', 'mutual_info', 'eval_node_probs', 'sample_pop', 'evaluate' and
+      'best_child', where 'mutual_info' is recorded from within `DiscreteOpt.eval_node_probs`.
+
+    'bookkeeping' covers the work between iterations: recording the fitness curve, calling the state fitness
+    callback (including any logging done by a runner) and checking the stopping conditions.
+    """
+
+    def __init__(self):
+        self._totals: dict[str, int] = {}
+        self._counts: dict[str, int] = {}
+        self._last: int = perf_counter_ns()
+
+    def start(self, phases: tuple[str, ...] = ()):
+        """
+        Clear the recorded times and start timing the first phase.
+
+        Parameters
+        ----------
+        phases : tuple[str, ...], optional, default=()
+            Phases to report with a zero time until they are first recorded.
+        """
+        self._totals = {phase: 0 for phase in phases}
+        self._counts = {phase: 0 for phase in phases}
+        self._last = perf_counter_ns()
+
+    def record(self, phase: str):
+        """
+        End a phase, adding the time since the previous phase ended (or since start) to its total.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase.
+        """
+        now = perf_counter_ns()
+        self._totals[phase] = self._totals.get(phase, 0) + now - self._last
+        self._counts[phase] = self._counts.get(phase, 0) + 1
+        self._last = now
+
+    @property
+    def totals(self) -> dict[str, int]:
+        """Total time spent in each phase, in nanoseconds."""
+        return dict(self._totals)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of times each phase was recorded."""
+        return dict(self._counts)
+
+    def seconds(self) -> dict[str, float]:
+        """
+        Return the total time spent in each phase.
+
+        Returns
+        -------
+        dict[str, float]
+            Total time of each phase, in seconds, in the order the phases were first recorded.
+        """
+        return {phase: total / 1e9 for phase, total in self._totals.items()}
+
+    def to_columns(self, prefix: str = "Time_") -> dict[str, float]:
+        """
+        Return the total time spent in each phase, keyed by column name.
+
+        Parameters
+        ----------
+        prefix : str, optional, default='Time_'
+            Prefix of the column names.
+
+        Returns
+        -------
+        dict[str, float]
+            Total time of each phase, in seconds, keyed by the prefixed phase name.
+        """
+        return {f"{prefix}{phase}": total / 1e9 for phase, total in self._totals.items()}
@@ -0,0 +1,6 @@
+"""Classes for defining restart strategies for local search algorithms."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from .stagnation_restart import StagnationRestart
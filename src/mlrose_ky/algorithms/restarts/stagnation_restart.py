@@ -0,0 +1,219 @@
+"""Class for restarting a local search that has stagnated, with adaptive perturbation strength."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import math
+from typing import Any
+
+import numpy as np
+
+
+class StagnationRestart:
+    """
+    Restart controller that restarts a local search once it stops improving, in the style of iterated local search.
+
+    The search is considered stagnant when it has made `patience` fitness evaluations without improving on the best
+    fitness it reached since its last restart. It is then restarted from a perturbation of the best state found so
+    far, made by applying `strength` random moves to it (calls to `problem.random_neighbor`). The strength adapts to
+    the outcome of the previous restarts:
+
+    - If the search found a new best state since the last restart, the strength is reset to `min_strength`, to
+      intensify the search around it.
+    - Otherwise the strength is multiplied by `growth`, to escape the basin of attraction of the best state. Once it
+      would exceed `max_strength`, the search is instead restarted from a random state and the strength is reset to
+      `min_strength`.
+
+    Controllers are passed to `hill_climb`, `random_hill_climb` or `simulated_annealing` as `restart_controller`,
+    which call start at the beginning of each run, update after each iteration, and restart when update reports
+    stagnation. `hill_climb` also restarts as soon as it reaches a local optimum. While the controller can restart,
+    the `max_attempts` stopping criterion of `random_hill_climb` and `simulated_annealing` is suspended, so plateaus
+    are handled by the controller; the runs therefore need a finite `max_restarts`, `max_iters`, `max_time` or
+    `max_fevals` to end. A controller can be reused across runs.
+
+    Parameters
+    ----------
+    patience : int, default=100
+        Number of fitness evaluations without improvement after which the search is restarted.
+    min_strength : int, default=1
+        Number of random moves used to perturb the best state after an improving restart. Must be at least 1.
+    max_strength : int, default=None
+        Largest number of random moves used to perturb the best state. If None, the length of the problem is used.
+    growth : float, default=2.0
+        Factor the strength is multiplied by after a restart that did not find a new best state. Must be greater
+        than 1.
+    max_restarts : int | float, default=np.inf
+        Maximum number of restarts per run. Once reached, the search is no longer restarted and stops as it would
+        without a controller.
+
+    Attributes
+    ----------
+    best_state : np.ndarray
+        Best state found in the current run.
+    best_fitness : float
+        Fitness of the best state, multiplied by the problem's maximization factor.
+    strength : int
+        Number of random moves that will perturb the best state at the next restart.
+    restarts : int
+        Number of restarts made in the current run.
+    """
+
+    def __init__(
+        self, patience: int = 100, min_strength: int = 1, max_strength: int = None, growth: float = 2.0, max_restarts: int | float = np.inf
+    ):
+        if not isinstance(patience, int) or patience <= 0:
+            raise ValueError(f"patience must be a positive integer. Got {patience}")
+        if not isinstance(min_strength, int) or min_strength <= 0:
+            raise ValueError(f"min_strength must be a positive integer. Got {min_strength}")
+        if max_strength is not None and (not isinstance(max_strength, int) or max_strength < min_strength):
+            raise ValueError(f"max_strength must be an integer greater than or equal to min_strength, or None. Got {max_strength}")
+        if not growth > 1:
+            raise ValueError(f"growth must be greater than 1. Got {growth}")
+        if not (isinstance(max_restarts, int) or max_restarts == np.inf) or max_restarts < 0:
+            raise ValueError(f"max_restarts must be a non-negative integer or np.inf. Got {max_restarts}")
+
+        self.patience: int = patience
+        self.min_strength: int = min_strength
+        self.max_strength: int | None = max_strength
+        self.growth: float = growth
+        self.max_restarts: int | float = max_restarts
+
+        self.best_state: np.ndarray | None = None
+        self.best_fitness: float = -np.inf
+        self.strength: int = min_strength
+        self.restarts: int = 0
+        self._max_strength: int = min_strength
+        self._run_best_fitness: float = -np.inf
+        self._last_improvement: int = 0
+        self._found_new_best: bool = False
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(patience={self.patience}, min_strength={self.min_strength}, max_strength={self.max_strength}, "
+            f"growth={self.growth}, max_restarts={self.max_restarts})"
+        )
+
+    @property
+    def can_restart(self) -> bool:
+        """Whether the run may be restarted again."""
+        return self.restarts < self.max_restarts
+
+    def check_termination(self, max_iters: int | float, budget: Any):
+        """
+        Check that a run using the controller ends, i.e. that its restarts or the run itself are limited.
+
+        Parameters
+        ----------
+        max_iters : int | float
+            Maximum number of iterations of the run.
+        budget : RunBudget
+            Time and fitness evaluation budget of the run.
+
+        Raises
+        ------
+        ValueError
+            If max_restarts and max_iters are both np.inf and the run has no time or fitness evaluation budget.
+        """
+        if self.max_restarts == np.inf and max_iters == np.inf and not budget.bounded:
+            raise ValueError(
+                "restart_controller must have a finite max_restarts unless max_iters, max_time or max_fevals is given. "
+                f"Got max_restarts={self.max_restarts}, max_iters={max_iters}"
+            )
+
+    def start(self, problem: Any):
+        """
+        Clear the history of the previous run and start tracking the problem's current state.
+
+        Parameters
+        ----------
+        problem : optimization object
+            The problem being optimized, initialized with the starting state of the run.
+        """
+        self.best_state = problem.get_state().copy()
+        self.best_fitness = problem.get_fitness()
+        self.strength = self.min_strength
+        self.restarts = 0
+        self._max_strength = max(self.max_strength if self.max_strength is not None else problem.get_length(), self.min_strength)
+        self._run_best_fitness = self.best_fitness
+        self._last_improvement = problem.fitness_evaluations
+        self._found_new_best = False
+
+    def update(self, problem: Any) -> bool:
+        """
+        Record the problem's current state, and return whether the search has stagnated.
+
+        Parameters
+        ----------
+        problem : optimization object
+            The problem being optimized.
+
+        Returns
+        -------
+        bool
+            True if the search made `patience` evaluations without improving and may be restarted, False otherwise.
+        """
+        fitness = problem.get_fitness()
+        if fitness > self._run_best_fitness:
+            self._run_best_fitness = fitness
+            self._last_improvement = problem.fitness_evaluations
+        if fitness > self.best_fitness:
+            self.best_fitness = fitness
+            self.best_state = problem.get_state().copy()
+            self._found_new_best = True
+
+        return self.can_restart and problem.fitness_evaluations - self._last_improvement >= self.patience
+
+    def restart(self, problem: Any):
+        """
+        Adapt the perturbation strength to the outcome of the last restart, and move the problem to a perturbation
+        of the best state (or to a random state once the strength exceeds its maximum).
+
+        Parameters
+        ----------
+        problem : optimization object
+            The problem being optimized.
+        """
+        self.update(problem)
+        if self._found_new_best:
+            self.strength = self.min_strength
+        else:
+            self.strength = math.ceil(self.strength * self.growth)
+
+        if self.strength > self._max_strength:
+            self.strength = self.min_strength
+            problem.set_state(problem.random())
+        else:
+            problem.set_state(self._perturb(problem, self.best_state, self.strength))
+
+        self.restarts += 1
+        self._run_best_fitness = problem.get_fitness()
+        self._last_improvement = problem.fitness_evaluations
+        self._found_new_best = False
+
+    @staticmethod
+    def _perturb(problem: Any, state: np.ndarray, strength: int) -> np.ndarray:
+        """
+        Apply random moves to a state without evaluating the intermediate states.
+
+        Parameters
+        ----------
+        problem : optimization object
+            The problem whose neighborhood defines the moves.
+        state : np.ndarray
+            State to perturb.
+        strength : int
+            Number of random moves.
+
+        Returns
+        -------
+        np.ndarray
+            The perturbed state.
+        """
+        current_state = problem.state
+        try:
+            problem.state = state
+            for _ in range(strength):
+                problem.state = problem.random_neighbor()
+            return problem.state
+        finally:
+            problem.state = current_state
@@ -7,6 +7,11 @@ from typing import Callable, Any
 
 import numpy as np
 
+from mlrose_ky.algorithms._budget import RunBudget
+from mlrose_ky.algorithms._callbacks import get_next_callback_iteration
+from mlrose_ky.algorithms._state import accept_state
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
+from mlrose_ky.algorithms.restarts import StagnationRestart
 from mlrose_ky.decorators import short_name
 
 
@@ -21,6 +26,11 @@ def random_hill_climb(
     random_state: int = None,
     state_fitness_callback: Callable = None,
     callback_user_info: dict = None,
+    curve_buffer: CurveBuffer = None,
+    max_time: float = None,
+    max_fevals: int = None,
+    target_fitness: float = None,
+    restart_controller: StagnationRestart = None,
 ) -> tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use randomized hill climbing to find the optimum for a given optimization problem.
@@ -63,7 +73,8 @@ def random_hill_climb(
         - attempt: int
           The current number of consecutive unsuccessful attempts to find a better neighbor.
         - done: bool
-          True if the algorithm is about to terminate (max attempts reached, max iterations reached, or `problem.can_stop()` returns True);
+          True if the algorithm is about to terminate (max attempts, max iterations, max time, max fitness evaluations or
+          target fitness reached, or `problem.can_stop()` returns True);
           False otherwise.
         - state: np.ndarray
           The current state vector.
@@ -81,6 +92,33 @@ def random_hill_climb(
     callback_user_info: dict, default: None
         Dictionary of user-managed data passed as the `user_data` parameter of the callback function.
 
+    curve_buffer: CurveBuffer, default: None
+        Buffer the fitness curve is recorded in when `curve` is `True`, e.g. to decimate the curve of a long run
+        (see `CurveBuffer`). The buffer is cleared at the start of the run. If `None`, every point is recorded in a
+        new buffer.
+
+    max_time: float, default: None
+        Maximum number of seconds the run may take, checked once per iteration. If `None`, the run is not limited
+        in time.
+
+    max_fevals: int, default: None
+        Maximum number of fitness evaluations the run may make, checked once per iteration, so the last iteration
+        may exceed it. If `None`, the number of evaluations is not limited.
+
+    target_fitness: float, default: None
+        Fitness at which to stop, e.g. the known optimum of the problem. The run stops at the end of the iteration in
+        which the best fitness found reaches it: for a maximization problem when the fitness is at least
+        `target_fitness`, and for a minimization problem when it is at most `target_fitness`. If `None`, the run
+        does not stop at any fitness.
+
+    restart_controller: StagnationRestart, default: None
+        Controller that restarts the search from a perturbation of the best state found once it stagnates (see
+        `StagnationRestart`). The controller is started anew for each of the `restarts`
+        runs. While it can restart, reaching `max_attempts` does not end a run: the controller's `patience` decides
+        when the search has stagnated, and it is restarted. Once the controller has made `max_restarts` restarts,
+        the run stops after `max_attempts` attempts as usual. A controller with an unlimited `max_restarts` therefore
+        requires a finite `max_iters`, `max_time` or `max_fevals`. If `None`, the search is not restarted.
+
     Returns
     -------
     best_state: np.ndarray
@@ -116,6 +154,9 @@ def random_hill_climb(
         raise ValueError(f"init_state must have the same length as the problem. Expected {problem.get_length()}, got {len(init_state)}")
     if callback_user_info is not None and not isinstance(callback_user_info, dict):
         raise TypeError(f"callback_user_info must be a dict. Got {type(callback_user_info).__name__}")
+    budget = RunBudget(max_time, max_fevals, target_fitness)
+    if restart_controller is not None:
+        restart_controller.check_termination(max_iters, budget)
 
     # Set random seed
     if isinstance(random_state, int) and random_state > 0:
@@ -123,20 +164,28 @@ def random_hill_climb(
 
     best_fitness = -np.inf
     best_state = None
-    best_fitness_curve = []
-    all_curves = []
+    best_fitness_curve = np.empty((0, 2))
+    all_curves = curve_buffer if curve_buffer is not None else CurveBuffer()
+    all_curves.clear()
 
     problem.reset()
     for current_restart in range(restarts + 1):
-        # Initialize optimization problem
-        fevals = problem.fitness_evaluations
+        # Initialize optimization problem, adding the evaluations of the restart to those of the previous ones
         if init_state is None:
+            fevals = problem.fitness_evaluations
+            evaluation_stats = getattr(problem, "evaluation_stats", None)
             problem.reset()
+            if evaluation_stats is None:
+                problem.fitness_evaluations = fevals
+            else:
+                problem.fitness_evaluations += fevals
+                problem.evaluation_stats.merge(evaluation_stats)
         else:
             problem.set_state(init_state)
-        problem.fitness_evaluations = fevals
 
-        fitness_curve = []
+        fitness_curve = all_curves.empty_like()
+        if restart_controller is not None:
+            restart_controller.start(problem)
 
         # Prepare callback user data
         if state_fitness_callback is not None:
@@ -152,16 +201,17 @@ def random_hill_climb(
                 state=problem.get_state(),
                 fitness=problem.get_adjusted_fitness(),
                 fitness_evaluations=problem.fitness_evaluations,
-                curve=np.asarray(fitness_curve) if curve else None,
+                curve=fitness_curve.view() if curve else None,
                 user_data=callback_user_info,
             )
             if not continue_iterating:
-                return problem.get_state(), best_fitness, np.asarray(best_fitness_curve) if curve else None
+                return problem.get_state(), best_fitness, best_fitness_curve if curve else None
 
         attempts = 0
         iters = 0
-        # Main optimization loop
-        while attempts < max_attempts and iters < max_iters:
+        next_callback_iteration = get_next_callback_iteration(state_fitness_callback, 0)
+        # Main optimization loop, in which max_attempts only applies once the controller can no longer restart
+        while (attempts < max_attempts or (restart_controller is not None and restart_controller.can_restart)) and iters < max_iters:
             iters += 1
             problem.current_iteration += 1
 
@@ -172,50 +222,63 @@ def random_hill_climb(
             # If next state is better, move to that state and reset attempts counter
             current_fitness = problem.get_fitness()
             if next_fitness > current_fitness:
-                problem.set_state(next_state)
+                accept_state(problem, next_state, next_fitness)
                 attempts = 0
             else:
                 attempts += 1
 
+            # Restart from a perturbation of the best state of this run if the search has stagnated
+            if restart_controller is not None and restart_controller.update(problem):
+                restart_controller.restart(problem)
+                attempts = 0
+
             if curve:
                 adjusted_fitness = problem.get_adjusted_fitness()
-                curve_value = (adjusted_fitness, problem.fitness_evaluations)
-                fitness_curve.append(curve_value)
-                all_curves.append(curve_value)
+                fitness_curve.append(adjusted_fitness, problem.fitness_evaluations)
+                all_curves.append(adjusted_fitness, problem.fitness_evaluations)
+            budget_exhausted = budget.exhausted(problem)
+            target_reached = budget.target_reached(problem, problem.get_fitness())
 
             # Invoke callback
             if state_fitness_callback is not None:
-                max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop()
-                continue_iterating = state_fitness_callback(
-                    iteration=iters,
-                    attempt=attempts,
-                    done=max_attempts_reached,
-                    state=problem.get_state(),
-                    fitness=problem.get_adjusted_fitness(),
-                    fitness_evaluations=problem.fitness_evaluations,
-                    curve=np.asarray(all_curves) if curve else None,
-                    user_data=callback_user_info,
-                )
-                # Break out if requested
-                if not continue_iterating:
-                    break
-
-            # Terminate if problem signals to stop
-            if problem.can_stop():
+                attempts_exhausted = attempts >= max_attempts and (restart_controller is None or not restart_controller.can_restart)
+                max_attempts_reached = attempts_exhausted or iters == max_iters or problem.can_stop() or budget_exhausted or target_reached
+                if max_attempts_reached or iters >= next_callback_iteration:
+                    continue_iterating = state_fitness_callback(
+                        iteration=iters,
+                        attempt=attempts,
+                        done=max_attempts_reached,
+                        state=problem.get_state(),
+                        fitness=problem.get_adjusted_fitness(),
+                        fitness_evaluations=problem.fitness_evaluations,
+                        curve=all_curves.view() if curve else None,
+                        user_data=callback_user_info,
+                    )
+                    next_callback_iteration = get_next_callback_iteration(state_fitness_callback, iters)
+                    # Break out if requested
+                    if not continue_iterating:
+                        break
+
+            # Terminate if problem signals to stop, the budget is used up or the target fitness is reached
+            if problem.can_stop() or budget_exhausted or target_reached:
                 break
 
-        # Update best state and best fitness if current is better
-        current_fitness = problem.get_fitness()
+        # Update best state and best fitness if the best state of this run is better
+        if restart_controller is not None:
+            restart_controller.update(problem)
+            current_state, current_fitness = restart_controller.best_state, restart_controller.best_fitness
+        else:
+            current_state, current_fitness = problem.get_state(), problem.get_fitness()
         if current_fitness > best_fitness:
             best_fitness = current_fitness
-            best_state = problem.get_state()
+            best_state = current_state.copy()
             if curve:
-                best_fitness_curve = [*fitness_curve]
+                best_fitness_curve = fitness_curve.to_array()
 
-        # Break out if problem signals to stop
-        if problem.can_stop():
+        # Break out if problem signals to stop, the budget is used up or the target fitness is reached
+        if problem.can_stop() or budget.exhausted(problem) or budget.target_reached(problem, best_fitness):
             break
 
     best_fitness *= problem.get_maximize()
 
-    return best_state, best_fitness, np.asarray(best_fitness_curve) if curve else None
+    return best_state, best_fitness, best_fitness_curve if curve else None
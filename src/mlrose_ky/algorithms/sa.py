@@ -7,6 +7,11 @@ from typing import Callable, Any
 
 import numpy as np
 
+from mlrose_ky.algorithms._budget import RunBudget
+from mlrose_ky.algorithms._callbacks import get_next_callback_iteration
+from mlrose_ky.algorithms._state import accept_state
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
+from mlrose_ky.algorithms.restarts import StagnationRestart
 from mlrose_ky.algorithms.decay import GeomDecay
 from mlrose_ky.decorators import short_name
 
@@ -22,6 +27,11 @@ def simulated_annealing(
     random_state: int = None,
     state_fitness_callback: Callable = None,
     callback_user_info: dict = None,
+    curve_buffer: CurveBuffer = None,
+    max_time: float = None,
+    max_fevals: int = None,
+    target_fitness: float = None,
+    restart_controller: StagnationRestart = None,
 ) -> tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use simulated annealing to find the optimum for a given optimization problem.
@@ -64,7 +74,8 @@ def simulated_annealing(
         - attempt: int
           The current number of consecutive unsuccessful attempts to find a better neighbor.
         - done: bool
-          True if the algorithm is about to terminate (max attempts reached, max iterations reached, or `problem.can_stop()` returns True);
+          True if the algorithm is about to terminate (max attempts, max iterations, max time, max fitness evaluations or
+          target fitness reached, or `problem.can_stop()` returns True);
           False otherwise.
         - state: np.ndarray
           The current state vector.
@@ -82,6 +93,33 @@ def simulated_annealing(
     callback_user_info: dict, default: None
         Dictionary of user-managed data passed as the `user_data` parameter of the callback function.
 
+    curve_buffer: CurveBuffer, default: None
+        Buffer the fitness curve is recorded in when `curve` is `True`, e.g. to decimate the curve of a long run
+        (see `CurveBuffer`). The buffer is cleared at the start of the run. If `None`, every point is recorded in a
+        new buffer.
+
+    max_time: float, default: None
+        Maximum number of seconds the run may take, checked once per iteration. If `None`, the run is not limited
+        in time.
+
+    max_fevals: int, default: None
+        Maximum number of fitness evaluations the run may make, checked once per iteration, so the last iteration
+        may exceed it. If `None`, the number of evaluations is not limited.
+
+    target_fitness: float, default: None
+        Fitness at which to stop, e.g. the known optimum of the problem. The run stops at the end of the iteration in
+        which the best fitness found reaches it: for a maximization problem when the fitness is at least
+        `target_fitness`, and for a minimization problem when it is at most `target_fitness`. If `None`, the run
+        does not stop at any fitness.
+
+    restart_controller: StagnationRestart, default: None
+        Controller that restarts the search from a perturbation of the best state found once it stagnates (see
+        `StagnationRestart`). Restarts do not reset the temperature schedule. While the controller can
+        restart, reaching `max_attempts` does not end the run: the controller's `patience` decides when the search has
+        stagnated, and it is restarted. Once the controller has made `max_restarts` restarts, the run stops after
+        `max_attempts` attempts as usual. A controller with an unlimited `max_restarts` therefore requires a finite
+        `max_iters`, `max_time` or `max_fevals`. If `None`, the search is not restarted.
+
     Returns
     -------
     best_state: np.ndarray
@@ -103,7 +141,8 @@ def simulated_annealing(
     - The `state_fitness_callback` function is also called before the optimization loop starts (iteration 0) with the initial
       state and fitness values.
     - The simulated annealing algorithm probabilistically accepts worse states as it explores the solution
-      space, with the probability decreasing over time according to the `schedule`.
+      space, with the probability decreasing over time according to the `schedule`. The best state visited is
+      returned, which may not be the state the algorithm terminates in.
 
     References
     ----------
@@ -119,18 +158,28 @@ def simulated_annealing(
         raise ValueError(f"init_state must have the same length as the problem. Expected {problem.get_length()}, got {len(init_state)}")
     if callback_user_info is not None and not isinstance(callback_user_info, dict):
         raise TypeError(f"callback_user_info must be a dict. Got {type(callback_user_info).__name__}")
+    budget = RunBudget(max_time, max_fevals, target_fitness)
+    if restart_controller is not None:
+        restart_controller.check_termination(max_iters, budget)
 
     # Set random seed for reproducibility
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
     # Initialize the optimization problem
-    fitness_curve = []
+    fitness_curve = curve_buffer if curve_buffer is not None else CurveBuffer()
+    fitness_curve.clear()
     if init_state is None:
         problem.reset()
     else:
         problem.set_state(init_state)
 
+    # Track the best state visited, as worse moves may be accepted, copying it only when it improves
+    best_fitness = problem.get_fitness()
+    best_state = problem.get_state().copy()
+    if restart_controller is not None:
+        restart_controller.start(problem)
+
     # Initial callback invocation (iteration 0)
     if state_fitness_callback is not None:
         if callback_user_info is None:
@@ -142,17 +191,18 @@ def simulated_annealing(
             state=problem.get_state(),
             fitness=problem.get_adjusted_fitness(),
             fitness_evaluations=problem.fitness_evaluations,
-            curve=np.asarray(fitness_curve) if curve else None,
+            curve=fitness_curve.view() if curve else None,
             user_data=callback_user_info,
         )
         if not continue_iterating:
             # Early termination as per callback request
-            return problem.get_state(), problem.get_maximize() * problem.get_fitness(), np.asarray(fitness_curve) if curve else None
+            return problem.get_state(), problem.get_maximize() * problem.get_fitness(), fitness_curve.to_array() if curve else None
 
-    # Main optimization loop
+    # Main optimization loop, in which max_attempts only applies once the controller can no longer restart
     attempts = 0
     iters = 0
-    while attempts < max_attempts and iters < max_iters:
+    next_callback_iteration = get_next_callback_iteration(state_fitness_callback, 0)
+    while (attempts < max_attempts or (restart_controller is not None and restart_controller.can_restart)) and iters < max_iters:
         # Evaluate the temperature at the current iteration
         temp = schedule.evaluate(iters)
         iters += 1
@@ -173,39 +223,52 @@ def simulated_annealing(
             # Decide whether to accept the new state
             if delta_e > 0 or np.random.uniform() < prob:
                 # Accept the new state
-                problem.set_state(next_state)
+                accept_state(problem, next_state, next_fitness)
                 attempts = 0  # Reset attempts since a move was made
             else:
                 # Reject the new state
                 attempts += 1  # Increment attempts since no move was made
 
+            # Restart from a perturbation of the best state if the search has stagnated
+            if restart_controller is not None and restart_controller.update(problem):
+                restart_controller.restart(problem)
+                attempts = 0
+
+            if problem.get_fitness() > best_fitness:
+                best_fitness = problem.get_fitness()
+                best_state = problem.get_state().copy()
+
         # Record fitness curve if requested
         if curve:
-            fitness_curve.append((problem.get_adjusted_fitness(), problem.fitness_evaluations))
+            fitness_curve.append(problem.get_adjusted_fitness(), problem.fitness_evaluations)
+        budget_exhausted = budget.exhausted(problem)
+        target_reached = budget.target_reached(problem, best_fitness)
 
         # Invoke callback function
         if state_fitness_callback is not None:
-            max_attempts_reached = attempts == max_attempts or iters == max_iters or problem.can_stop()
-            continue_iterating = state_fitness_callback(
-                iteration=iters,
-                attempt=attempts,
-                done=max_attempts_reached,
-                state=problem.get_state(),
-                fitness=problem.get_adjusted_fitness(),
-                fitness_evaluations=problem.fitness_evaluations,
-                curve=np.asarray(fitness_curve) if curve else None,
-                user_data=callback_user_info,
-            )
-            # Break out if callback requests termination
-            if not continue_iterating:
-                break
-
-        # Check if the problem signals to stop
-        if problem.can_stop():
+            attempts_exhausted = attempts >= max_attempts and (restart_controller is None or not restart_controller.can_restart)
+            max_attempts_reached = attempts_exhausted or iters == max_iters or problem.can_stop() or budget_exhausted or target_reached
+            if max_attempts_reached or iters >= next_callback_iteration:
+                continue_iterating = state_fitness_callback(
+                    iteration=iters,
+                    attempt=attempts,
+                    done=max_attempts_reached,
+                    state=problem.get_state(),
+                    fitness=problem.get_adjusted_fitness(),
+                    fitness_evaluations=problem.fitness_evaluations,
+                    curve=fitness_curve.view() if curve else None,
+                    user_data=callback_user_info,
+                )
+                next_callback_iteration = get_next_callback_iteration(state_fitness_callback, iters)
+                # Break out if callback requests termination
+                if not continue_iterating:
+                    break
+
+        # Check if the problem signals to stop, the budget is used up or the target fitness is reached
+        if problem.can_stop() or budget_exhausted or target_reached:
             break
 
-    # Prepare the final best state and fitness
-    best_state = problem.get_state()
-    best_fitness = problem.get_maximize() * problem.get_fitness()
+    # Return the best state visited rather than the final one
+    best_fitness = problem.get_maximize() * best_fitness
 
-    return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
+    return best_state, best_fitness, fitness_curve.to_array() if curve else None
@@ -0,0 +1,28 @@
+"""Benchmarks of the optimization algorithms and their kernels, runnable with `python -m mlrose_ky.bench`."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from .suite import (
+    ALGORITHMS,
+    DEFAULT_SIZES,
+    PROBLEMS,
+    BenchmarkCase,
+    BenchmarkResult,
+    build_cases,
+    get_environment,
+    load_results,
+    run_benchmarks,
+    run_case,
+    save_results,
+)
+from .kernels import (
+    KERNELS,
+    KernelComparison,
+    KernelResult,
+    compare_kernels,
+    format_comparison_report,
+    load_kernel_results,
+    run_kernels,
+    save_kernel_results,
+)
@@ -0,0 +1,147 @@
+"""
+Command-line entry point of the benchmark suites.
+
+`python -m mlrose_ky.bench [algorithms] --help` benchmarks the algorithms on generated problems, and
+`python -m mlrose_ky.bench kernels --help` micro-benchmarks the fitness functions and operators against a baseline.
+"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import argparse
+import sys
+
+from mlrose_ky.bench.kernels import (
+    BASELINE_FILENAME,
+    DEFAULT_LENGTHS,
+    DEFAULT_TOLERANCE,
+    KERNELS,
+    compare_kernels,
+    format_comparison_report,
+    load_kernel_results,
+    run_kernels,
+    save_kernel_results,
+)
+from mlrose_ky.bench.suite import ALGORITHMS, DEFAULT_SIZES, PROBLEMS, BenchmarkResult, build_cases, run_benchmarks, save_results
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    """Format a benchmark result as a row of the results table."""
+    peak_memory = "-" if result.peak_memory is None else f"{result.peak_memory / 1024:.0f}"
+    return (
+        f"{result.algorithm:<20} {result.problem:<17} {result.size:>5} {result.iterations:>6} {result.fitness_evaluations:>8} "
+        f"{result.time:>9.4f} {result.evaluations_per_second:>11.0f} {result.iterations_per_second:>10.1f} {peak_memory:>10}"
+    )
+
+
+def _run_algorithm_benchmarks(argv: list[str]) -> int:
+    """Run the algorithm benchmarks selected by the command-line arguments, print their results, and optionally save them."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mlrose_ky.bench [algorithms]", description="Benchmark the optimization algorithms on generated problems."
+    )
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=list(ALGORITHMS), help="algorithms to benchmark (default: all)")
+    parser.add_argument("-p", "--problems", nargs="+", choices=list(PROBLEMS), help="problems to benchmark on (default: all)")
+    parser.add_argument("-s", "--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="problem sizes (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the problems and algorithms (default: %(default)s)")
+    parser.add_argument("--max-iters", type=int, help="iterations of each run (default: each algorithm's own)")
+    parser.add_argument("--max-attempts", type=int, help="attempts at each step of each run (default: max-iters)")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="timed runs of each benchmark, the fastest is reported (default: %(default)s)"
+    )
+    parser.add_argument("--no-memory", action="store_true", help="do not measure peak memory")
+    parser.add_argument("-o", "--output", help="JSON file to save the results to")
+    args = parser.parse_args(argv)
+
+    try:
+        cases = build_cases(args.algorithms, args.problems, args.sizes)
+    except ValueError as e:
+        parser.error(str(e))
+
+    settings = {
+        "seed": args.seed,
+        "max_iters": args.max_iters,
+        "max_attempts": args.max_attempts,
+        "repeat": args.repeat,
+        "measure_memory": not args.no_memory,
+    }
+
+    print(
+        f"{'algorithm':<20} {'problem':<17} {'size':>5} {'iters':>6} {'fevals':>8} "
+        f"{'time (s)':>9} {'fevals/s':>11} {'iters/s':>10} {'peak (KiB)':>10}"
+    )
+    results = run_benchmarks(
+        cases,
+        callback=lambda result: print(_format_result(result), flush=True),
+        seed=args.seed,
+        max_iters=args.max_iters,
+        max_attempts=args.max_attempts,
+        repeat=args.repeat,
+        measure_memory=not args.no_memory,
+    )
+
+    if args.output:
+        save_results(results, args.output, settings=settings)
+        print(f"Saved: [{args.output}]")
+
+    return 0
+
+
+def _run_kernel_benchmarks(argv: list[str]) -> int:
+    """Run the kernel micro-benchmarks selected by the command-line arguments, and compare them with a baseline."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mlrose_ky.bench kernels",
+        description="Micro-benchmark the fitness functions, operators and MIMIC kernels, and flag regressions against a baseline.",
+    )
+    parser.add_argument("-k", "--kernels", nargs="+", choices=list(KERNELS), help="kernels to benchmark (default: all)")
+    parser.add_argument("-l", "--lengths", nargs="+", type=int, default=list(DEFAULT_LENGTHS), help="state lengths (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the kernels' inputs (default: %(default)s)")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="timed rounds of each kernel, the fastest is reported (default: %(default)s)"
+    )
+    parser.add_argument("-b", "--baseline", default=BASELINE_FILENAME, help="JSON file of the baseline (default: the packaged baseline)")
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="tolerated relative slowdown (default: %(default)s)"
+    )
+    parser.add_argument("-o", "--output", help="JSON file to save the results to, e.g. as a new baseline")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_kernels(args.kernels, args.lengths, seed=args.seed, repeat=args.repeat)
+    except ValueError as e:
+        parser.error(str(e))
+
+    comparisons = compare_kernels(results, load_kernel_results(args.baseline), args.tolerance)
+    print(format_comparison_report(comparisons))
+
+    if args.output:
+        save_kernel_results(results, args.output)
+        print(f"Saved: [{args.output}]")
+
+    return 1 if any(comparison.status == "regression" for comparison in comparisons) else 0
+
+
+def main(argv: list[str] = None) -> int:
+    """
+    Run the benchmark suite selected by the command-line arguments.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command-line arguments. By default, those the program was run with.
+
+    Returns
+    -------
+    int
+        The exit status, 1 if the kernel micro-benchmarks found regressions, otherwise 0.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "kernels":
+        return _run_kernel_benchmarks(argv[1:])
+    if argv and argv[0] == "algorithms":
+        argv = argv[1:]
+
+    return _run_algorithm_benchmarks(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
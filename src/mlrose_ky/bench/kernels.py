@@ -0,0 +1,415 @@
+"""Functions for micro-benchmarking the fitness functions, operators and MIMIC estimation kernels, and comparing them to baselines."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import json
+import os
+import timeit
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import numpy as np
+
+from mlrose_ky.algorithms.crossovers import OnePointCrossOver, TSPCrossOver, UniformCrossOver
+from mlrose_ky.algorithms.mutators import ChangeOneMutator, DiscreteMutator, ShiftOneMutator, SwapMutator
+from mlrose_ky.bench.suite import get_environment
+from mlrose_ky.fitness import ContinuousPeaks, FlipFlop, FourPeaks, Knapsack, MaxKColor, OneMax, Queens, SixPeaks, TravellingSales
+from mlrose_ky.opt_probs import DiscreteOpt, TSPOpt
+
+DEFAULT_LENGTHS = (16, 32, 64)
+DEFAULT_TOLERANCE = 0.5
+
+# The baseline shipped with the package, to compare measurements with when no other baseline is given
+BASELINE_FILENAME = os.path.join(os.path.dirname(__file__), "baselines", "kernels.json")
+
+
+def _random_bits(rng: np.random.Generator, length: int) -> np.ndarray:
+    """Return a random state of length bits."""
+    return rng.integers(0, 2, length)
+
+
+def _make_fitness(fitness_class: type) -> Callable[[int, np.random.Generator], Any]:
+    """Return a function making a fitness function of the given class for a state length, with its input states."""
+
+    def make(length: int, rng: np.random.Generator) -> tuple[Any, np.ndarray]:
+        if fitness_class is Knapsack:
+            fitness = Knapsack(rng.integers(1, 25, length).tolist(), rng.integers(1, 10, length).tolist(), max_weight_pct=0.6)
+        elif fitness_class is MaxKColor:
+            edges = {tuple(sorted(edge)) for edge in rng.integers(0, length, (2 * length, 2)).tolist() if edge[0] != edge[1]}
+            fitness = MaxKColor(sorted(edges))
+        elif fitness_class is TravellingSales:
+            fitness = TravellingSales(coords=[tuple(coord) for coord in rng.uniform(0, 250, (length, 2)).tolist()])
+        else:
+            fitness = fitness_class()
+
+        if fitness_class is TravellingSales or fitness_class is Queens:
+            states = np.array([rng.permutation(length) for _ in range(100)])
+        elif fitness_class is MaxKColor:
+            states = rng.integers(0, 4, (100, length))
+        else:
+            states = rng.integers(0, 2, (100, length))
+
+        return fitness, states
+
+    return make
+
+
+def _fitness_kernel(fitness_class: type) -> Callable[[int, np.random.Generator], Callable[[], Any]]:
+    """Return the setup of the benchmark of a fitness function's evaluate, on one state at a time."""
+    make = _make_fitness(fitness_class)
+
+    def setup(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+        fitness, states = make(length, rng)
+        state = states[0]
+        return lambda: fitness.evaluate(state)
+
+    return setup
+
+
+def _batched_fitness_kernel(fitness_class: type) -> Callable[[int, np.random.Generator], Callable[[], Any]]:
+    """Return the setup of the benchmark of a fitness function's evaluate_many, on a population of states."""
+    make = _make_fitness(fitness_class)
+
+    def setup(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+        fitness, states = make(length, rng)
+        return lambda: fitness.evaluate_many(states)
+
+    return setup
+
+
+def _crossover_kernel(crossover_class: type) -> Callable[[int, np.random.Generator], Callable[[], Any]]:
+    """Return the setup of the benchmark of a crossover's mate."""
+
+    def setup(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+        if crossover_class is TSPCrossOver:
+            problem = TSPOpt(length=length, coords=[tuple(coord) for coord in rng.uniform(0, 250, (length, 2)).tolist()])
+            p1, p2 = rng.permutation(length), rng.permutation(length)
+        else:
+            problem = DiscreteOpt(length, OneMax())
+            p1, p2 = _random_bits(rng, length), _random_bits(rng, length)
+        crossover = crossover_class(problem)
+        return lambda: crossover.mate(p1, p2)
+
+    return setup
+
+
+def _mutator_kernel(mutator_class: type) -> Callable[[int, np.random.Generator], Callable[[], Any]]:
+    """Return the setup of the benchmark of a mutator's mutate, at a mutation probability of 0.1."""
+
+    def setup(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+        mutator = mutator_class(DiscreteOpt(length, OneMax(), max_val=2))
+        child = _random_bits(rng, length)
+        return lambda: mutator.mutate(child.copy(), 0.1)
+
+    return setup
+
+
+def _mimic_problem(length: int, rng: np.random.Generator) -> DiscreteOpt:
+    """Return a problem whose kept sample is the top 20% of a population of 200, ready for MIMIC's estimation."""
+    problem = DiscreteOpt(length, FourPeaks())
+    problem.random_pop(200)
+    problem.find_top_pct(0.2)
+    return problem
+
+
+def _eval_node_probs_kernel(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+    """Set up the benchmark of DiscreteOpt.eval_node_probs."""
+    problem = _mimic_problem(length, rng)
+    return problem.eval_node_probs
+
+
+def _eval_node_probs_fast_kernel(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+    """Set up the benchmark of DiscreteOpt.eval_node_probs in MIMIC fast mode."""
+    problem = _mimic_problem(length, rng)
+    problem.set_mimic_fast_mode(True)
+    return problem.eval_node_probs
+
+
+def _sample_pop_kernel(length: int, rng: np.random.Generator) -> Callable[[], Any]:
+    """Set up the benchmark of DiscreteOpt.sample_pop, drawing a population of 200."""
+    problem = _mimic_problem(length, rng)
+    problem.eval_node_probs()
+    return lambda: problem.sample_pop(200)
+
+
+_FITNESS_CLASSES = (ContinuousPeaks, FlipFlop, FourPeaks, Knapsack, MaxKColor, OneMax, Queens, SixPeaks, TravellingSales)
+
+# The benchmarked kernels, by name: a function that, given a state length and a random generator, sets up the
+# kernel's inputs and returns a function calling the kernel on them
+KERNELS: dict[str, Callable[[int, np.random.Generator], Callable[[], Any]]] = {
+    **{f"{cls.__name__}.evaluate": _fitness_kernel(cls) for cls in _FITNESS_CLASSES},
+    **{f"{cls.__name__}.evaluate_many": _batched_fitness_kernel(cls) for cls in _FITNESS_CLASSES if hasattr(cls, "evaluate_many")},
+    **{f"{cls.__name__}.mate": _crossover_kernel(cls) for cls in (UniformCrossOver, OnePointCrossOver, TSPCrossOver)},
+    **{f"{cls.__name__}.mutate": _mutator_kernel(cls) for cls in (ChangeOneMutator, DiscreteMutator, ShiftOneMutator, SwapMutator)},
+    "DiscreteOpt.eval_node_probs": _eval_node_probs_kernel,
+    "DiscreteOpt.eval_node_probs[fast]": _eval_node_probs_fast_kernel,
+    "DiscreteOpt.sample_pop": _sample_pop_kernel,
+}
+
+
+@dataclass
+class KernelResult:
+    """
+    The measurements of a kernel at a state length.
+
+    Parameters
+    ----------
+    kernel : str
+        Name of the kernel, a key of KERNELS.
+    length : int
+        Length of the states the kernel was run on.
+    time_per_call : float
+        Fastest time of a call to the kernel, in seconds.
+    calls_per_second : float
+        Calls per second at the fastest time.
+    calibration : float
+        Fastest time of the calibration workload, timed in rounds interleaved with the kernel's, in seconds.
+    """
+
+    kernel: str
+    length: int
+    time_per_call: float
+    calls_per_second: float
+    calibration: float
+
+
+@dataclass
+class KernelComparison:
+    """
+    The comparison of a kernel's measurement with its baseline.
+
+    Parameters
+    ----------
+    kernel : str
+        Name of the kernel.
+    length : int
+        Length of the states the kernel was run on.
+    time_per_call : float
+        Measured time of a call to the kernel, in seconds.
+    baseline_time_per_call : float | None
+        Baseline time of a call, scaled by the ratio of the measurement's calibration to the baseline's, or None if
+        there is no baseline.
+    ratio : float | None
+        Ratio of the measured time to the baseline time, or None if there is no baseline.
+    status : str
+        'regression' if the ratio exceeds 1 + tolerance, 'improvement' if it is below 1 / (1 + tolerance), 'new'
+        if there is no baseline, otherwise 'ok'.
+    """
+
+    kernel: str
+    length: int
+    time_per_call: float
+    baseline_time_per_call: float | None
+    ratio: float | None
+    status: str
+
+
+_CALIBRATION_DATA = np.random.default_rng(0).random(4096)
+
+
+def _calibration_workload() -> float:
+    """Run a fixed reference workload, mixing interpreted Python and NumPy, whose time measures the machine's speed."""
+    total = 0.0
+    for value in _CALIBRATION_DATA[:1024].tolist():
+        total += value * value
+
+    return total + float(np.sort(_CALIBRATION_DATA)[0]) + float(np.cumsum(_CALIBRATION_DATA)[-1])
+
+
+def _get_calls_per_round(timer: timeit.Timer, min_time: float) -> int:
+    """Return the number of calls of a timed function that last at least min_time."""
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            return number
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+
+def _measure(func: Callable[[], Any], repeat: int, min_time: float) -> tuple[float, float]:
+    """
+    Return the fastest time of a call to func, over repeat rounds of calls lasting at least min_time each, and the
+    fastest time of the calibration workload, over rounds interleaved with them.
+    """
+    timer, calibration_timer = timeit.Timer(func), timeit.Timer(_calibration_workload)
+    number = _get_calls_per_round(timer, min_time)
+    calibration_number = _get_calls_per_round(calibration_timer, min_time / 4)
+
+    times, calibration_times = [], []
+    for _ in range(repeat):
+        times.append(timer.timeit(number) / number)
+        calibration_times.append(calibration_timer.timeit(calibration_number) / calibration_number)
+
+    return min(times), min(calibration_times)
+
+
+def run_kernels(
+    kernels: list[str] = None, lengths: list[int] = DEFAULT_LENGTHS, seed: int = 1, repeat: int = 5, min_time: float = 0.1
+) -> list[KernelResult]:
+    """
+    Micro-benchmark each of the given kernels at each state length.
+
+    Each kernel is called in a loop on fixed inputs, generated with the seed outside the timing, until a round of
+    calls lasts at least min_time, and the fastest of repeat rounds is reported. A fixed calibration workload is
+    timed in rounds interleaved with the kernel's, so that comparisons with a baseline can account for the speed of
+    the machine, and for changes in its speed (e.g. due to other load) while the kernels are measured.
+
+    Parameters
+    ----------
+    kernels : list[str], optional
+        Names of the kernels to benchmark. By default, every kernel in KERNELS.
+    lengths : list[int], optional, default=(16, 32, 64)
+        State lengths to benchmark the kernels at.
+    seed : int, optional, default=1
+        Seed of the kernels' inputs.
+    repeat : int, optional, default=5
+        Number of timed rounds of calls.
+    min_time : float, optional, default=0.1
+        Minimum duration of a round of calls, in seconds.
+
+    Returns
+    -------
+    list[KernelResult]
+        The result of each kernel at each length.
+    """
+    kernels = list(KERNELS) if kernels is None else kernels
+    for name in kernels:
+        if name not in KERNELS:
+            raise ValueError(f"kernel must be one of {list(KERNELS)}, got {name}.")
+    for length in lengths:
+        if isinstance(length, bool) or not isinstance(length, int) or length < 4:
+            raise ValueError(f"length must be an integer of at least 4, got {length}.")
+    if isinstance(repeat, bool) or not isinstance(repeat, int) or repeat < 1:
+        raise ValueError(f"repeat must be a positive integer, got {repeat}.")
+
+    results = []
+    for name in kernels:
+        for length in lengths:
+            # Seed both generators, since some kernels (such as the mutators) draw from NumPy's global state
+            np.random.seed(seed)
+            func = KERNELS[name](length, np.random.default_rng(seed))
+            time_per_call, calibration = _measure(func, repeat=repeat, min_time=min_time)
+            results.append(KernelResult(name, length, time_per_call, 1 / time_per_call, calibration))
+
+    return results
+
+
+def save_kernel_results(results: list[KernelResult], filename: str):
+    """
+    Save kernel results to a JSON file, e.g. to be used as a baseline.
+
+    Parameters
+    ----------
+    results : list[KernelResult]
+        The results to save.
+    filename : str
+        Path of the JSON file.
+    """
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": get_environment(),
+        "results": [asdict(result) for result in results],
+    }
+    with open(filename, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def load_kernel_results(filename: str = BASELINE_FILENAME) -> list[KernelResult]:
+    """
+    Load the kernel results saved to a JSON file by save_kernel_results.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Path of the JSON file. By default, the baseline shipped with the package.
+
+    Returns
+    -------
+    list[KernelResult]
+        The saved results.
+    """
+    with open(filename) as report_file:
+        report = json.load(report_file)
+
+    return [KernelResult(**result) for result in report["results"]]
+
+
+def compare_kernels(
+    results: list[KernelResult], baseline: list[KernelResult], tolerance: float = DEFAULT_TOLERANCE
+) -> list[KernelComparison]:
+    """
+    Compare kernel results with a baseline, flagging the kernels that slowed down by more than the tolerance.
+
+    Baseline times are first scaled by the ratio of the results' calibration times to the baseline's, so that
+    results measured on a slower or busier machine than the baseline are not flagged as regressions.
+
+    Parameters
+    ----------
+    results : list[KernelResult]
+        The measured results.
+    baseline : list[KernelResult]
+        The baseline results.
+    tolerance : float, optional, default=0.5
+        Relative slowdown tolerated before a kernel is flagged as a regression.
+
+    Returns
+    -------
+    list[KernelComparison]
+        The comparison of each measured result.
+    """
+    if isinstance(tolerance, bool) or not isinstance(tolerance, (int, float)) or tolerance < 0:
+        raise ValueError(f"tolerance must be a non-negative number, got {tolerance}.")
+
+    baseline_results = {(result.kernel, result.length): result for result in baseline}
+
+    comparisons = []
+    for result in results:
+        baseline_result = baseline_results.get((result.kernel, result.length))
+        if baseline_result is None:
+            baseline_time, ratio, status = None, None, "new"
+        else:
+            baseline_time = baseline_result.time_per_call * result.calibration / baseline_result.calibration
+            ratio = result.time_per_call / baseline_time
+            if ratio > 1 + tolerance:
+                status = "regression"
+            elif ratio < 1 / (1 + tolerance):
+                status = "improvement"
+            else:
+                status = "ok"
+        comparisons.append(KernelComparison(result.kernel, result.length, result.time_per_call, baseline_time, ratio, status))
+
+    return comparisons
+
+
+def format_comparison_report(comparisons: list[KernelComparison]) -> str:
+    """
+    Format kernel comparisons as a table, followed by a summary of the regressions.
+
+    Parameters
+    ----------
+    comparisons : list[KernelComparison]
+        The comparisons to format.
+
+    Returns
+    -------
+    str
+        The report.
+    """
+    lines = [f"{'kernel':<34} {'length':>6} {'time (us)':>11} {'baseline (us)':>14} {'ratio':>7}  status"]
+    for comparison in comparisons:
+        baseline = "-" if comparison.baseline_time_per_call is None else f"{comparison.baseline_time_per_call * 1e6:.2f}"
+        ratio = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}"
+        lines.append(
+            f"{comparison.kernel:<34} {comparison.length:>6} {comparison.time_per_call * 1e6:>11.2f} {baseline:>14} {ratio:>7}  "
+            f"{comparison.status}"
+        )
+
+    regressions = [comparison for comparison in comparisons if comparison.status == "regression"]
+    if regressions:
+        lines.append(f"{len(regressions)} regression(s): " + ", ".join(f"{c.kernel}[{c.length}] x{c.ratio:.2f}" for c in regressions))
+    else:
+        lines.append("No regressions.")
+
+    return "\n".join(lines)
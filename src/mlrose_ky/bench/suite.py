@@ -0,0 +1,351 @@
+"""Functions for benchmarking the optimization algorithms on generated problems."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import inspect
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable
+
+import numpy as np
+
+from mlrose_ky.algorithms import genetic_alg, gradient_descent, hill_climb, mimic, random_hill_climb, simulated_annealing
+from mlrose_ky.algorithms.curve_buffer import CurveBuffer
+from mlrose_ky.generators import (
+    ContinuousPeaksGenerator,
+    FourPeaksGenerator,
+    KnapsackGenerator,
+    MaxKColorGenerator,
+    QueensGenerator,
+    SixPeaksGenerator,
+    TSPGenerator,
+)
+from mlrose_ky.neural.activation import relu
+from mlrose_ky.neural.fitness import NetworkWeights
+from mlrose_ky.opt_probs import ContinuousOpt
+
+DEFAULT_SIZES = (8, 16, 32)
+
+
+def _generate_network_weights_problem(size: int, seed: int) -> ContinuousOpt:
+    """Generate a problem of optimizing the weights of a network with one hidden layer of the given size."""
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-1, 1, (200, 8))
+    y = (X[:, :4].sum(axis=1) > 0).astype(int).reshape(-1, 1)
+    node_list = [X.shape[1] + 1, size, 1]
+    fitness = NetworkWeights(X, y, node_list, activation=relu, learning_rate=0.1)
+
+    n_weights = sum(n_in * n_out for n_in, n_out in zip(node_list[:-1], node_list[1:]))
+
+    return ContinuousOpt(length=n_weights, fitness_fn=fitness, maximize=False, min_val=-5, max_val=5, step=0.1)
+
+
+# The benchmark problems, by name: their kind and a function generating an instance of a given size with a given seed
+PROBLEMS: dict[str, tuple[str, Callable[[int, int], Any]]] = {
+    "tsp": ("discrete", lambda size, seed: TSPGenerator.generate(number_of_cities=size, seed=seed)),
+    "knapsack": ("discrete", lambda size, seed: KnapsackGenerator.generate(seed=seed, number_of_item_types=size)),
+    "max_k_color": ("discrete", lambda size, seed: MaxKColorGenerator.generate(seed=seed, number_of_nodes=size)),
+    "queens": ("discrete", lambda size, seed: QueensGenerator.generate(seed=seed, size=size)),
+    "four_peaks": ("discrete", lambda size, seed: FourPeaksGenerator.generate(seed=seed, size=size)),
+    "six_peaks": ("discrete", lambda size, seed: SixPeaksGenerator.generate(seed=seed, size=size)),
+    "continuous_peaks": ("discrete", lambda size, seed: ContinuousPeaksGenerator.generate(seed=seed, size=size)),
+    "network_weights": ("neural", _generate_network_weights_problem),
+}
+
+# The benchmarked algorithms, by name: the kind of problem they are run on, the function running them, and their
+# default number of iterations, chosen so that a run takes in the order of a second on the largest default size
+ALGORITHMS: dict[str, tuple[str, Callable, int]] = {
+    "hill_climb": ("discrete", hill_climb, 10),
+    "random_hill_climb": ("discrete", random_hill_climb, 1000),
+    "simulated_annealing": ("discrete", simulated_annealing, 1000),
+    "genetic_alg": ("discrete", genetic_alg, 20),
+    "mimic": ("discrete", mimic, 5),
+    "gradient_descent": ("neural", gradient_descent, 200),
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    An algorithm to benchmark on a problem of a given size.
+
+    Parameters
+    ----------
+    algorithm : str
+        Name of the algorithm, a key of ALGORITHMS.
+    problem : str
+        Name of the problem, a key of PROBLEMS.
+    size : int
+        Size of the problem, such as its number of cities, items, nodes or bits.
+    """
+
+    algorithm: str
+    problem: str
+    size: int
+
+    def __post_init__(self):
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {list(ALGORITHMS)}, got {self.algorithm}.")
+        if self.problem not in PROBLEMS:
+            raise ValueError(f"problem must be one of {list(PROBLEMS)}, got {self.problem}.")
+        if isinstance(self.size, bool) or not isinstance(self.size, int) or self.size < 2:
+            raise ValueError(f"size must be an integer greater than 1, got {self.size}.")
+        if ALGORITHMS[self.algorithm][0] != PROBLEMS[self.problem][0]:
+            raise ValueError(f"algorithm {self.algorithm} cannot be run on problem {self.problem}.")
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The measurements of a benchmark case.
+
+    Parameters
+    ----------
+    algorithm : str
+        Name of the algorithm.
+    problem : str
+        Name of the problem.
+    size : int
+        Size of the problem.
+    seed : int
+        Seed the problem was generated, and the algorithm run, with.
+    iterations : int
+        Number of iterations the algorithm ran.
+    fitness_evaluations : int
+        Number of fitness evaluations the algorithm made.
+    time : float
+        Fastest wall time of the repeated runs, in seconds.
+    evaluations_per_second : float
+        Fitness evaluations per second of the fastest run.
+    iterations_per_second : float
+        Iterations per second of the fastest run.
+    peak_memory : int | None
+        Peak memory allocated during a run, in bytes, or None if memory was not measured.
+    best_fitness : float
+        Best fitness the algorithm found.
+    """
+
+    algorithm: str
+    problem: str
+    size: int
+    seed: int
+    iterations: int
+    fitness_evaluations: int
+    time: float
+    evaluations_per_second: float
+    iterations_per_second: float
+    peak_memory: int | None
+    best_fitness: float
+
+
+def build_cases(algorithms: list[str] = None, problems: list[str] = None, sizes: list[int] = DEFAULT_SIZES) -> list[BenchmarkCase]:
+    """
+    Build the benchmark cases of every applicable combination of the given algorithms, problems and sizes.
+
+    Parameters
+    ----------
+    algorithms : list[str], optional
+        Names of the algorithms to benchmark. By default, every algorithm in ALGORITHMS.
+    problems : list[str], optional
+        Names of the problems to benchmark on. By default, every problem in PROBLEMS.
+    sizes : list[int], optional, default=(8, 16, 32)
+        Sizes of the problems.
+
+    Returns
+    -------
+    list[BenchmarkCase]
+        The cases, skipping the algorithms that cannot be run on a problem (such as gradient descent on a
+        discrete problem).
+    """
+    algorithms = list(ALGORITHMS) if algorithms is None else algorithms
+    problems = list(PROBLEMS) if problems is None else problems
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {list(ALGORITHMS)}, got {name}.")
+    for name in problems:
+        if name not in PROBLEMS:
+            raise ValueError(f"problem must be one of {list(PROBLEMS)}, got {name}.")
+
+    return [
+        BenchmarkCase(algorithm, problem, size)
+        for algorithm in algorithms
+        for problem in problems
+        for size in sizes
+        if ALGORITHMS[algorithm][0] == PROBLEMS[problem][0]
+    ]
+
+
+def _run_algorithm(case: BenchmarkCase, problem: Any, seed: int, max_iters: int, max_attempts: int) -> tuple[int, int, float, float]:
+    """Run a case's algorithm once, returning its iterations, fitness evaluations, wall time and best fitness."""
+    # Count the iterations with a curve buffer that records only the first point, so counting them costs next to nothing
+    iteration_counter = CurveBuffer(capacity=1, decimation="every", every=np.iinfo(np.int64).max)
+    algorithm = ALGORITHMS[case.algorithm][1]
+    kwargs = {"max_attempts": max_attempts} if "max_attempts" in inspect.signature(algorithm).parameters else {}
+
+    start = time.perf_counter()
+    _, best_fitness, _ = algorithm(problem, max_iters=max_iters, curve=True, random_state=seed, curve_buffer=iteration_counter, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    return iteration_counter.n_appended, problem.fitness_evaluations, elapsed, float(best_fitness)
+
+
+def run_case(
+    case: BenchmarkCase, seed: int = 1, max_iters: int = None, max_attempts: int = None, repeat: int = 3, measure_memory: bool = True
+) -> BenchmarkResult:
+    """
+    Benchmark an algorithm on a generated problem.
+
+    The problem is generated once, outside the timed runs. The algorithm is run repeat times with the same seed,
+    and the fastest run is reported, which is the least affected by other load on the machine. Peak memory is
+    measured with tracemalloc in an additional run, since tracing allocations slows the run down.
+
+    Parameters
+    ----------
+    case : BenchmarkCase
+        The algorithm, problem and size to benchmark.
+    seed : int, optional, default=1
+        Seed to generate the problem and run the algorithm with. Must be positive, for the runs to be reproducible.
+    max_iters : int, optional
+        Maximum number of iterations of each run. By default, the algorithm's default number of iterations in ALGORITHMS.
+    max_attempts : int, optional
+        Maximum number of attempts to find a better state at each step of each run, for the algorithms that have one.
+        By default, max_iters, so that runs are not cut short by a lucky or unlucky streak of attempts.
+    repeat : int, optional, default=3
+        Number of timed runs.
+    measure_memory : bool, optional, default=True
+        Whether to measure the peak memory allocated during a run.
+
+    Returns
+    -------
+    BenchmarkResult
+        The measurements of the fastest run.
+    """
+    if isinstance(seed, bool) or not isinstance(seed, int) or seed < 1:
+        raise ValueError(f"seed must be a positive integer, got {seed}.")
+    if isinstance(repeat, bool) or not isinstance(repeat, int) or repeat < 1:
+        raise ValueError(f"repeat must be a positive integer, got {repeat}.")
+
+    max_iters = ALGORITHMS[case.algorithm][2] if max_iters is None else max_iters
+    max_attempts = max_iters if max_attempts is None else max_attempts
+    problem = PROBLEMS[case.problem][1](case.size, seed)
+    runs = [_run_algorithm(case, problem, seed, max_iters, max_attempts) for _ in range(repeat)]
+    iterations, fitness_evaluations, elapsed, best_fitness = min(runs, key=lambda run: run[2])
+
+    peak_memory = None
+    if measure_memory:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        _run_algorithm(case, problem, seed, max_iters, max_attempts)
+        peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        algorithm=case.algorithm,
+        problem=case.problem,
+        size=case.size,
+        seed=seed,
+        iterations=int(iterations),
+        fitness_evaluations=int(fitness_evaluations),
+        time=elapsed,
+        evaluations_per_second=fitness_evaluations / elapsed if elapsed > 0 else float("inf"),
+        iterations_per_second=iterations / elapsed if elapsed > 0 else float("inf"),
+        peak_memory=peak_memory,
+        best_fitness=best_fitness,
+    )
+
+
+def run_benchmarks(cases: list[BenchmarkCase], callback: Callable[[BenchmarkResult], None] = None, **kwargs: Any) -> list[BenchmarkResult]:
+    """
+    Benchmark each of the given cases in turn.
+
+    Parameters
+    ----------
+    cases : list[BenchmarkCase]
+        The cases to benchmark.
+    callback : Callable[[BenchmarkResult], None], optional
+        Function called with the result of each case as soon as it is measured, e.g. to report progress.
+    **kwargs : Any
+        Arguments passed to run_case.
+
+    Returns
+    -------
+    list[BenchmarkResult]
+        The result of each case.
+    """
+    results = []
+    for case in cases:
+        result = run_case(case, **kwargs)
+        if callback is not None:
+            callback(result)
+        results.append(result)
+
+    return results
+
+
+def get_environment() -> dict[str, str]:
+    """Return the versions of the software the benchmarks are run with, to tell apart results from different setups."""
+    try:
+        mlrose_ky_version = version("mlrose-ky")
+    except PackageNotFoundError:
+        mlrose_ky_version = "unknown"
+
+    return {
+        "mlrose_ky": mlrose_ky_version,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def save_results(results: list[BenchmarkResult], filename: str, settings: dict[str, Any] = None):
+    """
+    Save benchmark results to a JSON file, along with the environment they were measured in.
+
+    Parameters
+    ----------
+    results : list[BenchmarkResult]
+        The results to save.
+    filename : str
+        Path of the JSON file.
+    settings : dict[str, Any], optional
+        The settings the benchmarks were run with, such as the seed and number of iterations.
+    """
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": get_environment(),
+        "settings": settings or {},
+        "results": [asdict(result) for result in results],
+    }
+    with open(filename, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def load_results(filename: str) -> list[BenchmarkResult]:
+    """
+    Load the benchmark results saved to a JSON file by save_results.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON file.
+
+    Returns
+    -------
+    list[BenchmarkResult]
+        The saved results.
+    """
+    with open(filename) as report_file:
+        report = json.load(report_file)
+
+    return [BenchmarkResult(**result) for result in report["results"]]
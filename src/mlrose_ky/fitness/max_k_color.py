@@ -7,6 +7,8 @@ from typing import Any
 
 import numpy as np
 
+from mlrose_ky.kernels import get_kernel
+
 
 class MaxKColor:
     """Fitness function for Max-K color optimization problem.
@@ -28,6 +30,10 @@ class MaxKColor:
     maximize : bool, optional, default=False
         Whether to maximize or minimize the fitness function.
 
+    kernel_backend : str | None, optional, default=None
+        Backend of the kernel that counts the edges (see `mlrose_ky.kernels`), e.g. 'numba'. If None, the backend set
+        with `set_kernel_backend` is used.
+
     Examples
     --------
     >>> edges = [(0, 1), (0, 2), (0, 4), (1, 3), (2, 0), (2, 3), (3, 4)]
@@ -52,7 +58,7 @@ class MaxKColor:
     the number of pairs of adjacent nodes of different colors are maximized.
     """
 
-    def __init__(self, edges: list[tuple[int, int]], maximize: bool = False):
+    def __init__(self, edges: list[tuple[int, int]], maximize: bool = False, kernel_backend: str = None):
         """
         Initialize the MaxKColor fitness function.
 
@@ -63,10 +69,16 @@ class MaxKColor:
 
         maximize : bool, optional, default=False
             Whether to maximize or minimize the fitness function.
+
+        kernel_backend : str | None, optional, default=None
+            Backend of the kernel that counts the edges, or None for the backend set with `set_kernel_backend`.
         """
         self.prob_type: str = "discrete"
         self.maximize: bool = maximize
         self.graph_edges: list[tuple[int, int]] | None = None
+        self.kernel_backend: str | None = kernel_backend
+        self._edge_array: np.ndarray | None = None
+        self._edge_array_source: list[tuple[int, int]] | None = None
 
         if not isinstance(edges, list) or not all(isinstance(edge, tuple) and len(edge) == 2 for edge in edges):
             raise TypeError(f"Expected edges to be a list of tuples of ints.")
@@ -96,14 +108,23 @@ class MaxKColor:
         if not isinstance(state, np.ndarray):
             raise TypeError(f"Expected state to be np.ndarray, got {type(state).__name__} instead.")
 
-        edges = self.graph_edges if self.graph_edges is not None else self.edges
+        # Maximize the number of adjacent nodes not of the same color, or minimize the number of those of the same color
+        return get_kernel("max_k_color", self.kernel_backend)(self._get_edge_array(), state, self.maximize)
+
+    def _get_edge_array(self) -> np.ndarray:
+        """Return the edges as an array of shape (n_edges, 2), converting them again only when they are replaced.
 
-        if self.maximize:
-            # Maximize the number of adjacent nodes not of the same color.
-            return float(sum(state[n1] != state[n2] for (n1, n2) in edges))
+        Returns
+        -------
+        np.ndarray
+            Array of the graph edges if a graph was set, or of the edges otherwise.
+        """
+        edges = self.graph_edges if self.graph_edges is not None else self.edges
+        if edges is not self._edge_array_source:
+            self._edge_array = np.array(edges, dtype=np.int64).reshape(-1, 2)
+            self._edge_array_source = edges
 
-        # Minimize the number of adjacent nodes of the same color.
-        return float(sum(state[n1] == state[n2] for (n1, n2) in edges))
+        return self._edge_array
 
     def get_prob_type(self) -> str:
         """Return the problem type.
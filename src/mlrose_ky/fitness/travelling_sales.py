@@ -7,6 +7,8 @@ from typing import Callable
 
 import numpy as np
 
+from mlrose_ky.kernels import get_kernel
+
 
 class TravellingSales:
     """
@@ -30,6 +32,10 @@ class TravellingSales:
         considered to be the same. If a pair is missing from the list, it is assumed that travel between the two nodes
         is not possible. This argument is ignored if coords is not None.
 
+    kernel_backend : str | None, optional
+        Backend of the kernel that evaluates tours from distances (see `mlrose_ky.kernels`), e.g. 'numba'. If None,
+        the backend set with `set_kernel_backend` is used.
+
     Examples
     --------
     >>> coords = [(0, 0), (3, 0), (3, 2), (2, 4), (1, 3)]
@@ -51,7 +57,7 @@ class TravellingSales:
        fitness function object.
     """
 
-    def __init__(self, coords: list[tuple] = None, distances: list[tuple] = None):
+    def __init__(self, coords: list[tuple] = None, distances: list[tuple] = None, kernel_backend: str = None):
         # Ensure that at least one of coords or distances is provided
         if coords is None and distances is None:
             raise ValueError("At least one of coords and distances must be specified.")
@@ -60,6 +66,7 @@ class TravellingSales:
         self.coords: list = coords
         self.distances: list = distances
         self.is_coords: bool = coords is not None
+        self.kernel_backend: str | None = kernel_backend
 
         # Determine which fitness calculation method to use
         self.calculate_fitness: Callable = self._calculate_fitness_by_coords if self.is_coords else self._calculate_fitness_by_distance
@@ -126,22 +133,7 @@ class TravellingSales:
         fitness : float
             Calculated fitness value. Returns np.inf if any segment of the tour is not possible.
         """
-        fitness = 0.0
-        num_nodes = len(state)
-
-        # Iterate over each node in the state
-        for i in range(num_nodes):
-            start = state[i]
-            end = state[(i + 1) % num_nodes]
-            distance = self.distance_matrix[start, end]
-
-            # Check if the segment is possible
-            if np.isinf(distance):
-                return np.inf
-
-            fitness += distance
-
-        return float(fitness)
+        return float(get_kernel("tsp_distance", self.kernel_backend)(self.distance_matrix, np.asarray(state)))
 
     def evaluate(self, state: np.ndarray) -> float:
         """
@@ -2,7 +2,8 @@
 GridSearchMixin: A mixin providing grid search functionality for a neural network runner.
 
 This mixin allows for parameter optimization through grid search, leveraging scikit-learn's
-GridSearchCV for cross-validated search over parameter grids.
+GridSearchCV for cross-validated search over parameter grids, or HalvingGridSearchCV for
+successive-halving searches that prune poorly performing candidates early.
 """
 
 import inspect
@@ -11,6 +12,7 @@ from typing import Callable, Any
 import numpy as np
 import sklearn.metrics as skmt
 import sklearn.model_selection as skms
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (enables skms.HalvingGridSearchCV)
 
 
 class GridSearchMixin:
@@ -41,8 +43,21 @@ class GridSearchMixin:
         self._get_y_argmax: bool = False
 
     def _perform_grid_search(
-        self, classifier: Any, x_train: np.ndarray, y_train: np.ndarray, cv: int, parameters: dict, n_jobs: int = 1, verbose: bool = False
-    ) -> skms.GridSearchCV:
+        self,
+        classifier: Any,
+        x_train: np.ndarray,
+        y_train: np.ndarray,
+        cv: int,
+        parameters: dict,
+        n_jobs: int = 1,
+        verbose: bool = False,
+        search_mode: str = "grid",
+        resource: str = "n_samples",
+        min_resources: int | str = "exhaust",
+        max_resources: int | str = "auto",
+        factor: int | float = 3,
+        fit_params: dict = None,
+    ) -> skms.GridSearchCV | skms.HalvingGridSearchCV:
         """
         Perform grid search with cross-validation on the provided classifier.
 
@@ -62,17 +77,51 @@ class GridSearchMixin:
             Number of jobs to run in parallel.
         verbose : bool, optional, default=1
             Whether to display verbose output during grid search.
+        search_mode : str, optional, default="grid"
+            Either 'grid', to evaluate every candidate with the full budget, or 'halving', to evaluate all candidates
+            with a small budget and only give the best 1/factor of them a larger budget at each successive round.
+        resource : str, optional, default="n_samples"
+            Budget increased at each successive-halving round: 'n_samples' or the name of an integer parameter of
+            the classifier (e.g. its maximum number of iterations). Only used when search_mode is 'halving'.
+        min_resources : int | str, optional, default="exhaust"
+            Budget given to every candidate in the first round. Only used when search_mode is 'halving'.
+        max_resources : int | str, optional, default="auto"
+            Maximum budget given to any candidate. Only used when search_mode is 'halving'.
+        factor : int | float, optional, default=3
+            Proportion of candidates eliminated (and budget multiplier) at each round. Only used when search_mode
+            is 'halving'.
+        fit_params : dict, optional, default=None
+            Additional arguments passed to the classifier's fit method. Arrays with one entry per row of x_train are
+            restricted to the rows of the training fold of each fit.
 
         Returns
         -------
-        skms.GridSearchCV
-            The fitted GridSearchCV object containing the results of the grid search.
+        skms.GridSearchCV | skms.HalvingGridSearchCV
+            The fitted search object containing the results of the grid search.
         """
         scorer = self.make_scorer()
-        search_results = skms.GridSearchCV(
-            classifier, parameters, cv=cv, scoring=scorer, n_jobs=n_jobs, return_train_score=True, verbose=verbose
-        )
-        search_results.fit(x_train, y_train)
+        if search_mode == "grid":
+            search_results = skms.GridSearchCV(
+                classifier, parameters, cv=cv, scoring=scorer, n_jobs=n_jobs, return_train_score=True, verbose=verbose
+            )
+        elif search_mode == "halving":
+            search_results = skms.HalvingGridSearchCV(
+                classifier,
+                parameters,
+                resource=resource,
+                min_resources=min_resources,
+                max_resources=max_resources,
+                factor=factor,
+                cv=cv,
+                scoring=scorer,
+                n_jobs=n_jobs,
+                return_train_score=True,
+                verbose=verbose,
+            )
+        else:
+            raise ValueError(f"search_mode must be one of {{'grid', 'halving'}}, got {search_mode}.")
+
+        search_results.fit(x_train, y_train, **(fit_params or {}))
         return search_results
 
     def make_scorer(self) -> Callable:
@@ -0,0 +1,6 @@
+"""Registry of the loop-bound kernels of fitness functions and operators, with optional compiled backends."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from .registry import available_kernel_backends, check_kernel_backend, get_kernel, get_kernel_backend, register_kernel, set_kernel_backend
@@ -0,0 +1,62 @@
+"""Numba implementations of the kernels, used by the 'numba' backend. Importing this module requires numba."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def tsp_distance(distance_matrix: np.ndarray, state: np.ndarray) -> float:
+    """Return the length of the tour visiting the nodes of state in order, or np.inf if a leg is not possible."""
+    fitness = 0.0
+    num_nodes = state.shape[0]
+    for i in range(num_nodes):
+        distance = distance_matrix[state[i], state[(i + 1) % num_nodes]]
+        if np.isinf(distance):
+            return np.inf
+        fitness += distance
+
+    return fitness
+
+
+@numba.njit(cache=True)
+def max_k_color(edges: np.ndarray, state: np.ndarray, maximize: bool) -> float:
+    """Return the number of edges whose nodes have different colors if maximize, or the same color otherwise."""
+    count = 0
+    for k in range(edges.shape[0]):
+        if (state[edges[k, 0]] == state[edges[k, 1]]) != maximize:
+            count += 1
+
+    return float(count)
+
+
+@numba.njit(cache=True)
+def tsp_mate_fill(p1: np.ndarray, p2: np.ndarray, n: int) -> np.ndarray:
+    """Return the route made of the first n cities of p1, followed by the other cities in the order of p2."""
+    visited = np.zeros(max(p1.max(), p2.max()) + 1, dtype=np.bool_)
+    child = np.empty(p1.shape[0], dtype=np.int64)
+    for i in range(n):
+        child[i] = p1[i]
+        visited[p1[i]] = True
+
+    j = n
+    for city in p2:
+        if not visited[city]:
+            child[j] = city
+            j += 1
+
+    return child
+
+
+@numba.njit(cache=True)
+def discrete_mutate(child: np.ndarray, indices: np.ndarray, offsets: np.ndarray, max_val: int) -> np.ndarray:
+    """Shift the genes of child at indices by offsets, modulo max_val, in place."""
+    for k in range(indices.shape[0]):
+        child[indices[k]] = (child[indices[k]] + offsets[k]) % max_val
+
+    return child
+
+
+KERNELS = {"tsp_distance": tsp_distance, "max_k_color": max_k_color, "tsp_mate_fill": tsp_mate_fill, "discrete_mutate": discrete_mutate}
@@ -0,0 +1,45 @@
+"""Pure NumPy implementations of the kernels, used by the 'numpy' backend and as the fallback of other backends."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+
+
+def tsp_distance(distance_matrix: np.ndarray, state: np.ndarray) -> float:
+    """Return the length of the tour visiting the nodes of state in order, or np.inf if a leg is not possible."""
+    legs = distance_matrix[state, np.roll(state, -1)]
+    if np.isinf(legs).any():
+        return np.inf
+
+    # Sum the legs in tour order (cumsum is sequential, unlike sum), so the length does not depend on the backend
+    return float(np.cumsum(legs)[-1])
+
+
+def max_k_color(edges: np.ndarray, state: np.ndarray, maximize: bool) -> float:
+    """Return the number of edges whose nodes have different colors if maximize, or the same color otherwise."""
+    same_color = state[edges[:, 0]] == state[edges[:, 1]]
+
+    return float(np.count_nonzero(same_color != maximize))
+
+
+def tsp_mate_fill(p1: np.ndarray, p2: np.ndarray, n: int) -> np.ndarray:
+    """Return the route made of the first n cities of p1, followed by the other cities in the order of p2."""
+    visited = np.zeros(max(p1.max(), p2.max()) + 1, dtype=bool)
+    visited[p1[:n]] = True
+
+    child = np.empty(len(p1), dtype=np.int64)
+    child[:n] = p1[:n]
+    child[n:] = p2[~visited[p2]]
+
+    return child
+
+
+def discrete_mutate(child: np.ndarray, indices: np.ndarray, offsets: np.ndarray, max_val: int) -> np.ndarray:
+    """Shift the genes of child at indices by offsets, modulo max_val, in place."""
+    child[indices] = (child[indices] + offsets) % max_val
+
+    return child
+
+
+KERNELS = {"tsp_distance": tsp_distance, "max_k_color": max_k_color, "tsp_mate_fill": tsp_mate_fill, "discrete_mutate": discrete_mutate}
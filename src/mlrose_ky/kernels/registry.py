@@ -0,0 +1,183 @@
+"""Functions for selecting the backend that implements the loop-bound kernels of fitness functions and operators."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from importlib import import_module
+from typing import Callable
+
+KERNEL_NAMES = ("tsp_distance", "max_k_color", "tsp_mate_fill", "discrete_mutate")
+
+_BACKEND_MODULES: dict[str, str] = {"numpy": "mlrose_ky.kernels._numpy_kernels", "numba": "mlrose_ky.kernels._numba_kernels"}
+
+_BACKEND_REQUIREMENTS: dict[str, str] = {"numba": "numba"}
+
+_KERNELS: dict[str, dict[str, Callable]] = {}
+
+_default_backend: str = "numpy"
+
+
+def _load_backend(backend: str) -> dict[str, Callable]:
+    """
+    Return the kernels of a backend, importing the backend's module the first time it is used.
+
+    Parameters
+    ----------
+    backend : str
+        Name of the backend.
+
+    Returns
+    -------
+    dict[str, Callable]
+        Kernels implemented by the backend, keyed by kernel name.
+
+    Raises
+    ------
+    ValueError
+        If the backend is neither a built-in backend nor one registered with register_kernel.
+    ImportError
+        If the backend requires a package that is not installed.
+    """
+    if backend not in _KERNELS:
+        if backend not in _BACKEND_MODULES:
+            raise ValueError(f"backend must be one of {sorted(set(_BACKEND_MODULES) | set(_KERNELS))}. Got {backend}")
+        try:
+            module = import_module(_BACKEND_MODULES[backend])
+        except ImportError as e:
+            package = _BACKEND_REQUIREMENTS.get(backend, backend)
+            raise ImportError(
+                f"The '{backend}' kernel backend requires {package}, which can be installed with `pip install {package}`."
+            ) from e
+        _KERNELS[backend] = dict(module.KERNELS)
+
+    return _KERNELS[backend]
+
+
+def register_kernel(name: str, backend: str, kernel: Callable):
+    """
+    Register an implementation of a kernel for a backend, e.g. to add a backend or replace a built-in kernel.
+
+    Parameters
+    ----------
+    name : str
+        Name of the kernel, one of KERNEL_NAMES.
+    backend : str
+        Name of the backend. A new backend only needs to implement some of the kernels; the others fall back to
+        their 'numpy' implementations.
+    kernel : Callable
+        Implementation of the kernel, taking the same arguments as its 'numpy' implementation.
+
+    Raises
+    ------
+    ValueError
+        If name is not one of KERNEL_NAMES.
+    """
+    if name not in KERNEL_NAMES:
+        raise ValueError(f"name must be one of {KERNEL_NAMES}. Got {name}")
+
+    kernels = _load_backend(backend) if backend in _BACKEND_MODULES else _KERNELS.setdefault(backend, {})
+    kernels[name] = kernel
+
+
+def available_kernel_backends() -> list[str]:
+    """
+    Return the backends that can be used, i.e. whose required packages are installed.
+
+    Returns
+    -------
+    list[str]
+        Names of the usable built-in and registered backends.
+    """
+    backends = []
+    for backend in dict.fromkeys([*_BACKEND_MODULES, *_KERNELS]):
+        try:
+            _load_backend(backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+
+    return backends
+
+
+def check_kernel_backend(backend: str):
+    """
+    Check that a backend can be used, importing its module if it was not yet used.
+
+    Parameters
+    ----------
+    backend : str
+        Name of the backend.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+    ImportError
+        If the backend requires a package that is not installed.
+    """
+    _load_backend(backend)
+
+
+def set_kernel_backend(backend: str):
+    """
+    Set the backend used by the objects whose kernel_backend is None, which is the default.
+
+    Parameters
+    ----------
+    backend : str
+        Name of the backend, e.g. 'numpy' (the default) or 'numba' (requires numba, and compiles each kernel on its
+        first call).
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+    ImportError
+        If the backend requires a package that is not installed.
+    """
+    global _default_backend
+
+    check_kernel_backend(backend)
+    _default_backend = backend
+
+
+def get_kernel_backend() -> str:
+    """
+    Return the backend used by the objects whose kernel_backend is None.
+
+    Returns
+    -------
+    str
+        Name of the backend.
+    """
+    return _default_backend
+
+
+def get_kernel(name: str, backend: str | None = None) -> Callable:
+    """
+    Return the implementation of a kernel for a backend.
+
+    Parameters
+    ----------
+    name : str
+        Name of the kernel, one of KERNEL_NAMES.
+    backend : str | None, optional, default=None
+        Name of the backend, or None for the backend set with set_kernel_backend.
+
+    Returns
+    -------
+    Callable
+        The backend's implementation of the kernel, or its 'numpy' implementation if the backend does not implement it.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+    ImportError
+        If the backend requires a package that is not installed.
+    """
+    kernels = _load_backend(_default_backend if backend is None else backend)
+    if name in kernels:
+        return kernels[name]
+
+    return _load_backend("numpy")[name]
@@ -3,8 +3,10 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
+import os
 from abc import ABC, abstractmethod
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
 
 import numpy as np
 from sklearn.base import BaseEstimator
@@ -76,6 +78,30 @@ class _NNBase(BaseEstimator, ABC):
 
         return [input_nodes] + hidden_nodes + [output_nodes]
 
+    @staticmethod
+    def _as_array(data: np.ndarray | str | os.PathLike) -> np.ndarray:
+        """
+        Convert data to an array without copying it.
+
+        Paths to ``.npy`` files are opened as read-only memory maps, so the data is read
+        from disk on demand rather than loaded into memory. Arrays (including
+        :class:`numpy.memmap` instances) are returned as-is.
+
+        Parameters
+        ----------
+        data : np.ndarray, str or os.PathLike
+            Array-like data, or the path of a ``.npy`` file.
+
+        Returns
+        -------
+        np.ndarray
+            The data as an array.
+        """
+        if isinstance(data, (str, os.PathLike)):
+            return np.load(data, mmap_mode="r")
+
+        return np.asarray(data)
+
     @staticmethod
     def _format_x_y_data(X: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
@@ -83,10 +109,11 @@ class _NNBase(BaseEstimator, ABC):
 
         Parameters
         ----------
-        X : np.ndarray
-            Feature dataset with each row representing a single observation.
-        y : np.ndarray
-            Data labels.
+        X : np.ndarray, str or os.PathLike
+            Feature dataset with each row representing a single observation, or the path of a ``.npy`` file
+            containing it.
+        y : np.ndarray, str or os.PathLike
+            Data labels, or the path of a ``.npy`` file containing them.
 
         Returns
         -------
@@ -100,7 +127,8 @@ class _NNBase(BaseEstimator, ABC):
         ValueError
             If the lengths of X and y do not match.
         """
-        y = np.array(y)
+        X = _NNBase._as_array(X)
+        y = _NNBase._as_array(y)
 
         if len(np.shape(y)) == 1:
             y = np.reshape(y, [len(y), 1])
@@ -120,6 +148,7 @@ class _NNBase(BaseEstimator, ABC):
         clip_max: float,
         bias: bool = False,
         is_classifier: bool = True,
+        batch_size: int = None,
     ) -> tuple[NetworkWeights, ContinuousOpt]:
         """
         Initialize the optimization problem and fitness function.
@@ -142,6 +171,8 @@ class _NNBase(BaseEstimator, ABC):
             Whether to include a bias term in the network.
         is_classifier : bool, optional, default=True
             Whether the network is a classifier.
+        batch_size : int, optional, default=None
+            Number of rows of X processed per forward pass. If None, X is processed all at once.
 
         Returns
         -------
@@ -150,7 +181,7 @@ class _NNBase(BaseEstimator, ABC):
         ContinuousOpt
             The continuous optimization problem for gradient descent.
         """
-        fitness = NetworkWeights(X, y, node_list, activation, bias, is_classifier, learning_rate=learning_rate)
+        fitness = NetworkWeights(X, y, node_list, activation, bias, is_classifier, learning_rate=learning_rate, batch_size=batch_size)
         num_nodes = _NNBase._calculate_state_size(node_list)
 
         problem = ContinuousOpt(
@@ -168,6 +199,8 @@ class _NNBase(BaseEstimator, ABC):
         output_activation: Callable,
         bias: bool = False,
         is_classifier: bool = True,
+        batch_size: int = None,
+        n_threads: int = 1,
     ) -> tuple[np.ndarray, np.ndarray | None]:
         """
         Predict data labels based on the fitted weights of the network.
@@ -188,6 +221,13 @@ class _NNBase(BaseEstimator, ABC):
             Whether to include a bias term in the network.
         is_classifier : bool, optional, default=True
             Whether the network is a classifier.
+        batch_size : int, optional, default=None
+            Number of rows of X passed through the network at a time. If None, X is processed all at once.
+            The outputs are written into a preallocated array, so only one chunk of intermediate layer
+            outputs is held in memory at a time (per thread).
+        n_threads : int, optional, default=1
+            Number of threads used to pass chunks through the network concurrently. NumPy releases the
+            GIL during matrix products, so threads speed up scoring of large inputs.
 
         Returns
         -------
@@ -200,32 +240,130 @@ class _NNBase(BaseEstimator, ABC):
             raise ValueError("node_list cannot be empty.")
 
         weights = list(unflatten_weights(fitted_weights, node_list))
+        n_rows = np.shape(X)[0]
+        y_pred = np.empty((n_rows, node_list[-1]))
+
+        def predict_chunk(rows: slice):
+            """Pass one chunk of rows through the network, writing the output into y_pred."""
+            y_pred[rows] = _NNBase._forward_pass(X[rows], weights, input_activation, output_activation, bias)
+
+        chunks = _NNBase._iter_chunks(n_rows, batch_size)
+        if n_threads > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                list(executor.map(predict_chunk, chunks))
+        else:
+            for rows in chunks:
+                predict_chunk(rows)
+
+        return _NNBase._label_predictions(y_pred, is_classifier)
+
+    @staticmethod
+    def _iter_predict(
+        X: np.ndarray,
+        fitted_weights: np.ndarray,
+        node_list: list[int],
+        input_activation: Callable,
+        output_activation: Callable,
+        bias: bool = False,
+        is_classifier: bool = True,
+        batch_size: int = None,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray | None]]:
+        """
+        Predict data labels chunk by chunk, yielding the predictions for each chunk of rows.
+
+        Takes the same parameters as :meth:`_predict`. Only one chunk of predictions is held in memory
+        at a time, so arbitrarily large (e.g. memory-mapped) inputs can be scored.
+
+        Yields
+        ------
+        y_pred : np.ndarray
+            Predicted labels for the chunk.
+        predicted_probs : np.ndarray or None
+            Predicted probabilities for the chunk, if the network is a classifier.
+        """
+        if not node_list:
+            raise ValueError("node_list cannot be empty.")
+
+        weights = list(unflatten_weights(fitted_weights, node_list))
+
+        for rows in _NNBase._iter_chunks(np.shape(X)[0], batch_size):
+            chunk_pred = _NNBase._forward_pass(X[rows], weights, input_activation, output_activation, bias)
+            yield _NNBase._label_predictions(chunk_pred, is_classifier)
+
+    @staticmethod
+    def _iter_chunks(n_rows: int, batch_size: int = None) -> Iterator[slice]:
+        """Yield row slices covering n_rows rows in chunks of batch_size rows (a single chunk if batch_size is None)."""
+        batch_size = max(n_rows if batch_size is None else int(batch_size), 1)
 
+        for start in range(0, max(n_rows, 1), batch_size):
+            yield slice(start, min(start + batch_size, n_rows))
+
+    @staticmethod
+    def _label_predictions(y_pred: np.ndarray, is_classifier: bool = True) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Convert network outputs into predicted labels.
+
+        Parameters
+        ----------
+        y_pred : np.ndarray
+            Output of the network.
+        is_classifier : bool, optional, default=True
+            Whether the network is a classifier.
+
+        Returns
+        -------
+        y_pred : np.ndarray
+            Predicted labels (the network outputs themselves for regression).
+        predicted_probs : np.ndarray or None
+            Predicted probabilities, if the network is a classifier.
+        """
+        if not is_classifier:
+            return y_pred, None
+
+        predicted_probs = y_pred
+
+        if np.shape(y_pred)[1] == 1:
+            y_pred = np.round(y_pred).astype(int)
+        else:
+            zeros = np.zeros_like(y_pred)
+            zeros[np.arange(len(y_pred)), np.argmax(y_pred, axis=1)] = 1
+            y_pred = zeros.astype(int)
+
+        return y_pred, predicted_probs
+
+    @staticmethod
+    def _forward_pass(
+        X: np.ndarray, weights: list[np.ndarray], input_activation: Callable, output_activation: Callable, bias: bool = False
+    ) -> np.ndarray:
+        """
+        Pass a chunk of feature rows through the network.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Feature rows.
+        weights : list of np.ndarray
+            Weight matrix of each layer of the network.
+        input_activation : Callable
+            Activation function for the hidden layers.
+        output_activation : Callable
+            Activation function for the output layer.
+        bias : bool, optional, default=False
+            Whether to include a bias term in the network.
+
+        Returns
+        -------
+        np.ndarray
+            Output of the network for the given rows.
+        """
         if bias:
             ones = np.ones([np.shape(X)[0], 1])
             inputs = np.hstack((X, ones))
         else:
             inputs = X
 
-        y_pred = np.empty(0)  # Initialize y_pred to prevent uninitialized warning
-        predicted_probs = None  # Initialize predicted_probs
-
         for i in range(len(weights)):
             outputs = np.dot(inputs, weights[i])
+            inputs = input_activation(outputs) if i < len(weights) - 1 else output_activation(outputs)
 
-            if i < len(weights) - 1:
-                inputs = input_activation(outputs)
-            else:
-                y_pred = output_activation(outputs)
-
-        if is_classifier:
-            predicted_probs = y_pred
-
-            if node_list[-1] == 1:
-                y_pred = np.round(y_pred).astype(int)
-            else:
-                zeros = np.zeros_like(y_pred)
-                zeros[np.arange(len(y_pred)), np.argmax(y_pred, axis=1)] = 1
-                y_pred = zeros.astype(int)
-
-        return y_pred, predicted_probs
+        return inputs
@@ -3,13 +3,14 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
-from typing import Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import numpy as np
 from sklearn.preprocessing import LabelBinarizer
 
 from mlrose_ky.algorithms.decay import GeomDecay
 from mlrose_ky.algorithms.ga import genetic_alg
+from mlrose_ky.algorithms.optimizers import SGD, Adam, Momentum, RMSProp
 from mlrose_ky.algorithms.rhc import random_hill_climb
 from mlrose_ky.algorithms.sa import simulated_annealing
 from mlrose_ky.neural._nn_base import _NNBase
@@ -43,6 +44,9 @@ class _NNCore(_NNBase):
         max_attempts: int = 10,
         random_state: int = None,
         curve: bool = False,
+        optimizer: str | Any = None,
+        batch_size: int = None,
+        n_threads: int = 1,
     ):
         super().__init__()
         self.hidden_nodes: list[int] = hidden_nodes if hidden_nodes is not None else []
@@ -62,6 +66,10 @@ class _NNCore(_NNBase):
         self.max_attempts: int = max_attempts
         self.random_state: int | None = random_state
         self.curve: bool = curve
+        self.optimizer_dict: dict[str, type] = {"sgd": SGD, "momentum": Momentum, "adam": Adam, "rmsprop": RMSProp}
+        self.optimizer: str | Any = optimizer
+        self.batch_size: int | None = batch_size
+        self.n_threads: int = n_threads
 
         self.node_list: list[int] = []
         self.fitted_weights: np.ndarray = np.array([])
@@ -92,6 +100,14 @@ class _NNCore(_NNBase):
             raise ValueError(f"mutation_prob must be between 0 and 1, got {self.mutation_prob}.")
         if self.activation not in self.activation_dict:
             raise ValueError(f"Activation function must be one of: 'identity', 'relu', 'sigmoid', or 'tanh', got {self.activation}.")
+        if self.batch_size is not None and (not isinstance(self.batch_size, int) or self.batch_size <= 0):
+            raise ValueError(f"batch_size must be a positive integer or None, got {self.batch_size}.")
+        if not isinstance(self.n_threads, int) or self.n_threads <= 0:
+            raise ValueError(f"n_threads must be a positive integer, got {self.n_threads}.")
+        if isinstance(self.optimizer, str) and self.optimizer not in self.optimizer_dict:
+            raise ValueError(f"Optimizer must be one of: 'sgd', 'momentum', 'adam', or 'rmsprop', got {self.optimizer}.")
+        if self.optimizer is not None and not isinstance(self.optimizer, str) and not hasattr(self.optimizer, "step"):
+            raise TypeError(f"optimizer must be a str or an optimizer object with a step method, got {type(self.optimizer).__name__}.")
         if self.algorithm not in ["random_hill_climb", "simulated_annealing", "genetic_alg", "gradient_descent"]:
             raise ValueError(
                 f"Algorithm must be one of: "
@@ -145,7 +161,15 @@ class _NNCore(_NNBase):
             np.random.seed(self.random_state)
 
         fitness, problem = self._build_problem_and_fitness_function(
-            X, y, node_list, self.activation_dict[self.activation], self.learning_rate, self.clip_max, self.bias, self.is_classifier
+            X,
+            y,
+            node_list,
+            self.activation_dict[self.activation],
+            self.learning_rate,
+            self.clip_max,
+            self.bias,
+            self.is_classifier,
+            batch_size=self.batch_size,
         )
 
         if self.algorithm == "random_hill_climb":
@@ -177,10 +201,18 @@ class _NNCore(_NNBase):
             max_iters=self.max_iters,
             curve=self.curve,
             init_state=init_weights,
+            optimizer=self._build_optimizer(),
         )
 
         return fitness_curve if fitness_curve is not None else [], fitted_weights, loss
 
+    def _build_optimizer(self) -> Any:
+        """Return the optimizer to use for gradient descent, or None to use fixed learning rate updates."""
+        if isinstance(self.optimizer, str):
+            return self.optimizer_dict[self.optimizer](learning_rate=self.learning_rate)
+
+        return self.optimizer
+
     def _run_with_ga(self, problem) -> tuple[np.ndarray | list, np.ndarray, float]:
         fitted_weights, loss, fitness_curve = genetic_alg(
             problem,
@@ -239,14 +271,15 @@ class _NNCore(_NNBase):
 
         Parameters
         ----------
-        X : np.ndarray
-            Feature dataset.
+        X : np.ndarray, str or os.PathLike
+            Feature dataset, or the path of a ``.npy`` file containing it (opened as a memory map).
 
         Returns
         -------
         np.ndarray
             Predicted data labels.
         """
+        X = self._as_array(X)
         if np.shape(X)[1] != (self.node_list[0] - self.bias):
             raise ValueError(f"The number of columns in X must equal {self.node_list[0] - self.bias}, got {np.shape(X)[1]}.")
 
@@ -258,8 +291,46 @@ class _NNCore(_NNBase):
             output_activation=self.output_activation,
             bias=self.bias,
             is_classifier=self.is_classifier,
+            batch_size=self.batch_size,
+            n_threads=self.n_threads,
         )
 
         self.predicted_probs = pp
 
         return y_pred
+
+    def iter_predict(self, X: np.ndarray, batch_size: int = None) -> Iterator[tuple[np.ndarray, np.ndarray | None]]:
+        """
+        Use model to predict data labels chunk by chunk.
+
+        Only one chunk of predictions is held in memory at a time, so arbitrarily large inputs
+        can be scored, e.g. writing each chunk to disk as it is produced.
+
+        Parameters
+        ----------
+        X : np.ndarray, str or os.PathLike
+            Feature dataset, or the path of a ``.npy`` file containing it (opened as a memory map).
+        batch_size : int, optional
+            Number of rows per chunk. Defaults to the model's batch_size (or a single chunk if that is None).
+
+        Yields
+        ------
+        y_pred : np.ndarray
+            Predicted data labels for the chunk.
+        predicted_probs : np.ndarray or None
+            Predicted probabilities for the chunk, if the model is a classifier.
+        """
+        X = self._as_array(X)
+        if np.shape(X)[1] != (self.node_list[0] - self.bias):
+            raise ValueError(f"The number of columns in X must equal {self.node_list[0] - self.bias}, got {np.shape(X)[1]}.")
+
+        yield from self._iter_predict(
+            X=X,
+            fitted_weights=self.fitted_weights,
+            node_list=self.node_list,
+            input_activation=self.activation_dict[self.activation],
+            output_activation=self.output_activation,
+            bias=self.bias,
+            is_classifier=self.is_classifier,
+            batch_size=self.batch_size if batch_size is None else batch_size,
+        )
@@ -8,6 +8,7 @@ from typing import Callable
 
 import numpy as np
 import sklearn.metrics as skm
+from scipy.special import xlogy
 
 from mlrose_ky.neural import activation as act
 from mlrose_ky.neural.utils import unflatten_weights
@@ -38,6 +39,13 @@ class NetworkWeights:
         classification and False for regression.
     learning_rate : float, default=0.1
         The learning rate for gradient descent updates.
+    batch_size : int, default=None
+        Number of rows of X processed per forward pass. If None, the whole of X is
+        processed at once. Setting a batch size streams X through the network in
+        chunks, so that X can be a memory-mapped array (see :class:`numpy.memmap`)
+        that is never fully loaded into memory. The loss and the gradient descent
+        updates are accumulated over the chunks, so they are identical to the
+        unchunked values.
     """
 
     def __init__(
@@ -49,6 +57,7 @@ class NetworkWeights:
         bias: bool = True,
         is_classifier: bool = True,
         learning_rate: float = 0.1,
+        batch_size: int = None,
     ):
         if not callable(activation):
             raise TypeError(f"Activation function must be callable, got {type(activation).__name__}.")
@@ -59,7 +68,7 @@ class NetworkWeights:
         if X.size == 0 or y.size == 0:
             raise ValueError("X and y cannot be empty.")
 
-        y = np.array(y)
+        y = np.asarray(y)
 
         if len(np.shape(y)) == 1:
             y = np.reshape(y, [len(y), 1])
@@ -78,6 +87,8 @@ class NetworkWeights:
             raise ValueError("is_classifier must be True or False.")
         if learning_rate <= 0:
             raise ValueError("learning_rate must be greater than 0.")
+        if batch_size is not None and (not isinstance(batch_size, (int, np.integer)) or batch_size <= 0):
+            raise ValueError(f"batch_size must be a positive integer or None, got {batch_size}.")
 
         self.X: np.ndarray = X
         self.y_true: np.ndarray = y
@@ -86,6 +97,7 @@ class NetworkWeights:
         self.bias: bool = bias
         self.is_classifier: bool = is_classifier
         self.learning_rate: float = learning_rate
+        self.batch_size: int | None = batch_size
 
         if self.is_classifier:
             self.loss: skm.log_loss = skm.log_loss
@@ -101,6 +113,17 @@ class NetworkWeights:
 
         self.nodes: int = sum(node_list[i] * node_list[i + 1] for i in range(len(node_list) - 1))
 
+        # Gradient buffer reused by calculate_gradient, and its per-layer views
+        self._gradient: np.ndarray = np.zeros(self.nodes)
+        self._gradient_views: list[np.ndarray] = list(unflatten_weights(self._gradient, self.node_list))
+
+        # Once calculate_gradient has been called, forward passes also keep the activation derivatives of the
+        # hidden layers, and chunked evaluations back propagate each chunk while it is in memory
+        self._track_gradient: bool = False
+        self._derivatives: list[np.ndarray] | None = None
+        self._gradient_ready: bool = False
+        self._delta_buffers: list[np.ndarray] = []
+
     def evaluate(self, state: np.ndarray) -> float:
         """
         Evaluate the fitness of a state.
@@ -120,21 +143,101 @@ class NetworkWeights:
 
         self.inputs_list = []
         self.weights = list(unflatten_weights(state, self.node_list))
+        self._gradient_ready = False
+
+        if self._is_chunked():
+            return self._evaluate_chunked()
+
+        self._derivatives = [] if self._track_gradient else None
+        self.inputs_list, self.y_pred = self._forward(self.X, self._derivatives)
+        return self.loss(self.y_true, self.y_pred)
+
+    def _is_chunked(self) -> bool:
+        """Return True if X is processed in chunks of batch_size rows."""
+        return self.batch_size is not None and self.batch_size < np.shape(self.X)[0]
+
+    def _iter_chunks(self):
+        """Yield row slices of X covering the whole dataset in chunks of batch_size rows."""
+        n_rows = np.shape(self.X)[0]
+        for start in range(0, n_rows, self.batch_size):
+            yield slice(start, min(start + self.batch_size, n_rows))
+
+    def _forward(self, X: np.ndarray, derivatives: list[np.ndarray] | None = None) -> tuple[list[np.ndarray], np.ndarray]:
+        """
+        Run a forward pass of X through the network using the current weights.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Feature rows to pass through the network.
+        derivatives : list of np.ndarray, optional
+            If given, the derivative of the activation function at the output of each hidden layer is appended to it.
+
+        Returns
+        -------
+        inputs_list : list of np.ndarray
+            Inputs to each layer of the network.
+        y_pred : np.ndarray
+            Output of the network.
+        """
+        inputs_list = []
 
         if self.bias:
-            ones = np.ones([np.shape(self.X)[0], 1])
-            inputs = np.hstack((self.X, ones))
+            ones = np.ones([np.shape(X)[0], 1])
+            inputs = np.hstack((X, ones))
         else:
-            inputs = self.X
+            inputs = X
 
         for i in range(len(self.weights)):
             outputs = np.dot(inputs, self.weights[i])
-            self.inputs_list.append(inputs)
+            inputs_list.append(inputs)
 
-            inputs = self.activation(outputs) if i < len(self.weights) - 1 else self.output_activation(outputs)
+            if i < len(self.weights) - 1:
+                inputs = self.activation(outputs)
+                if derivatives is not None:
+                    derivatives.append(self.activation(inputs, deriv=True))
+            else:
+                inputs = self.output_activation(outputs)
 
-        self.y_pred = inputs
-        return self.loss(self.y_true, self.y_pred)
+        return inputs_list, inputs
+
+    def _chunk_loss(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        """
+        Calculate the loss of a chunk of rows, summed over the rows of the chunk.
+
+        The calculation matches that of the full-dataset loss, but does not depend on every
+        class being present in the chunk.
+        """
+        if not self.is_classifier:
+            return float(np.sum(np.square(y_true - y_pred)) / np.shape(y_true)[1])
+
+        if np.shape(y_pred)[1] == 1:
+            y_true = np.hstack((1 - y_true, y_true))
+            y_pred = np.hstack((1 - y_pred, y_pred))
+
+        eps = np.finfo(y_pred.dtype).eps
+        return float(-np.sum(xlogy(y_true, np.clip(y_pred, eps, 1 - eps))))
+
+    def _evaluate_chunked(self) -> float:
+        """
+        Calculate the loss of the current weights by streaming X through the network in chunks.
+
+        Once the gradient is tracked, each chunk is also back propagated while it is in memory, so that
+        calculate_gradient does not need a second pass over X.
+        """
+        n_rows = np.shape(self.X)[0]
+        total_loss = 0.0
+
+        for i, rows in enumerate(self._iter_chunks()):
+            derivatives = [] if self._track_gradient else None
+            inputs_list, y_pred = self._forward(self.X[rows], derivatives)
+            total_loss += self._chunk_loss(self.y_true[rows], y_pred)
+            if self._track_gradient:
+                self._accumulate_gradient(inputs_list, y_pred, self.y_true[rows], derivatives, accumulate=i > 0)
+
+        self.y_pred = None
+        self._gradient_ready = self._track_gradient
+        return total_loss / n_rows
 
     def get_output_activation(self) -> Callable:
         """
@@ -162,6 +265,102 @@ class NetworkWeights:
         """
         Calculate gradient descent updates.
 
+        Returns
+        -------
+        list of np.ndarray
+            List of back propagation weight updates.
+        """
+        if not self._is_chunked():
+            return self._backward(self.inputs_list, self.y_pred, self.y_true)
+
+        updates_list = None
+
+        for rows in self._iter_chunks():
+            inputs_list, y_pred = self._forward(self.X[rows])
+            chunk_updates = self._backward(inputs_list, y_pred, self.y_true[rows])
+
+            if updates_list is None:
+                updates_list = chunk_updates
+            else:
+                for updates, chunk_update in zip(updates_list, chunk_updates):
+                    updates += chunk_update
+
+        return updates_list
+
+    def calculate_gradient(self) -> np.ndarray:
+        """
+        Calculate the gradient of the loss with respect to the flattened weights.
+
+        The gradient is calculated from the layer inputs stored by the most recent call to
+        :meth:`evaluate`, and is written into a buffer that is reused between calls, so the
+        returned array is overwritten by the next call. The gradient is summed over the rows
+        of X, so ``-learning_rate * calculate_gradient()`` equals the flattened output of
+        :meth:`calculate_updates`.
+
+        After the first call, :meth:`evaluate` keeps the activation derivatives of its forward
+        pass for the next call, and when X is processed in chunks it calculates the gradient
+        itself, as each chunk passes through the network.
+
+        Returns
+        -------
+        np.ndarray
+            Gradient of the loss, with the same layout as the state array.
+        """
+        self._track_gradient = True
+
+        if not self._is_chunked():
+            derivatives = self._derivatives
+            if derivatives is None:
+                derivatives = [self.activation(inputs, deriv=True) for inputs in self.inputs_list[1:]]
+            self._accumulate_gradient(self.inputs_list, self.y_pred, self.y_true, derivatives, accumulate=False)
+            return self._gradient
+
+        if not self._gradient_ready:
+            for i, rows in enumerate(self._iter_chunks()):
+                derivatives = []
+                inputs_list, y_pred = self._forward(self.X[rows], derivatives)
+                self._accumulate_gradient(inputs_list, y_pred, self.y_true[rows], derivatives, accumulate=i > 0)
+
+        return self._gradient
+
+    def _accumulate_gradient(
+        self, inputs_list: list[np.ndarray], y_pred: np.ndarray, y_true: np.ndarray, derivatives: list[np.ndarray], accumulate: bool
+    ):
+        """Back propagate the prediction error of a forward pass, writing or adding the gradient into the gradient buffer."""
+        deltas = self._get_delta_buffers(np.shape(y_pred)[0])
+        last = len(inputs_list) - 1
+        np.subtract(y_pred, y_true, out=deltas[last])
+
+        for i in range(last, -1, -1):
+            if i < last:
+                np.dot(deltas[i + 1], np.transpose(self.weights[i + 1]), out=deltas[i])
+                deltas[i] *= derivatives[i]
+
+            if accumulate:
+                self._gradient_views[i] += np.matmul(np.transpose(inputs_list[i]), deltas[i])
+            else:
+                np.matmul(np.transpose(inputs_list[i]), deltas[i], out=self._gradient_views[i])
+
+    def _get_delta_buffers(self, n_rows: int) -> list[np.ndarray]:
+        """Return the back propagation error buffers of each layer for n_rows rows, allocating them on first use."""
+        if not self._delta_buffers or len(self._delta_buffers[0]) < n_rows:
+            self._delta_buffers = [np.empty((n_rows, nodes)) for nodes in self.node_list[1:]]
+
+        return [buffer[:n_rows] for buffer in self._delta_buffers]
+
+    def _backward(self, inputs_list: list[np.ndarray], y_pred: np.ndarray, y_true: np.ndarray) -> list[np.ndarray]:
+        """
+        Back propagate the prediction error of a forward pass.
+
+        Parameters
+        ----------
+        inputs_list : list of np.ndarray
+            Inputs to each layer of the network, as returned by the forward pass.
+        y_pred : np.ndarray
+            Output of the network.
+        y_true : np.ndarray
+            True data labels for the rows of the forward pass.
+
         Returns
         -------
         list of np.ndarray
@@ -170,16 +369,16 @@ class NetworkWeights:
         delta_list: list = []
         updates_list: list = []
 
-        for i in range(len(self.inputs_list) - 1, -1, -1):
-            if i == len(self.inputs_list) - 1:
-                delta = self.y_pred - self.y_true
+        for i in range(len(inputs_list) - 1, -1, -1):
+            if i == len(inputs_list) - 1:
+                delta = y_pred - y_true
             else:
                 dot = np.dot(delta_list[-1], np.transpose(self.weights[i + 1]))
-                activation = self.activation(self.inputs_list[i + 1], deriv=True)
+                activation = self.activation(inputs_list[i + 1], deriv=True)
                 delta = dot * activation
 
             delta_list.append(delta)
-            updates = -self.learning_rate * np.dot(np.transpose(self.inputs_list[i]), delta)
+            updates = -self.learning_rate * np.dot(np.transpose(inputs_list[i]), delta)
             updates_list.append(updates)
 
         return updates_list[::-1]
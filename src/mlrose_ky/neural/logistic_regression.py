@@ -3,6 +3,8 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
+from typing import Any
+
 from sklearn.base import ClassifierMixin
 
 from mlrose_ky.algorithms.decay import GeomDecay
@@ -67,6 +69,20 @@ class LogisticRegression(_NNCore, ClassifierMixin):
         If True, a curve containing the fitness at each training iteration
         is returned.
 
+    optimizer : str or optimizer object, default=None
+        Update rule used with :code:`algorithm='gradient_descent'`. Either one
+        of 'sgd', 'momentum', 'adam' or 'rmsprop' (created with
+        :code:`learning_rate` as the step size), or an optimizer object such
+        as :code:`mlrose_ky.Adam(learning_rate=0.01)`. If None, the fixed
+        learning rate updates are used.
+
+    batch_size : int or None, default=None
+        Number of rows passed through the network at a time when fitting and
+        predicting. If None, the whole dataset is processed at once.
+
+    n_threads : int, default=1
+        Number of threads used to predict chunks of rows concurrently.
+
     Attributes
     ----------
     fitted_weights : np.ndarray
@@ -94,6 +110,9 @@ class LogisticRegression(_NNCore, ClassifierMixin):
         max_attempts: int = 10,
         random_state: int = None,
         curve: bool = False,
+        optimizer: str | Any = None,
+        batch_size: int = None,
+        n_threads: int = 1,
     ):
         # Initialize the LogisticRegression model with neural network configurations
         super().__init__(
@@ -112,4 +131,7 @@ class LogisticRegression(_NNCore, ClassifierMixin):
             max_attempts=max_attempts,
             random_state=random_state,
             curve=curve,
+            optimizer=optimizer,
+            batch_size=batch_size,
+            n_threads=n_threads,
         )
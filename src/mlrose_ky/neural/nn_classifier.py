@@ -3,7 +3,7 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
-from typing import Any, Optional, Callable
+from typing import Any, Callable, Iterator, Optional
 
 import numpy as np
 
@@ -39,6 +39,12 @@ class NNClassifier(_NNBase):
         Maximum value for clipping weights during optimization.
     seed : int or None, default=None
         Random seed for reproducibility.
+    batch_size : int or None, default=None
+        Number of rows passed through the network at a time during training and prediction. If None, the
+        whole dataset is processed at once. Combined with memory-mapped inputs (a :class:`numpy.memmap` or the
+        path of a ``.npy`` file), this allows training on datasets that do not fit in memory.
+    n_threads : int, default=1
+        Number of threads used to pass chunks of rows through the network concurrently during prediction.
     kwargs : dict, optional
         Additional arguments passed to the training functions.
     """
@@ -56,6 +62,8 @@ class NNClassifier(_NNBase):
         early_stopping: bool = False,
         clip_max: float = 1e10,
         seed: int = None,
+        batch_size: int = None,
+        n_threads: int = 1,
         **kwargs: Any,
     ):
         super().__init__()
@@ -87,6 +95,8 @@ class NNClassifier(_NNBase):
         self.loss: float | None = None
         self.fit_started_: bool = False
         self.seed: int | None = seed
+        self.batch_size: int | None = batch_size
+        self.n_threads: int = n_threads
 
         # Extra parameters
         self.kwargs: dict[str, Any] = kwargs
@@ -137,18 +147,23 @@ class NNClassifier(_NNBase):
         """
         return _NNBase._build_node_list(X=x_train, y=y_train, hidden_nodes=self.hidden_layer_sizes, bias=self.bias)
 
-    def fit(self, x_train: np.ndarray, y_train: np.ndarray = None, init_weights: np.ndarray = None) -> "NNClassifier":
+    def fit(
+        self, x_train: np.ndarray, y_train: np.ndarray = None, init_weights: np.ndarray = None, sample_ids: np.ndarray = None
+    ) -> "NNClassifier":
         """
         Fit the neural network classifier to the training data.
 
         Parameters
         ----------
-        x_train : np.ndarray
-            The training feature set.
-        y_train : np.ndarray, optional
-            The training label set.
+        x_train : np.ndarray, str or os.PathLike
+            The training feature set, or the path of a ``.npy`` file containing it (opened as a memory map).
+        y_train : np.ndarray, str or os.PathLike, optional
+            The training label set, or the path of a ``.npy`` file containing it.
         init_weights : np.ndarray, optional
             Initial weights for the network. If None, random weights are used.
+        sample_ids : np.ndarray, optional
+            Indices of the rows of x_train in the full training set, which identify the cross-validation fold being
+            fitted. Passed by NNGSRunner's grid search when warm starts are enabled.
 
         Returns
         -------
@@ -167,6 +182,7 @@ class NNClassifier(_NNBase):
             learning_rate=self.learning_rate_init,
             clip_max=self.clip_max,
             bias=self.bias,
+            batch_size=self.batch_size,
         )
         self.fitness_fn = fitness
         self.problem = problem
@@ -203,6 +219,8 @@ class NNClassifier(_NNBase):
         }
         max_attempts = self.max_attempts if self.early_stopping else self.max_iters
         self.fit_started_ = True
+        if sample_ids is not None:
+            params["sample_ids"] = sample_ids
 
         fitted_weights, loss, _ = self.runner.run_one_experiment_(
             algorithm=self.algorithm, problem=problem, max_iters=self.max_iters, max_attempts=max_attempts, total_args=total_args, **params
@@ -221,14 +239,15 @@ class NNClassifier(_NNBase):
 
         Parameters
         ----------
-        x_test : np.ndarray
-            The test feature set.
+        x_test : np.ndarray, str or os.PathLike
+            The test feature set, or the path of a ``.npy`` file containing it (opened as a memory map).
 
         Returns
         -------
         np.ndarray
             Predicted labels.
         """
+        x_test = self._as_array(x_test)
         if np.shape(x_test)[1] != (self.node_list[0] - self.bias):
             raise ValueError(f"The number of columns in X must equal {self.node_list[0] - self.bias}, got {np.shape(x_test)[1]}.")
 
@@ -239,20 +258,57 @@ class NNClassifier(_NNBase):
             input_activation=self.activation,
             output_activation=self.output_activation,
             bias=self.bias,
+            batch_size=self.batch_size,
+            n_threads=self.n_threads,
         )
 
         self.predicted_probabilities = pp
 
         return y_pred
 
+    def iter_predict(self, x_test: np.ndarray, batch_size: int = None) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Predict labels and class probabilities chunk by chunk.
+
+        Only one chunk of predictions is held in memory at a time, so arbitrarily large inputs
+        can be scored, e.g. writing each chunk to disk as it is produced.
+
+        Parameters
+        ----------
+        x_test : np.ndarray, str or os.PathLike
+            The test feature set, or the path of a ``.npy`` file containing it (opened as a memory map).
+        batch_size : int, optional
+            Number of rows per chunk. Defaults to the classifier's batch_size (or a single chunk if that is None).
+
+        Yields
+        ------
+        y_pred : np.ndarray
+            Predicted labels for the chunk.
+        predicted_probabilities : np.ndarray
+            Predicted probabilities for the chunk.
+        """
+        x_test = self._as_array(x_test)
+        if np.shape(x_test)[1] != (self.node_list[0] - self.bias):
+            raise ValueError(f"The number of columns in X must equal {self.node_list[0] - self.bias}, got {np.shape(x_test)[1]}.")
+
+        yield from self._iter_predict(
+            X=x_test,
+            fitted_weights=self.fitted_weights,
+            node_list=self.node_list,
+            input_activation=self.activation,
+            output_activation=self.output_activation,
+            bias=self.bias,
+            batch_size=self.batch_size if batch_size is None else batch_size,
+        )
+
     def predict_proba(self, x_test: np.ndarray) -> np.ndarray:
         """
         Predict class probabilities for the test feature set.
 
         Parameters
         ----------
-        x_test : np.ndarray
-            The test feature set.
+        x_test : np.ndarray, str or os.PathLike
+            The test feature set, or the path of a ``.npy`` file containing it.
 
         Returns
         -------
@@ -7,6 +7,8 @@ from typing import List, Tuple
 
 import numpy as np
 
+from mlrose_ky.algorithms._state import accept_state
+
 
 def flatten_weights(weights: List[np.ndarray]) -> np.ndarray:
     """
@@ -22,12 +24,10 @@ def flatten_weights(weights: List[np.ndarray]) -> np.ndarray:
     np.ndarray
         1D array of flattened weights.
     """
-    flat_weights = []
-
-    for weight in weights:
-        flat_weights += list(weight.flatten())
+    if len(weights) == 0:
+        return np.array([])
 
-    return np.array(flat_weights)
+    return np.concatenate([np.ravel(weight) for weight in weights])
 
 
 def unflatten_weights(flat_weights: np.ndarray, node_list: List[int]) -> List[np.ndarray]:
@@ -71,6 +71,7 @@ def gradient_descent_original(
     init_state: np.ndarray = None,
     curve: bool = False,
     random_state: int = None,
+    optimizer=None,
 ) -> Tuple[np.ndarray, float, np.ndarray | None]:
     """
     Use gradient descent to find the optimal neural network weights.
@@ -90,6 +91,9 @@ def gradient_descent_original(
         If True, returns a history of fitness values.
     random_state : int, default=None
         If provided, sets the random seed for reproducibility.
+    optimizer : optimizer object, default=None
+        Update rule used to turn the gradient of the loss into a step. If None, the fixed
+        learning rate updates returned by `problem.calculate_updates()` are used.
 
     Returns
     -------
@@ -113,6 +117,9 @@ def gradient_descent_original(
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
+    if optimizer is not None:
+        optimizer.reset()
+
     # Initialize problem
     if init_state is None:
         problem.reset()
@@ -130,7 +137,10 @@ def gradient_descent_original(
         iters += 1
 
         # Update weights
-        updates = flatten_weights(problem.calculate_updates())
+        if optimizer is None:
+            updates = flatten_weights(problem.calculate_updates())
+        else:
+            updates = optimizer.step(problem.calculate_gradient())
         next_state = problem.update_state(updates)
         next_fitness = problem.eval_fitness(next_state)
 
@@ -146,7 +156,7 @@ def gradient_descent_original(
         if curve:
             fitness_curve.append(problem.get_adjusted_fitness())
 
-        problem.set_state(next_state)
+        accept_state(problem, next_state, next_fitness)
 
     if curve:
         return best_state, best_fitness, np.asarray(fitness_curve)
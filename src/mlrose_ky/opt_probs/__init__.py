@@ -5,6 +5,7 @@
 
 from .continuous_opt import ContinuousOpt
 from .discrete_opt import DiscreteOpt
+from .evaluation_stats import EvaluationStats
 from .flip_flop_opt import FlipFlopOpt
 from .knapsack_opt import KnapsackOpt
 from .max_k_color_opt import MaxKColorOpt
@@ -3,10 +3,13 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
+from time import perf_counter_ns
 from typing import Any
 
 import numpy as np
 
+from mlrose_ky.opt_probs.evaluation_stats import EvaluationStats
+
 
 class _OptProb:
     """Base class for optimization problems.
@@ -45,6 +48,8 @@ class _OptProb:
         Dictionary for tracking function evaluations.
     fitness_evaluations : int
         Counter for the number of fitness evaluations.
+    evaluation_stats : EvaluationStats
+        Breakdown of the fitness evaluations by purpose, with their wall time and cache hits.
     current_iteration : int
         Current iteration number in the optimization process.
     """
@@ -67,6 +72,7 @@ class _OptProb:
         self.mate_probs: np.ndarray = np.array([])
         self.fevals: dict = {}
         self.fitness_evaluations: int = 0
+        self.evaluation_stats: EvaluationStats = EvaluationStats()
         self.current_iteration: int = 0
         self.maximize: float = 1.0 if maximize else -1.0
 
@@ -88,16 +94,18 @@ class _OptProb:
         np.ndarray
             State vector defining the best neighbor.
         """
-        fitness_list = [self.eval_fitness(neigh) for neigh in self.neighbors]
+        fitness_list = [self.eval_fitness(neigh, purpose="neighbor") for neigh in self.neighbors]
         return self.neighbors[np.argmax(fitness_list)]
 
-    def eval_fitness(self, state: np.ndarray) -> float:
+    def eval_fitness(self, state: np.ndarray, purpose: str = "acceptance") -> float:
         """Evaluate the fitness of a state vector.
 
         Parameters
         ----------
         state : np.ndarray
             State vector for evaluation.
+        purpose : str, default="acceptance"
+            Purpose the evaluation is counted under in evaluation_stats (see EvaluationStats).
 
         Returns
         -------
@@ -109,10 +117,17 @@ class _OptProb:
         if len(state) != self.length:
             raise ValueError(f"State length {len(state)} must match problem length {self.length}.")
 
+        start = perf_counter_ns()
         fitness = self.maximize * self.fitness_fn.evaluate(state)
+        self.evaluation_stats.record(purpose, perf_counter_ns() - start)
         self.fitness_evaluations += 1
         return fitness
 
+    def reset_evaluations(self) -> None:
+        """Clear the fitness evaluation counter and the evaluation accounting."""
+        self.fitness_evaluations = 0
+        self.evaluation_stats = EvaluationStats()
+
     def eval_mate_probs(self) -> None:
         """Calculate the probability of each member of the population reproducing."""
         pop_fitness = np.copy(self.pop_fitness)
@@ -228,7 +243,7 @@ class _OptProb:
 
     def evaluate_population_fitness(self) -> None:
         """Evaluate the fitness of the current population."""
-        self.pop_fitness = np.array([self.eval_fitness(indiv) for indiv in self.population])
+        self.pop_fitness = np.array([self.eval_fitness(indiv, purpose="population") for indiv in self.population])
 
     def set_state(self, new_state: np.ndarray) -> None:
         """Set a new state vector and evaluate its fitness.
@@ -242,7 +257,26 @@ class _OptProb:
             raise ValueError(f"new_state length {len(new_state)} must match problem length {self.length}")
 
         self.state = new_state
-        self.fitness = self.eval_fitness(self.state)
+        self.fitness = self.eval_fitness(self.state, purpose="reevaluation")
+
+    def _accept_state(self, new_state: np.ndarray, fitness: float) -> None:
+        """Set a new state vector whose fitness is already known, e.g. a candidate an algorithm has just evaluated.
+
+        The fitness is used instead of evaluating new_state again, which is counted as a cache hit.
+
+        Parameters
+        ----------
+        new_state : np.ndarray
+            New state vector.
+        fitness : float
+            Fitness of new_state, as returned by eval_fitness.
+        """
+        if len(new_state) != self.length:
+            raise ValueError(f"new_state length {len(new_state)} must match problem length {self.length}")
+
+        self.state = new_state
+        self.fitness = fitness
+        self.evaluation_stats.record_cache_hit()
 
     def can_stop(self) -> bool:
         """Determine if the optimization process can stop.
@@ -77,30 +77,28 @@ class ContinuousOpt(_OptProb):
         """
         return self.fitness_fn.calculate_updates()
 
-    def find_neighbors(self):
-        """Find all neighbors of the current state."""
-        # Pre-allocate a NumPy array for neighbors (maximum of 2 * length neighbors)
-        neighbors_matrix = np.zeros((2 * self.length, self.length))
-
-        neighbor_count = 0  # Track how many valid neighbors we find
-
-        for i in range(self.length):
-            base_neighbor = np.copy(self.state)
+    def calculate_gradient(self) -> np.ndarray:
+        """Calculate the gradient of the loss with respect to the state.
 
-            for step_dir in [-self.step, self.step]:
-                neighbor = base_neighbor.copy()
-                neighbor[i] += step_dir
+        Returns
+        -------
+        np.ndarray
+            Gradient of the loss, with the same layout as the state array.
+        """
+        return self.fitness_fn.calculate_gradient()
 
-                # Clip the value to ensure it remains within bounds
-                neighbor[i] = np.clip(neighbor[i], self.min_val, self.max_val)
+    def find_neighbors(self):
+        """Find all neighbors of the current state."""
+        # Each row of the neighbors matrix steps one element down (even rows) or up (odd rows), in element order
+        step_values = np.clip(self.state[:, np.newaxis] + np.array([-self.step, self.step]), self.min_val, self.max_val).ravel()
+        rows = np.arange(2 * self.length)
+        elements = rows // 2
 
-                # Only add if different from the current state
-                if not np.array_equal(neighbor, self.state):
-                    neighbors_matrix[neighbor_count] = neighbor
-                    neighbor_count += 1
+        neighbors_matrix = np.repeat(self.state[np.newaxis, :].astype(float), 2 * self.length, axis=0)
+        neighbors_matrix[rows, elements] = step_values
 
-        # Store only the valid neighbors (slice the array up to the count of valid ones)
-        self.neighbors = neighbors_matrix[:neighbor_count]
+        # Only keep the neighbors that differ from the current state, i.e. whose step was not clipped away
+        self.neighbors = neighbors_matrix[step_values != self.state[elements]]
 
     def get_prob_type(self) -> str:
         """Return the problem type.
@@ -130,19 +128,16 @@ class ContinuousOpt(_OptProb):
         np.ndarray
             State vector of the random neighbor.
         """
+        # Redraw steps clipped away at a bound, checking only the stepped element rather than copying the whole state
         while True:
-            neighbor = np.copy(self.state)
             i = np.random.randint(0, self.length)
-            neighbor[i] += self.step * np.random.choice([-1, 1])
-
-            if neighbor[i] > self.max_val:
-                neighbor[i] = self.max_val
-            elif neighbor[i] < self.min_val:
-                neighbor[i] = self.min_val
-
-            if not np.array_equal(neighbor, self.state):
+            value = min(max(self.state[i] + self.step * np.random.choice([-1, 1]), self.min_val), self.max_val)
+            if value != self.state[i]:
                 break
 
+        neighbor = self.state.astype(float)
+        neighbor[i] = value
+
         return neighbor
 
     def random_pop(self, pop_size: int):
@@ -161,17 +156,8 @@ class ContinuousOpt(_OptProb):
         if pop_size <= 0 or not isinstance(pop_size, int):
             raise ValueError("pop_size must be a positive integer.")
 
-        population = []
-        pop_fitness = []
-
-        for _ in range(pop_size):
-            state = self.random()
-            fitness = self.eval_fitness(state)
-            population.append(state)
-            pop_fitness.append(fitness)
-
-        self.population = np.array(population)
-        self.pop_fitness = np.array(pop_fitness)
+        self.population = np.random.uniform(self.min_val, self.max_val, (pop_size, self.length))
+        self.evaluate_population_fitness()
 
     def reproduce(self, parent_1: np.ndarray, parent_2: np.ndarray, mutation_prob: float = 0.1) -> np.ndarray:
         """Create a child state vector from two parent state vectors.
@@ -201,31 +187,86 @@ class ContinuousOpt(_OptProb):
         if len(parent_1) != self.length or len(parent_2) != self.length:
             raise ValueError("Lengths of parents must match problem length.")
 
+        return self.reproduce_batch(np.asarray(parent_1)[np.newaxis, :], np.asarray(parent_2)[np.newaxis, :], mutation_prob)[0]
+
+    def reproduce_batch(self, parents_1: np.ndarray, parents_2: np.ndarray, mutation_prob: float = 0.1) -> np.ndarray:
+        """Create a batch of children from pairs of parent state vectors, with one-point crossover and mutation.
+
+        Parameters
+        ----------
+        parents_1 : np.ndarray
+            Array of shape (n_children, length) of the first parent of each child.
+
+        parents_2 : np.ndarray
+            Array of shape (n_children, length) of the second parent of each child.
+
+        mutation_prob : float, default=0.1
+            Probability of a mutation at each state vector element during reproduction.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_children, length) of the children, where each child takes the elements of its first
+            parent up to a random crossover point, and those of its second parent after it.
+
+        Raises
+        ------
+        ValueError
+            If the shapes of the parents do not match each other or the problem length,
+            or if mutation_prob is not between 0 and 1.
+        """
+        parents_1, parents_2 = np.asarray(parents_1), np.asarray(parents_2)
+        if parents_1.shape != parents_2.shape or parents_1.ndim != 2 or parents_1.shape[1] != self.length:
+            raise ValueError("Shapes of parents must match each other and be (n_children, problem length).")
+
         if not (0 <= mutation_prob <= 1):
             raise ValueError("mutation_prob must be between 0 and 1.")
 
+        n_children = len(parents_1)
         if self.length > 1:
-            _n = np.random.randint(self.length - 1)
-            child = np.zeros(self.length)
-            child[0 : _n + 1] = parent_1[0 : _n + 1]
-            child[_n + 1 :] = parent_2[_n + 1 :]
+            crossover_points = np.random.randint(self.length - 1, size=n_children)
+            from_parent_1 = np.arange(self.length) <= crossover_points[:, np.newaxis]
         else:
-            child = np.copy(parent_1 if np.random.randint(2) == 0 else parent_2)
+            from_parent_1 = np.random.randint(2, size=(n_children, 1)) == 0
+        children = np.where(from_parent_1, parents_1, parents_2).astype(float)
+
+        return self.mutate_batch(children, mutation_prob)
+
+    def mutate_batch(self, children: np.ndarray, mutation_prob: float = 0.1) -> np.ndarray:
+        """Mutate a batch of state vectors in place, replacing each element with probability mutation_prob by a
+        random value.
+
+        Parameters
+        ----------
+        children : np.ndarray
+            Array of shape (n_children, length) of float state vectors to mutate.
 
-        # Mutate child
-        rand = np.random.uniform(size=self.length)
-        mutate = np.where(rand < mutation_prob)[0]
+        mutation_prob : float, default=0.1
+            Probability of a mutation at each state vector element.
+
+        Returns
+        -------
+        np.ndarray
+            The mutated state vectors.
+
+        Raises
+        ------
+        ValueError
+            If mutation_prob is not between 0 and 1.
+        """
+        if not (0 <= mutation_prob <= 1):
+            raise ValueError("mutation_prob must be between 0 and 1.")
 
-        for i in mutate:
-            child[i] = np.random.uniform(self.min_val, self.max_val)
+        mutate = np.random.uniform(size=children.shape) < mutation_prob
+        children[mutate] = np.random.uniform(self.min_val, self.max_val, np.count_nonzero(mutate))
 
-        return child
+        return children
 
     def reset(self):
         """Set the current state vector to a random value and reset its fitness."""
         self.state = self.random()
-        self.fitness_evaluations = 0
-        self.fitness = self.eval_fitness(self.state)
+        self.reset_evaluations()
+        self.fitness = self.eval_fitness(self.state, purpose="initial")
 
     def update_state(self, updates: np.ndarray) -> np.ndarray:
         """Update the current state given a vector of updates.
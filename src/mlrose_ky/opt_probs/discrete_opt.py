@@ -12,6 +12,7 @@ from sklearn.metrics import mutual_info_score
 
 from mlrose_ky.algorithms.crossovers import UniformCrossOver, TSPCrossOver
 from mlrose_ky.algorithms.mutators import SwapMutator
+from mlrose_ky.kernels import check_kernel_backend
 from mlrose_ky.opt_probs._opt_prob import _OptProb
 
 
@@ -99,9 +100,18 @@ class DiscreteOpt(_OptProb):
         self._mut_mask: np.ndarray | None = None
         self._mut_inf: np.ndarray | None = None
 
-    def eval_node_probs(self) -> None:
-        """Update probability density estimates."""
+    def eval_node_probs(self, profiler: Any = None) -> None:
+        """
+        Update probability density estimates.
+
+        Parameters
+        ----------
+        profiler : PhaseProfiler, optional, default=None
+            Profiler to record the computation of the mutual information matrix in, as its 'mutual_info' phase.
+        """
         mutual_info = self._get_mutual_info_impl()
+        if profiler is not None:
+            profiler.record("mutual_info")
 
         # Find minimum spanning tree of mutual info matrix
         csr_mx = csr_matrix(mutual_info)
@@ -154,6 +164,30 @@ class DiscreteOpt(_OptProb):
             self._get_mutual_info_impl = self._get_mutual_info_slow
             self._mut_inf = None
 
+    def set_kernel_backend(self, backend: str | None) -> None:
+        """
+        Set the kernel backend of the problem's fitness function, crossover and mutator, for those that have kernels.
+
+        Parameters
+        ----------
+        backend : str | None
+            Name of the backend (see `mlrose_ky.kernels`), e.g. 'numba', or None to use the backend set with
+            `set_kernel_backend`.
+
+        Raises
+        ------
+        ValueError
+            If the backend is unknown.
+        ImportError
+            If the backend requires a package that is not installed.
+        """
+        if backend is not None:
+            check_kernel_backend(backend)
+
+        for component in (self.fitness_fn, self._crossover, self._mutator):
+            if hasattr(component, "kernel_backend"):
+                component.kernel_backend = backend
+
     def _get_mutual_info_slow(self) -> np.ndarray:
         mutual_info = np.zeros([self.length, self.length])
 
@@ -326,7 +360,7 @@ class DiscreteOpt(_OptProb):
         for _ in range(pop_size):
             state = self.random()
             population.append(state)
-            fitness = self.eval_fitness(state)
+            fitness = self.eval_fitness(state, purpose="population")
             pop_fitness.append(fitness)
 
         self.population = np.array(population)
@@ -361,9 +395,9 @@ class DiscreteOpt(_OptProb):
     def reset(self) -> None:
         """Set the current state vector to a random value and get its fitness."""
         self.state = self.random()
-        self.fitness = self.eval_fitness(self.state)
+        self.reset_evaluations()
+        self.fitness = self.eval_fitness(self.state, purpose="initial")
         self.fevals = {}
-        self.fitness_evaluations = 0
         self.current_iteration = 0
 
     def sample_pop(self, sample_size: int) -> np.ndarray:
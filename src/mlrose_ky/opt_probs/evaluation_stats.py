@@ -0,0 +1,111 @@
+"""Class for accounting for the fitness evaluations of an optimization problem."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+EVALUATION_PURPOSES = ("initial", "neighbor", "population", "acceptance", "reevaluation")
+
+
+class EvaluationStats:
+    """
+    Accounting of the fitness evaluations of an optimization problem, split by purpose.
+
+    Problems record every fitness evaluation here, along with its wall time, so algorithms can be compared by the
+    compute they spend rather than by their number of iterations. Each evaluation is counted under one purpose:
+
+    - 'initial': evaluating the initial state of a run, or of a restart.
+    - 'neighbor': evaluating the neighbors of the current state, e.g. to find the best one.
+    - 'population': evaluating the members of a population.
+    - 'acceptance': evaluating a candidate state to decide whether to move to it, as the algorithms do by calling
+      eval_fitness directly. Direct calls to eval_fitness are counted under this purpose by default.
+    - 'reevaluation': evaluating a state passed to set_state.
+
+    The algorithms move the problem to the candidates they have just evaluated with _accept_state, which reuses their
+    fitness instead of evaluating them again; this is counted as a cache hit rather than an evaluation.
+
+    Attributes
+    ----------
+    counts : dict[str, int]
+        Number of evaluations made for each purpose.
+    time_ns : int
+        Total wall time spent evaluating the fitness function, in nanoseconds.
+    cache_hits : int
+        Number of evaluations avoided by accepting a state with a known fitness.
+    """
+
+    def __init__(self):
+        self.counts: dict[str, int] = dict.fromkeys(EVALUATION_PURPOSES, 0)
+        self.time_ns: int = 0
+        self.cache_hits: int = 0
+
+    def record(self, purpose: str, elapsed_ns: int, n: int = 1):
+        """
+        Record fitness evaluations.
+
+        Parameters
+        ----------
+        purpose : str
+            Purpose of the evaluations, usually one of EVALUATION_PURPOSES.
+        elapsed_ns : int
+            Wall time the evaluations took, in nanoseconds.
+        n : int, optional, default=1
+            Number of evaluations.
+        """
+        self.counts[purpose] = self.counts.get(purpose, 0) + n
+        self.time_ns += elapsed_ns
+
+    def record_cache_hit(self):
+        """Record an evaluation avoided by reusing a known fitness."""
+        self.cache_hits += 1
+
+    def merge(self, other: "EvaluationStats"):
+        """
+        Add the evaluations recorded by another instance to this one.
+
+        Parameters
+        ----------
+        other : EvaluationStats
+            The evaluations to add, e.g. those of the previous restarts of an algorithm.
+        """
+        for purpose, count in other.counts.items():
+            self.counts[purpose] = self.counts.get(purpose, 0) + count
+        self.time_ns += other.time_ns
+        self.cache_hits += other.cache_hits
+
+    def reset(self):
+        """Clear the recorded evaluations."""
+        self.counts = dict.fromkeys(EVALUATION_PURPOSES, 0)
+        self.time_ns = 0
+        self.cache_hits = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of evaluations, whatever their purpose."""
+        return sum(self.counts.values())
+
+    @property
+    def time(self) -> float:
+        """Total wall time spent evaluating the fitness function, in seconds."""
+        return self.time_ns / 1e9
+
+    @property
+    def evaluations_per_second(self) -> float:
+        """Number of evaluations per second of evaluation wall time, or 0 if no time was recorded."""
+        return self.total / self.time if self.time_ns > 0 else 0.0
+
+    def to_columns(self) -> dict[str, float]:
+        """
+        Return the recorded evaluations keyed by column name, for logging them alongside run statistics.
+
+        Returns
+        -------
+        dict[str, float]
+            The count of each purpose as 'FEvals_<purpose>', followed by 'FEvals_cache_hits', the evaluation wall
+            time in seconds as 'FEvals_time' and the evaluation throughput as 'FEvals_per_second'.
+        """
+        columns: dict[str, float] = {f"FEvals_{purpose}": count for purpose, count in self.counts.items()}
+        columns["FEvals_cache_hits"] = self.cache_hits
+        columns["FEvals_time"] = self.time
+        columns["FEvals_per_second"] = self.evaluations_per_second
+
+        return columns
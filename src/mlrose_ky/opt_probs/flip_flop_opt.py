@@ -3,6 +3,7 @@
 # Authors: Genevieve Hayes (modified by Andrew Rollings, Kyle Nakamura)
 # License: BSD 3-clause
 
+from time import perf_counter_ns
 from typing import Any
 
 import numpy as np
@@ -82,7 +83,10 @@ class FlipFlopOpt(DiscreteOpt):
 
     def evaluate_population_fitness(self):
         """Calculate fitness for the current population."""
+        start = perf_counter_ns()
         self.pop_fitness = self.fitness_fn.evaluate_many(self.population)
+        self.evaluation_stats.record("population", perf_counter_ns() - start, n=len(self.population))
+        self.fitness_evaluations += len(self.population)
 
     def random_pop(self, pop_size: int):
         """Create a population of random state vectors.
@@ -12,4 +12,7 @@ from .skmlp_runner import SKMLPRunner
 
 from ._nn_runner_base import _NNRunnerBase
 
-from .utils import build_data_filename
+from .result_sinks import ResultSink, PickleSink, CSVSink, ParquetSink, NpzSink
+from .curve_table import CurveTable
+from .state_store import StateStore, load_states
+from .utils import build_data_filename, load_journal
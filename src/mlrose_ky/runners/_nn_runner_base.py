@@ -16,6 +16,7 @@ import pandas as pd
 
 from mlrose_ky.gridsearch import GridSearchMixin
 from mlrose_ky.runners._runner_base import _RunnerBase
+from mlrose_ky.runners.result_sinks import ResultSink
 
 
 class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
@@ -56,6 +57,10 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         Whether to override the default CTRL+C handler.
     n_jobs : int
         Number of parallel jobs for grid search.
+    search_mode : str
+        Either 'grid' for an exhaustive grid search or 'halving' for a successive-halving search.
+    halving_factor : int
+        Proportion of candidates eliminated at each round of a successive-halving search.
     cv_results_df : pd.DataFrame | None
         DataFrame to store cross-validation results.
     best_params : dict | None
@@ -64,6 +69,10 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
 
     _interrupted_results: list = []
 
+    # Name of the classifier parameter holding the maximum number of training iterations ('max_iters' for the
+    # mlrose_ky classifiers, 'max_iter' for scikit-learn's), which a successive-halving search uses as its budget
+    _iteration_budget_param: str = "max_iters"
+
     def __init__(
         self,
         x_train: np.ndarray,
@@ -82,6 +91,10 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         override_ctrl_c_handler: bool = True,
         n_jobs: int = 1,
         replay: bool = False,
+        search_mode: str = "grid",
+        halving_factor: int = 3,
+        result_formats: str | ResultSink | list[str | ResultSink] = "pickle",
+        store_states: bool = False,
         **kwargs,
     ):
         """
@@ -121,9 +134,32 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
             Number of parallel jobs for grid search.
         replay : bool, optional, default=False
             Whether to replay previous results.
+        search_mode : str, optional, default="grid"
+            Either 'grid', to train every parameter combination for max(iteration_list) iterations on every fold, or
+            'halving', to train every combination for min(iteration_list) iterations and then repeatedly retrain only
+            the best 1/halving_factor of them with halving_factor times more iterations, up to max(iteration_list).
+            Only the bounds of iteration_list are used in 'halving' mode: the budget of round k is
+            min(iteration_list) * halving_factor**k whatever the other values in iteration_list, and each round trains
+            its candidates from scratch rather than from the weights of the previous round. Any maximum-iterations
+            values in grid_search_parameters are ignored in 'halving' mode.
+        halving_factor : int, optional, default=3
+            Proportion of candidates eliminated (and iteration budget multiplier) at each successive-halving round.
+        result_formats : str | ResultSink | list[str | ResultSink], optional, default="pickle"
+            File formats the result DataFrames are saved in: any of 'pickle', 'csv', 'parquet' (requires pyarrow)
+            and 'npz', and/or ResultSink instances. In replay mode, results are read from the first of these formats
+            found; formats other than pickle store object columns such as State as strings.
+        store_states : bool, optional, default=False
+            Whether logged network weights are saved to a deduplicated '<...>__states.npy' file, with the State
+            column of the run statistics holding row references into it instead of strings. The weights must be a
+            numeric array of the same shape at every logged iteration.
         **kwargs :
             Additional hyperparameters for grid search.
         """
+        if search_mode not in ("grid", "halving"):
+            raise ValueError(f"search_mode must be one of {{'grid', 'halving'}}, got {search_mode}.")
+        if isinstance(halving_factor, bool) or not isinstance(halving_factor, (int, np.integer)) or halving_factor < 2:
+            raise ValueError(f"halving_factor must be an integer greater than 1, got {halving_factor}.")
+
         super().__init__(
             problem=None,
             experiment_name=experiment_name,
@@ -134,6 +170,8 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
             replay=replay,
             override_ctrl_c_handler=override_ctrl_c_handler,
             copy_zero_curve_fitness_from_first=True,
+            result_formats=result_formats,
+            store_states=store_states,
         )
 
         GridSearchMixin.__init__(self, scorer_method=grid_search_scorer_method)
@@ -147,6 +185,8 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         self.cv: int = cv
         self.n_jobs: int = n_jobs
         self.verbose_grid_search: bool = verbose_grid_search
+        self.search_mode: str = search_mode
+        self.halving_factor: int = int(halving_factor)
         self.cv_results_df: pd.DataFrame | None = None
         self.best_params: dict | None = None
 
@@ -173,12 +213,12 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
                 run_start = time.perf_counter()
                 search_results = self._perform_grid_search(
                     classifier=self.classifier,
-                    parameters=self.grid_search_parameters,
                     x_train=self.x_train,
                     y_train=self.y_train,
                     cv=self.cv,
                     n_jobs=self.n_jobs,
                     verbose=self.verbose_grid_search,
+                    **self._get_search_arguments(),
                 )
                 run_end = time.perf_counter()
                 logging.info(f"Run time: {run_end - run_start}")
@@ -213,6 +253,46 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         finally:
             self._tear_down()
 
+    def _save_fit_results(self):
+        """
+        Saves the results logged by the current fit to its own files, which _tear_down keeps only for the best fit.
+
+        Each fit is run by its own copy of the runner, so these files hold the results of that fit alone.
+        """
+        if self._raw_run_stats or self._fitness_curves:
+            self._create_and_save_run_data_frames()
+
+    def _get_search_arguments(self) -> dict[str, Any]:
+        """
+        Builds the search arguments for the configured search mode.
+
+        In 'halving' mode, the maximum number of training iterations is the successive-halving budget and is removed
+        from the grid search parameters. Only min(iteration_list) and max(iteration_list) are passed on, as the
+        bounds of the budget: the rounds in between are spaced by halving_factor, not taken from iteration_list.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments for GridSearchMixin._perform_grid_search.
+        """
+        if self.search_mode != "halving":
+            return {"parameters": self.grid_search_parameters}
+
+        iterations = sorted(int(i) for i in self.iteration_list if i > 0)
+        if not iterations:
+            raise ValueError(f"iteration_list must contain a positive iteration count in 'halving' mode, got {self.iteration_list}.")
+
+        parameters = {k: v for k, v in self.grid_search_parameters.items() if k not in ("max_iters", "max_iter")}
+
+        return {
+            "parameters": parameters,
+            "search_mode": "halving",
+            "resource": self._iteration_budget_param,
+            "min_resources": iterations[0],
+            "max_resources": iterations[-1],
+            "factor": self.halving_factor,
+        }
+
     def _get_pickle_filename_root(self, name: str) -> str:
         """
         Generates a root filename for pickle files with a hash based on the current algorithm arguments.
@@ -281,7 +361,9 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         if not os.path.isdir(path) and path[0] != os.sep:
             path = f"{os.sep}{path}"
 
-        filenames = [fn for fn in os.listdir(str(path)) if (filename_part in fn and fn.endswith(".p") and "_df_" in fn)]
+        # The per-fit results are matched against the best parameters using the files of the first result format
+        sink = self._result_sinks[0]
+        filenames = [fn for fn in os.listdir(str(path)) if (filename_part in fn and fn.endswith(sink.extension) and "_df_" in fn)]
 
         if not filenames:
             raise FileNotFoundError(f"No matching filenames found in path: {path}")
@@ -292,17 +374,16 @@ class _NNRunnerBase(_RunnerBase, GridSearchMixin, ABC):
         incorrect_files = []
         for fn in filenames:
             filename = os.path.join(str(path), fn)
-            with open(filename, "rb") as pickle_file:
-                try:
-                    df = pk.load(pickle_file)
-                    found = self._check_match(df_best_params, df)
-                    (correct_files if found else incorrect_files).append(filename)
-                except (EOFError, pk.PickleError):
-                    pass
+            try:
+                df = sink.read(filename)
+                found = self._check_match(df_best_params, df)
+                (correct_files if found else incorrect_files).append(filename)
+            except (EOFError, OSError, ValueError, KeyError, ImportError, pk.PickleError):
+                pass
 
         # Extracts md5 hashes from correct and incorrect files for renaming or deletion
-        correct_md5s = {p.split("_")[-1][:-2] for p in correct_files}
-        incorrect_md5s = {p.split("_")[-1][:-2] for p in incorrect_files}
+        correct_md5s = {p.split("_")[-1][: -len(sink.extension)] for p in correct_files}
+        incorrect_md5s = {p.split("_")[-1][: -len(sink.extension)] for p in incorrect_files}
 
         # Remove files corresponding to incorrect md5 hashes
         all_incorrect_files = [
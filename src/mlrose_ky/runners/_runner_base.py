@@ -3,24 +3,34 @@
 # Authors: Andrew Rollings (modified by Kyle Nakamura)
 # License: BSD 3-clause
 
+import bisect
 import copy
 import ctypes
+import hashlib
 import inspect
 import itertools
+import json
 import logging
 import multiprocessing
 import os
 import pickle as pk
 import signal
+import sys
 import time
+import tracemalloc
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator
 
 import numpy as np
 import pandas as pd
 
+from mlrose_ky.algorithms.phase_profiler import PhaseProfiler
 from mlrose_ky.decorators import get_short_name
-from mlrose_ky.runners.utils import build_data_filename
+from mlrose_ky.runners.curve_table import CURVE_COLUMNS, CurveTable
+from mlrose_ky.runners.result_sinks import ResultSink, build_result_sinks
+from mlrose_ky.runners.state_store import StateStore
+from mlrose_ky.runners.utils import build_data_filename, JOURNAL_EXTENSION
 
 
 class _RunnerBase(ABC):
@@ -29,7 +39,10 @@ class _RunnerBase(ABC):
 
     This class provides a framework for setting up, running, and managing the lifecycle
     of optimization experiments. It handles tasks such as logging, error handling,
-    signal interruption, dynamic naming, and result saving to both pickle and CSV files.
+    signal interruption, dynamic naming, and result saving in one or more file formats
+    (pickle by default, or CSV, Parquet and compressed NumPy archives).
+    While an experiment is running, logged results are appended in batches to journal
+    files, which are replaced by the result files when the results are saved.
     The class is designed to be extended by concrete subclasses that implement the
     `run` method, which defines the specific behavior of the experiment.
 
@@ -45,6 +58,8 @@ class _RunnerBase(ABC):
         Stores the original signal handler for Ctrl-C.
     __sigint_params : tuple[int, Any] | None
         Stores the signal and frame parameters when Ctrl-C is triggered.
+    _MAX_CALLBACK_INTERVAL : int
+        Maximum number of iterations algorithms may run without calling the runner back.
     """
 
     __abort: multiprocessing.Value = multiprocessing.Value(ctypes.c_bool)
@@ -52,6 +67,8 @@ class _RunnerBase(ABC):
     __replay: multiprocessing.Value = multiprocessing.Value(ctypes.c_bool)
     __original_sigint_handler: Any = None
     __sigint_params: tuple[int, Any] | None = None
+    _MAX_CALLBACK_INTERVAL: int = 1000
+    _MEMORY_TOP_SITES: int = 10
 
     def __init__(
         self,
@@ -65,6 +82,15 @@ class _RunnerBase(ABC):
         copy_zero_curve_fitness_from_first: bool = False,
         replay: bool = False,
         override_ctrl_c_handler: bool = True,
+        flush_rows: int = 1000,
+        flush_interval: float = 60.0,
+        result_formats: str | ResultSink | list[str | ResultSink] = "pickle",
+        store_states: bool = False,
+        n_jobs: int = 1,
+        checkpoint: bool = False,
+        profile_phases: bool = False,
+        log_evaluations: bool = False,
+        profile_memory: bool = False,
         **kwargs: Any,
     ):
         """
@@ -93,6 +119,43 @@ class _RunnerBase(ABC):
             Whether to enable replay mode, default=False.
         override_ctrl_c_handler : bool, optional, default=True
             Whether to override the Ctrl-C signal handler.
+        flush_rows : int, optional, default=1000
+            Number of logged rows buffered in memory before they are appended to the journal files.
+        flush_interval : float, optional, default=60.0
+            Maximum number of seconds logged rows are buffered in memory before they are appended to the journal files.
+        result_formats : str | ResultSink | list[str | ResultSink], optional, default="pickle"
+            File formats the result DataFrames are saved in: any of 'pickle', 'csv', 'parquet' (requires pyarrow)
+            and 'npz', and/or ResultSink instances. In replay mode, results are read from the first of these formats
+            found; formats other than pickle store object columns such as State as strings.
+        store_states : bool, optional, default=False
+            Whether logged states are kept in a deduplicated state store, saved alongside the results as a
+            '<...>__states.npy' file (see load_states), with the State column of the run statistics holding each
+            state's row in that file instead of a string representation of the state. Every logged state must then
+            be a numeric array of the same shape, so ragged states (e.g. lists of layer weights) are rejected.
+        n_jobs : int, optional, default=1
+            Number of worker processes the parameter combinations of an experiment are distributed across, or -1
+            to use one per CPU. Each worker runs its combinations on its own copy of the problem.
+        checkpoint : bool, optional, default=False
+            Whether to save the results of each completed parameter combination to a checkpoint in the output
+            directory, so that an interrupted experiment skips the combinations it had completed when it is run
+            again. The checkpoint is removed once the experiment has completed.
+        profile_phases : bool, optional, default=False
+            Whether to time the phases of the iterations of algorithms that accept a profiler (see PhaseProfiler), adding
+            the cumulative time of each phase to the run statistics as 'Time_<phase>' columns.
+        log_evaluations : bool, optional, default=False
+            Whether to add the problem's fitness evaluation accounting (see EvaluationStats) to the run statistics:
+            the cumulative number of evaluations made for each purpose as 'FEvals_<purpose>' columns, along with
+            'FEvals_cache_hits', 'FEvals_time' and 'FEvals_per_second'. The same columns are added to the fitness
+            curves, at the points logged in the run statistics (they are NaN at the other points).
+        profile_memory : bool, optional, default=False
+            Whether to trace memory allocations with tracemalloc while the experiment runs, adding the current and
+            peak traced memory of each run (in bytes) to the run statistics as 'Memory_current' and 'Memory_peak'
+            columns, along with the peak resident set size of the process as 'Memory_max_rss' where the platform
+            reports it. The allocation sites holding the most memory at the logged iteration with the highest
+            traced memory are summarized in memory_summary_df (saved as 'memory_summary_df' in the output
+            directory) when the experiment ends. When n_jobs is not 1, each worker process traces its own
+            allocations, so the memory columns describe the worker that ran each combination, and no
+            memory_summary_df is produced. Tracing allocations slows the algorithms down noticeably.
         **kwargs : Any
             Additional keyword arguments for experiment configuration.
         """
@@ -103,12 +166,37 @@ class _RunnerBase(ABC):
         self.generate_curves: bool = generate_curves
         self.parameter_description_dict: dict[str, str] = {}
         self.override_ctrl_c_handler: bool = override_ctrl_c_handler
+        if isinstance(flush_rows, bool) or not isinstance(flush_rows, (int, np.integer)) or flush_rows < 1:
+            raise ValueError(f"flush_rows must be a positive integer, got {flush_rows}.")
+        if isinstance(flush_interval, bool) or not isinstance(flush_interval, (int, float)) or flush_interval < 0:
+            raise ValueError(f"flush_interval must be a non-negative number, got {flush_interval}.")
+        self.flush_rows: int = int(flush_rows)
+        self.flush_interval: float = float(flush_interval)
+        self._result_sinks: list[ResultSink] = build_result_sinks(result_formats)
+        self.store_states: bool = store_states
+        if isinstance(n_jobs, bool) or not isinstance(n_jobs, (int, np.integer)) or (n_jobs < 1 and n_jobs != -1):
+            raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}.")
+        self.n_jobs: int = int(n_jobs)
+        if checkpoint and output_directory is None:
+            raise ValueError(f"checkpoint requires an output_directory, got {output_directory}.")
+        self.checkpoint: bool = checkpoint
+        self.profile_phases: bool = profile_phases
+        self._profiler: PhaseProfiler | None = None
+        self.log_evaluations: bool = log_evaluations
+        self._evaluated_problem: Any = None
+        self.profile_memory: bool = profile_memory
+        self.memory_summary_df: pd.DataFrame | None = None
+        self._started_tracemalloc: bool = False
+        self._memory_snapshot: tracemalloc.Snapshot | None = None
+        self._memory_snapshot_size: int = -1
+        self._state_store: StateStore = StateStore()
 
         # Initialize output and state-tracking variables
         self.run_stats_df: pd.DataFrame | None = None
         self.curves_df: pd.DataFrame | None = None
+        self.curve_runs_df: pd.DataFrame | None = None
         self._raw_run_stats: list[dict[str, Any]] = []
-        self._fitness_curves: list[dict[str, Any]] = []
+        self._fitness_curves: CurveTable = CurveTable()
         self._curve_base: int = 0
         self._copy_zero_curve_fitness_from_first: bool = copy_zero_curve_fitness_from_first
         self._copy_zero_curve_fitness_from_first_original: bool = copy_zero_curve_fitness_from_first
@@ -119,7 +207,16 @@ class _RunnerBase(ABC):
         self._current_logged_algorithm_args: dict[str, Any] = {}
         self._run_start_time: float | None = None
         self._iteration_times: list[float] = []
+        self._last_callback_iteration: int = 0
+        self._logged_iterations: list[int] = []
+        self._logged_iteration_set: frozenset[int] = frozenset()
+        self._set_logged_iterations()
         self._first_curve_synthesized: bool = False
+        self._flushed_run_stats: int = 0
+        self._flushed_curves: int = 0
+        self._last_flush_time: float = time.monotonic()
+        self._journal_filenames: set[str] = set()
+        self._checkpoint_manifest: dict[str, Any] = {"config": {}, "completed": {}}
 
         if replay:
             self.set_replay_mode()
@@ -201,13 +298,27 @@ class _RunnerBase(ABC):
     def _setup(self):
         """Prepare the runner by clearing stats, setting up directories, and handling Ctrl-C interrupts."""
         self._raw_run_stats = []
-        self._fitness_curves = []
+        self._fitness_curves = CurveTable()
         self._curve_base = 0
+        self._flushed_run_stats = 0
+        self._flushed_curves = 0
+        self._last_flush_time = time.monotonic()
+        self._journal_filenames = set()
+        self._state_store.clear()
 
         self._iteration_times = []
+        self._set_logged_iterations()
         self._copy_zero_curve_fitness_from_first = self._copy_zero_curve_fitness_from_first_original
         self._current_logged_algorithm_args.clear()
 
+        if self.profile_memory:
+            self.memory_summary_df = None
+            self._memory_snapshot = None
+            self._memory_snapshot_size = -1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+
         # Create the output directory if it doesn't exist
         if self._output_directory is not None:
             if not os.path.exists(self._output_directory):
@@ -219,6 +330,11 @@ class _RunnerBase(ABC):
                 self.__original_sigint_handler = signal.getsignal(signal.SIGINT)
                 signal.signal(signal.SIGINT, self._ctrl_c_handler)
 
+    def _set_logged_iterations(self):
+        """Precompute the sorted iterations of iteration_list, and their set, used to decide which iterations to log."""
+        self._logged_iterations = sorted(set(self.iteration_list))
+        self._logged_iteration_set = frozenset(self._logged_iterations)
+
     def _ctrl_c_handler(self, sig: int, frame: Any):
         """
         Handle Ctrl-C interruptions by saving progress and aborting the run.
@@ -236,6 +352,14 @@ class _RunnerBase(ABC):
 
     def _tear_down(self):
         """Clean up after the experiment, restoring signal handlers and managing resources."""
+        try:
+            self._flush_results(force=True)
+        except OSError as e:
+            logging.error(f"Problem flushing results to the journal: {e}")
+
+        if self.profile_memory:
+            self._summarize_memory()
+
         if not self.override_ctrl_c_handler:
             return
 
@@ -282,18 +406,52 @@ class _RunnerBase(ABC):
         logging.info(f"Running {self.dynamic_runner_name()}")
         run_start = time.perf_counter()
 
+        all_total_args = []
         for value_set in value_sets:
             total_args = dict(value_set)
 
             if "max_iters" not in total_args:
                 total_args["max_iters"] = int(max(self.iteration_list))
 
-            self._run_one_experiment(algorithm, total_args)
+            all_total_args.append(total_args)
+
+        completed = self._load_checkpoint() if self.checkpoint and not self.replay_mode() else {}
+        checkpoint_keys = [self._get_checkpoint_key(total_args) for total_args in all_total_args]
+        n_pending = sum(key not in completed for key in checkpoint_keys)
+        if completed:
+            logging.info(f"Resuming from checkpoint: {len(all_total_args) - n_pending} of {len(all_total_args)} combinations completed")
+
+        n_workers = min((os.cpu_count() or 1) if self.n_jobs == -1 else self.n_jobs, n_pending)
+        parallel_results = None
+        if n_workers > 1 and not self.replay_mode():
+            pending_args = [total_args for total_args, key in zip(all_total_args, checkpoint_keys) if key not in completed]
+            parallel_results = self._run_experiments_in_parallel(algorithm, pending_args, n_workers)
+
+        try:
+            for total_args, key in zip(all_total_args, checkpoint_keys):
+                if key in completed:
+                    self._merge_results(*self._load_checkpoint_shard(completed[key]))
+                    continue
+
+                first_run_stat, first_curve = len(self._raw_run_stats), len(self._fitness_curves)
+                if parallel_results is not None:
+                    self._merge_results(*next(parallel_results))
+                else:
+                    self._run_one_experiment(algorithm, total_args)
+
+                # A combination that was interrupted is run again when the experiment is resumed
+                if self.checkpoint and not self.has_aborted():
+                    self._save_checkpoint(key, first_run_stat, first_curve)
+        finally:
+            if parallel_results is not None:
+                parallel_results.close()
 
         run_end = time.perf_counter()
         logging.info(f"Run time: {run_end - run_start:.2f} seconds")
 
         self._create_and_save_run_data_frames(final_save=True)
+        if self.checkpoint and not self.has_aborted():
+            self._remove_checkpoint()
         self._tear_down()
 
         return self.run_stats_df, self.curves_df
@@ -325,6 +483,177 @@ class _RunnerBase(ABC):
             **total_args,
         )
 
+    def _run_experiments_in_parallel(
+        self, algorithm: Any, all_total_args: list[dict[str, Any]], n_workers: int
+    ) -> Iterator[tuple[list[dict[str, Any]], list[dict[str, Any]], np.ndarray | None]]:
+        """
+        Run the experiment for each set of arguments in a pool of worker processes.
+
+        Each worker runs its experiments on its own copy of the runner (and problem), without saving anything to
+        disk. Results are yielded in the order of all_total_args, so merging them gives the same results as running
+        the experiments one after the other. Workers ignore Ctrl-C and stop when this runner is aborted.
+
+        Parameters
+        ----------
+        algorithm : Any
+            The algorithm to run.
+        all_total_args : list[dict[str, Any]]
+            The arguments of each experiment.
+        n_workers : int
+            Number of worker processes.
+
+        Yields
+        ------
+        tuple[list[dict[str, Any]], list[dict[str, Any]], np.ndarray | None]
+            The run statistics, fitness curves and stored states of each experiment, to be passed to _merge_results.
+        """
+        worker_runner = copy.copy(self)
+        worker_runner._output_directory = None
+        worker_runner.override_ctrl_c_handler = False
+        worker_runner.n_jobs = 1
+        worker_runner.checkpoint = False
+        worker_runner._started_tracemalloc = False
+
+        chunk_size = max(1, len(all_total_args) // (4 * n_workers))
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(worker_runner, algorithm, self.__abort))
+        try:
+            yield from executor.map(_run_in_worker, all_total_args, chunksize=chunk_size)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _merge_results(self, run_stats: list[dict[str, Any]], fitness_curves: CurveTable, states: Any = None):
+        """
+        Merge the results of an experiment run elsewhere (in a worker process or a previous run) into this runner's.
+
+        Parameters
+        ----------
+        run_stats : list[dict[str, Any]]
+            The run statistics rows of the experiment.
+        fitness_curves : CurveTable
+            The fitness curve points of the experiment.
+        states : Any, optional
+            When the State values of run_stats are state store references, the referenced states, indexable by
+            reference. They are added to this runner's state store, and the references updated accordingly.
+        """
+        if states is not None:
+            for run_stat in run_stats:
+                if isinstance(run_stat["State"], (int, np.integer)):
+                    run_stat["State"] = self._state_store.add(states[run_stat["State"]])
+
+        self._raw_run_stats.extend(run_stats)
+        self._fitness_curves.extend(fitness_curves)
+        self._curve_base = len(self._fitness_curves)
+        self._flush_results()
+
+    def _get_checkpoint_key(self, total_args: dict[str, Any]) -> str:
+        """Return the key identifying a parameter combination in the checkpoint manifest."""
+        return json.dumps({k: str(self._sanitize_value(v)) for k, v in total_args.items()}, sort_keys=True)
+
+    def _get_checkpoint_config(self) -> dict[str, Any]:
+        """Return the runner settings a checkpoint is only valid for."""
+        return {
+            "seed": None if self.seed is None else int(self.seed),
+            "iteration_list": [int(i) for i in self.iteration_list],
+            "max_attempts": int(self.max_attempts),
+            "generate_curves": bool(self.generate_curves),
+            "store_states": bool(self.store_states),
+            "profile_phases": bool(self.profile_phases),
+            "log_evaluations": bool(self.log_evaluations),
+            "profile_memory": bool(self.profile_memory),
+        }
+
+    def _get_checkpoint_manifest_filename(self) -> str:
+        """Return the filename of the checkpoint manifest."""
+        return f"{self._get_pickle_filename_root('checkpoint')}.json"
+
+    def _load_checkpoint(self) -> dict[str, str]:
+        """
+        Load the checkpoint manifest of a previous, interrupted run of the experiment.
+
+        Returns
+        -------
+        dict[str, str]
+            The shard filename of each completed parameter combination, by checkpoint key. Empty if there is no
+            checkpoint, or if it was made with different runner settings.
+        """
+        self._checkpoint_manifest = {"config": self._get_checkpoint_config(), "completed": {}}
+
+        manifest_filename = self._get_checkpoint_manifest_filename()
+        if not os.path.exists(manifest_filename):
+            return {}
+
+        try:
+            with open(manifest_filename) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable checkpoint [{manifest_filename}]: {e}")
+            return {}
+
+        if manifest.get("config") != self._checkpoint_manifest["config"]:
+            logging.warning(f"Ignoring checkpoint [{manifest_filename}] made with different runner settings")
+            return {}
+
+        checkpoint_directory = os.path.dirname(manifest_filename)
+        completed = {}
+        for key, shard_name in manifest.get("completed", {}).items():
+            if os.path.exists(os.path.join(checkpoint_directory, shard_name)):
+                completed[key] = shard_name
+
+        self._checkpoint_manifest["completed"] = dict(completed)
+        return completed
+
+    def _load_checkpoint_shard(self, shard_name: str) -> tuple[list[dict[str, Any]], CurveTable, dict[int, np.ndarray] | None]:
+        """Load the results of a completed parameter combination from its checkpoint shard."""
+        shard_filename = os.path.join(os.path.dirname(self._get_checkpoint_manifest_filename()), shard_name)
+        with open(shard_filename, "rb") as shard_file:
+            shard = pk.load(shard_file)
+
+        return shard["run_stats"], shard["curves"], shard["states"]
+
+    def _save_checkpoint(self, key: str, first_run_stat: int, first_curve: int):
+        """
+        Save the results of a completed parameter combination to a checkpoint shard, and record it in the manifest.
+
+        Parameters
+        ----------
+        key : str
+            The checkpoint key of the parameter combination.
+        first_run_stat : int
+            Index of the combination's first row in the run statistics.
+        first_curve : int
+            Index of the combination's first row in the fitness curves.
+        """
+        run_stats = self._raw_run_stats[first_run_stat:]
+        states = None
+        if self.store_states:
+            states = {
+                ref: np.array(self._state_store.get(ref))
+                for ref in (run_stat["State"] for run_stat in run_stats)
+                if isinstance(ref, (int, np.integer))
+            }
+        shard = {"run_stats": run_stats, "curves": self._fitness_curves.take(first_curve), "states": states}
+
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        shard_filename = f"{self._get_pickle_filename_root(f'checkpoint_{digest}')}.p"
+        _write_atomically(shard_filename, pk.dumps(shard, protocol=pk.HIGHEST_PROTOCOL))
+
+        self._checkpoint_manifest["completed"][key] = os.path.basename(shard_filename)
+        _write_atomically(self._get_checkpoint_manifest_filename(), json.dumps(self._checkpoint_manifest, indent=2).encode())
+
+    def _remove_checkpoint(self):
+        """Remove the checkpoint manifest and shards, once the experiment's results have been saved."""
+        manifest_filename = self._get_checkpoint_manifest_filename()
+        checkpoint_directory = os.path.dirname(manifest_filename)
+        for shard_name in self._checkpoint_manifest["completed"].values():
+            shard_filename = os.path.join(checkpoint_directory, shard_name)
+            if os.path.exists(shard_filename):
+                os.remove(shard_filename)
+
+        if os.path.exists(manifest_filename):
+            os.remove(manifest_filename)
+
+        self._checkpoint_manifest["completed"].clear()
+
     def _create_and_save_run_data_frames(self, extra_data_frames: dict[str, pd.DataFrame] = None, final_save: bool = False):
         """
         Save the collected run statistics and fitness curves to disk.
@@ -337,7 +666,8 @@ class _RunnerBase(ABC):
             Whether this is the final save of the experiment (default False).
         """
         self.run_stats_df = pd.DataFrame(self._raw_run_stats)
-        self.curves_df = pd.DataFrame(self._fitness_curves)
+        self.curves_df = self._add_evaluation_columns(self._fitness_curves.to_frame(), self.run_stats_df)
+        self.curve_runs_df = self._fitness_curves.runs_frame()
 
         if self._output_directory:
             if not self.run_stats_df.empty:
@@ -350,9 +680,102 @@ class _RunnerBase(ABC):
                 for name, df in extra_data_frames.items():
                     self._dump_df_to_disk(df, df_name=name, final_save=final_save)
 
+            if len(self._state_store) > 0:
+                self._state_store.save(f"{self._get_pickle_filename_root('states')}.npy")
+
+            # Every logged row is now in the saved files, so the journals are no longer needed
+            for journal_filename in self._journal_filenames:
+                if os.path.exists(journal_filename):
+                    os.remove(journal_filename)
+            self._journal_filenames.clear()
+
+        self._flushed_run_stats = len(self._raw_run_stats)
+        self._flushed_curves = len(self._fitness_curves)
+
+    @staticmethod
+    def _add_evaluation_columns(curves_df: pd.DataFrame, run_stats_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add the fitness evaluation accounting logged in the run statistics to the matching points of the curves.
+
+        The accounting is only known when a row is logged, so it is matched to the points of the same run with the same
+        number of fitness evaluations (this also matches the final rows, which are logged under the remaining logged
+        iterations rather than the iteration the run ended at). The other points are left as NaN.
+
+        Parameters
+        ----------
+        curves_df : pd.DataFrame
+            The fitness curves.
+        run_stats_df : pd.DataFrame
+            The run statistics, with 'FEvals_<...>' columns if evaluations were logged.
+
+        Returns
+        -------
+        pd.DataFrame
+            The fitness curves, with the 'FEvals_<...>' columns of the run statistics if it has any.
+        """
+        evaluation_columns = [c for c in run_stats_df.columns if c.startswith("FEvals_")]
+        if not evaluation_columns or curves_df.empty:
+            return curves_df
+
+        key_columns = ["FEvals"] + [c for c in curves_df.columns if c not in CURVE_COLUMNS and c in run_stats_df.columns]
+        evaluations_df = run_stats_df[key_columns + evaluation_columns].astype({"FEvals": np.float64})
+        evaluations_df = evaluations_df.drop_duplicates(subset=key_columns)
+
+        return curves_df.merge(evaluations_df, how="left", on=key_columns)
+
+    def _flush_results(self, force: bool = False):
+        """
+        Append the run statistics and fitness curve rows logged since the last flush to the journal files.
+
+        Rows are only appended once flush_rows rows are pending or flush_interval seconds have passed since the
+        last flush, unless force is True, so that the cost of writing results grows linearly with their number.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to append the pending rows regardless of the flush policy (default False).
+        """
+        if self._output_directory is None:
+            return
+
+        # The zeroth curve row may still have its fitness overwritten, so hold the curves back until it has been
+        flushable_curves = self._flushed_curves if self._copy_zero_curve_fitness_from_first else len(self._fitness_curves)
+        pending_rows = len(self._raw_run_stats) - self._flushed_run_stats + flushable_curves - self._flushed_curves
+        if pending_rows <= 0:
+            return
+        if not force and pending_rows < self.flush_rows and time.monotonic() - self._last_flush_time < self.flush_interval:
+            return
+
+        if len(self._raw_run_stats) > self._flushed_run_stats:
+            self._append_to_journal(self._raw_run_stats[self._flushed_run_stats :], df_name="run_stats_df")
+            self._flushed_run_stats = len(self._raw_run_stats)
+
+        if flushable_curves > self._flushed_curves:
+            self._append_to_journal(self._fitness_curves.to_frame(self._flushed_curves, flushable_curves), df_name="curves_df")
+            self._flushed_curves = flushable_curves
+
+        self._last_flush_time = time.monotonic()
+
+    def _append_to_journal(self, rows: list[dict[str, Any]] | pd.DataFrame, df_name: str):
+        """
+        Append a batch of rows to the journal file of a DataFrame.
+
+        Parameters
+        ----------
+        rows : list[dict[str, Any]] | pd.DataFrame
+            The rows to append.
+        df_name : str
+            The name of the DataFrame the rows belong to.
+        """
+        journal_filename = f"{self._get_pickle_filename_root(df_name)}{JOURNAL_EXTENSION}"
+        with open(journal_filename, "ab") as journal_file:
+            pk.dump(rows, journal_file, protocol=pk.HIGHEST_PROTOCOL)
+
+        self._journal_filenames.add(journal_filename)
+
     def _dump_df_to_disk(self, df: pd.DataFrame, df_name: str, final_save: bool = False):
         """
-        Save the DataFrame to disk as both a pickle and CSV file.
+        Save the DataFrame to disk in each of the runner's result formats.
 
         Parameters
         ----------
@@ -363,11 +786,15 @@ class _RunnerBase(ABC):
         final_save : bool, optional
             Whether this is the final save (default False).
         """
-        filename_root = self._dump_pickle_to_disk(object_to_pickle=df, name=df_name)
-        df.to_csv(f"{filename_root}.csv")
+        if self._output_directory is None:
+            return
 
-        if final_save:
-            logging.info(f"Saved: [{filename_root}.csv]")
+        filename_root = self._get_pickle_filename_root(df_name)
+        for sink in self._result_sinks:
+            filename = sink.write(df, filename_root)
+
+            if final_save:
+                logging.info(f"Saved: [{filename}]")
 
     def _get_pickle_filename_root(self, name: str) -> str:
         """Generate the root filename for the pickle file based on experiment metadata."""
@@ -408,28 +835,36 @@ class _RunnerBase(ABC):
         return filename_root
 
     def _load_pickles(self) -> bool:
-        """Load pickled fitness curves and run statistics from disk."""
-        curves_df_filename = f"{self._get_pickle_filename_root('curves_df')}.p"
-        run_stats_df_filename = f"{self._get_pickle_filename_root('run_stats_df')}.p"
+        """Load saved fitness curves and run statistics from disk, in the first of the runner's result formats found."""
+        self.curves_df = self._load_df_from_disk("curves_df")
+        self.run_stats_df = self._load_df_from_disk("run_stats_df")
 
-        self.curves_df = None
-        self.run_stats_df = None
+        return self.curves_df is not None and self.run_stats_df is not None
 
-        if os.path.exists(curves_df_filename):
-            with open(curves_df_filename, "rb") as pickle_file:
-                try:
-                    self.curves_df = pk.load(pickle_file)
-                except (OSError, IOError, pk.PickleError):
-                    pass
+    def _load_df_from_disk(self, df_name: str) -> pd.DataFrame | None:
+        """
+        Load a saved DataFrame from disk, from the first of the runner's result formats that can read it.
+
+        Parameters
+        ----------
+        df_name : str
+            The name of the DataFrame.
 
-        if os.path.exists(run_stats_df_filename):
-            with open(run_stats_df_filename, "rb") as pickle_file:
+        Returns
+        -------
+        pd.DataFrame | None
+            The DataFrame, or None if no readable file was found.
+        """
+        filename_root = self._get_pickle_filename_root(df_name)
+        for sink in self._result_sinks:
+            filename = sink.filename(filename_root)
+            if os.path.exists(filename):
                 try:
-                    self.run_stats_df = pk.load(pickle_file)
-                except (OSError, IOError, pk.PickleError):
+                    return sink.read(filename)
+                except (OSError, IOError, ValueError, KeyError, ImportError, pk.PickleError):
                     pass
 
-        return self.curves_df is not None and self.run_stats_df is not None
+        return None
 
     def _invoke_algorithm(
         self,
@@ -489,6 +924,12 @@ class _RunnerBase(ABC):
         # Filter arguments to those accepted by the algorithm function signature
         valid_args = [k for k in inspect.signature(algorithm).parameters]
         kwargs = {k: v for k, v in total_args.items() if k in valid_args}
+        self._profiler = PhaseProfiler() if self.profile_phases and "profiler" in valid_args else None
+        self._evaluated_problem = problem if self.log_evaluations else None
+        if self.profile_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        if self._profiler is not None:
+            kwargs["profiler"] = self._profiler
 
         # Reset the problem instance and run the algorithm
         self._start_run_timing()
@@ -498,7 +939,7 @@ class _RunnerBase(ABC):
             max_attempts=max_attempts,
             curve=curve,
             random_state=self.seed,
-            state_fitness_callback=self._save_state,
+            state_fitness_callback=_StateCallback(self),
             callback_user_info=callback_user_info,
             **kwargs,
         )
@@ -511,43 +952,28 @@ class _RunnerBase(ABC):
     def _start_run_timing(self):
         """Start timing the experiment's execution."""
         self._run_start_time = time.perf_counter()
+        self._iteration_times = []
+        self._last_callback_iteration = 0
 
     @staticmethod
-    def _create_curve_stat(
-        iteration: int, curve_value: tuple[float, int] | dict[str, Any], curve_data: dict[str, Any], t: float = None
-    ) -> dict[str, Any]:
+    def _to_curve_values(points: Any) -> np.ndarray:
         """
-        Create a single fitness curve statistic for logging.
+        Convert fitness curve points to an array of their fitness and fitness evaluations.
 
         Parameters
         ----------
-        iteration : int
-            The iteration number.
-        curve_value : tuple[float, int] | dict[str, Any]
-            The curve's fitness and evaluation values.
-        curve_data : dict[str, Any]
-            Additional data to log.
-        t : float | None, optional
-            Time elapsed for this iteration (default None).
+        points : Any
+            The curve points, as (fitness, fitness evaluations) pairs or as dicts with 'Fitness' and 'FEvals' keys.
 
         Returns
         -------
-        dict[str, Any]
-            The fitness curve statistic as a dictionary.
-        """
-        curve_fitness_value, curve_feval_value = curve_value
-        curve_stat = {
-            "Iteration": iteration,
-            "Time": t if t is not None else 0.0,  # Handle None time values
-            "Fitness": curve_fitness_value,
-            "FEvals": curve_feval_value,
-        }
-
-        curve_stat.update(curve_data)
-        if isinstance(curve_value, dict):
-            curve_stat.update(curve_value)
+        np.ndarray
+            Array of shape (n, 2) with the fitness and fitness evaluations of each point.
+        """
+        if len(points) and isinstance(points[0], dict):
+            points = [(point["Fitness"], point["FEvals"]) for point in points]
 
-        return curve_stat
+        return np.asarray(points, dtype=np.float64).reshape(-1, 2)
 
     def _save_state(
         self,
@@ -587,33 +1013,40 @@ class _RunnerBase(ABC):
         bool
             True if the experiment should continue, False otherwise.
         """
-        # Log iteration timing
+        # Log iteration timing, interpolating the times of any iterations the algorithm did not call back at
         end = time.perf_counter()
         t = end - self._run_start_time
+        n_skipped = iteration - self._last_callback_iteration - 1
+        if n_skipped > 0:
+            last_t = self._iteration_times[-1] if self._iteration_times else 0.0
+            self._iteration_times.extend(np.linspace(last_t, t, n_skipped + 2)[1:-1].tolist())
         self._iteration_times.append(t)
-
-        # Skip logging for non-final iterations not in the list
-        if iteration > 0 and iteration not in self.iteration_list and not done:
-            return True
-
-        # Update logging with current algorithm and user data
-        display_data = {**self._current_logged_algorithm_args}
-        if user_data:
-            display_data.update(user_data)
-            data_desc = ", ".join([f"{n}:[{get_short_name(v)}]" for n, v in display_data.items()])
-            logging.debug(data_desc)
-
-        logging.debug(
-            f"runner_name:[{self.dynamic_runner_name()}], experiment_name:[{self._experiment_name}], "
-            + ("" if attempt is None else f"attempt:[{attempt}], ")
-            + f"iteration:[{iteration}], done:[{done}], "
-            f"time:[{t:.2f}], fitness:[{fitness:.4f}]"
-        )
-
-        # Log the state as a truncated string for easier viewing
-        state_string = str(state).replace("\n", "//")[:200]
-        logging.debug(f"\t{state_string}...")
-        logging.debug("")
+        self._last_callback_iteration = iteration
+
+        # Skip logging for non-final iterations not in the list, but still stop the algorithm if the runner has aborted
+        if iteration > 0 and iteration not in self._logged_iteration_set and not done:
+            return not self.has_aborted()
+
+        # Only format the debug messages (which stringify the whole state) if they will be logged
+        if logging.root.isEnabledFor(logging.DEBUG):
+            # Update logging with current algorithm and user data
+            display_data = {**self._current_logged_algorithm_args}
+            if user_data:
+                display_data.update(user_data)
+                data_desc = ", ".join([f"{n}:[{get_short_name(v)}]" for n, v in display_data.items()])
+                logging.debug(data_desc)
+
+            logging.debug(
+                f"runner_name:[{self.dynamic_runner_name()}], experiment_name:[{self._experiment_name}], "
+                + ("" if attempt is None else f"attempt:[{attempt}], ")
+                + f"iteration:[{iteration}], done:[{done}], "
+                f"time:[{t:.2f}], fitness:[{fitness:.4f}]"
+            )
+
+            # Log the state as a truncated string for easier viewing
+            state_string = str(state).replace("\n", "//")[:200]
+            logging.debug(f"\t{state_string}...")
+            logging.debug("")
 
         # Sanitize and log additional user data
         def get_description(name: str) -> str:
@@ -635,14 +1068,22 @@ class _RunnerBase(ABC):
 
         # Determine which iterations to log
         if iteration > 0:
-            remaining_iterations = [i for i in self.iteration_list if i >= iteration]
-            iterations = [min(remaining_iterations)] if not done else remaining_iterations
+            remaining_iterations = self._logged_iterations[bisect.bisect_left(self._logged_iterations, iteration) :]
+            iterations = remaining_iterations[:1] if not done else remaining_iterations
         else:
             iterations = [0]
 
-        # Log the run statistics for each iteration
+        # Log the run statistics for each iteration, with the state either stored out-of-band or as a string
+        logged_state = self._state_store.add(state) if self.store_states else self._sanitize_value(state)
+        phase_times = self._profiler.to_columns() if self._profiler is not None else {}
+        evaluation_stats = getattr(self._evaluated_problem, "evaluation_stats", None)
+        evaluation_columns = evaluation_stats.to_columns() if evaluation_stats is not None else {}
+        memory_columns = self._sample_memory() if self.profile_memory else {}
         for i in iterations:
-            run_stat = {"Iteration": i, "Fitness": fitness, "FEvals": fitness_evaluations, "Time": t, "State": self._sanitize_value(state)}
+            run_stat = {"Iteration": i, "Fitness": fitness, "FEvals": fitness_evaluations, "Time": t, "State": logged_state}
+            run_stat.update(phase_times)
+            run_stat.update(evaluation_columns)
+            run_stat.update(memory_columns)
             run_stat.update(additional_info)
             run_stat.update(current_iteration_stats)
             self._raw_run_stats.append(run_stat)
@@ -666,23 +1107,171 @@ class _RunnerBase(ABC):
             if ix_start < 0:
                 ix_start = 0
 
-            curve_tuples = list(zip(range(ix_start, ix_end), curve[-curve_stats_to_save:]))
-
-            curve_stats = []
-            for ix, f in curve_tuples:
-                if ix < len(self._iteration_times):
-                    t = self._iteration_times[ix]
-                else:
-                    t = 0.0
-                curve_stat = self._create_curve_stat(iteration=ix, curve_value=f, curve_data=current_iteration_stats, t=t)
-                curve_stats.append(curve_stat)
+            # Build the new points as column arrays, pairing iterations with the last points of the curve
+            curve_values = self._to_curve_values(curve[-curve_stats_to_save:] if curve_stats_to_save > 0 else [])
+            n_points = max(min(ix_end - ix_start, len(curve_values)), 0)
+            times = np.zeros(n_points)
+            known_times = self._iteration_times[ix_start : ix_start + n_points]
+            times[: len(known_times)] = known_times
 
-            self._fitness_curves.extend(curve_stats)
+            run_id = self._fitness_curves.add_run(current_iteration_stats)
+            self._fitness_curves.append(run_id, np.arange(ix_start, ix_start + n_points), times, curve_values[:n_points])
 
             # Copy the first fitness value to the zeroth iteration if specified
             if self._copy_zero_curve_fitness_from_first and len(self._fitness_curves) > 1:
-                self._fitness_curves[0]["Fitness"] = self._fitness_curves[1]["Fitness"]
+                self._fitness_curves.fitness[0] = self._fitness_curves.fitness[1]
                 self._copy_zero_curve_fitness_from_first = False
-            self._create_and_save_run_data_frames()
+
+        self._flush_results()
 
         return not (self.has_aborted() or done)
+
+    def _sample_memory(self) -> dict[str, int]:
+        """
+        Sample the memory used by the current run, keeping a tracemalloc snapshot of the largest sample.
+
+        Returns
+        -------
+        dict[str, int]
+            The current and peak traced memory of the run, and the peak resident set size of the process if known,
+            in bytes, keyed by column name.
+        """
+        if not tracemalloc.is_tracing():
+            return {}
+
+        current, peak = tracemalloc.get_traced_memory()
+        if current > self._memory_snapshot_size:
+            self._memory_snapshot = tracemalloc.take_snapshot()
+            self._memory_snapshot_size = current
+
+        memory_columns = {"Memory_current": current, "Memory_peak": peak}
+        max_rss = _get_max_rss()
+        if max_rss is not None:
+            memory_columns["Memory_max_rss"] = max_rss
+
+        return memory_columns
+
+    def _summarize_memory(self):
+        """Summarize the top allocation sites of the largest memory sample, and stop tracing if the runner started it."""
+        if self._memory_snapshot is not None:
+            snapshot = self._memory_snapshot.filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*"))
+            )
+            top_sites = snapshot.statistics("lineno")[: self._MEMORY_TOP_SITES]
+            self.memory_summary_df = pd.DataFrame(
+                {
+                    "File": [site.traceback[0].filename for site in top_sites],
+                    "Line": [site.traceback[0].lineno for site in top_sites],
+                    "Size": [site.size for site in top_sites],
+                    "Count": [site.count for site in top_sites],
+                }
+            )
+
+            logging.info(f"Top allocation sites, with {self._memory_snapshot_size} bytes traced:")
+            for site in top_sites:
+                logging.info(f"\t{site}")
+
+            if self._output_directory:
+                try:
+                    self._dump_df_to_disk(self.memory_summary_df, df_name="memory_summary_df", final_save=True)
+                except OSError as e:
+                    logging.error(f"Problem saving the memory summary: {e}")
+
+            self._memory_snapshot = None
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _get_next_callback_iteration(self, iteration: int) -> int | float:
+        """
+        Return the next iteration after the given one at which _save_state logs anything.
+
+        Algorithms may skip calling back until then (or until they are done), but are asked to call back at least
+        every _MAX_CALLBACK_INTERVAL iterations, so that aborting the runner still stops them promptly.
+
+        Parameters
+        ----------
+        iteration : int
+            The current iteration number.
+
+        Returns
+        -------
+        int | float
+            The next iteration to call back at.
+        """
+        next_index = bisect.bisect_right(self._logged_iterations, iteration)
+        next_logged_iteration = self._logged_iterations[next_index] if next_index < len(self._logged_iterations) else np.inf
+
+        return min(next_logged_iteration, iteration + self._MAX_CALLBACK_INTERVAL)
+
+
+class _StateCallback:
+    """
+    State fitness callback passed by a runner to the algorithms it runs.
+
+    Calling it calls the runner's _save_state. Algorithms that find a next_callback_iteration method on their
+    callback only call it back at that iteration (or when they are done), skipping the iterations in between.
+    """
+
+    def __init__(self, runner: _RunnerBase):
+        self.runner: _RunnerBase = runner
+
+    def __call__(self, **kwargs: Any) -> bool:
+        return self.runner._save_state(**kwargs)
+
+    def next_callback_iteration(self, iteration: int) -> int | float:
+        """Return the next iteration after the given one at which the callback must be called."""
+        return self.runner._get_next_callback_iteration(iteration)
+
+
+def _get_max_rss() -> int | None:
+    """Return the peak resident set size of the process in bytes, or None if the platform does not report it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    return int(max_rss if sys.platform == "darwin" else max_rss * 1024)
+
+
+def _write_atomically(filename: str, data: bytes):
+    """Write data to a file, so that the file is never left partially written if the process dies."""
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, "wb") as temp_file:
+        temp_file.write(data)
+    os.replace(temp_filename, filename)
+
+
+# The runner copy and algorithm used by the experiments run in a worker process, set when the worker starts
+_worker_runner: _RunnerBase | None = None
+_worker_algorithm: Any = None
+
+
+def _init_worker(runner: _RunnerBase, algorithm: Any, abort: multiprocessing.Value):
+    """Initialize a worker process of _RunnerBase._run_experiments_in_parallel."""
+    global _worker_runner, _worker_algorithm
+
+    # Ctrl-C is handled by the parent process, which signals workers to stop through the shared abort flag
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _RunnerBase._RunnerBase__abort = abort
+
+    _worker_runner = runner
+    _worker_algorithm = algorithm
+
+    # Tracing does not carry over to the worker process, so each worker traces its own allocations
+    if runner.profile_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def _run_in_worker(total_args: dict[str, Any]) -> tuple[list[dict[str, Any]], CurveTable, np.ndarray | None]:
+    """Run one experiment in a worker process, returning its run statistics, fitness curves and stored states."""
+    _worker_runner._setup()
+    _worker_runner._run_one_experiment(_worker_algorithm, total_args)
+
+    states = _worker_runner._state_store.to_array() if _worker_runner.store_states else None
+
+    return _worker_runner._raw_run_stats, _worker_runner._fitness_curves.take(), states
@@ -0,0 +1,262 @@
+"""Class for storing the fitness curves logged by a runner as column arrays, with a separate table of run parameters."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+CURVE_COLUMNS = ("Iteration", "Time", "Fitness", "FEvals")
+
+
+class CurveTable:
+    """
+    Long-format table of the fitness curve points logged by a runner.
+
+    Each point is stored as a row of preallocated column arrays (iteration, time, fitness and fitness evaluations),
+    along with the id of the run it belongs to. The parameters of each run (the algorithm arguments and user data
+    logged with its points) are stored once per run in a separate, small table, instead of being copied into every
+    point. Both tables grow by doubling their capacity, so appending a curve segment costs amortized O(n) in its
+    length, and DataFrames are built directly from the column arrays.
+
+    Parameters
+    ----------
+    capacity : int, optional, default=1024
+        Initial number of points the table can hold before growing.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got {capacity}.")
+
+        self._iterations: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self._times: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._values: np.ndarray = np.empty((capacity, 2), dtype=np.float64)
+        self._run_ids: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self._size: int = 0
+
+        self._run_params: list[dict[str, Any]] = []
+        self._run_ids_by_key: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def iterations(self) -> np.ndarray:
+        """Iteration of each point, without copying."""
+        return self._iterations[: self._size]
+
+    @property
+    def times(self) -> np.ndarray:
+        """Time of each point, in seconds since the start of its run, without copying."""
+        return self._times[: self._size]
+
+    @property
+    def fitness(self) -> np.ndarray:
+        """Fitness of each point, without copying."""
+        return self._values[: self._size, 0]
+
+    @property
+    def fitness_evaluations(self) -> np.ndarray:
+        """Number of fitness evaluations at each point, without copying."""
+        return self._values[: self._size, 1]
+
+    @property
+    def run_ids(self) -> np.ndarray:
+        """Id of the run each point belongs to, without copying."""
+        return self._run_ids[: self._size]
+
+    @property
+    def n_runs(self) -> int:
+        """Number of distinct runs in the table."""
+        return len(self._run_params)
+
+    def add_run(self, params: dict[str, Any]) -> int:
+        """
+        Add a run with the given parameters, unless a run with identical parameters was already added.
+
+        Parameters
+        ----------
+        params : dict[str, Any]
+            The parameters logged with the run's points.
+
+        Returns
+        -------
+        int
+            The id of the run.
+        """
+        try:
+            key = tuple(params.items())
+            hash(key)
+        except TypeError:
+            key = repr(list(params.items()))
+
+        run_id = self._run_ids_by_key.get(key)
+        if run_id is None:
+            run_id = len(self._run_params)
+            self._run_params.append(dict(params))
+            self._run_ids_by_key[key] = run_id
+
+        return run_id
+
+    def append(self, run_id: int, iterations: np.ndarray, times: np.ndarray, values: np.ndarray):
+        """
+        Append a segment of a run's curve.
+
+        Parameters
+        ----------
+        run_id : int
+            The id of the run, as returned by add_run.
+        iterations : np.ndarray
+            Iteration of each point.
+        times : np.ndarray
+            Time of each point.
+        values : np.ndarray
+            Array of shape (n, 2) with the fitness and fitness evaluations of each point.
+        """
+        n = len(iterations)
+        if n == 0:
+            return
+
+        end = self._size + n
+        if end > len(self._iterations):
+            self._grow(end)
+
+        self._iterations[self._size : end] = iterations
+        self._times[self._size : end] = times
+        self._values[self._size : end] = values
+        self._run_ids[self._size : end] = run_id
+        self._size = end
+
+    def _grow(self, min_capacity: int):
+        """Grow the capacity of the table, by doubling it, to at least min_capacity points."""
+        capacity = max(2 * len(self._iterations), min_capacity)
+        for name in ("_iterations", "_times", "_values", "_run_ids"):
+            column = getattr(self, name)
+            grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+
+    def take(self, start: int = 0, stop: int | None = None) -> "CurveTable":
+        """
+        Return a compact copy of a range of the table's points, with only the runs they belong to.
+
+        Parameters
+        ----------
+        start : int, optional, default=0
+            Index of the first point to copy.
+        stop : int | None, optional, default=None
+            Index after the last point to copy. By default, the end of the table.
+
+        Returns
+        -------
+        CurveTable
+            A table with the points, and their runs renumbered from zero.
+        """
+        stop = self._size if stop is None else min(stop, self._size)
+        start = min(start, stop)
+        run_ids = self._run_ids[start:stop]
+        used_run_ids, new_run_ids = np.unique(run_ids, return_inverse=True)
+
+        table = CurveTable(capacity=max(stop - start, 1))
+        for run_id in used_run_ids:
+            table.add_run(self._run_params[run_id])
+        table._iterations[: stop - start] = self._iterations[start:stop]
+        table._times[: stop - start] = self._times[start:stop]
+        table._values[: stop - start] = self._values[start:stop]
+        table._run_ids[: stop - start] = new_run_ids
+        table._size = stop - start
+
+        return table
+
+    def extend(self, other: "CurveTable"):
+        """
+        Append the points of another table, such as one built in a worker process, merging identical runs.
+
+        Parameters
+        ----------
+        other : CurveTable
+            The table to append.
+        """
+        if len(other) == 0:
+            return
+
+        run_id_map = np.array([self.add_run(params) for params in other._run_params], dtype=np.int64)
+        end = self._size + len(other)
+        if end > len(self._iterations):
+            self._grow(end)
+
+        self._iterations[self._size : end] = other.iterations
+        self._times[self._size : end] = other.times
+        self._values[self._size : end] = other._values[: len(other)]
+        self._run_ids[self._size : end] = run_id_map[other.run_ids]
+        self._size = end
+
+    def runs_frame(self) -> pd.DataFrame:
+        """
+        Return the table of run parameters.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per run, with its id in a 'Run' column followed by its parameters.
+        """
+        runs_df = pd.DataFrame(self._run_params, index=pd.RangeIndex(len(self._run_params)))
+        runs_df.insert(0, "Run", np.arange(len(self._run_params), dtype=np.int64))
+
+        return runs_df
+
+    def points_frame(self, start: int = 0, stop: int | None = None) -> pd.DataFrame:
+        """
+        Return a range of the points in long format, with the id of their run rather than its parameters.
+
+        Parameters
+        ----------
+        start : int, optional, default=0
+            Index of the first point.
+        stop : int | None, optional, default=None
+            Index after the last point. By default, the end of the table.
+
+        Returns
+        -------
+        pd.DataFrame
+            A 'Run' column followed by the Iteration, Time, Fitness and FEvals columns.
+        """
+        points = slice(start, self._size if stop is None else min(stop, self._size))
+        return pd.DataFrame(
+            {
+                "Run": self._run_ids[points].copy(),
+                "Iteration": self._iterations[points].copy(),
+                "Time": self._times[points].copy(),
+                "Fitness": self._values[points, 0].copy(),
+                "FEvals": self._values[points, 1].copy(),
+            }
+        )
+
+    def to_frame(self, start: int = 0, stop: int | None = None) -> pd.DataFrame:
+        """
+        Return a range of the points, each joined to the parameters of its run.
+
+        Parameters
+        ----------
+        start : int, optional, default=0
+            Index of the first point.
+        stop : int | None, optional, default=None
+            Index after the last point. By default, the end of the table.
+
+        Returns
+        -------
+        pd.DataFrame
+            The Iteration, Time, Fitness and FEvals columns, followed by the run parameter columns.
+        """
+        points_df = self.points_frame(start, stop)
+        if len(points_df) == 0:
+            return points_df.drop(columns="Run")
+
+        run_params_df = pd.DataFrame(self._run_params, index=pd.RangeIndex(len(self._run_params)))
+        run_params_df = run_params_df.drop(columns=[c for c in CURVE_COLUMNS if c in run_params_df.columns])
+        joined_params_df = run_params_df.take(points_df.pop("Run").to_numpy()).reset_index(drop=True)
+
+        return pd.concat([points_df, joined_params_df], axis=1)
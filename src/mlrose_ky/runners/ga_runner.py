@@ -64,6 +64,7 @@ class GARunner(_RunnerBase):
         max_attempts: int = 500,
         generate_curves: bool = True,
         output_directory: str = None,
+        n_jobs: int = 1,
         **kwargs: Any,
     ):
         """
@@ -93,6 +94,8 @@ class GARunner(_RunnerBase):
             Whether to generate learning curves.
         output_directory : str, optional
             Directory to save experiment result, default=None.
+        n_jobs : int, optional
+            Number of worker processes to run the parameter combinations in, or -1 for one per CPU, default=1.
         """
         super().__init__(
             problem=problem,
@@ -102,6 +105,7 @@ class GARunner(_RunnerBase):
             max_attempts=max_attempts,
             generate_curves=generate_curves,
             output_directory=output_directory,
+            n_jobs=n_jobs,
             **kwargs,
         )
         self.population_sizes: list[int] = population_sizes
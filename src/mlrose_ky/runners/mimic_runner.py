@@ -61,6 +61,7 @@ class MIMICRunner(_RunnerBase):
         generate_curves: bool = True,
         use_fast_mimic: bool = True,
         output_directory: str = None,
+        n_jobs: int = 1,
         **kwargs: Any,
     ):
         """
@@ -88,6 +89,8 @@ class MIMICRunner(_RunnerBase):
             Whether to use the fast MIMIC mode, if available.
         output_directory : str, optional
             Directory to save experiment result, default=None.
+        n_jobs : int, optional
+            Number of worker processes to run the parameter combinations in, or -1 for one per CPU, default=1.
         """
         super().__init__(
             problem=problem,
@@ -97,6 +100,7 @@ class MIMICRunner(_RunnerBase):
             max_attempts=max_attempts,
             generate_curves=generate_curves,
             output_directory=output_directory,
+            n_jobs=n_jobs,
             **kwargs,
         )
         self.keep_percent_list: list[float] = keep_percent_list
@@ -33,6 +33,7 @@ Example usage:
 # License: BSD 3-clause
 
 import copy
+import hashlib
 from typing import Any, Callable, Optional
 
 import numpy as np
@@ -41,6 +42,41 @@ import sklearn.metrics as skmt
 from mlrose_ky.decorators import short_name, get_short_name
 from mlrose_ky.neural import NNClassifier
 from mlrose_ky.runners._nn_runner_base import _NNRunnerBase
+from mlrose_ky.runners.result_sinks import ResultSink
+
+
+class _WarmStartCache:
+    """
+    Best network weights found so far, keyed by network architecture (and training fold, unless warm starts are shared
+    across folds).
+
+    GridSearchCV deep-copies the runner for every fit, so deep copies of the cache return the cache
+    itself, allowing all fits in the same process to share it.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, tuple[float, np.ndarray]] = {}
+
+    def __deepcopy__(self, memo: dict) -> "_WarmStartCache":
+        return self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> np.ndarray | None:
+        """Return a copy of the best weights stored for key, or None if there are none."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry[1].copy()
+
+    def update(self, key: tuple, weights: np.ndarray, loss: float) -> bool:
+        """Store weights for key if their loss is lower than that of the stored weights. Return True if they were stored."""
+        if loss is None or not np.isfinite(loss):
+            return False
+        if key in self._entries and self._entries[key][0] <= loss:
+            return False
+
+        self._entries[key] = (float(loss), np.array(weights, copy=True))
+        return True
 
 
 @short_name("nngs")
@@ -77,6 +113,13 @@ class NNGSRunner(_NNRunnerBase):
         cv: int = 5,
         generate_curves: bool = True,
         output_directory: str = None,
+        batch_size: int = None,
+        warm_start: bool = False,
+        warm_start_scope: str = "fold",
+        search_mode: str = "grid",
+        halving_factor: int = 3,
+        result_formats: str | ResultSink | list[str | ResultSink] = "pickle",
+        store_states: bool = False,
         **kwargs: Any,
     ):
         """
@@ -120,6 +163,33 @@ class NNGSRunner(_NNRunnerBase):
             Whether to generate learning curves.
         output_directory : str, optional
             Directory to save output.
+        batch_size : int, optional
+            Number of rows passed through the network at a time. If None, the whole dataset is processed at once.
+        warm_start : bool, optional
+            Whether each fit starts from the best weights found so far by earlier fits of the same
+            architecture (hidden_layer_sizes, activation and bias), instead of from random weights.
+            The cache is shared by the fits run in the same process, so it has no effect across
+            worker processes when n_jobs is not 1.
+        warm_start_scope : str, optional
+            Either 'fold', to only warm-start fits from weights found on the same cross-validation fold,
+            so that no fold starts from weights trained on its own validation data, or 'all', to share
+            the weights found on every fold (which converges faster, but leaks validation data into
+            the cross-validation scores).
+        search_mode : str, optional
+            Either 'grid' for an exhaustive grid search, or 'halving' for a successive-halving search that prunes
+            poorly performing candidates early. The halving search trains for min(iteration_list) up to
+            max(iteration_list) iterations, multiplying the budget by halving_factor at each round; the values in
+            between are not used, and each round retrains its candidates from scratch.
+        halving_factor : int, optional
+            Proportion of candidates eliminated at each successive-halving round.
+        result_formats : str | ResultSink | list[str | ResultSink], optional
+            File formats the result DataFrames are saved in: any of 'pickle', 'csv', 'parquet' (requires pyarrow)
+            and 'npz', and/or ResultSink instances. In replay mode, results are read from the first of these formats
+            found; formats other than pickle store object columns such as State as strings.
+        store_states : bool, optional
+            Whether logged network weights are saved to a deduplicated '<...>__states.npy' file, with the State
+            column of the run statistics holding row references into it instead of strings. The weights must be a
+            numeric array of the same shape at every logged iteration.
         """
         # Take a copy of the grid search parameters
         grid_search_parameters = {**grid_search_parameters}
@@ -143,12 +213,23 @@ class NNGSRunner(_NNRunnerBase):
             n_jobs=n_jobs,
             cv=cv,
             grid_search_scorer_method=grid_search_scorer_method,
+            search_mode=search_mode,
+            halving_factor=halving_factor,
+            result_formats=result_formats,
+            store_states=store_states,
             **kwargs,
         )
 
         # Assign kwargs to self._extra_args
         self._extra_args = kwargs
 
+        if warm_start_scope not in ("fold", "all"):
+            raise ValueError(f"warm_start_scope must be one of {{'fold', 'all'}}, got {warm_start_scope}.")
+
+        self.warm_start: bool = warm_start
+        self.warm_start_scope: str = warm_start_scope
+        self._warm_start_cache: _WarmStartCache = _WarmStartCache()
+
         # Build the classifier
         self.classifier = NNClassifier(
             runner=self,
@@ -158,6 +239,7 @@ class NNGSRunner(_NNRunnerBase):
             early_stopping=early_stopping,
             seed=seed,
             bias=bias,
+            batch_size=batch_size,
         )
 
         # Update short name based on the algorithm
@@ -183,14 +265,68 @@ class NNGSRunner(_NNRunnerBase):
         """
         if self._extra_args is not None and len(self._extra_args) > 0:
             params = {**params, **self._extra_args}
+        sample_ids = params.pop("sample_ids", None)
+
+        fold_sample_ids = sample_ids if self.warm_start_scope == "fold" else None
+        warm_start_key = self._get_warm_start_key(total_args, fold_sample_ids) if self.warm_start else None
+        if warm_start_key is not None:
+            warm_start_weights = self._warm_start_cache.get(warm_start_key)
+            if warm_start_weights is not None:
+                params["init_state"] = warm_start_weights
 
         total_args.update(params)
         total_args.pop("problem")
 
-        return self._invoke_algorithm(
+        results = self._invoke_algorithm(
             algorithm=algorithm,
             curve=self.generate_curves,
             callback_user_info=copy.deepcopy(total_args),
             additional_algorithm_args=total_args,
             **params,
         )
+        self._save_fit_results()
+
+        if warm_start_key is not None and results is not None and not self.has_aborted():
+            self._warm_start_cache.update(warm_start_key, weights=results[0], loss=results[1])
+
+        return results
+
+    def _get_search_arguments(self) -> dict[str, Any]:
+        """
+        Builds the search arguments, passing each fit the indices of its training rows when warm starts are per fold.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments for GridSearchMixin._perform_grid_search.
+        """
+        search_arguments = super()._get_search_arguments()
+        if self.warm_start and self.warm_start_scope == "fold":
+            search_arguments["fit_params"] = {"sample_ids": np.arange(len(self.y_train))}
+
+        return search_arguments
+
+    @staticmethod
+    def _get_warm_start_key(total_args: dict, sample_ids: np.ndarray | None) -> tuple:
+        """
+        Build the warm-start cache key for a fit from its network architecture and, if given, its training fold.
+
+        Parameters
+        ----------
+        total_args : dict
+            Arguments of the fit, including hidden_layer_sizes, activation and bias.
+        sample_ids : np.ndarray | None
+            Indices of the training rows of the fit, or None if it was not run by a grid search or warm starts are
+            shared across folds.
+
+        Returns
+        -------
+        tuple
+            The cache key.
+        """
+        key = (tuple(total_args.get("hidden_layer_sizes") or []), get_short_name(total_args.get("activation")), total_args.get("bias"))
+        if sample_ids is not None:
+            sample_ids = np.ascontiguousarray(sample_ids, dtype=np.int64)
+            key += (len(sample_ids), hashlib.md5(sample_ids.view(np.uint8)).hexdigest())
+
+        return key
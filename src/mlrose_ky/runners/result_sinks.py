@@ -0,0 +1,230 @@
+"""Classes for writing runner result DataFrames to disk in different file formats, and reading them back."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import pickle as pk
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class ResultSink(ABC):
+    """
+    Base class for writing result DataFrames to disk and reading them back.
+
+    Subclasses set `name` (used to select the sink in a runner's result_formats) and `extension` (appended to
+    the root filename of each DataFrame), and implement `write` and `read`.
+
+    Only PickleSink reads back exactly the DataFrame it wrote: the other sinks store object columns, such as
+    states, as strings, which is what a runner replaying its experiments from their files reads back.
+    """
+
+    name: str = ""
+    extension: str = ""
+
+    def filename(self, filename_root: str) -> str:
+        """Return the filename of a DataFrame with the given root filename."""
+        return f"{filename_root}{self.extension}"
+
+    @abstractmethod
+    def write(self, df: pd.DataFrame, filename_root: str) -> str:
+        """
+        Write a DataFrame to disk.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to write.
+        filename_root : str
+            Root filename of the DataFrame, to which the sink's extension is appended.
+
+        Returns
+        -------
+        str
+            The name of the written file.
+        """
+        raise NotImplementedError("Subclasses must implement write method.")
+
+    @abstractmethod
+    def read(self, filename: str) -> pd.DataFrame:
+        """
+        Read a DataFrame written by this sink.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to read.
+
+        Returns
+        -------
+        pd.DataFrame
+            The DataFrame read from the file.
+        """
+        raise NotImplementedError("Subclasses must implement read method.")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
+
+class PickleSink(ResultSink):
+    """Writes DataFrames as pickle files (.p), preserving every column's type and value exactly."""
+
+    name = "pickle"
+    extension = ".p"
+
+    def write(self, df: pd.DataFrame, filename_root: str) -> str:
+        filename = self.filename(filename_root)
+        with open(filename, "wb") as pickle_file:
+            pk.dump(df, pickle_file)
+
+        return filename
+
+    def read(self, filename: str) -> pd.DataFrame:
+        with open(filename, "rb") as pickle_file:
+            return pk.load(pickle_file)
+
+
+class CSVSink(ResultSink):
+    """Exports DataFrames as human-readable CSV files (.csv), in which every value is read back as text or a number."""
+
+    name = "csv"
+    extension = ".csv"
+
+    def write(self, df: pd.DataFrame, filename_root: str) -> str:
+        filename = self.filename(filename_root)
+        df.to_csv(filename)
+
+        return filename
+
+    def read(self, filename: str) -> pd.DataFrame:
+        return pd.read_csv(filename, index_col=0)
+
+
+def _to_typed_columns(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Convert the columns of a DataFrame to typed NumPy arrays for columnar storage.
+
+    Numeric and boolean columns keep their dtype, while object columns holding anything other than only
+    numbers (and missing values), e.g. states or callables, are stored as their string representations.
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == object:
+            inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+            if inferred_type in ("integer", "floating", "mixed-integer-float", "decimal"):
+                columns[str(column)] = pd.to_numeric(values).to_numpy(dtype=float if values.isna().any() else None)
+            else:
+                columns[str(column)] = values.astype(str).to_numpy(dtype=str)
+        else:
+            columns[str(column)] = values.to_numpy()
+
+    return columns
+
+
+class ParquetSink(ResultSink):
+    """
+    Exports DataFrames as Apache Parquet files (.parquet) with typed, compressed columns.
+
+    Object columns other than numeric ones, e.g. states or callables, are exported as strings. Requires the
+    optional pyarrow package.
+    """
+
+    name = "parquet"
+    extension = ".parquet"
+
+    @staticmethod
+    def _import_pyarrow() -> Any:
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("The 'parquet' result format requires pyarrow, which can be installed with `pip install pyarrow`.") from e
+
+        return pyarrow
+
+    def write(self, df: pd.DataFrame, filename_root: str) -> str:
+        self._import_pyarrow()
+        filename = self.filename(filename_root)
+        pd.DataFrame(_to_typed_columns(df), index=df.index).to_parquet(filename, engine="pyarrow")
+
+        return filename
+
+    def read(self, filename: str) -> pd.DataFrame:
+        self._import_pyarrow()
+        return pd.read_parquet(filename, engine="pyarrow")
+
+
+class NpzSink(ResultSink):
+    """
+    Exports DataFrames as compressed NumPy archives (.npz) of typed columns, without any extra dependency.
+
+    Object columns other than numeric ones, e.g. states or callables, are exported as strings.
+    """
+
+    name = "npz"
+    extension = ".npz"
+
+    _COLUMNS_KEY = "__columns__"
+    _INDEX_KEY = "__index__"
+
+    def write(self, df: pd.DataFrame, filename_root: str) -> str:
+        filename = self.filename(filename_root)
+        columns = _to_typed_columns(df)
+        index = _to_typed_columns(pd.DataFrame({self._INDEX_KEY: df.index}))[self._INDEX_KEY]
+        arrays = {f"column_{i}": values for i, values in enumerate(columns.values())}
+        np.savez_compressed(filename, **{self._COLUMNS_KEY: np.array(list(columns), dtype=str), self._INDEX_KEY: index}, **arrays)
+
+        return filename
+
+    def read(self, filename: str) -> pd.DataFrame:
+        with np.load(filename, allow_pickle=False) as npz_file:
+            column_names = npz_file[self._COLUMNS_KEY].tolist()
+            index = npz_file[self._INDEX_KEY] if self._INDEX_KEY in npz_file else None
+            return pd.DataFrame({name: npz_file[f"column_{i}"] for i, name in enumerate(column_names)}, index=index)
+
+
+RESULT_SINKS: dict[str, type[ResultSink]] = {sink.name: sink for sink in (PickleSink, CSVSink, ParquetSink, NpzSink)}
+
+
+def build_result_sinks(result_formats: str | ResultSink | list[str | ResultSink] | tuple[str | ResultSink, ...]) -> list[ResultSink]:
+    """
+    Build the result sinks for a runner's result_formats.
+
+    Parameters
+    ----------
+    result_formats : str | ResultSink | list[str | ResultSink] | tuple[str | ResultSink, ...]
+        Names of the formats to write (any of 'pickle', 'csv', 'parquet' and 'npz') and/or ResultSink instances.
+
+    Returns
+    -------
+    list[ResultSink]
+        The result sinks, without duplicates, in the order of result_formats.
+    """
+    if isinstance(result_formats, (str, ResultSink)):
+        result_formats = [result_formats]
+
+    sinks = []
+    for result_format in result_formats:
+        if isinstance(result_format, ResultSink):
+            sink = result_format
+        elif result_format in RESULT_SINKS:
+            sink = RESULT_SINKS[result_format]()
+        else:
+            raise ValueError(f"result_formats must contain ResultSink instances or names among {set(RESULT_SINKS)}, got {result_format}.")
+
+        if sink not in sinks:
+            sinks.append(sink)
+
+    if not sinks:
+        raise ValueError(f"result_formats must contain at least one format, got {result_formats}.")
+
+    return sinks
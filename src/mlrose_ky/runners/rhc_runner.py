@@ -54,6 +54,7 @@ class RHCRunner(_RunnerBase):
         max_attempts: int = 500,
         generate_curves: bool = True,
         output_directory: str = None,
+        n_jobs: int = 1,
         **kwargs: Any,
     ):
         """
@@ -77,6 +78,8 @@ class RHCRunner(_RunnerBase):
             Whether to generate learning curves.
         output_directory : str, optional
             Directory to save experiment result, default=None.
+        n_jobs : int, optional
+            Number of worker processes to run the parameter combinations in, or -1 for one per CPU, default=1.
         """
         super().__init__(
             problem=problem,
@@ -86,6 +89,7 @@ class RHCRunner(_RunnerBase):
             max_attempts=max_attempts,
             generate_curves=generate_curves,
             output_directory=output_directory,
+            n_jobs=n_jobs,
             **kwargs,
         )
         self.restart_list: list[int] = restart_list
@@ -66,6 +66,7 @@ class SARunner(_RunnerBase):
         max_attempts: int = 500,
         generate_curves: bool = True,
         output_directory: str = None,
+        n_jobs: int = 1,
         **kwargs: dict,
     ):
         """
@@ -91,6 +92,8 @@ class SARunner(_RunnerBase):
             Whether to generate learning curves.
         output_directory : str, optional
             Directory to save experiment result, default=None.
+        n_jobs : int, optional
+            Number of worker processes to run the parameter combinations in, or -1 for one per CPU, default=1.
         """
         super().__init__(
             problem=problem,
@@ -100,6 +103,7 @@ class SARunner(_RunnerBase):
             max_attempts=max_attempts,
             generate_curves=generate_curves,
             output_directory=output_directory,
+            n_jobs=n_jobs,
             **kwargs,
         )
         self.use_raw_temp = True
@@ -14,6 +14,7 @@ from sklearn.neural_network import MLPClassifier
 import mlrose_ky.neural.activation as act
 from mlrose_ky.decorators import short_name
 from mlrose_ky.runners._nn_runner_base import _NNRunnerBase
+from mlrose_ky.runners.result_sinks import ResultSink
 
 
 @short_name("skmlp")
@@ -30,6 +31,8 @@ class SKMLPRunner(_NNRunnerBase):
         An instance of an internal MLPClassifier with extended functionality.
     """
 
+    _iteration_budget_param: str = "max_iter"
+
     class _MLPClassifier(BaseEstimator):
         """
         Internal wrapper for MLPClassifier with additional callback functionality for tracking
@@ -171,6 +174,7 @@ class SKMLPRunner(_NNRunnerBase):
                 done=True,
                 curve=self.curve_,
             )
+            self.runner._save_fit_results()
 
     def __init__(
         self,
@@ -191,6 +195,9 @@ class SKMLPRunner(_NNRunnerBase):
         generate_curves: bool = True,
         output_directory: str = None,
         replay: bool = False,
+        search_mode: str = "grid",
+        halving_factor: int = 3,
+        result_formats: str | ResultSink | list[str | ResultSink] = "pickle",
         **kwargs: Any,
     ):
         """
@@ -232,6 +239,17 @@ class SKMLPRunner(_NNRunnerBase):
             Directory to save output.
         replay : bool, optional
             Whether to replay the experiment.
+        search_mode : str, optional
+            Either 'grid' for an exhaustive grid search, or 'halving' for a successive-halving search that prunes
+            poorly performing candidates early. The halving search trains for min(iteration_list) up to
+            max(iteration_list) iterations, multiplying the budget by halving_factor at each round; the values in
+            between are not used, and each round retrains its candidates from scratch.
+        halving_factor : int, optional
+            Proportion of candidates eliminated at each successive-halving round.
+        result_formats : str | ResultSink | list[str | ResultSink], optional
+            File formats the result DataFrames are saved in: any of 'pickle', 'csv', 'parquet' (requires pyarrow)
+            and 'npz', and/or ResultSink instances. In replay mode, results are read from the first of these formats
+            found; formats other than pickle store object columns such as State as strings.
         """
         grid_search_parameters = {**grid_search_parameters}
 
@@ -258,6 +276,9 @@ class SKMLPRunner(_NNRunnerBase):
             replay=replay,
             n_jobs=n_jobs,
             cv=cv,
+            search_mode=search_mode,
+            halving_factor=halving_factor,
+            result_formats=result_formats,
         )
 
         # Create a dictionary of default values
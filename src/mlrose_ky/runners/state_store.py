@@ -0,0 +1,222 @@
+"""Class for storing the states logged by a runner out-of-band, deduplicated by content."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import hashlib
+from typing import Any, BinaryIO
+
+import numpy as np
+
+_MIN_CAPACITY = 64
+
+
+class StateStore:
+    """
+    Deduplicated, content-addressed store of the states logged by a runner.
+
+    Each distinct state is stored once and identified by an integer reference (its row in the store), so that
+    run statistics can hold the reference instead of a string representation of the whole state. The store is
+    saved as a single 2-D .npy file, which load_states can memory-map.
+
+    States are kept in a preallocated array that grows geometrically. Once the store has been saved, that array
+    is a memory map of the saved file: new states are written to the file directly, and later saves only update
+    its header, so neither the memory used by the store nor the cost of saving it grows with the number of states.
+
+    All states in a store must have the shape of the first state added, and a dtype that can be cast to its dtype.
+    """
+
+    def __init__(self):
+        self._refs: dict[bytes, int] = {}
+        self._buffer: np.ndarray | None = None
+        self._size: int = 0
+        self._shape: tuple[int, ...] | None = None
+        self._dtype: np.dtype | None = None
+        self._filename: str | None = None
+        self._file: BinaryIO | None = None
+        self._header_length: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies (e.g. sent to worker processes) hold their states in memory rather than sharing the saved file
+        state = self.__dict__.copy()
+        state["_buffer"] = None if self._buffer is None else np.array(self._buffer[: self._size])
+        state["_filename"] = None
+        state["_file"] = None
+        state["_header_length"] = 0
+        return state
+
+    def add(self, state: Any) -> int:
+        """
+        Add a state to the store, unless an identical state is already stored.
+
+        Parameters
+        ----------
+        state : Any
+            The state to add, convertible to a numeric array.
+
+        Returns
+        -------
+        int
+            The reference of the state.
+
+        Raises
+        ------
+        ValueError
+            If the state is not a numeric array, or does not have the shape and a dtype compatible with the dtype of
+            the first state added.
+        """
+        try:
+            array = np.asarray(state)
+        except (ValueError, TypeError):
+            array = np.asarray(None)
+
+        if array.dtype == object or not (np.issubdtype(array.dtype, np.number) or array.dtype == bool):
+            raise ValueError(f"state must be convertible to a numeric array. Got {type(state).__name__} with dtype {array.dtype}")
+        if self._shape is None:
+            self._shape, self._dtype = array.shape, array.dtype
+        elif array.shape != self._shape or not np.can_cast(array.dtype, self._dtype, casting="same_kind"):
+            raise ValueError(
+                f"state must have shape {self._shape} and a dtype that can be cast to {self._dtype}. Got shape {array.shape} "
+                f"and dtype {array.dtype}"
+            )
+
+        array = np.ascontiguousarray(array, dtype=self._dtype)
+        key = hashlib.blake2b(array.tobytes(), digest_size=16).digest()
+
+        ref = self._refs.get(key)
+        if ref is None:
+            if self._buffer is None or self._size == len(self._buffer):
+                self._grow()
+            ref = self._size
+            self._buffer[ref] = array
+            self._refs[key] = ref
+            self._size += 1
+
+        return ref
+
+    def get(self, ref: int) -> np.ndarray:
+        """Return the state with the given reference."""
+        if not 0 <= ref < self._size:
+            raise IndexError(f"ref must be between 0 and {self._size - 1}. Got {ref}")
+
+        return self._buffer[ref]
+
+    def to_array(self) -> np.ndarray:
+        """Return all stored states as one array, with the state of reference i in row i."""
+        if self._size == 0:
+            return np.empty((0,))
+
+        return self._buffer[: self._size]
+
+    def save(self, filename: str):
+        """
+        Save all stored states to a .npy file.
+
+        The first save to a file writes every state to it and memory-maps it. Later saves to the same file only
+        update its header, as the states added in between were written to the file directly.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the .npy file.
+        """
+        if self._size == 0:
+            np.save(filename, self.to_array())
+            return
+
+        if filename != self._filename:
+            states = self.to_array()
+            self.close()
+            self._file = open(filename, "w+b")
+            self._filename = filename
+            self._write_header()
+            self._header_length = self._file.tell()
+            self._file.write(np.ascontiguousarray(states).tobytes())
+        else:
+            self._buffer.flush()
+            self._write_header()
+
+        # Trim the file to the stored states; it is extended again once more states are added
+        self._file.flush()
+        self._map(self._size)
+
+    def close(self):
+        """Stop writing new states to the saved file, keeping the stored states in memory."""
+        if self._file is None:
+            return
+
+        self._buffer = np.array(self._buffer[: self._size])
+        self._file.close()
+        self._file = None
+        self._filename = None
+
+    def clear(self):
+        """Remove all stored states. The saved file, if any, is left as it is."""
+        if self._file is not None:
+            self._file.close()
+        self._refs.clear()
+        self._buffer = None
+        self._size = 0
+        self._shape = None
+        self._dtype = None
+        self._filename = None
+        self._file = None
+        self._header_length = 0
+
+    def _row_size(self) -> int:
+        """Return the number of bytes of a stored state."""
+        return int(np.prod(self._shape, dtype=np.int64)) * self._dtype.itemsize
+
+    def _grow(self):
+        """Double the capacity of the store, extending the saved file if the store has been saved."""
+        capacity = max(_MIN_CAPACITY, 2 * self._size)
+        if self._file is None:
+            buffer = np.empty((capacity, *self._shape), dtype=self._dtype)
+            if self._size:
+                buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        else:
+            self._buffer.flush()
+            self._map(capacity)
+
+    def _map(self, capacity: int):
+        """Resize the saved file to hold capacity states, and memory-map it."""
+        self._buffer = None
+        self._file.truncate(self._header_length + capacity * self._row_size())
+        self._buffer = np.memmap(self._file, dtype=self._dtype, mode="r+", offset=self._header_length, shape=(capacity, *self._shape))
+
+    def _write_header(self):
+        """
+        Write the .npy header of the saved file, describing the states stored so far.
+
+        The header is padded so that its length does not depend on the number of states, which allows it to be
+        rewritten in place.
+        """
+        self._file.seek(0)
+        np.lib.format.write_array_header_1_0(
+            self._file, {"descr": np.lib.format.dtype_to_descr(self._dtype), "fortran_order": False, "shape": (self._size, *self._shape)}
+        )
+        if self._header_length and self._file.tell() != self._header_length:
+            raise OSError(f"The header of {self._filename} changed length and cannot be rewritten in place.")
+
+
+def load_states(filename: str, mmap: bool = True) -> np.ndarray:
+    """
+    Load the states saved by a runner's state store.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .npy file saved by the state store.
+    mmap : bool, optional, default=True
+        Whether to memory-map the file instead of reading it into memory.
+
+    Returns
+    -------
+    np.ndarray
+        The states, with the state referenced by a run statistics row's State value in the row of that index.
+    """
+    return np.load(filename, mmap_mode="r" if mmap else None)
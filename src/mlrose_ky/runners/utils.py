@@ -1,6 +1,11 @@
-"""Utility function to build file paths for experiment data, ensuring directories are created if needed."""
+"""Utility functions to build file paths for experiment data and to read experiment result journals."""
 
 import os
+import pickle as pk
+
+import pandas as pd
+
+JOURNAL_EXTENSION = ".journal"
 
 
 def build_data_filename(
@@ -49,3 +54,33 @@ def build_data_filename(
     filename = f"{runner_name.lower()}__{experiment_name}__{df_name}{x_param}{y_param}{ext}"
 
     return os.path.join(output_directory, experiment_name, filename)
+
+
+def load_journal(filename: str) -> pd.DataFrame:
+    """
+    Load the rows appended to a runner's result journal file into a DataFrame.
+
+    Runners append logged rows to journal files in batches while an experiment is running, and remove them once
+    the results have been saved, so a journal file is only left behind by an interrupted experiment.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the journal file, ending with '.journal'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of every complete batch in the journal. A batch truncated by an interruption is ignored.
+    """
+    batches = []
+    with open(filename, "rb") as journal_file:
+        while True:
+            try:
+                batch = pk.load(journal_file)
+            except (EOFError, pk.UnpicklingError):
+                break
+            # Run statistics are journaled as lists of rows, and fitness curves as DataFrames built from their columns
+            batches.append(batch if isinstance(batch, pd.DataFrame) else pd.DataFrame(batch))
+
+    return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
@@ -1,267 +1,387 @@
+"""Functions for running sweeps of optimization algorithms over parameter grids and seeds in parallel."""
+
 # Original implementation by yxlow: https://github.com/freedom89
 # Output formatting and enhancements by nkapila6: https://github.com/nkapila6
+# Sweep engine by Kyle Nakamura
+# License: BSD 3-clause
 
-from joblib import Parallel, delayed
-from itertools import product
+import functools
+import math
+import os
 import time
-import mlrose_ky as mlrose
-import pandas as pd
-import pickle
+from dataclasses import dataclass, field
+from itertools import product
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from pprint import pprint
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from mlrose_ky.algorithms import genetic_alg, gradient_descent, hill_climb, mimic, random_hill_climb, simulated_annealing
+from mlrose_ky.utils.shared_problem import SharedProblem
+
+ALGORITHMS: dict[str, Callable] = {
+    "hill_climb": hill_climb,
+    "random_hill_climb": random_hill_climb,
+    "simulated_annealing": simulated_annealing,
+    "genetic_alg": genetic_alg,
+    "mimic": mimic,
+    "gradient_descent": gradient_descent,
+}
+
+_SWEEP_COLUMNS = ["Task", "Algorithm", "Seed"]
+_CURVE_COLUMNS = ["Iteration", "Fitness", "FEvals"]
+_TASK_COLUMNS = ["Best Fitness", "Best State", "Time"]
+
+
+@dataclass(frozen=True)
+class SweepTask:
+    """
+    Specification of one run of an optimization algorithm in a sweep.
+
+    Attributes
+    ----------
+    task_id : int
+        Position of the task in its sweep.
+    algorithm : str
+        Name of the algorithm to run, a key of ALGORITHMS.
+    seed : int
+        Random state of the run.
+    params : dict[str, Any]
+        Keyword arguments passed to the algorithm, other than the problem, random_state and curve.
+    """
+
+    task_id: int
+    algorithm: str
+    seed: int
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {list(ALGORITHMS)}, got {self.algorithm}.")
+
+        reserved_params = {"problem", "random_state", "curve"} & set(self.params)
+        if reserved_params:
+            raise ValueError(f"params must not contain problem, random_state or curve, got {sorted(reserved_params)}.")
+
+
+def generate_parameter_list(parameter_dict: dict[str, list], view_params: bool = False) -> list[dict[str, Any]]:
+    """
+    Generate every combination of the values of a parameter grid.
+
+    Parameters
+    ----------
+    parameter_dict : dict[str, list]
+        The values of each parameter.
+    view_params : bool, optional, default=False
+        Whether to print the combinations.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One dictionary of parameter values per combination.
+    """
+    parameters_list = [dict(zip(parameter_dict.keys(), combination)) for combination in product(*parameter_dict.values())]
+    if view_params:
+        pprint(parameters_list)
+
+    return parameters_list
+
+
+def build_tasks(algorithm: str, grid: dict[str, list], seeds: list[int] | range) -> list[SweepTask]:
+    """
+    Build the tasks of a sweep of an algorithm over every combination of a parameter grid and seeds.
+
+    Parameters
+    ----------
+    algorithm : str
+        Name of the algorithm, a key of ALGORITHMS.
+    grid : dict[str, list]
+        The values of each of the algorithm's keyword arguments to sweep over.
+    seeds : list[int] | range
+        The random states to run each combination of parameters with.
+
+    Returns
+    -------
+    list[SweepTask]
+        One task per combination of parameters and seed, with the seeds of each combination consecutive.
+    """
+    if len(seeds) == 0:
+        raise ValueError(f"seeds must contain at least one seed, got {seeds}.")
+
+    return [
+        SweepTask(task_id=i, algorithm=algorithm, seed=int(seed), params=params)
+        for i, (params, seed) in enumerate(product(generate_parameter_list(grid), seeds))
+    ]
+
+
+def _run_task(problem: Any, task: SweepTask) -> tuple[float, np.ndarray, np.ndarray, float]:
+    """Run one task, returning its best fitness, best state, fitness curve (with two columns) and run time."""
+    start_time = time.perf_counter()
+    best_state, best_fitness, fitness_curve = ALGORITHMS[task.algorithm](problem, random_state=task.seed, curve=True, **task.params)
+    run_time = time.perf_counter() - start_time
+
+    fitness_curve = np.asarray(fitness_curve, dtype=np.float64)
+    fitness_curve = fitness_curve.reshape(len(fitness_curve), -1) if fitness_curve.size else np.empty((0, 2))
+    if fitness_curve.shape[1] < 2:
+        fitness_curve = np.column_stack([fitness_curve[:, 0], np.full(len(fitness_curve), np.nan)])
+
+    return float(best_fitness), np.asarray(best_state), fitness_curve[:, :2], run_time
+
+
+def _run_chunk(problem: Any | SharedProblem, tasks: list[SweepTask]) -> tuple[list[tuple[float, np.ndarray, float]], str | None, list[int]]:
+    """
+    Run a chunk of tasks on one copy of the problem.
+
+    The fitness curves of the chunk are written, one after the other, to a shared memory block that the caller reads
+    them from and then unlinks, instead of being pickled back with the other results.
+
+    Returns
+    -------
+    tuple[list[tuple[float, np.ndarray, float]], str | None, list[int]]
+        The best fitness, best state and run time of each task, the name of the shared memory block holding the
+        curves (None if they are all empty), and the length of each task's curve.
+    """
+    if isinstance(problem, SharedProblem):
+        problem = problem.get()
+
+    task_results, curves = [], []
+    for task in tasks:
+        best_fitness, best_state, fitness_curve, run_time = _run_task(problem, task)
+        task_results.append((best_fitness, best_state, run_time))
+        curves.append(fitness_curve)
+
+    curve_lengths = [len(curve) for curve in curves]
+    if sum(curve_lengths) == 0:
+        return task_results, None, curve_lengths
+
+    all_curves = np.concatenate(curves)
+    shared_memory = SharedMemory(create=True, size=all_curves.nbytes)
+    np.ndarray(all_curves.shape, dtype=all_curves.dtype, buffer=shared_memory.buf)[:] = all_curves
+    shared_memory.close()
+
+    # The block outlives this process until the caller has read it, so it must not be cleaned up on exit. The
+    # resource tracker (POSIX only) registers blocks under their name with a leading slash
+    if os.name == "posix":
+        resource_tracker.unregister(f"/{shared_memory.name}", "shared_memory")
+
+    return task_results, shared_memory.name, curve_lengths
+
+
+def _read_shared_curves(name: str | None, n_rows: int) -> np.ndarray:
+    """Copy the curves written by _run_chunk out of their shared memory block."""
+    if name is None:
+        return np.empty((0, 2))
+
+    shared_memory = SharedMemory(name=name)
+    try:
+        return np.ndarray((n_rows, 2), dtype=np.float64, buffer=shared_memory.buf).copy()
+    finally:
+        shared_memory.close()
+
+
+def _unlink_shared_curves(name: str | None):
+    """Unlink the shared memory block written by _run_chunk, if it still exists."""
+    if name is None:
+        return
+
+    try:
+        shared_memory = SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+def run_sweep(
+    problem: Any | SharedProblem, tasks: list[SweepTask], n_jobs: int = -1, chunk_size: int | None = None, verbose: int = 0
+) -> pd.DataFrame:
+    """
+    Run the tasks of a sweep in parallel, and consolidate their results in one tidy DataFrame.
+
+    Tasks are run in chunks, so that the problem is pickled once per chunk rather than once per task, and the
+    fitness curves are returned through shared memory as NumPy arrays.
+
+    Parameters
+    ----------
+    problem : Any | SharedProblem
+        The optimization problem to run every task on. Each worker runs its chunks on its own copy, unless the
+        problem is a SharedProblem, which each worker attaches to once instead of receiving with every chunk.
+    tasks : list[SweepTask]
+        The tasks to run, as built by build_tasks.
+    n_jobs : int, optional, default=-1
+        Number of worker processes, as understood by joblib (-1 uses one per CPU).
+    chunk_size : int | None, optional, default=None
+        Number of tasks per chunk. By default, the tasks are split into about four chunks per worker.
+    verbose : int, optional, default=0
+        Verbosity of joblib's progress messages.
 
-def timeit(func):
+    Returns
+    -------
+    pd.DataFrame
+        One row per iteration of each task's fitness curve, with the columns Task, Algorithm, Seed, the swept
+        parameters, Iteration (1-based position in the curve), Fitness and FEvals, followed by the task's
+        Best Fitness, Best State and Time (in seconds).
+    """
+    if chunk_size is not None and (isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError(f"chunk_size must be a positive integer or None, got {chunk_size}.")
+
+    if not tasks:
+        return pd.DataFrame(columns=_SWEEP_COLUMNS + _CURVE_COLUMNS + _TASK_COLUMNS)
+
+    if chunk_size is None:
+        n_workers = Parallel(n_jobs=n_jobs).n_jobs
+        n_workers = n_workers if n_workers > 0 else 1
+        chunk_size = max(1, math.ceil(len(tasks) / (4 * n_workers)))
+    chunks = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    chunk_results = Parallel(n_jobs=n_jobs, verbose=verbose)(delayed(_run_chunk)(problem, chunk) for chunk in chunks)
+
+    frames = []
+    try:
+        for chunk, (task_results, shared_memory_name, curve_lengths) in zip(chunks, chunk_results):
+            curves = _read_shared_curves(shared_memory_name, sum(curve_lengths))
+            offsets = np.concatenate([[0], np.cumsum(curve_lengths)])
+
+            for task, (best_fitness, best_state, run_time), start, end in zip(chunk, task_results, offsets[:-1], offsets[1:]):
+                n_rows = int(end - start)
+                frame = {"Task": task.task_id, "Algorithm": task.algorithm, "Seed": task.seed}
+                frame.update({name: [value] * n_rows for name, value in task.params.items()})
+                frame.update({"Iteration": np.arange(1, n_rows + 1), "Fitness": curves[start:end, 0], "FEvals": curves[start:end, 1]})
+                frame.update({"Best Fitness": best_fitness, "Best State": [best_state] * n_rows, "Time": run_time})
+                frames.append(pd.DataFrame(frame, index=pd.RangeIndex(n_rows)))
+    finally:
+        # Unlink every block, including those left unread when building the frames fails
+        for _, shared_memory_name, _ in chunk_results:
+            _unlink_shared_curves(shared_memory_name)
+
+    results = pd.concat(frames, ignore_index=True)
+    parameter_columns = [column for column in results.columns if column not in _SWEEP_COLUMNS + _CURVE_COLUMNS + _TASK_COLUMNS]
+
+    return results[_SWEEP_COLUMNS + parameter_columns + _CURVE_COLUMNS + _TASK_COLUMNS]
+
+
+def timeit(func: Callable) -> Callable:
+    """Decorate a function returning a DataFrame to return a copy of it with its execution time in a Time column."""
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()  # Record start time
-        result = func(*args, **kwargs)  # Call the decorated function
-        end_time = time.time()  # Record end time
-        execution_time = end_time - start_time  # Calculate execution time
-        
+        start_time = time.perf_counter()
+        result = func(*args, **kwargs)
+        execution_time = time.perf_counter() - start_time
+
         if isinstance(result, pd.DataFrame):
-            result['Time'] = execution_time
-        else:
-            print('Warning: Unable to append execution time to the result.')
-        # return result, execution_time  # Return result and execution time as a tuple
-        return result  # Return result and execution time as a tuple
-    return wrapper
+            return result.assign(Time=execution_time)
 
+        print("Warning: Unable to append execution time to the result.")
+        return result
 
-def generate_parameter_list(parameter_dict, view_params=False):
-    # pprint(parameter_dict)
-    combinations = product(*parameter_dict.values())
-    parameters_list = [
-        dict(zip(parameter_dict.keys(), combination)) for combination in combinations
-    ]
-    if view_params==True: pprint(parameters_list)
-    # pprint(len(parameters_list))
-    return parameters_list
+    return wrapper
 
 
-@timeit
-def rhc_run(
-    problem,
-    max_attempt,
-    max_iter,
-    restart,
-    seeds,
-    param_dict=None,
-    state_fitness_call_back=None,
-    callback_user_info={}
-):
+def _legacy_run(problem: Any, algorithm: str, seeds: list[int], params: dict[str, Any], columns: dict[str, Any]) -> pd.DataFrame:
+    """Run an algorithm once per seed, returning one row per seed with the fitness curve stored as lists."""
     results = []
     for seed in seeds:
-        best_state, best_fitness, fitness_curve = mlrose.random_hill_climb(
-            problem,
-            max_attempts=max_attempt,
-            max_iters=max_iter,
-            restarts=restart,
-            init_state=None,
-            curve=True,
-            random_state=seed,
-            state_fitness_callback=state_fitness_call_back,
-            callback_user_info=callback_user_info,
-        )
-        fitness_value = fitness_curve[:,0].tolist()
-        fevals = fitness_curve[:,1].tolist()
+        best_fitness, best_state, fitness_curve, _ = _run_task(problem, SweepTask(task_id=0, algorithm=algorithm, seed=seed, params=params))
         run_result = {
             "Seed": seed,
             "Best State": best_state.tolist(),
             "Best Fitness": best_fitness,
-            "Fitness Value": fitness_value,
-            "Fevals": fevals,
-            'Max Attempt': param_dict['max_attempt'],
-            'Max Iters': param_dict['max_iter'],
-            'Restart': param_dict['restart'],
-            'Problem': param_dict['problem'],
-            # "Param dict": param_dict
+            "Fitness Value": fitness_curve[:, 0].tolist(),
+            "Fevals": fitness_curve[:, 1].tolist(),
         }
-        # run_result.update(params)
+        run_result.update(columns)
         results.append(run_result)
-    
-    df = pd.DataFrame(results)
-    return df
-    # return results
+
+    return pd.DataFrame(results)
+
+
+def _callback_params(state_fitness_call_back: Callable | None, callback_user_info: dict | None) -> dict[str, Any]:
+    return {
+        "state_fitness_callback": state_fitness_call_back,
+        "callback_user_info": {} if callback_user_info is None else callback_user_info,
+    }
 
 
 @timeit
-def sa_run(
-    problem,
-    decay,
-    max_attempt,
-    max_iter,
-    seeds,
-    param_dict=None,
-    state_fitness_call_back=None,
-    callback_user_info={},
-):
-    results = []
-    for seed in seeds:
-        best_state, best_fitness, fitness_curve = mlrose.simulated_annealing(
-            problem,
-            schedule=decay,
-            max_attempts=max_attempt,
-            max_iters=max_iter,
-            init_state=None,
-            curve=True,
-            random_state=seed,
-            state_fitness_callback=state_fitness_call_back,
-            callback_user_info=callback_user_info,
-        )
-
-        fitness_value = fitness_curve[:,0].tolist()
-        fevals = fitness_curve[:,1].tolist()
-        run_result = {
-            "Seed": seed,
-            "Best State": best_state.tolist(),
-            "Best Fitness": best_fitness,
-            "Fitness Value": fitness_value,
-            "Fevals": fevals,
-            'Max Attempt': param_dict['max_attempt'],
-            'Max Iters': param_dict['max_iter'],
-            'Decay': param_dict['decay'],
-            'Problem': param_dict['problem'],
-            # "Param dict": param_dict
-        }
-        results.append(run_result)
-    
-    df = pd.DataFrame(results)
-    # results.append(sa)
-    return df
+def rhc_run(problem, max_attempt, max_iter, restart, seeds, param_dict=None, state_fitness_call_back=None, callback_user_info=None):
+    """Run random hill climbing once per seed. Prefer build_tasks and run_sweep, which cover every algorithm."""
+    params = {
+        "max_attempts": max_attempt,
+        "max_iters": max_iter,
+        "restarts": restart,
+        **_callback_params(state_fitness_call_back, callback_user_info),
+    }
+    columns = {"Max Attempt": param_dict["max_attempt"], "Max Iters": param_dict["max_iter"], "Restart": param_dict["restart"]}
+
+    return _legacy_run(problem, "random_hill_climb", seeds, params, {**columns, "Problem": param_dict["problem"]})
+
+
+@timeit
+def sa_run(problem, decay, max_attempt, max_iter, seeds, param_dict=None, state_fitness_call_back=None, callback_user_info=None):
+    """Run simulated annealing once per seed. Prefer build_tasks and run_sweep, which cover every algorithm."""
+    params = {
+        "schedule": decay,
+        "max_attempts": max_attempt,
+        "max_iters": max_iter,
+        **_callback_params(state_fitness_call_back, callback_user_info),
+    }
+    columns = {"Max Attempt": param_dict["max_attempt"], "Max Iters": param_dict["max_iter"], "Decay": param_dict["decay"]}
+
+    return _legacy_run(problem, "simulated_annealing", seeds, params, {**columns, "Problem": param_dict["problem"]})
 
 
 @timeit
 def ga_run(
-    problem,
-    pop_size,
-    mutation_prob,
-    max_attempt,
-    max_iter,
-    seeds,
-    param_dict=None,
-    state_fitness_call_back=None,
-    callback_user_info={},
+    problem, pop_size, mutation_prob, max_attempt, max_iter, seeds, param_dict=None, state_fitness_call_back=None, callback_user_info=None
 ):
-    results = []
-    for seed in seeds:
-        best_state, best_fitness, fitness_curve = mlrose.genetic_alg(
-            problem,
-            pop_size=pop_size,
-            mutation_prob=mutation_prob,
-            max_attempts=max_attempt,
-            max_iters=max_iter,
-            curve=True,
-            random_state=seed,
-            state_fitness_callback=state_fitness_call_back,
-            callback_user_info=callback_user_info,
-        )
-        fitness_value = fitness_curve[:,0].tolist()
-        fevals = fitness_curve[:,1].tolist()
-        run_result = {
-            "Seed": seed,
-            "Best State": best_state.tolist(),
-            "Best Fitness": best_fitness,
-            "Fitness Value": fitness_value,
-            "Fevals": fevals,
-            'Max Attempt': param_dict['max_attempt'],
-            'Max Iters': param_dict['max_iter'],
-            'Pop Size': param_dict['pop_size'],
-            'Mutation Prob': param_dict['mutation_prob'],
-            'Problem': param_dict['problem'],
-            # "Param dict": param_dict
-        }
-        results.append(run_result)
-    
-    df = pd.DataFrame(results)
-    # results.append(sa)
-    return df
+    """Run the genetic algorithm once per seed. Prefer build_tasks and run_sweep, which cover every algorithm."""
+    params = {
+        "pop_size": pop_size,
+        "mutation_prob": mutation_prob,
+        "max_attempts": max_attempt,
+        "max_iters": max_iter,
+        **_callback_params(state_fitness_call_back, callback_user_info),
+    }
+    columns = {
+        "Max Attempt": param_dict["max_attempt"],
+        "Max Iters": param_dict["max_iter"],
+        "Pop Size": param_dict["pop_size"],
+        "Mutation Prob": param_dict["mutation_prob"],
+    }
+
+    return _legacy_run(problem, "genetic_alg", seeds, params, {**columns, "Problem": param_dict["problem"]})
 
 
 @timeit
 def mimic_run(
-    problem,
-    pop_size,
-    keep_pct,
-    max_attempt,
-    max_iter,
-    seeds,
-    param_dict=None,
-    state_fitness_call_back=None,
-    callback_user_info={},
+    problem, pop_size, keep_pct, max_attempt, max_iter, seeds, param_dict=None, state_fitness_call_back=None, callback_user_info=None
 ):
-    results = []
-    for seed in seeds:
-        best_state, best_fitness, fitness_curve = mlrose.mimic(
-            problem,
-            pop_size=pop_size,
-            keep_pct=keep_pct,
-            max_attempts=max_attempt,
-            max_iters=max_iter,
-            curve=True,
-            random_state=seed,
-            state_fitness_callback=state_fitness_call_back,
-            callback_user_info=callback_user_info,
-        )
-        fitness_value = fitness_curve[:,0].tolist()
-        fevals = fitness_curve[:,1].tolist()
-        run_result = {
-            "Seed": seed,
-            "Best State": best_state.tolist(),
-            "Best Fitness": best_fitness,
-            "Fitness Value": fitness_value,
-            "Fevals": fevals,
-            'Max Attempt': param_dict['max_attempt'],
-            'Max Iters': param_dict['max_iter'],
-            'Pop Size': param_dict['pop_size'],
-            'Keep Pct': param_dict['keep_pct'],
-            'Problem': param_dict['problem'],
-            # "Param dict": param_dict
-        }
-        results.append(run_result)
+    """Run MIMIC once per seed. Prefer build_tasks and run_sweep, which cover every algorithm."""
+    params = {
+        "pop_size": pop_size,
+        "keep_pct": keep_pct,
+        "max_attempts": max_attempt,
+        "max_iters": max_iter,
+        **_callback_params(state_fitness_call_back, callback_user_info),
+    }
+    columns = {
+        "Max Attempt": param_dict["max_attempt"],
+        "Max Iters": param_dict["max_iter"],
+        "Pop Size": param_dict["pop_size"],
+        "Keep Pct": param_dict["keep_pct"],
+    }
 
-    df = pd.DataFrame(results)
-    # return results
-    return df
+    return _legacy_run(problem, "mimic", seeds, params, {**columns, "Problem": param_dict["problem"]})
 
 
 def get_results(grid, func, n_jobs=-1, verbose=0, view_params=False):
+    """Run one of rhc_run, sa_run, ga_run or mimic_run for every combination of a grid, returning one DataFrame per combination."""
     params = generate_parameter_list(grid, view_params)
     print("Number of params:", len(params))
-    results = Parallel(n_jobs=n_jobs, verbose=verbose)(
-        delayed(func)(param_dict=params, **params) for params in params
-    )
-    # best_param = get_best_param(results, params)
-    # return results, params
-    return results
-
-# Example of custom call back function for Four Peaks.
-# def please_stop(
-#     iteration,
-#     state,
-#     fitness,
-#     fitness_evaluations,
-#     user_data,
-#     attempt=None,
-#     done=None,
-#     curve=None,
-# ):
-#     # Example of a please stop function
-#     # Hit max attempts or max iters - stop
-#     if done:
-#         return False
-#     if iteration > 1000:
-#         if fitness >= user_data["target"]:
-#             return False
-#         delta = abs(curve[iteration - 1][0] - (curve[-1000:].min(axis=0)[0]))
-#         if delta < user_data["delta"]:
-#             return False
-#     return True
-
-# Unnecessary
-# def pickle_dump(filename, results):
-#     with open(filename, "wb") as handle:
-#         pickle.dump(results, handle, protocol=pickle.HIGHEST_PROTOCOL)
-
-
-# def pickle_read(filename):
-#     with open(filename, "rb") as handle:
-#         file_contents = pickle.load(handle)
-#     return file_contents
+
+    return Parallel(n_jobs=n_jobs, verbose=verbose)(delayed(func)(param_dict=params, **params) for params in params)
@@ -0,0 +1,161 @@
+"""Class for publishing an optimization problem once, so worker processes can attach to it instead of unpickling copies."""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import copy
+import os
+import pickle as pk
+import shutil
+import tempfile
+from typing import Any
+
+import numpy as np
+
+_PAYLOAD_FILENAME = "problem.p"
+_SHARED_ARRAY_TAG = "mlrose_ky.shared_array"
+
+# The problems attached to in this process, with their memory-mapped arrays, by the directory they were published to
+_attached_problems: dict[str, tuple[Any, list[np.ndarray]]] = {}
+
+
+class _ArrayPublishingPickler(pk.Pickler):
+    """Pickler that saves large arrays to .npy files in a directory, and pickles a reference to the file instead."""
+
+    def __init__(self, file: Any, directory: str, min_bytes: int):
+        super().__init__(file, protocol=pk.HIGHEST_PROTOCOL)
+        self._directory = directory
+        self._min_bytes = min_bytes
+        self._filenames: dict[int, str] = {}
+        self._arrays: list[np.ndarray] = []
+        self.shared_nbytes: int = 0
+
+    def persistent_id(self, obj: Any) -> tuple[str, str] | None:
+        if type(obj) is not np.ndarray or obj.dtype.hasobject or obj.nbytes < self._min_bytes:
+            return None
+
+        filename = self._filenames.get(id(obj))
+        if filename is None:
+            filename = f"array_{len(self._filenames)}.npy"
+            np.save(os.path.join(self._directory, filename), obj)
+            self._filenames[id(obj)] = filename
+            # Keep the array alive while pickling, so that its id is not reused by another array
+            self._arrays.append(obj)
+            self.shared_nbytes += obj.nbytes
+
+        return _SHARED_ARRAY_TAG, filename
+
+
+class _ArrayAttachingUnpickler(pk.Unpickler):
+    """Unpickler that memory-maps the arrays saved by _ArrayPublishingPickler, read-only."""
+
+    def __init__(self, file: Any, directory: str):
+        super().__init__(file)
+        self._directory = directory
+        self.arrays: list[np.ndarray] = []
+
+    def persistent_load(self, pid: Any) -> np.ndarray:
+        tag, filename = pid
+        if tag != _SHARED_ARRAY_TAG:
+            raise pk.UnpicklingError(f"Unsupported persistent id: {pid}.")
+
+        array = np.load(os.path.join(self._directory, filename), mmap_mode="r")
+        self.arrays.append(array)
+        return array
+
+
+def _get_default_directory() -> str | None:
+    """Return the RAM-backed /dev/shm directory where available, otherwise None for the system's temporary directory."""
+    shm_directory = "/dev/shm"
+    if os.path.isdir(shm_directory) and os.access(shm_directory, os.W_OK):
+        return shm_directory
+
+    return None
+
+
+class SharedProblem:
+    """
+    Lightweight handle to an optimization problem published once for use by multiple processes.
+
+    The problem is pickled once into a directory, with every NumPy array of at least min_bytes (such as a
+    TravellingSales distance matrix, or the training data of a NetworkWeights fitness function) saved to its own
+    .npy file instead. Pickling the handle only pickles the directory's path, so sending it to a worker process
+    is cheap regardless of the problem's size. In each process, get unpickles the problem once, with the large
+    arrays memory-mapped read-only, so that their pages are shared by every process rather than copied into each.
+
+    Other attributes (such as a MaxKColorOpt source graph) are unpickled once per process, and copied for each
+    call to get, so that every task run in a process gets its own problem to modify. The problem should be
+    published before it is run, so that only its definition, rather than the state of a run, is shared.
+
+    The process that publishes the problem owns the directory, and removes it on close (or when used as a
+    context manager exits).
+
+    Parameters
+    ----------
+    problem : Any
+        The optimization problem to publish.
+    min_bytes : int, optional, default=1048576
+        Minimum size of the arrays that are memory-mapped rather than pickled with the rest of the problem.
+    directory : str | None, optional, default=None
+        Directory in which the problem's directory is created. By default, the RAM-backed /dev/shm where
+        available, otherwise the system's temporary directory.
+
+    Attributes
+    ----------
+    path : str
+        Directory the problem is published to.
+    shared_nbytes : int
+        Total size of the memory-mapped arrays.
+    """
+
+    def __init__(self, problem: Any, min_bytes: int = 1 << 20, directory: str | None = None):
+        if isinstance(min_bytes, bool) or not isinstance(min_bytes, int) or min_bytes < 0:
+            raise ValueError(f"min_bytes must be a non-negative integer, got {min_bytes}.")
+
+        self.path: str = tempfile.mkdtemp(prefix="mlrose_ky_problem_", dir=directory if directory is not None else _get_default_directory())
+        self._owner_pid: int = os.getpid()
+
+        try:
+            with open(os.path.join(self.path, _PAYLOAD_FILENAME), "wb") as payload_file:
+                pickler = _ArrayPublishingPickler(payload_file, self.path, min_bytes)
+                pickler.dump(problem)
+        except BaseException:
+            shutil.rmtree(self.path, ignore_errors=True)
+            raise
+
+        self.shared_nbytes: int = pickler.shared_nbytes
+
+    def get(self) -> Any:
+        """
+        Return a new copy of the problem, unpickling it in this process on first use.
+
+        Returns
+        -------
+        Any
+            A copy of the problem that shares its large, read-only memory-mapped arrays with every other copy.
+        """
+        attached = _attached_problems.get(self.path)
+        if attached is None:
+            with open(os.path.join(self.path, _PAYLOAD_FILENAME), "rb") as payload_file:
+                unpickler = _ArrayAttachingUnpickler(payload_file, self.path)
+                attached = unpickler.load(), unpickler.arrays
+            _attached_problems[self.path] = attached
+
+        problem, arrays = attached
+        # The memo makes the copy reuse the memory-mapped arrays instead of copying them into memory
+        return copy.deepcopy(problem, memo={id(array): array for array in arrays})
+
+    def close(self):
+        """Remove the published problem, if this process published it."""
+        _attached_problems.pop(self.path, None)
+        if os.getpid() == self._owner_pid:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self) -> "SharedProblem":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SharedProblem(path={self.path!r}, shared_nbytes={self.shared_nbytes})"
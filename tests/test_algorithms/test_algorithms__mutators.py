@@ -107,9 +107,9 @@ class TestAlgorithmsMutators:
 
         with (
             patch("numpy.random.uniform", return_value=np.array([0.0, 0.1, 0.2, 0.3, 0.4])),
-            patch("numpy.random.choice", side_effect=[1, 2, 3, 0, 2]),
+            patch("numpy.random.randint", return_value=np.array([1, 1, 1, 1, 2])),
         ):
-            # Mocking choices for each gene mutation
+            # Mocking the offset each gene is shifted by, modulo max_val
             mutated_child = mutator.mutate(child.copy(), mutation_probability)
             expected_child = np.array([1, 2, 3, 0, 2])
             assert np.array_equal(mutated_child, expected_child), "DiscreteMutator failed for non-binary genes."
@@ -0,0 +1,106 @@
+"""Unit tests for algorithms/optimizers/"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+import pytest
+
+from mlrose_ky import SGD, Adam, Momentum, RMSProp
+
+
+class TestAlgorithmsOptimizers:
+    """Test cases for the algorithms.optimizers module."""
+
+    def test_sgd_step(self):
+        """Test SGD step is the negative gradient scaled by the learning rate."""
+        optimizer = SGD(learning_rate=0.5)
+        assert np.allclose(optimizer.step(np.array([1.0, -2.0])), [-0.5, 1.0])
+
+    def test_momentum_step_accumulates_velocity(self):
+        """Test Momentum carries a fraction of the previous update into the next one."""
+        optimizer = Momentum(learning_rate=0.1, momentum=0.5)
+        gradient = np.array([1.0, -1.0])
+
+        first = optimizer.step(gradient)
+        second = optimizer.step(gradient)
+
+        assert np.allclose(first, [-0.1, 0.1])
+        assert np.allclose(second, [-0.15, 0.15])
+
+    def test_momentum_nesterov_step(self):
+        """Test Momentum with Nesterov looks ahead by the momentum term."""
+        optimizer = Momentum(learning_rate=0.1, momentum=0.5, nesterov=True)
+        assert np.allclose(optimizer.step(np.array([1.0])), [0.5 * -0.1 - 0.1])
+
+    def test_adam_first_step_is_learning_rate_sized(self):
+        """Test the bias-corrected first Adam step has magnitude close to the learning rate."""
+        optimizer = Adam(learning_rate=0.01)
+        update = optimizer.step(np.array([100.0, -0.001]))
+
+        assert np.allclose(np.abs(update), 0.01, rtol=1e-3)
+        assert np.all(np.sign(update) == [-1, 1])
+
+    def test_rmsprop_step(self):
+        """Test RMSProp scales the gradient by the root mean square of past gradients."""
+        optimizer = RMSProp(learning_rate=0.01, rho=0.9)
+        update = optimizer.step(np.array([2.0]))
+
+        assert np.allclose(update, -0.01 * 2.0 / (np.sqrt(0.1 * 4.0) + 1e-8))
+
+    @pytest.mark.parametrize("optimizer", [Momentum(), Adam(), RMSProp()])
+    def test_reset_clears_state(self, optimizer):
+        """Test that reset makes the optimizer behave as if newly created."""
+        gradient = np.array([0.3, -0.7, 1.1])
+        first = optimizer.step(gradient)
+        optimizer.step(gradient)
+
+        optimizer.reset()
+
+        assert np.allclose(optimizer.step(gradient), first)
+
+    @pytest.mark.parametrize("optimizer", [SGD(0.1), Momentum(0.05), Adam(0.05), RMSProp(0.05)])
+    def test_optimizers_minimize_quadratic(self, optimizer):
+        """Test that every optimizer converges on a simple quadratic bowl."""
+        state = np.array([3.0, -2.0])
+        for _ in range(500):
+            state = state + optimizer.step(2 * state)
+
+        assert np.allclose(state, 0, atol=0.05)
+
+    def test_invalid_parameters(self):
+        """Test optimizer initialization with invalid parameters."""
+        with pytest.raises(ValueError, match="learning_rate must be greater than 0"):
+            SGD(learning_rate=0)
+        with pytest.raises(ValueError, match="momentum must be between 0 and 1"):
+            Momentum(momentum=1.5)
+        with pytest.raises(ValueError, match="beta_1 must be between 0 and 1"):
+            Adam(beta_1=1)
+        with pytest.raises(ValueError, match="beta_2 must be between 0 and 1"):
+            Adam(beta_2=-0.1)
+        with pytest.raises(ValueError, match="rho must be between 0 and 1"):
+            RMSProp(rho=1)
+        with pytest.raises(ValueError, match="epsilon must be greater than 0"):
+            RMSProp(epsilon=0)
+
+    def test_str_repr_eq(self):
+        """Test optimizer __str__, __repr__ and __eq__ methods."""
+        optimizer = Momentum(learning_rate=0.2, momentum=0.8)
+
+        assert str(optimizer) == "Momentum(learning_rate=0.2, momentum=0.8, nesterov=False)"
+        assert repr(optimizer) == str(optimizer)
+        assert optimizer == Momentum(learning_rate=0.2, momentum=0.8)
+        assert optimizer != Momentum(learning_rate=0.2, momentum=0.7)
+        assert optimizer != SGD(learning_rate=0.2)
+
+    def test_get_info(self):
+        """Test optimizer get_info__ method."""
+        info = Adam(learning_rate=0.01).get_info__(prefix="test")
+
+        assert info == {
+            "test__optimizer_type": "adam",
+            "test__optimizer_learning_rate": 0.01,
+            "test__optimizer_beta_1": 0.9,
+            "test__optimizer_beta_2": 0.999,
+            "test__optimizer_epsilon": 1e-8,
+        }
@@ -0,0 +1,171 @@
+"""Unit tests for algorithms/restarts/"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+import pytest
+
+from mlrose_ky import DiscreteOpt, FourPeaks, OneMax, StagnationRestart
+from mlrose_ky.algorithms import hill_climb, random_hill_climb, simulated_annealing
+from tests.globals import SEED
+
+
+class TestStagnationRestart:
+    """Test cases for the algorithms.restarts module."""
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"patience": 0}, "patience must be a positive integer"),
+            ({"min_strength": 0}, "min_strength must be a positive integer"),
+            ({"min_strength": 3, "max_strength": 2}, "max_strength must be an integer greater than or equal to min_strength"),
+            ({"growth": 1}, "growth must be greater than 1"),
+            ({"max_restarts": -1}, "max_restarts must be a non-negative integer or np.inf"),
+        ],
+    )
+    def test_invalid_parameters_raise(self, kwargs, match):
+        """Test that StagnationRestart raises ValueError when its parameters are invalid."""
+        with pytest.raises(ValueError, match=match):
+            StagnationRestart(**kwargs)
+
+    def test_update_reports_stagnation_after_patience_evaluations(self):
+        """Test that update reports stagnation once patience evaluations were made without improvement."""
+        problem = DiscreteOpt(10, OneMax())
+        problem.set_state(np.zeros(10))
+        controller = StagnationRestart(patience=5)
+        controller.start(problem)
+
+        problem.fitness_evaluations += 4
+        assert not controller.update(problem)
+
+        problem.set_state(np.ones(10))
+        assert not controller.update(problem)
+        assert controller.best_fitness == 10
+
+        problem.fitness_evaluations += 5
+        assert controller.update(problem)
+
+    def test_update_does_not_report_stagnation_once_max_restarts_is_reached(self):
+        """Test that update does not report stagnation once the controller made max_restarts restarts."""
+        problem = DiscreteOpt(10, OneMax())
+        controller = StagnationRestart(patience=1, max_restarts=1)
+        controller.start(problem)
+        controller.restart(problem)
+
+        problem.fitness_evaluations += 10
+        assert not controller.can_restart
+        assert not controller.update(problem)
+
+    def test_restart_adapts_strength(self):
+        """Test that restarts reset the strength after finding a new best state, and grow it otherwise."""
+        np.random.seed(SEED)
+        problem = DiscreteOpt(20, OneMax())
+        problem.set_state(np.zeros(20))
+        controller = StagnationRestart(min_strength=1, max_strength=8, growth=2.0)
+        controller.start(problem)
+
+        # No new best since the start: the strength grows
+        controller.restart(problem)
+        assert controller.strength == 2
+        problem.set_state(np.zeros(20))
+        controller.restart(problem)
+        assert controller.strength == 4
+
+        # A new best since the last restart: the strength is reset
+        problem.set_state(np.ones(20))
+        controller.restart(problem)
+        assert controller.strength == 1
+        assert controller.restarts == 3
+
+    def test_restart_perturbs_best_state(self):
+        """Test that a restart moves the problem to a state at most strength moves away from the best state."""
+        np.random.seed(SEED)
+        problem = DiscreteOpt(20, OneMax())
+        problem.set_state(np.ones(20))
+        controller = StagnationRestart(min_strength=3, max_strength=20)
+        controller.start(problem)
+
+        problem.set_state(np.zeros(20))
+        controller.restart(problem)
+
+        distance = np.count_nonzero(problem.get_state() != controller.best_state)
+        assert 0 < distance <= controller.strength
+        assert problem.get_fitness() == OneMax().evaluate(problem.get_state())
+
+    def test_restart_from_random_state_once_strength_exceeds_maximum(self):
+        """Test that a restart moves to a random state and resets the strength once the strength would exceed its maximum."""
+        np.random.seed(SEED)
+        problem = DiscreteOpt(20, OneMax())
+        controller = StagnationRestart(min_strength=2, max_strength=3)
+        controller.start(problem)
+
+        controller.restart(problem)
+        assert controller.strength == 2
+
+    def test_perturb_does_not_evaluate_or_move_problem(self):
+        """Test that perturbing a state makes no fitness evaluations and leaves the problem's state unchanged."""
+        np.random.seed(SEED)
+        problem = DiscreteOpt(20, OneMax())
+        problem.set_state(np.zeros(20))
+        state = problem.get_state()
+        fitness_evaluations = problem.fitness_evaluations
+
+        perturbed = StagnationRestart._perturb(problem, np.ones(20), 5)
+
+        assert problem.get_state() is state
+        assert problem.fitness_evaluations == fitness_evaluations
+        assert 0 < np.count_nonzero(perturbed == 0) <= 5
+
+    @pytest.mark.parametrize(
+        "algorithm, kwargs",
+        [(hill_climb, {}), (random_hill_climb, {"max_attempts": 10_000}), (simulated_annealing, {"max_attempts": 10_000})],
+    )
+    def test_algorithms_restart_and_return_best_state(self, algorithm, kwargs):
+        """Test that algorithms given a controller restart when they stagnate, and return the best state found."""
+        controller = StagnationRestart(patience=50)
+        problem = DiscreteOpt(30, FourPeaks(t_pct=0.1))
+        best_state, best_fitness, _ = algorithm(problem, random_state=SEED, max_fevals=3_000, restart_controller=controller, **kwargs)
+
+        assert controller.restarts > 0
+        assert best_fitness == FourPeaks(t_pct=0.1).evaluate(best_state) == controller.best_fitness
+
+    @pytest.mark.parametrize("algorithm", [random_hill_climb, simulated_annealing])
+    def test_algorithms_restart_with_default_arguments(self, algorithm):
+        """Test that a default controller restarts runs whose default max_attempts would otherwise end them first."""
+        controller = StagnationRestart()
+        problem = DiscreteOpt(60, FourPeaks())
+        algorithm(problem, random_state=SEED, max_iters=5_000, restart_controller=controller)
+
+        assert controller.restarts > 0
+        assert problem.fitness_evaluations > 5_000
+
+    def test_algorithms_stop_after_max_attempts_once_max_restarts_is_reached(self):
+        """Test that max_attempts ends the run once the controller can no longer restart."""
+        controller = StagnationRestart(patience=20, max_restarts=2)
+        problem = DiscreteOpt(30, FourPeaks(t_pct=0.1))
+        random_hill_climb(problem, random_state=SEED, max_attempts=100, restart_controller=controller)
+
+        assert controller.restarts == 2
+        assert problem.fitness_evaluations < 10_000
+
+    @pytest.mark.parametrize("algorithm", [hill_climb, random_hill_climb, simulated_annealing])
+    def test_unbounded_run_raises(self, algorithm):
+        """Test that a controller with unlimited restarts is rejected when nothing else would end the run."""
+        with pytest.raises(ValueError, match="restart_controller must have a finite max_restarts"):
+            algorithm(DiscreteOpt(10, OneMax()), restart_controller=StagnationRestart())
+
+    def test_algorithm_stops_once_max_restarts_is_reached(self):
+        """Test that hill climbing stops at a local optimum once the controller made max_restarts restarts."""
+        controller = StagnationRestart(max_restarts=3)
+        hill_climb(DiscreteOpt(30, FourPeaks(t_pct=0.1)), random_state=SEED, restart_controller=controller)
+
+        assert controller.restarts == 3
+
+    def test_controller_is_reset_between_runs(self):
+        """Test that a controller reused across runs starts each run afresh."""
+        controller = StagnationRestart(max_restarts=2)
+        hill_climb(DiscreteOpt(30, OneMax()), random_state=SEED, restart_controller=controller)
+        hill_climb(DiscreteOpt(30, OneMax()), random_state=SEED, restart_controller=controller)
+
+        assert controller.restarts == 2
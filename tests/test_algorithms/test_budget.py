@@ -0,0 +1,162 @@
+"""Unit tests for algorithms/_budget.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import time
+
+import numpy as np
+import pytest
+
+from mlrose_ky import ContinuousOpt, DiscreteOpt, NetworkWeights, OneMax, SARunner, tanh
+from mlrose_ky.algorithms import genetic_alg, gradient_descent, hill_climb, mimic, random_hill_climb, simulated_annealing
+from mlrose_ky.algorithms._budget import RunBudget
+from tests.globals import SEED
+
+
+def _discrete_problem():
+    """Return a small discrete problem that takes many iterations to converge."""
+    return DiscreteOpt(length=20, fitness_fn=OneMax())
+
+
+def _network_problem():
+    """Return a neural network weight problem for gradient descent."""
+    X = np.random.default_rng(SEED).uniform(-1, 1, (40, 3))
+    y = (X.sum(axis=1) > 0).astype(int).reshape(-1, 1)
+    fitness = NetworkWeights(X, y, [4, 4, 1], activation=tanh)
+    return ContinuousOpt(fitness.nodes, fitness, maximize=False, min_val=-5, max_val=5)
+
+
+ALGORITHMS = [
+    (hill_climb, _discrete_problem, {}),
+    (random_hill_climb, _discrete_problem, {"max_attempts": 10_000, "restarts": 1_000}),
+    (simulated_annealing, _discrete_problem, {"max_attempts": 10_000}),
+    (genetic_alg, _discrete_problem, {"pop_size": 20, "max_attempts": 10_000}),
+    (mimic, _discrete_problem, {"pop_size": 20, "max_attempts": 10_000}),
+    (gradient_descent, _network_problem, {"max_attempts": 10_000}),
+]
+
+
+class TestRunBudget:
+    """Tests for the max_time and max_fevals budgets of the algorithms."""
+
+    @pytest.mark.parametrize(
+        "max_time, max_fevals, match", [(0, None, "max_time"), (True, None, "max_time"), (None, 0, "max_fevals"), (None, 1.5, "max_fevals")]
+    )
+    def test_invalid_budget_raises(self, max_time, max_fevals, match):
+        """Test that invalid budgets raise a ValueError."""
+        with pytest.raises(ValueError, match=f"{match} must be a positive"):
+            RunBudget(max_time, max_fevals)
+
+    def test_numpy_integer_max_fevals(self):
+        """Test that max_fevals accepts NumPy integers, such as the values of a NumPy parameter grid."""
+        problem = _discrete_problem()
+        problem.fitness_evaluations = 10
+
+        budget = RunBudget(None, np.int64(10))
+
+        assert budget.max_fevals == 10 and type(budget.max_fevals) is int
+        assert budget.exhausted(problem)
+
+    def test_exhausted(self):
+        """Test that a budget is exhausted once either of its limits is reached."""
+        problem = _discrete_problem()
+
+        assert not RunBudget(None, None).exhausted(problem)
+        problem.fitness_evaluations = 10
+        assert RunBudget(None, 10).exhausted(problem)
+        assert not RunBudget(None, 11).exhausted(problem)
+        assert RunBudget(1e-9, None).exhausted(problem)
+
+    @pytest.mark.parametrize("algorithm, make_problem, kwargs", ALGORITHMS)
+    def test_algorithm_stops_at_max_fevals(self, algorithm, make_problem, kwargs):
+        """Test that each algorithm stops once it has made max_fevals fitness evaluations."""
+        problem = make_problem()
+        unlimited = make_problem()
+        max_fevals = 5
+        algorithm(problem, random_state=SEED, max_iters=10, max_fevals=max_fevals, **kwargs)
+        algorithm(unlimited, random_state=SEED, max_iters=10, **kwargs)
+
+        assert max_fevals <= problem.fitness_evaluations < unlimited.fitness_evaluations
+
+    @pytest.mark.parametrize("algorithm, make_problem, kwargs", ALGORITHMS)
+    def test_algorithm_stops_at_max_time(self, algorithm, make_problem, kwargs):
+        """Test that each algorithm stops once it has run for max_time seconds."""
+        problem = make_problem()
+        if algorithm is hill_climb:
+            # Hill climbing stops at its first local optimum, so give it a problem that is slow to climb
+            problem = DiscreteOpt(length=2_000, fitness_fn=OneMax())
+
+        start = time.perf_counter()
+        algorithm(problem, random_state=SEED, max_time=0.2, **kwargs)
+
+        assert time.perf_counter() - start < 5
+
+    def test_callback_is_told_the_run_is_done_when_budget_is_used_up(self):
+        """Test that the state fitness callback is called with done=True when the budget is used up."""
+        calls = []
+
+        def callback(iteration, done, **kwargs):
+            calls.append((iteration, done))
+            return True
+
+        simulated_annealing(_discrete_problem(), max_attempts=10_000, random_state=SEED, max_fevals=50, state_fitness_callback=callback)
+
+        assert calls[-1][1]
+        assert sum(done for _, done in calls) == 1
+
+    def test_runner_passes_budget_to_algorithm(self):
+        """Test that runners pass budgets given as extra arguments to the algorithm, and log them."""
+        runner = SARunner(
+            problem=_discrete_problem(),
+            experiment_name="budget",
+            seed=SEED,
+            iteration_list=[0, 1_000],
+            temperature_list=[1.0],
+            max_attempts=10_000,
+            max_fevals=100,
+        )
+        run_stats_df, _ = runner.run()
+
+        assert run_stats_df["FEvals"].iloc[-1] <= 101
+        assert run_stats_df["max_fevals"].iloc[-1] == 100
+
+
+class TestTargetFitness:
+    """Tests for the target_fitness stopping criterion of the algorithms."""
+
+    def test_invalid_target_fitness_raises(self):
+        """Test that a target fitness that is not a number raises a ValueError."""
+        with pytest.raises(ValueError, match="target_fitness must be a number or None. Got high"):
+            RunBudget(None, None, "high")
+
+    def test_target_reached(self):
+        """Test that the target is reached at or above it when maximizing, and at or below it when minimizing."""
+        maximized = DiscreteOpt(length=20, fitness_fn=OneMax())
+        minimized = DiscreteOpt(length=20, fitness_fn=OneMax(), maximize=False)
+
+        assert not RunBudget(None, None).target_reached(maximized, 100.0)
+        assert RunBudget(None, None, 10).target_reached(maximized, 10.0)
+        assert not RunBudget(None, None, 10).target_reached(maximized, 9.0)
+        assert RunBudget(None, None, 10).target_reached(minimized, -9.0)
+        assert not RunBudget(None, None, 10).target_reached(minimized, -11.0)
+
+    @pytest.mark.parametrize(
+        "algorithm, kwargs",
+        [
+            (random_hill_climb, {"max_attempts": 100, "restarts": 3}),
+            (simulated_annealing, {"max_attempts": 100}),
+            (genetic_alg, {"pop_size": 20, "max_attempts": 100}),
+        ],
+    )
+    @pytest.mark.parametrize("maximize, target_fitness", [(True, 15), (False, 5)])
+    def test_algorithm_stops_at_target_fitness(self, algorithm, kwargs, maximize, target_fitness):
+        """Test that each algorithm stops as soon as it reaches the target fitness, and returns a state reaching it."""
+        problem = DiscreteOpt(length=20, fitness_fn=OneMax(), maximize=maximize)
+        unlimited = DiscreteOpt(length=20, fitness_fn=OneMax(), maximize=maximize)
+        best_state, best_fitness, _ = algorithm(problem, random_state=SEED, max_iters=200, target_fitness=target_fitness, **kwargs)
+        algorithm(unlimited, random_state=SEED, max_iters=200, **kwargs)
+
+        assert best_fitness == OneMax().evaluate(best_state)
+        assert best_fitness >= target_fitness if maximize else best_fitness <= target_fitness
+        assert problem.fitness_evaluations < unlimited.fitness_evaluations
@@ -0,0 +1,129 @@
+"""Unit tests for algorithms/curve_buffer.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+import pytest
+
+from mlrose_ky import CurveBuffer, DiscreteOpt, OneMax
+from mlrose_ky.algorithms import random_hill_climb, simulated_annealing
+from tests.globals import SEED
+
+
+class TestCurveBuffer:
+    """Unit tests for CurveBuffer."""
+
+    def test_append_grows_beyond_capacity(self):
+        """Test that appending more points than the initial capacity keeps every point."""
+        buffer = CurveBuffer(capacity=2)
+        for i in range(5):
+            buffer.append(float(i), float(10 * i))
+
+        assert len(buffer) == 5
+        np.testing.assert_array_equal(buffer.view(), [[0, 0], [1, 10], [2, 20], [3, 30], [4, 40]])
+
+    def test_view_does_not_copy(self):
+        """Test that view returns the recorded points without copying them."""
+        buffer = CurveBuffer()
+        buffer.append(1.0, 1.0)
+
+        assert np.shares_memory(buffer.view(), buffer.view())
+        assert not np.shares_memory(buffer.to_array(), buffer.view())
+
+    def test_view_is_read_only(self):
+        """Test that the views of the recorded points and positions cannot be written to, but the buffer still can."""
+        buffer = CurveBuffer()
+        buffer.append(1.0, 1.0)
+
+        assert not buffer.view().flags.writeable
+        assert not buffer.positions().flags.writeable
+        with pytest.raises(ValueError):
+            buffer.view()[0, 0] = 2.0
+
+        buffer.append(2.0, 2.0)
+        np.testing.assert_array_equal(buffer.view(), [[1, 1], [2, 2]])
+
+    def test_empty_like_starts_at_the_initial_capacity(self):
+        """Test that empty_like does not allocate the capacity the buffer has grown to."""
+        buffer = CurveBuffer(capacity=2, decimation="every", every=3)
+        for i in range(10):
+            buffer.append(float(i), float(i))
+
+        empty = buffer.empty_like()
+
+        assert len(empty) == 0
+        assert len(empty._points) == 2
+        assert (empty.decimation, empty.every) == ("every", 3)
+
+    def test_every_decimation_records_every_kth_point_and_the_last(self):
+        """Test that 'every' decimation records every k-th point, and to_array adds the last point."""
+        buffer = CurveBuffer(decimation="every", every=3)
+        for i in range(1, 9):
+            buffer.append(float(i), float(i))
+
+        assert buffer.positions().tolist() == [1, 4, 7]
+        assert buffer.to_array()[:, 0].tolist() == [1, 4, 7, 8]
+
+    def test_change_decimation_records_fitness_changes(self):
+        """Test that 'change' decimation only records points whose fitness changed."""
+        buffer = CurveBuffer(decimation="change")
+        for fitness in [1, 1, 2, 2, 2, 3]:
+            buffer.append(float(fitness), 0.0)
+
+        assert buffer.positions().tolist() == [1, 3, 6]
+
+    def test_log_decimation_records_log_spaced_points(self):
+        """Test that 'log' decimation records a logarithmic number of points."""
+        buffer = CurveBuffer(decimation="log", factor=2)
+        for i in range(1000):
+            buffer.append(float(i), float(i))
+
+        assert buffer.positions().tolist() == [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+        assert buffer.n_appended == 1000
+
+    def test_clear_removes_points(self):
+        """Test that clear removes all points."""
+        buffer = CurveBuffer()
+        buffer.append(1.0, 1.0)
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert buffer.to_array().shape == (0, 2)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"capacity": 0}, {"decimation": "random"}, {"decimation": "every", "every": 0}, {"decimation": "log", "factor": 1}]
+    )
+    def test_invalid_arguments_raise(self, kwargs):
+        """Test that invalid arguments raise a ValueError."""
+        with pytest.raises(ValueError):
+            CurveBuffer(**kwargs)
+
+    def test_algorithm_passes_buffer_view_to_callback(self):
+        """Test that an algorithm passes the callback a view of its curve buffer, and records the curve in it."""
+        problem = DiscreteOpt(10, OneMax())
+        buffer = CurveBuffer()
+        curves = []
+
+        def callback(curve, **kwargs):
+            curves.append(curve)
+            return True
+
+        _, _, fitness_curve = simulated_annealing(
+            problem, max_iters=20, curve=True, random_state=SEED, state_fitness_callback=callback, curve_buffer=buffer
+        )
+
+        assert all(curve.base is not None for curve in curves[1:])
+        assert [len(curve) for curve in curves] == list(range(len(curves)))
+        np.testing.assert_array_equal(fitness_curve, buffer.view())
+
+    def test_decimated_algorithm_curve_ends_with_final_fitness(self):
+        """Test that a decimated curve still ends with the final point of the run."""
+        problem = DiscreteOpt(10, OneMax())
+        _, _, full_curve = random_hill_climb(problem, max_iters=50, curve=True, random_state=SEED)
+        _, _, decimated_curve = random_hill_climb(
+            problem, max_iters=50, curve=True, random_state=SEED, curve_buffer=CurveBuffer(decimation="every", every=7)
+        )
+
+        assert len(decimated_curve) < len(full_curve)
+        np.testing.assert_array_equal(decimated_curve[-1], full_curve[-1])
@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 
 from mlrose_ky import DiscreteOpt, OneMax, ContinuousOpt
-from mlrose_ky.algorithms import genetic_alg
+from mlrose_ky.algorithms import genetic_alg, PhaseProfiler
 from tests.globals import SEED
 
 
@@ -187,3 +187,12 @@ class TestGeneticAlg:
         # Since can_stop() returns True, the algorithm should terminate immediately
         assert isinstance(best_state, np.ndarray)
         assert isinstance(best_fitness, float)
+
+    def test_genetic_alg_reproduces_generation_in_batch(self):
+        """Test genetic_alg reproduces each generation in a single batch when the problem supports it"""
+        problem = ContinuousOpt(5, OneMax(), maximize=True)
+        profiler = PhaseProfiler()
+        genetic_alg(problem, pop_size=20, max_attempts=100, max_iters=10, random_state=SEED, profiler=profiler)
+
+        assert profiler.counts["reproduce"] == 10
+        assert problem.get_population().shape == (20, 5)
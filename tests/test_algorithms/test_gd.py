@@ -6,7 +6,8 @@
 import numpy as np
 import pytest
 
-from mlrose_ky.algorithms import gradient_descent
+from mlrose_ky import ContinuousOpt, NetworkWeights, tanh
+from mlrose_ky.algorithms import Adam, gradient_descent
 from tests.globals import SEED
 
 
@@ -173,3 +174,21 @@ class TestGradientDescent:
         # Verify that the algorithm terminates immediately
         assert isinstance(best_state, np.ndarray)
         assert isinstance(best_fitness, float)
+
+    def test_gradient_descent_with_optimizer(self):
+        """Test that gradient_descent uses the optimizer step on the analytic gradient when one is given."""
+        X = np.random.default_rng(SEED).uniform(-1, 1, (40, 3))
+        y = (X.sum(axis=1) > 0).astype(int).reshape(-1, 1)
+        node_list = [4, 4, 1]
+        fitness = NetworkWeights(X, y, node_list, activation=tanh)
+        problem = ContinuousOpt(fitness.nodes, fitness, maximize=False, min_val=-5, max_val=5)
+        init_state = np.random.default_rng(SEED).uniform(-1, 1, problem.length)
+
+        optimizer = Adam(learning_rate=0.05)
+        optimizer.step(np.ones(3))  # State left over from a previous run must be cleared
+        best_state, best_fitness, curve = gradient_descent(
+            problem, max_attempts=50, max_iters=200, init_state=init_state, curve=True, optimizer=optimizer
+        )
+
+        assert optimizer.t == len(curve)
+        assert best_fitness < fitness.evaluate(init_state) / 2
@@ -0,0 +1,95 @@
+"""Unit tests for algorithms/phase_profiler.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+
+from mlrose_ky import DiscreteOpt, FourPeaks, MIMICRunner, OneMax, PhaseProfiler
+from mlrose_ky.algorithms import genetic_alg, mimic
+from mlrose_ky.algorithms.ga import GA_PHASES
+from mlrose_ky.algorithms.mimic import MIMIC_PHASES
+from tests.globals import SEED
+
+
+class TestPhaseProfiler:
+    """Unit tests for PhaseProfiler."""
+
+    def test_record_accumulates_time_between_phases(self):
+        """Test that recording a phase adds the time since the previous phase ended."""
+        profiler = PhaseProfiler()
+        profiler.start(("a", "b", "c"))
+        for _ in range(3):
+            profiler.record("a")
+            profiler.record("b")
+
+        assert list(profiler.totals) == ["a", "b", "c"]
+        assert profiler.counts == {"a": 3, "b": 3, "c": 0}
+        assert profiler.totals["c"] == 0
+        assert all(total >= 0 for total in profiler.totals.values())
+        assert profiler.seconds()["a"] == profiler.totals["a"] / 1e9
+        assert list(profiler.to_columns()) == ["Time_a", "Time_b", "Time_c"]
+
+    def test_start_clears_recorded_times(self):
+        """Test that start clears the times recorded before it."""
+        profiler = PhaseProfiler()
+        profiler.record("a")
+        profiler.start()
+
+        assert profiler.totals == {}
+        assert profiler.counts == {}
+
+    def test_mimic_records_phases_every_iteration(self):
+        """Test that MIMIC records each of its phases once per iteration."""
+        problem = DiscreteOpt(length=10, fitness_fn=FourPeaks())
+        profiler = PhaseProfiler()
+        mimic(problem, pop_size=50, max_attempts=5, max_iters=4, random_state=SEED, profiler=profiler)
+
+        counts = profiler.counts
+        assert list(counts) == list(MIMIC_PHASES)
+        assert counts["initialize"] == 1
+        assert all(counts[phase] == 4 for phase in MIMIC_PHASES[1:])
+
+    def test_ga_records_selection_and_reproduction_per_child(self):
+        """Test that the genetic algorithm records parent selection and reproduction for every child."""
+        problem = DiscreteOpt(length=10, fitness_fn=OneMax())
+        profiler = PhaseProfiler()
+        genetic_alg(problem, pop_size=20, pop_breed_percent=0.5, max_attempts=5, max_iters=3, random_state=SEED, profiler=profiler)
+
+        counts = profiler.counts
+        assert list(counts) == list(GA_PHASES)
+        assert counts["select"] == counts["reproduce"] == 3 * 10
+        assert counts["evaluate"] == counts["best_child"] == 3
+
+    def test_profiling_does_not_change_results(self):
+        """Test that profiling a run does not change its results."""
+        results = [
+            mimic(
+                DiscreteOpt(length=10, fitness_fn=FourPeaks()), pop_size=50, max_iters=5, curve=True, random_state=SEED, profiler=profiler
+            )
+            for profiler in (None, PhaseProfiler())
+        ]
+
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        np.testing.assert_array_equal(results[0][2], results[1][2])
+
+    def test_runner_adds_phase_time_columns(self):
+        """Test that a runner created with profile_phases adds cumulative phase times to its run statistics."""
+        problem = DiscreteOpt(length=10, fitness_fn=FourPeaks())
+        runner = MIMICRunner(
+            problem=problem,
+            experiment_name="phase_profiler",
+            seed=SEED,
+            iteration_list=[0, 2, 4],
+            population_sizes=[50],
+            keep_percent_list=[0.25],
+            max_attempts=10,
+            profile_phases=True,
+        )
+        run_stats_df, _ = runner.run()
+
+        columns = [f"Time_{phase}" for phase in MIMIC_PHASES]
+        assert set(columns) <= set(run_stats_df.columns)
+        assert run_stats_df.loc[run_stats_df["Iteration"] == 0, columns[2:]].to_numpy().sum() == 0
+        assert (run_stats_df[columns].diff().dropna().to_numpy() >= 0).all()
+        assert (run_stats_df[columns].sum(axis=1) <= run_stats_df["Time"] + 1e-3).all()
@@ -6,7 +6,7 @@
 import numpy as np
 import pytest
 
-from mlrose_ky import DiscreteOpt, ContinuousOpt, OneMax
+from mlrose_ky import DiscreteOpt, ContinuousOpt, OneMax, GeomDecay
 from mlrose_ky.algorithms import simulated_annealing
 from tests.globals import SEED
 
@@ -192,3 +192,43 @@ class TestSimulatedAnnealing:
         assert problem.current_iteration == 1
         assert isinstance(best_state, np.ndarray)
         assert isinstance(best_fitness, float)
+
+    def test_simulated_annealing_skips_callbacks_until_next_callback_iteration(self):
+        """Test that simulated_annealing only calls a callback at the iterations it asks for, and when done"""
+        problem = DiscreteOpt(5, OneMax())
+        iterations = []
+
+        # noinspection PyMissingOrEmptyDocstring
+        class SparseCallback:
+            def __call__(self, iteration, **kwargs):
+                iterations.append(iteration)
+                return True
+
+            def next_callback_iteration(self, iteration):
+                return iteration + 7
+
+        simulated_annealing(problem, max_attempts=100, max_iters=20, random_state=SEED, state_fitness_callback=SparseCallback())
+
+        assert iterations == [0, 7, 14, 20]
+
+    def test_simulated_annealing_returns_best_state_visited(self):
+        """Test that simulated_annealing returns the best state visited, not the state it terminates in"""
+        problem = DiscreteOpt(20, OneMax())
+        visited = []
+
+        def callback(fitness, **kwargs):
+            visited.append(fitness)
+            return True
+
+        # A high constant temperature accepts most worse moves, so the final state is rarely the best one
+        best_state, best_fitness, _ = simulated_annealing(
+            problem,
+            schedule=GeomDecay(init_temp=100, decay=1.0),
+            max_attempts=100,
+            max_iters=200,
+            random_state=SEED,
+            state_fitness_callback=callback,
+        )
+
+        assert best_fitness == max(visited) > visited[-1]
+        assert best_fitness == OneMax().evaluate(best_state)
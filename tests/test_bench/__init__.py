@@ -0,0 +1 @@
+"""This file can be left empty to help pytest discover this module as a test module."""
@@ -0,0 +1,116 @@
+"""Unit tests for bench/kernels.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import pytest
+
+from mlrose_ky.bench import (
+    KERNELS,
+    KernelResult,
+    compare_kernels,
+    format_comparison_report,
+    load_kernel_results,
+    run_kernels,
+    save_kernel_results,
+)
+from mlrose_ky.bench.__main__ import main
+from mlrose_ky.bench.kernels import DEFAULT_LENGTHS
+from tests.globals import SEED
+
+
+class TestKernelBenchmarks:
+    """Tests for the kernel benchmarks."""
+
+    def test_kernels_cover_fitness_functions_and_operators(self):
+        """Test that the kernels include fitness functions, operators and problem sampling."""
+        for name in ("Queens.evaluate", "FlipFlop.evaluate_many", "TSPCrossOver.mate", "SwapMutator.mutate", "DiscreteOpt.sample_pop"):
+            assert name in KERNELS
+
+    @pytest.mark.parametrize("kernel", list(KERNELS))
+    def test_every_kernel_runs(self, kernel):
+        """Test that every kernel runs and reports a consistent time per call and throughput."""
+        [result] = run_kernels([kernel], [8], seed=SEED, repeat=1, min_time=0.001)
+
+        assert (result.kernel, result.length) == (kernel, 8)
+        assert result.time_per_call > 0
+        assert result.calls_per_second == pytest.approx(1 / result.time_per_call)
+        assert result.calibration > 0
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"kernels": ["unknown"]}, "kernel must be one of"),
+            ({"lengths": [2]}, "length must be an integer of at least 4"),
+            ({"repeat": 0}, "repeat must be a positive integer"),
+        ],
+    )
+    def test_run_kernels_invalid_arguments_raise(self, kwargs, match):
+        """Test that an unknown kernel, a too short length or an invalid repeat count raises a ValueError."""
+        with pytest.raises(ValueError, match=match):
+            run_kernels(**{"kernels": ["OneMax.evaluate"], **kwargs})
+
+    def test_compare_kernels_flags_regressions(self):
+        """Test that compare_kernels classifies each result against the baseline, and the report lists the regressions."""
+        baseline = [
+            KernelResult("A.evaluate", 8, 1.0, 1.0, 1.0),
+            KernelResult("B.evaluate", 8, 1.0, 1.0, 1.0),
+            KernelResult("C.evaluate", 8, 1.0, 1.0, 1.0),
+        ]
+        results = [
+            KernelResult("A.evaluate", 8, 2.0, 0.5, 1.0),
+            KernelResult("B.evaluate", 8, 1.1, 1 / 1.1, 1.0),
+            KernelResult("C.evaluate", 8, 0.5, 2.0, 1.0),
+            KernelResult("A.evaluate", 16, 1.0, 1.0, 1.0),
+        ]
+
+        comparisons = compare_kernels(results, baseline, tolerance=0.25)
+
+        assert [c.status for c in comparisons] == ["regression", "ok", "improvement", "new"]
+        assert comparisons[0].ratio == pytest.approx(2.0)
+        assert comparisons[3].ratio is None
+        report = format_comparison_report(comparisons)
+        assert "1 regression(s): A.evaluate[8] x2.00" in report
+
+    def test_compare_kernels_scales_baseline_by_calibration(self):
+        """Test that baseline times are scaled by the ratio of calibrations before comparing them."""
+        baseline = [KernelResult("A.evaluate", 8, 1.0, 1.0, 1.0)]
+        results = [KernelResult("A.evaluate", 8, 2.0, 0.5, 2.0)]
+
+        [comparison] = compare_kernels(results, baseline)
+
+        assert comparison.baseline_time_per_call == pytest.approx(2.0)
+        assert comparison.status == "ok"
+        assert "No regressions." in format_comparison_report([comparison])
+
+    def test_compare_kernels_invalid_tolerance_raises(self):
+        """Test that a negative tolerance raises a ValueError."""
+        with pytest.raises(ValueError, match="tolerance must be a non-negative number"):
+            compare_kernels([], [], tolerance=-1)
+
+    def test_packaged_baseline_covers_default_kernels(self):
+        """Test that the packaged baseline has a result for every kernel at every default length."""
+        baseline = {(result.kernel, result.length) for result in load_kernel_results()}
+
+        assert baseline == {(kernel, length) for kernel in KERNELS for length in DEFAULT_LENGTHS}
+
+    def test_save_and_load_kernel_results(self, tmp_path):
+        """Test that saved kernel results are loaded back unchanged."""
+        filename = str(tmp_path / "kernels.json")
+        results = [KernelResult("OneMax.evaluate", 8, 1e-6, 1e6, 1e-5)]
+        save_kernel_results(results, filename)
+
+        assert load_kernel_results(filename) == results
+
+    def test_main_exit_status_reports_regressions(self, tmp_path, capsys):
+        """Test that the kernels command exits with status 1 on a regression and 0 otherwise, and saves its results."""
+        results = run_kernels(["OneMax.evaluate"], [8], repeat=1, min_time=0.001)
+        fast_baseline, slow_baseline = str(tmp_path / "fast.json"), str(tmp_path / "slow.json")
+        save_kernel_results([KernelResult(r.kernel, r.length, r.time_per_call / 100, 0, r.calibration) for r in results], fast_baseline)
+        save_kernel_results([KernelResult(r.kernel, r.length, r.time_per_call * 100, 0, r.calibration) for r in results], slow_baseline)
+        output = str(tmp_path / "results.json")
+
+        assert main(["kernels", "-k", "OneMax.evaluate", "-l", "8", "-r", "1", "-b", fast_baseline]) == 1
+        assert main(["kernels", "-k", "OneMax.evaluate", "-l", "8", "-r", "1", "-b", slow_baseline, "-o", output]) == 0
+        assert "improvement" in capsys.readouterr().out
+        assert [(r.kernel, r.length) for r in load_kernel_results(output)] == [("OneMax.evaluate", 8)]
@@ -0,0 +1,105 @@
+"""Unit tests for bench/suite.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import json
+
+import pytest
+
+from mlrose_ky.bench import ALGORITHMS, PROBLEMS, BenchmarkCase, build_cases, load_results, run_benchmarks, run_case, save_results
+from mlrose_ky.bench.__main__ import main
+from tests.globals import SEED
+
+
+class TestBenchmarkSuite:
+    """Tests for the benchmark suite."""
+
+    def test_build_cases_skips_inapplicable_combinations(self):
+        """Test that build_cases pairs each algorithm only with problems of its type."""
+        cases = build_cases(sizes=[8])
+
+        assert BenchmarkCase("gradient_descent", "network_weights", 8) in cases
+        assert all(ALGORITHMS[case.algorithm][0] == PROBLEMS[case.problem][0] for case in cases)
+        assert {case.algorithm for case in cases} == set(ALGORITHMS)
+        assert {case.problem for case in cases} == set(PROBLEMS)
+
+    def test_build_cases_filters(self):
+        """Test that build_cases keeps only the given algorithms, problems and sizes."""
+        cases = build_cases(["mimic"], ["tsp", "queens"], [8, 16])
+
+        assert cases == [BenchmarkCase("mimic", p, s) for p in ("tsp", "queens") for s in (8, 16)]
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"algorithm": "unknown", "problem": "tsp", "size": 8}, "algorithm must be one of"),
+            ({"algorithm": "mimic", "problem": "unknown", "size": 8}, "problem must be one of"),
+            ({"algorithm": "mimic", "problem": "tsp", "size": 1}, "size must be an integer greater than 1"),
+            ({"algorithm": "gradient_descent", "problem": "tsp", "size": 8}, "cannot be run on problem"),
+        ],
+    )
+    def test_invalid_case_raises(self, kwargs, match):
+        """Test that an unknown or inapplicable case raises a ValueError."""
+        with pytest.raises(ValueError, match=match):
+            BenchmarkCase(**kwargs)
+
+    def test_build_cases_invalid_name_raises(self):
+        """Test that build_cases raises a ValueError for an unknown algorithm."""
+        with pytest.raises(ValueError, match="algorithm must be one of"):
+            build_cases(["unknown"])
+
+    @pytest.mark.parametrize("algorithm, problem", [("random_hill_climb", "knapsack"), ("gradient_descent", "network_weights")])
+    def test_run_case_measures_throughput(self, algorithm, problem):
+        """Test that run_case reports the iterations, evaluations, time, throughputs and peak memory of a case."""
+        result = run_case(BenchmarkCase(algorithm, problem, 8), seed=SEED, max_iters=20, repeat=2)
+
+        assert result.iterations == 20
+        assert result.fitness_evaluations > 0
+        assert result.time > 0
+        assert result.evaluations_per_second == pytest.approx(result.fitness_evaluations / result.time)
+        assert result.iterations_per_second == pytest.approx(result.iterations / result.time)
+        assert result.peak_memory > 0
+
+    def test_run_case_is_reproducible(self):
+        """Test that runs of a case with the same seed make the same progress, and that memory can be left unmeasured."""
+        case = BenchmarkCase("simulated_annealing", "four_peaks", 16)
+        first = run_case(case, seed=SEED, max_iters=50, repeat=1, measure_memory=False)
+        second = run_case(case, seed=SEED, max_iters=50, repeat=1, measure_memory=False)
+
+        assert first.peak_memory is None
+        assert (first.iterations, first.fitness_evaluations, first.best_fitness) == (
+            second.iterations,
+            second.fitness_evaluations,
+            second.best_fitness,
+        )
+
+    @pytest.mark.parametrize("kwargs, match", [({"seed": 0}, "seed must be a positive integer"), ({"repeat": 0}, "repeat must be")])
+    def test_run_case_invalid_arguments_raise(self, kwargs, match):
+        """Test that an invalid seed or repeat count raises a ValueError."""
+        with pytest.raises(ValueError, match=match):
+            run_case(BenchmarkCase("hill_climb", "knapsack", 8), **kwargs)
+
+    def test_save_and_load_results(self, tmp_path):
+        """Test that saved results are loaded back unchanged, along with the report metadata."""
+        filename = str(tmp_path / "results.json")
+        results = run_benchmarks(build_cases(["hill_climb"], ["knapsack"], [8]), seed=SEED, max_iters=5, repeat=1)
+        save_results(results, filename, settings={"seed": SEED})
+
+        with open(filename) as report_file:
+            report = json.load(report_file)
+        assert set(report) == {"created", "environment", "settings", "results"}
+        assert report["settings"] == {"seed": SEED}
+        assert load_results(filename) == results
+
+    def test_main_prints_and_saves_results(self, tmp_path, capsys):
+        """Test that the command line prints a results table and saves the results."""
+        filename = str(tmp_path / "results.json")
+        status = main(["-a", "random_hill_climb", "-p", "knapsack", "-s", "8", "--max-iters", "10", "-r", "1", "-o", filename])
+
+        output = capsys.readouterr().out
+        assert status == 0
+        assert "random_hill_climb    knapsack" in output
+        assert [(r.algorithm, r.problem, r.size, r.iterations) for r in load_results(filename)] == [
+            ("random_hill_climb", "knapsack", 8, 10)
+        ]
@@ -226,3 +226,33 @@ class TestGridSearchMixin:
 
         # The scorer should be called with only y_true, and since y_true == y_true, the score should be 1.0
         assert score == 1.0, "Score should be calculated based only on y_true."
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_perform_grid_search_halving_mode(self, grid_search_mixin, sample_data, dummy_classifier, grid_search_parameters):
+        """Should perform a successive-halving search and return a HalvingGridSearchCV object"""
+        X_train, X_test, y_train, y_test = sample_data
+
+        search_results = grid_search_mixin._perform_grid_search(
+            classifier=dummy_classifier,
+            x_train=X_train,
+            y_train=y_train,
+            cv=2,
+            parameters=grid_search_parameters,
+            search_mode="halving",
+            min_resources=20,
+            factor=2,
+        )
+
+        assert isinstance(search_results, skms.HalvingGridSearchCV)
+        assert list(search_results.n_resources_) == [20, 40]
+        assert list(search_results.n_candidates_) == [2, 1]
+        assert "n_resources" in search_results.cv_results_
+
+    def test_perform_grid_search_invalid_search_mode(self, grid_search_mixin, sample_data, dummy_classifier, grid_search_parameters):
+        """Should raise ValueError for an unknown search mode"""
+        X_train, X_test, y_train, y_test = sample_data
+
+        with pytest.raises(ValueError, match="search_mode must be one of"):
+            grid_search_mixin._perform_grid_search(
+                classifier=dummy_classifier, x_train=X_train, y_train=y_train, cv=2, parameters=grid_search_parameters, search_mode="random"
+            )
@@ -0,0 +1,187 @@
+"""Unit tests for kernels/"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import importlib.util
+
+import numpy as np
+import pytest
+
+from mlrose_ky import DiscreteMutator, MaxKColor, TSPCrossOver, TravellingSales
+from mlrose_ky.kernels import available_kernel_backends, get_kernel, get_kernel_backend, register_kernel, set_kernel_backend
+from mlrose_ky.opt_probs import DiscreteOpt, TSPOpt
+from tests.globals import SEED
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+BACKENDS = ["numpy", pytest.param("numba", marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba is not installed"))]
+
+
+def _reference_tsp_distance(distance_matrix, state):
+    """Return the tour length computed one leg at a time, as TravellingSales did before kernels."""
+    fitness = 0.0
+    for i in range(len(state)):
+        distance = distance_matrix[state[i], state[(i + 1) % len(state)]]
+        if np.isinf(distance):
+            return np.inf
+        fitness += distance
+    return fitness
+
+
+def _reference_max_k_color(edges, state, maximize):
+    """Return the edge count computed one edge at a time, as MaxKColor did before kernels."""
+    if maximize:
+        return float(sum(state[n1] != state[n2] for (n1, n2) in edges))
+    return float(sum(state[n1] == state[n2] for (n1, n2) in edges))
+
+
+def _reference_tsp_mate_fill(p1, p2, n):
+    """Return the filled route computed with a list scan, as TSPCrossOver did before kernels."""
+    child = np.array([0] * len(p1))
+    child[:n] = p1[:n]
+    child[n:] = [city for city in p2 if city not in p1[:n]]
+    return child
+
+
+@pytest.fixture(autouse=True)
+def restore_kernel_backend():
+    """Restore the global kernel backend after each test."""
+    backend = get_kernel_backend()
+    yield
+    set_kernel_backend(backend)
+
+
+class TestKernelParity:
+    """Tests that every backend's kernels match the loops they replace."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_tsp_distance(self, backend):
+        """Test the tsp_distance kernel on complete and incomplete distance matrices."""
+        rng = np.random.default_rng(SEED)
+        distance_matrix = rng.uniform(1, 100, (50, 50))
+        kernel = get_kernel("tsp_distance", backend)
+
+        for _ in range(20):
+            state = rng.permutation(50)
+            assert kernel(distance_matrix, state) == _reference_tsp_distance(distance_matrix, state)
+
+        distance_matrix[3, 7] = distance_matrix[7, 3] = np.inf
+        state = np.array([0, 3, 7, *range(8, 50), 1, 2, 4, 5, 6])
+        assert kernel(distance_matrix, state) == np.inf
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("maximize", [True, False])
+    def test_max_k_color(self, backend, maximize):
+        """Test the max_k_color kernel, including on a graph without edges."""
+        rng = np.random.default_rng(SEED)
+        edges = [tuple(edge) for edge in rng.integers(0, 40, (200, 2)).tolist()]
+        kernel = get_kernel("max_k_color", backend)
+
+        for _ in range(20):
+            state = rng.integers(0, 4, 40)
+            assert kernel(np.array(edges), state, maximize) == _reference_max_k_color(edges, state, maximize)
+
+        assert kernel(np.empty((0, 2), dtype=np.int64), rng.integers(0, 4, 40), maximize) == 0.0
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_tsp_mate_fill(self, backend):
+        """Test the tsp_mate_fill kernel at every crossover point."""
+        rng = np.random.default_rng(SEED)
+        p1, p2 = rng.permutation(30), rng.permutation(30)
+        kernel = get_kernel("tsp_mate_fill", backend)
+
+        for n in range(1, 30):
+            child = kernel(p1, p2, n)
+            assert np.array_equal(child, _reference_tsp_mate_fill(p1, p2, n))
+            assert child.dtype == np.int64
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_discrete_mutate(self, backend):
+        """Test the discrete_mutate kernel changes each mutated gene to another value in range, and no other gene."""
+        rng = np.random.default_rng(SEED)
+        child = rng.integers(0, 5, 100)
+        indices = np.flatnonzero(rng.uniform(size=100) < 0.3)
+        offsets = rng.integers(1, 5, len(indices))
+
+        mutated = get_kernel("discrete_mutate", backend)(child.copy(), indices, offsets, 5)
+
+        assert np.array_equal(mutated[indices], (child[indices] + offsets) % 5)
+        assert np.all(mutated[indices] != child[indices]) and np.all((0 <= mutated) & (mutated < 5))
+        assert np.array_equal(np.delete(mutated, indices), np.delete(child, indices))
+
+
+class TestKernelRegistry:
+    """Tests for selecting kernel backends globally and per object."""
+
+    def test_numpy_backend_is_default_and_available(self):
+        """Test that the numpy backend is used by default and is always available."""
+        assert get_kernel_backend() == "numpy"
+        assert "numpy" in available_kernel_backends()
+        assert ("numba" in available_kernel_backends()) == HAS_NUMBA
+
+    def test_unknown_backend_raises(self):
+        """Test that selecting an unknown backend raises a ValueError."""
+        with pytest.raises(ValueError, match="backend must be one of"):
+            set_kernel_backend("fortran")
+        with pytest.raises(ValueError, match="backend must be one of"):
+            TSPOpt(length=5, distances=[(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0), (3, 4, 1.0), (4, 0, 1.0)]).set_kernel_backend("fortran")
+
+    @pytest.mark.skipif(HAS_NUMBA, reason="numba is installed")
+    def test_missing_backend_package_raises(self):
+        """Test that selecting the numba backend without numba raises an ImportError with an install hint."""
+        with pytest.raises(ImportError, match="pip install numba"):
+            set_kernel_backend("numba")
+        with pytest.raises(ImportError, match="pip install numba"):
+            TSPOpt(length=5, distances=[(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0), (3, 4, 1.0), (4, 0, 1.0)]).set_kernel_backend("numba")
+
+    def test_unknown_kernel_raises(self):
+        """Test that registering an unknown kernel raises a ValueError."""
+        with pytest.raises(ValueError, match="name must be one of"):
+            register_kernel("one_max", "numpy", lambda state: 0.0)
+
+    def test_registered_backend_falls_back_to_numpy(self):
+        """Test that a registered backend's kernels are used, and the kernels it lacks fall back to numpy."""
+        register_kernel("tsp_distance", "test_partial", lambda distance_matrix, state: -1.0)
+
+        assert "test_partial" in available_kernel_backends()
+        assert get_kernel("tsp_distance", "test_partial")(np.ones((2, 2)), np.array([0, 1])) == -1.0
+        assert get_kernel("max_k_color", "test_partial") is get_kernel("max_k_color", "numpy")
+
+    def test_global_and_per_object_selection(self):
+        """Test that objects use the global backend unless they select one, e.g. through their problem."""
+        register_kernel("tsp_distance", "test_global", lambda distance_matrix, state: -1.0)
+        register_kernel("tsp_distance", "test_problem", lambda distance_matrix, state: -2.0)
+        distances = [(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0), (3, 0, 1.0)]
+        state = np.array([0, 1, 2, 3])
+
+        fitness = TravellingSales(distances=distances)
+        assert fitness.evaluate(state) == 4.0
+        set_kernel_backend("test_global")
+        assert fitness.evaluate(state) == -1.0
+        assert TravellingSales(distances=distances, kernel_backend="numpy").evaluate(state) == 4.0
+
+        problem = TSPOpt(length=4, distances=distances)
+        problem.set_kernel_backend("test_problem")
+        assert problem.fitness_fn.evaluate(state) == -2.0
+        assert problem._crossover.kernel_backend == "test_problem" and fitness.kernel_backend is None
+
+    def test_objects_use_kernels(self):
+        """Test that the fitness functions and operators with kernels match their reference loops."""
+        np.random.seed(SEED)
+        edges = [(0, 1), (0, 2), (0, 4), (1, 3), (2, 0), (2, 3), (3, 4)]
+        assert MaxKColor(edges).evaluate(np.array([0, 1, 0, 1, 1])) == 3.0
+
+        fitness = MaxKColor(edges)
+        fitness.evaluate(np.array([0, 1, 0, 1, 1]))
+        fitness.edges = [(0, 1)]
+        assert fitness.evaluate(np.array([0, 0, 0, 0, 0])) == 1.0
+
+        problem = TSPOpt(length=6, coords=[(0, 0), (3, 0), (3, 2), (2, 4), (1, 3), (5, 5)])
+        p1, p2 = np.random.permutation(6), np.random.permutation(6)
+        child = TSPCrossOver(problem).mate(p1, p2)
+        assert sorted(child) == list(range(6))
+
+        child = np.array([0, 1, 2, 3, 0])
+        mutated = DiscreteMutator(DiscreteOpt(5, MaxKColor(edges), max_val=4)).mutate(child.copy(), 1.0)
+        assert np.all(mutated != child) and np.all((0 <= mutated) & (mutated < 4))
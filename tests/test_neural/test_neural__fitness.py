@@ -10,6 +10,7 @@ import pytest
 
 from mlrose_ky.neural.activation import sigmoid, identity
 from mlrose_ky.neural.fitness import NetworkWeights
+from mlrose_ky.neural.utils import flatten_weights
 from tests.globals import sample_data
 
 
@@ -323,6 +324,43 @@ class TestNeuralFitness:
 
         assert np.allclose(updates[0], update1, atol=0.001) and np.allclose(updates[1], update2, atol=0.001)
 
+    @pytest.mark.parametrize("batch_size", [None, 4])
+    def test_calculate_gradient_matches_updates(self, sample_data, batch_size):
+        """Test that the analytic gradient is the flattened updates divided by -learning_rate."""
+        X, y_classifier, _, _ = sample_data
+        node_list = [X.shape[1] + 1, 3, 1]
+        state = np.linspace(-1, 1, 18)
+        fitness = NetworkWeights(X, y_classifier, node_list, activation=sigmoid, learning_rate=0.5, batch_size=batch_size)
+        fitness.evaluate(state)
+
+        updates = flatten_weights(fitness.calculate_updates())
+        gradient = fitness.calculate_gradient()
+
+        assert gradient.shape == state.shape
+        assert np.allclose(-0.5 * gradient, updates)
+        assert fitness.calculate_gradient() is gradient
+
+    @pytest.mark.parametrize("batch_size", [None, 4])
+    def test_calculate_gradient_reuses_forward_pass_of_evaluate(self, sample_data, batch_size, monkeypatch):
+        """Test that once the gradient is tracked, calculate_gradient does not run a forward pass of its own."""
+        X, y_classifier, _, _ = sample_data
+        node_list = [X.shape[1] + 1, 3, 1]
+        fitness = NetworkWeights(X, y_classifier, node_list, activation=sigmoid, learning_rate=0.5, batch_size=batch_size)
+        fitness.evaluate(np.linspace(-1, 1, 18))
+        fitness.calculate_gradient()
+
+        state = np.linspace(1, -1, 18)
+        fitness.evaluate(state)
+        expected = flatten_weights(fitness.calculate_updates())
+
+        forward_calls = []
+        original_forward = fitness._forward
+        monkeypatch.setattr(fitness, "_forward", lambda *args: forward_calls.append(1) or original_forward(*args))
+        gradient = fitness.calculate_gradient()
+
+        assert forward_calls == []
+        assert np.allclose(-0.5 * gradient, expected)
+
     def test_y_1d_reshaped(self):
         """Test that a 1D y array is reshaped correctly."""
         X = np.array([[0.1], [0.3]])
@@ -365,3 +403,50 @@ class TestNeuralFitness:
 
         with pytest.raises(ValueError, match=re.escape("The length of X (2) and y (3) must be equal.")):
             NetworkWeights(X, y, node_list, activation)
+
+    @pytest.mark.parametrize("is_classifier, y_index, bias", [(True, 1, False), (True, 2, True), (False, 3, True)])
+    def test_evaluate_batched_matches_unbatched(self, sample_data, is_classifier, y_index, bias):
+        """Test that streaming X through the network in chunks gives the same loss as a single pass."""
+        X, y = sample_data[0], sample_data[y_index]
+        node_list = [X.shape[1] + bias, 3, y.shape[1]]
+        state = np.random.default_rng(0).uniform(-1, 1, sum(node_list[i] * node_list[i + 1] for i in range(len(node_list) - 1)))
+
+        full = NetworkWeights(X, y, node_list, activation=sigmoid, bias=bias, is_classifier=is_classifier)
+        batched = NetworkWeights(X, y, node_list, activation=sigmoid, bias=bias, is_classifier=is_classifier, batch_size=4)
+
+        assert np.isclose(batched.evaluate(state), full.evaluate(state))
+
+    def test_calculate_updates_batched_matches_unbatched(self, sample_data):
+        """Test that gradient descent updates accumulated over chunks match the single-pass updates."""
+        X, y_classifier, _, _ = sample_data
+        node_list = [X.shape[1] + 1, 2, 1]
+        state = np.linspace(-1, 1, 12)
+
+        full = NetworkWeights(X, y_classifier, node_list, activation=sigmoid, learning_rate=0.5)
+        batched = NetworkWeights(X, y_classifier, node_list, activation=sigmoid, learning_rate=0.5, batch_size=4)
+        full.evaluate(state)
+        batched.evaluate(state)
+
+        for full_update, batched_update in zip(full.calculate_updates(), batched.calculate_updates()):
+            assert np.allclose(batched_update, full_update)
+
+    def test_evaluate_memmap_input(self, sample_data, tmp_path):
+        """Test that a memory-mapped X is used without being loaded into memory."""
+        X, y_classifier, _, _ = sample_data
+        path = tmp_path / "X.npy"
+        np.save(path, X.astype(float))
+        X_mmap = np.load(path, mmap_mode="r")
+        node_list = [X.shape[1], 2, 1]
+        state = np.linspace(-1, 1, 10)
+
+        fitness = NetworkWeights(X_mmap, y_classifier, node_list, activation=sigmoid, bias=False, batch_size=2)
+
+        assert fitness.X is X_mmap
+        assert np.isclose(fitness.evaluate(state), NetworkWeights(X, y_classifier, node_list, sigmoid, bias=False).evaluate(state))
+
+    def test_invalid_batch_size(self, sample_data):
+        """Test that ValueError is raised when batch_size is not a positive integer."""
+        X, y_classifier, _, _ = sample_data
+
+        with pytest.raises(ValueError, match="batch_size must be a positive integer or None, got 0."):
+            NetworkWeights(X, y_classifier, [X.shape[1], 1], sigmoid, bias=False, batch_size=0)
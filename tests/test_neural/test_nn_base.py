@@ -93,6 +93,19 @@ class TestNNBase:
         with pytest.raises(ValueError, match="The length of X \\(2\\) and y \\(1\\) must be equal."):
             _NNBase._format_x_y_data(X, y)
 
+    def test_format_x_y_data_from_npy_files(self, tmp_path):
+        """Test that .npy paths passed to _format_x_y_data are opened as memory maps."""
+        X = np.array([[1.0, 2.0], [3.0, 4.0]])
+        y = np.array([1, 0])
+        np.save(tmp_path / "X.npy", X)
+        np.save(tmp_path / "y.npy", y)
+
+        X_formatted, y_formatted = _NNBase._format_x_y_data(tmp_path / "X.npy", str(tmp_path / "y.npy"))
+
+        assert isinstance(X_formatted, np.memmap)
+        assert np.array_equal(X_formatted, X)
+        assert np.array_equal(y_formatted, np.array([[1], [0]]))
+
     def test_build_problem_and_fitness_function(self):
         """Test _build_problem_and_fitness_function static method."""
         X = np.array([[0, 1], [1, 0]])
@@ -163,3 +176,33 @@ class TestNNBase:
         fitted_weights = np.array([])
         with pytest.raises(ValueError, match="node_list cannot be empty."):
             _NNBase._predict(X, fitted_weights, node_list, input_activation, output_activation, bias, is_classifier)
+
+    def test_predict_batched_matches_unbatched(self):
+        """Test that predicting in chunks gives the same output as a single pass."""
+        X = np.random.default_rng(0).uniform(-1, 1, (11, 3))
+        node_list = [4, 5, 3]
+        fitted_weights = np.linspace(-1, 1, _NNBase._calculate_state_size(node_list))
+        args = (fitted_weights, node_list, np.tanh, lambda x: np.exp(x) / np.sum(np.exp(x), axis=1, keepdims=True), True, True)
+
+        y_pred, predicted_probs = _NNBase._predict(X, *args)
+        y_pred_batched, predicted_probs_batched = _NNBase._predict(X, *args, batch_size=4)
+
+        assert np.array_equal(y_pred_batched, y_pred)
+        assert np.allclose(predicted_probs_batched, predicted_probs)
+
+    def test_predict_threaded_and_iter_predict_match_predict(self):
+        """Test that threaded and generator-based chunked prediction match a single pass."""
+        X = np.random.default_rng(1).uniform(-1, 1, (25, 3))
+        node_list = [3, 4, 1]
+        fitted_weights = np.linspace(-1, 1, _NNBase._calculate_state_size(node_list))
+        args = (fitted_weights, node_list, np.tanh, lambda x: 1 / (1 + np.exp(-x)), False, True)
+
+        y_pred, predicted_probs = _NNBase._predict(X, *args)
+        y_pred_threaded, predicted_probs_threaded = _NNBase._predict(X, *args, batch_size=4, n_threads=3)
+        chunks = list(_NNBase._iter_predict(X, *args, batch_size=10))
+
+        assert np.array_equal(y_pred_threaded, y_pred)
+        assert np.allclose(predicted_probs_threaded, predicted_probs)
+        assert [len(chunk_pred) for chunk_pred, _ in chunks] == [10, 10, 5]
+        assert np.array_equal(np.vstack([chunk_pred for chunk_pred, _ in chunks]), y_pred)
+        assert np.allclose(np.vstack([chunk_probs for _, chunk_probs in chunks]), predicted_probs)
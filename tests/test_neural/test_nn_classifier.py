@@ -270,6 +270,41 @@ class TestNNClassifier:
         with pytest.raises(ValueError, match="The number of columns in X must equal"):
             nn.predict_proba(X_invalid)
 
+    def test_fit_predict_memory_mapped_data(self, tmp_path):
+        """Test fitting and predicting from .npy files with a batch size."""
+        X = np.random.default_rng(0).uniform(-1, 1, (9, 2))
+        y = (X[:, 0] > 0).astype(int)
+        np.save(tmp_path / "X.npy", X)
+        np.save(tmp_path / "y.npy", y)
+
+        nn = NNClassifier(
+            runner=self.runner, algorithm=self.algorithm, activation=self.activation, hidden_layer_sizes=[3], seed=self.seed, batch_size=4
+        )
+        nn.fit(tmp_path / "X.npy", tmp_path / "y.npy")
+
+        assert isinstance(nn.fitness_fn.X, np.memmap)
+        assert nn.fitness_fn.batch_size == 4
+        assert nn.get_params()["batch_size"] == 4
+
+        y_pred = nn.predict(tmp_path / "X.npy")
+        expected, _ = nn._predict(X, nn.fitted_weights, nn.node_list, self.activation, nn.output_activation, bias=True)
+        assert np.array_equal(y_pred, expected)
+
+    def test_iter_predict(self):
+        """Test that iter_predict yields chunks that match predict and predict_proba."""
+        X = np.random.default_rng(0).uniform(-1, 1, (7, 2))
+        nn = NNClassifier(runner=self.runner, algorithm=self.algorithm, activation=self.activation, hidden_layer_sizes=[3], n_threads=2)
+        nn.fit(X, (X[:, 0] > 0).astype(int))
+
+        chunks = list(nn.iter_predict(X, batch_size=3))
+
+        assert [len(chunk_pred) for chunk_pred, _ in chunks] == [3, 3, 1]
+        assert np.array_equal(np.vstack([chunk_pred for chunk_pred, _ in chunks]), nn.predict(X))
+        assert np.allclose(np.vstack([chunk_probs for _, chunk_probs in chunks]), nn.predict_proba(X))
+
+        with pytest.raises(ValueError, match="The number of columns in X must equal"):
+            next(nn.iter_predict(np.array([[1, 2, 3]])))
+
     def test_extra_params_continue(self):
         """Test that extra parameters already present as attributes trigger the continue statement."""
         # Define kwargs with a key 'loss', which should not override the existing loss attribute
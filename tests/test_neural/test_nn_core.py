@@ -9,6 +9,7 @@ import numpy as np
 import pytest
 
 from mlrose_ky.algorithms.decay import GeomDecay
+from mlrose_ky.algorithms.optimizers import Adam
 
 # noinspection PyProtectedMember
 from mlrose_ky.neural._nn_core import _NNCore
@@ -147,6 +148,57 @@ class TestNNCore:
         with pytest.raises(ValueError, match="Algorithm must be one of"):
             nn._validate()
 
+    def test_validate_incorrect_optimizer(self):
+        """Test that _validate raises errors with an incorrect optimizer."""
+        nn = _NNCore(hidden_nodes=self.hidden_nodes, algorithm="gradient_descent", optimizer="invalid_optimizer")
+        with pytest.raises(ValueError, match="Optimizer must be one of"):
+            nn._validate()
+
+        nn = _NNCore(hidden_nodes=self.hidden_nodes, algorithm="gradient_descent", optimizer=0.1)
+        with pytest.raises(TypeError, match="optimizer must be a str or an optimizer object"):
+            nn._validate()
+
+    @pytest.mark.parametrize("optimizer", ["sgd", "momentum", "adam", "rmsprop", Adam(learning_rate=0.05)])
+    def test_fit_gradient_descent_with_optimizer(self, optimizer):
+        """Test fitting with gradient descent using each of the optimizers."""
+        nn = _NNCore(
+            hidden_nodes=[3],
+            activation="tanh",
+            algorithm="gradient_descent",
+            optimizer=optimizer,
+            learning_rate=0.05,
+            random_state=self.random_state,
+        )
+        nn.fit(self.X_train, self.y_train)
+
+        assert np.isfinite(nn.loss)
+        assert len(nn.fitted_weights) == _NNCore._calculate_state_size(nn.node_list)
+        assert nn.get_params()["optimizer"] == optimizer
+
+    def test_validate_incorrect_batch_size_and_n_threads(self):
+        """Test that _validate raises ValueError with an incorrect batch_size or n_threads."""
+        with pytest.raises(ValueError, match="batch_size must be a positive integer or None"):
+            _NNCore(hidden_nodes=self.hidden_nodes, batch_size=0)._validate()
+        with pytest.raises(ValueError, match="n_threads must be a positive integer"):
+            _NNCore(hidden_nodes=self.hidden_nodes, n_threads=0)._validate()
+
+    def test_predict_in_chunks(self):
+        """Test that chunked, threaded and generator-based prediction match unchunked prediction."""
+        X = np.random.default_rng(self.random_state).uniform(-1, 1, (30, 2))
+        y = (X[:, 0] > X[:, 1]).astype(int)
+        nn = _NNCore(hidden_nodes=[4], activation="tanh", max_iters=20, random_state=self.random_state)
+        nn.fit(X, y)
+        y_pred = nn.predict(X)
+        predicted_probs = nn.predicted_probs
+
+        nn.set_params(batch_size=7, n_threads=2)
+        assert np.array_equal(nn.predict(X), y_pred)
+        assert np.allclose(nn.predicted_probs, predicted_probs)
+
+        chunks = list(nn.iter_predict(X, batch_size=8))
+        assert len(chunks) == 4
+        assert np.array_equal(np.vstack([chunk_pred for chunk_pred, _ in chunks]), y_pred)
+
     def test_fit(self):
         """Test the fit method."""
         nn = _NNCore(hidden_nodes=self.hidden_nodes, activation=self.activation, algorithm=self.algorithm, random_state=self.random_state)
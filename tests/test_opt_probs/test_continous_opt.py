@@ -207,3 +207,69 @@ class TestContinuousOpt:
         # Check if child is either parent_1 or parent_2 (since it's length 1)
         assert len(child) == 1
         assert np.array_equal(child, parent_1) or np.array_equal(child, parent_2)
+
+    def test_random_neighbor_at_bound(self):
+        """Test random_neighbor method steps away from a bound when the random step is clipped away"""
+        problem = ContinuousOpt(5, OneMax(), step=0.5)
+        x = np.zeros(5)
+        problem.set_state(x)
+        for _ in range(20):
+            neigh = problem.random_neighbor()
+            assert np.count_nonzero(neigh) == 1 and np.sum(neigh) == 0.5
+
+    def test_random_neighbor_integer_state(self):
+        """Test random_neighbor method on an integer state with a fractional step size"""
+        problem = ContinuousOpt(5, OneMax(), step=0.1)
+        x = np.array([0, 1, 0, 1, 0])
+        problem.set_state(x)
+        neigh = problem.random_neighbor()
+        assert np.isclose(np.sum(np.abs(x - neigh)), 0.1)
+
+    def test_random_pop_evaluates_population(self):
+        """Test random_pop method evaluates each member of the population once"""
+        problem = ContinuousOpt(5, OneMax())
+        fitness_evaluations = problem.fitness_evaluations
+        problem.random_pop(10)
+        pop = problem.get_population()
+        assert problem.fitness_evaluations == fitness_evaluations + 10
+        assert np.allclose(problem.get_pop_fitness(), pop.sum(axis=1)) and 0 <= pop.min() and pop.max() <= 1
+
+    def test_reproduce_batch_mut0(self):
+        """Test reproduce_batch method when mutation_prob is 0"""
+        problem = ContinuousOpt(5, OneMax(), step=1)
+        fathers = np.zeros((50, 5))
+        mothers = np.ones((50, 5))
+        children = problem.reproduce_batch(fathers, mothers, mutation_prob=0)
+
+        # Each child takes a non-empty prefix from its father and a non-empty suffix from its mother
+        assert children.shape == (50, 5)
+        assert np.all(np.diff(children, axis=1) >= 0) and np.all(children[:, 0] == 0) and np.all(children[:, -1] == 1)
+
+    def test_reproduce_batch_length_one(self):
+        """Test reproduce_batch method when length of problem is 1"""
+        problem = ContinuousOpt(1, OneMax())
+        children = problem.reproduce_batch(np.zeros((20, 1)), np.ones((20, 1)), mutation_prob=0)
+        assert children.shape == (20, 1) and np.all((children == 0) | (children == 1))
+
+    def test_reproduce_batch_invalid_parent_shapes(self):
+        """Test reproduce_batch method with mismatched parent shapes."""
+        problem = ContinuousOpt(5, OneMax())
+        with pytest.raises(ValueError, match=re.escape("Shapes of parents must match each other and be (n_children, problem length).")):
+            problem.reproduce_batch(np.zeros((3, 5)), np.zeros((2, 5)))
+        with pytest.raises(ValueError, match=re.escape("Shapes of parents must match each other and be (n_children, problem length).")):
+            problem.reproduce_batch(np.zeros((3, 4)), np.zeros((3, 4)))
+
+    def test_mutate_batch(self):
+        """Test mutate_batch method when mutation_prob is 0 and 1"""
+        problem = ContinuousOpt(5, OneMax(), min_val=2, max_val=3)
+        children = np.zeros((10, 5))
+        assert np.all(problem.mutate_batch(children.copy(), mutation_prob=0) == 0)
+
+        mutated = problem.mutate_batch(children, mutation_prob=1)
+        assert np.all((2 <= mutated) & (mutated <= 3))
+
+    def test_mutate_batch_invalid_mutation_prob(self):
+        """Test mutate_batch method with invalid mutation_prob."""
+        problem = ContinuousOpt(5, OneMax())
+        with pytest.raises(ValueError, match="mutation_prob must be between 0 and 1."):
+            problem.mutate_batch(np.zeros((2, 5)), mutation_prob=1.5)
@@ -267,3 +267,13 @@ class TestDiscreteOpt:
 
         # Ensure that all elements in the sample_order are covered
         assert len(set(problem.sample_order)) == 5  # Check if all elements are unique
+
+    def test_reset_counts_initial_evaluation(self):
+        """Test that reset counts the evaluation of the new initial state, as ContinuousOpt.reset does."""
+        problem = DiscreteOpt(5, OneMax())
+        problem.eval_fitness(np.ones(5))
+        problem.reset()
+
+        assert problem.fitness_evaluations == 1
+        assert problem.evaluation_stats.counts["initial"] == 1
+        assert problem.get_fitness() == OneMax().evaluate(problem.get_state())
@@ -0,0 +1,152 @@
+"""Unit tests for opt_probs/evaluation_stats.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+import pytest
+
+from mlrose_ky import DiscreteOpt, EvaluationStats, FlipFlopOpt, OneMax, RHCRunner
+from mlrose_ky.algorithms import genetic_alg, hill_climb, random_hill_climb
+from mlrose_ky.opt_probs.evaluation_stats import EVALUATION_PURPOSES
+from tests.globals import SEED
+
+
+class TestEvaluationStats:
+    """Tests for EvaluationStats."""
+
+    def test_record_and_merge(self):
+        """Test that evaluations are counted by purpose, and merged across instances."""
+        stats = EvaluationStats()
+        stats.record("neighbor", 2_000, n=4)
+        stats.record("acceptance", 1_000)
+        stats.record_cache_hit()
+        other = EvaluationStats()
+        other.record("population", 1_000, n=5)
+        stats.merge(other)
+
+        assert stats.counts == {"initial": 0, "neighbor": 4, "population": 5, "acceptance": 1, "reevaluation": 0}
+        assert stats.total == 10
+        assert stats.time == pytest.approx(4e-6)
+        assert stats.evaluations_per_second == pytest.approx(10 / 4e-6)
+        assert stats.cache_hits == 1
+
+        stats.reset()
+        assert stats.total == 0 and stats.cache_hits == 0 and stats.evaluations_per_second == 0.0
+
+    def test_to_columns(self):
+        """Test the column names the accounting is logged under."""
+        columns = EvaluationStats().to_columns()
+
+        assert list(columns) == [f"FEvals_{purpose}" for purpose in EVALUATION_PURPOSES] + [
+            "FEvals_cache_hits",
+            "FEvals_time",
+            "FEvals_per_second",
+        ]
+
+    def test_problem_counts_evaluations_by_purpose(self):
+        """Test that a problem's evaluations are counted under their purpose, and match its evaluation counter."""
+        np.random.seed(SEED)
+        problem = DiscreteOpt(length=8, fitness_fn=OneMax())
+        problem.reset()
+        problem.find_neighbors()
+        problem.best_neighbor()
+        problem.random_pop(10)
+        problem.set_state(np.zeros(8, dtype=int))
+
+        stats = problem.evaluation_stats
+        assert stats.counts == {"initial": 1, "neighbor": 8, "population": 10, "acceptance": 0, "reevaluation": 1}
+        assert stats.total == problem.fitness_evaluations
+        assert stats.time > 0
+
+    def test_accept_state_reuses_given_fitness(self):
+        """Test that accepting a state along with its fitness does not evaluate it again, unlike set_state."""
+        problem = DiscreteOpt(length=8, fitness_fn=OneMax())
+        problem.reset()
+        next_state = np.ones(8, dtype=int)
+        next_fitness = problem.eval_fitness(next_state)
+        problem._accept_state(next_state, next_fitness)
+
+        assert problem.get_fitness() == next_fitness == 8
+        assert problem.evaluation_stats.cache_hits == 1
+        assert problem.fitness_evaluations == 2
+
+        problem.set_state(next_state)
+        assert problem.evaluation_stats.counts["reevaluation"] == 1
+        assert problem.fitness_evaluations == 3
+
+    def test_set_state_evaluates_state_modified_in_place(self):
+        """Test that setting the last evaluated state after modifying it in place evaluates its new contents."""
+        problem = DiscreteOpt(length=5, fitness_fn=OneMax())
+        state = np.zeros(5, dtype=int)
+        problem.eval_fitness(state)
+        state[:] = 1
+        problem.set_state(state)
+
+        assert problem.get_fitness() == 5.0
+        assert problem.evaluation_stats.cache_hits == 0
+
+    def test_flip_flop_population_evaluations_are_counted(self):
+        """Test that the vectorized population evaluation of FlipFlopOpt is counted."""
+        problem = FlipFlopOpt(length=8)
+        problem.reset()
+        problem.random_pop(20)
+
+        assert problem.evaluation_stats.counts["population"] == 20
+        assert problem.fitness_evaluations == problem.evaluation_stats.total == 21
+
+    @pytest.mark.parametrize(
+        "algorithm, kwargs",
+        [
+            (hill_climb, {"max_iters": 20}),
+            (random_hill_climb, {"max_attempts": 5, "max_iters": 20, "restarts": 3}),
+            (genetic_alg, {"pop_size": 20, "max_iters": 5}),
+        ],
+    )
+    def test_algorithm_evaluations_match_counter(self, algorithm, kwargs):
+        """Test that the accounting matches the evaluation counter after a run, including across restarts."""
+        problem = DiscreteOpt(length=10, fitness_fn=OneMax())
+        algorithm(problem, random_state=SEED, **kwargs)
+
+        stats = problem.evaluation_stats
+        assert stats.total == problem.fitness_evaluations
+        assert stats.cache_hits > 0
+
+    def test_runner_logs_evaluation_columns(self):
+        """Test that a runner created with log_evaluations adds the evaluation accounting to its run statistics."""
+        problem = DiscreteOpt(length=10, fitness_fn=OneMax())
+        runner = RHCRunner(
+            problem=problem,
+            experiment_name="evaluation_stats",
+            seed=SEED,
+            iteration_list=[0, 5, 10],
+            restart_list=[1],
+            max_attempts=5,
+            log_evaluations=True,
+        )
+        run_stats_df, _ = runner.run()
+
+        purpose_columns = [f"FEvals_{purpose}" for purpose in EVALUATION_PURPOSES]
+        assert {*purpose_columns, "FEvals_cache_hits", "FEvals_time", "FEvals_per_second"} <= set(run_stats_df.columns)
+        assert (run_stats_df[purpose_columns].sum(axis=1) == run_stats_df["FEvals"]).all()
+
+    def test_runner_adds_evaluation_columns_to_curves(self):
+        """Test that a runner created with log_evaluations adds the evaluation accounting to the logged curve points."""
+        problem = DiscreteOpt(length=10, fitness_fn=OneMax())
+        runner = RHCRunner(
+            problem=problem,
+            experiment_name="evaluation_stats",
+            seed=SEED,
+            iteration_list=[0, 5, 10],
+            restart_list=[1],
+            max_attempts=5,
+            generate_curves=True,
+            log_evaluations=True,
+        )
+        run_stats_df, curves_df = runner.run()
+
+        purpose_columns = [f"FEvals_{purpose}" for purpose in EVALUATION_PURPOSES]
+        logged_curves_df = curves_df.dropna(subset=purpose_columns)
+        assert len(logged_curves_df) > 0 and curves_df[purpose_columns].isna().any(axis=None)
+        assert (logged_curves_df[purpose_columns].sum(axis=1) == logged_curves_df["FEvals"]).all()
+        assert set(logged_curves_df["FEvals"]) <= set(run_stats_df["FEvals"])
@@ -0,0 +1,118 @@
+"""Unit tests for runners/curve_table.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlrose_ky.runners import CurveTable, RHCRunner
+from mlrose_ky.generators import FlipFlopGenerator
+from tests.globals import SEED
+
+
+class TestCurveTable:
+    """Tests for CurveTable."""
+
+    @pytest.mark.parametrize("capacity", [0, -1, 1.5, True])
+    def test_invalid_capacity_raises(self, capacity):
+        """Test that a capacity that is not a positive integer raises a ValueError."""
+        with pytest.raises(ValueError, match="capacity must be a positive integer"):
+            CurveTable(capacity=capacity)
+
+    def test_add_run_deduplicates_identical_parameters(self):
+        """Test that runs with identical parameters, hashable or not, share one id."""
+        table = CurveTable()
+
+        assert table.add_run({"Restarts": 1, "current_restart": 0}) == 0
+        assert table.add_run({"Restarts": 1, "current_restart": 1}) == 1
+        assert table.add_run({"Restarts": 1, "current_restart": 0}) == 0
+        assert table.add_run({"schedule": ["unhashable"]}) == 2
+        assert table.add_run({"schedule": ["unhashable"]}) == 2
+        assert table.n_runs == 3
+
+    def test_append_grows_capacity(self):
+        """Test that appending more points than the initial capacity keeps every point."""
+        table = CurveTable(capacity=2)
+        run_id = table.add_run({"A": 1})
+        for start in range(0, 10, 3):
+            iterations = np.arange(start, start + 3)
+            table.append(run_id, iterations, iterations / 10, np.column_stack([iterations * 2.0, iterations + 1.0]))
+
+        assert len(table) == 12
+        assert table.iterations.tolist() == list(range(12))
+        assert table.fitness.tolist() == [2.0 * i for i in range(12)]
+        assert table.fitness_evaluations.tolist() == [i + 1.0 for i in range(12)]
+        assert np.allclose(table.times, np.arange(12) / 10)
+
+    def test_to_frame_joins_run_parameters(self):
+        """Test that to_frame joins each point to the parameters of its run, for the whole table or a range of it."""
+        table = CurveTable()
+        table.append(table.add_run({"A": 1, "B": "x"}), [0, 1], [0.0, 0.1], [[1.0, 1.0], [2.0, 2.0]])
+        table.append(table.add_run({"A": 2, "B": "y"}), [0], [0.0], [[3.0, 1.0]])
+
+        df = table.to_frame()
+
+        assert list(df.columns) == ["Iteration", "Time", "Fitness", "FEvals", "A", "B"]
+        assert df["Fitness"].tolist() == [1.0, 2.0, 3.0]
+        assert df["A"].tolist() == [1, 1, 2]
+        assert df["B"].tolist() == ["x", "x", "y"]
+        assert table.to_frame(1, 2)["B"].tolist() == ["x"]
+
+    def test_points_and_runs_frames_are_joined_by_run_id(self):
+        """Test that merging points_frame and runs_frame on the Run column gives to_frame."""
+        table = CurveTable()
+        table.append(table.add_run({"A": 1}), [0, 1], [0.0, 0.1], [[1.0, 1.0], [2.0, 2.0]])
+        table.append(table.add_run({"A": 2}), [0], [0.0], [[3.0, 1.0]])
+
+        runs_df = table.runs_frame()
+        points_df = table.points_frame()
+
+        assert runs_df.to_dict("list") == {"Run": [0, 1], "A": [1, 2]}
+        assert points_df["Run"].tolist() == [0, 0, 1]
+        merged = points_df.merge(runs_df, on="Run").drop(columns="Run")
+        pd.testing.assert_frame_equal(merged, table.to_frame())
+
+    def test_empty_table_frames(self):
+        """Test that the frames of an empty table are empty but keep their columns."""
+        table = CurveTable()
+
+        assert table.to_frame().empty
+        assert list(table.to_frame().columns) == ["Iteration", "Time", "Fitness", "FEvals"]
+        assert table.points_frame().empty
+        assert list(table.points_frame().columns) == ["Run", "Iteration", "Time", "Fitness", "FEvals"]
+        assert list(table.runs_frame().columns) == ["Run"]
+
+    def test_take_and_extend_round_trip(self):
+        """Test that take copies a range with only its runs, and extend merges identical runs back."""
+        table = CurveTable()
+        table.append(table.add_run({"A": 1}), [0, 1], [0.0, 0.1], [[1.0, 1.0], [2.0, 2.0]])
+        table.append(table.add_run({"A": 2}), [0, 1], [0.0, 0.1], [[3.0, 1.0], [4.0, 2.0]])
+
+        taken = table.take(2)
+        assert taken.n_runs == 1
+        assert taken.run_ids.tolist() == [0, 0]
+        pd.testing.assert_frame_equal(taken.to_frame(), table.to_frame(2))
+
+        merged = CurveTable()
+        merged.extend(table.take(0, 2))
+        merged.extend(taken)
+        merged.extend(table.take(0, 2))
+        assert merged.n_runs == 2
+        assert merged.run_ids.tolist() == [0, 0, 1, 1, 0, 0]
+        assert merged.fitness.tolist() == [1.0, 2.0, 3.0, 4.0, 1.0, 2.0]
+
+    def test_runner_saves_run_parameters_table(self):
+        """Test that a runner exposes one row per run in curve_runs_df, matching the parameters in curves_df."""
+        problem = FlipFlopGenerator.generate(seed=SEED, size=20)
+        runner = RHCRunner(
+            problem=problem, experiment_name="curve_table", seed=SEED, iteration_list=[0, 10, 50], restart_list=[2], max_attempts=10
+        )
+        _, curves_df = runner.run()
+
+        runs_df = runner.curve_runs_df
+        assert runs_df["Run"].tolist() == list(range(len(runs_df)))
+        assert len(runs_df) < len(curves_df)
+        assert set(curves_df["current_restart"]) == set(runs_df["current_restart"])
+        assert list(curves_df.columns) == ["Iteration", "Time", "Fitness", "FEvals"] + list(runs_df.columns[1:])
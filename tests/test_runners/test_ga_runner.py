@@ -1,11 +1,14 @@
 """Unit tests for runners/ga_runner.py"""
 
+import os
+
 import pytest
 from unittest.mock import patch
 
 from tests.globals import SEED
 
 from mlrose_ky import GARunner, FlipFlopGenerator
+from mlrose_ky.runners._runner_base import _RunnerBase
 
 
 class TestGARunner:
@@ -110,3 +113,34 @@ class TestGARunner:
         assert runner.iteration_list == runner_kwargs["iteration_list"]
         assert runner.population_sizes == runner_kwargs["population_sizes"]
         assert runner.mutation_rates == runner_kwargs["mutation_rates"]
+
+    def test_checkpoint_requires_output_directory(self, runner_kwargs):
+        """Test that checkpointing without an output directory raises a ValueError."""
+        with pytest.raises(ValueError):
+            GARunner(**runner_kwargs, checkpoint=True)
+
+    def test_checkpointed_run_resumes_completed_combinations(self, runner_kwargs, tmp_path):
+        """Test that an interrupted checkpointed run skips the combinations it had completed when it is run again."""
+        expected_stats, expected_curves = GARunner(**runner_kwargs).run()
+        run_one_experiment = _RunnerBase._run_one_experiment
+        calls = []
+
+        def interrupted_after_two_combinations(runner, algorithm, total_args, **params):
+            calls.append(total_args)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return run_one_experiment(runner, algorithm, total_args, **params)
+
+        with patch.object(_RunnerBase, "_run_one_experiment", interrupted_after_two_combinations):
+            with pytest.raises(KeyboardInterrupt):
+                GARunner(**runner_kwargs, output_directory=str(tmp_path), checkpoint=True).run()
+
+        calls.clear()
+        with patch.object(_RunnerBase, "_run_one_experiment", interrupted_after_two_combinations):
+            run_stats, curves = GARunner(**runner_kwargs, output_directory=str(tmp_path), checkpoint=True).run()
+
+        assert len(calls) == 2
+        columns = ["Iteration", "Fitness", "FEvals", "State", "Population Size", "Mutation Rate"]
+        assert run_stats[columns].equals(expected_stats[columns])
+        assert curves[["Iteration", "Fitness", "FEvals"]].equals(expected_curves[["Iteration", "Fitness", "FEvals"]])
+        assert not any("checkpoint" in filename for filename in os.listdir(tmp_path / "test_experiment"))
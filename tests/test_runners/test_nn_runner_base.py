@@ -803,3 +803,48 @@ class TestNNRunnerBase:
 
                 mock_rename.assert_has_calls(expected_calls)
                 assert mock_rename.call_count == 2
+
+    @pytest.mark.parametrize("search_mode, halving_factor", [("random", 3), ("halving", 1), ("halving", 2.5)])
+    def test_nn_runner_base_invalid_search_arguments(self, search_mode, halving_factor):
+        """Test _NNRunnerBase raises ValueError for an invalid search_mode or halving_factor"""
+        with pytest.raises(ValueError):
+            _NNRunnerBase(
+                x_train=np.random.rand(10, 2),
+                y_train=np.random.randint(2, size=10),
+                x_test=np.random.rand(5, 2),
+                y_test=np.random.randint(2, size=5),
+                experiment_name="test_experiment",
+                seed=SEED,
+                iteration_list=[1, 2, 3],
+                grid_search_parameters={"param1": [0.1, 0.2]},
+                grid_search_scorer_method=skmt.accuracy_score,
+                search_mode=search_mode,
+                halving_factor=halving_factor,
+            )
+
+    def test_nn_runner_base_get_search_arguments(self):
+        """Test _NNRunnerBase _get_search_arguments uses iteration_list as the halving budget"""
+        kwargs = {
+            "x_train": np.random.rand(10, 2),
+            "y_train": np.random.randint(2, size=10),
+            "x_test": np.random.rand(5, 2),
+            "y_test": np.random.randint(2, size=5),
+            "experiment_name": "test_experiment",
+            "seed": SEED,
+            "iteration_list": [0, 4, 1, 16],
+            "grid_search_parameters": {"param1": [0.1, 0.2], "max_iters": [1, 2]},
+            "grid_search_scorer_method": skmt.accuracy_score,
+        }
+
+        grid_runner = _NNRunnerBase(**kwargs)
+        assert grid_runner._get_search_arguments() == {"parameters": grid_runner.grid_search_parameters}
+
+        halving_runner = _NNRunnerBase(**kwargs, search_mode="halving", halving_factor=4)
+        assert halving_runner._get_search_arguments() == {
+            "parameters": {"param1": [0.1, 0.2]},
+            "search_mode": "halving",
+            "resource": "max_iters",
+            "min_resources": 1,
+            "max_resources": 16,
+            "factor": 4,
+        }
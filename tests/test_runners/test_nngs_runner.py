@@ -3,12 +3,14 @@
 import copy
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 import sklearn.metrics as skmt
 
 import mlrose_ky
 from mlrose_ky import NNGSRunner
 from mlrose_ky.decorators import get_short_name
+from mlrose_ky.runners.nngs_runner import _WarmStartCache
 
 
 class TestNNGSRunner:
@@ -124,3 +126,131 @@ class TestNNGSRunner:
                 **expected_params,
             )
             assert result == "mock_result"
+
+    def test_warm_start_cache_keeps_best_weights(self):
+        """Test the warm-start cache only replaces weights with lower-loss weights and is shared by deep copies."""
+        cache = _WarmStartCache()
+        key = ((2,), "relu", True)
+
+        assert cache.get(key) is None
+        assert cache.update(key, weights=np.array([1.0, 2.0]), loss=0.5)
+        assert not cache.update(key, weights=np.array([3.0, 4.0]), loss=0.7)
+        assert not cache.update(key, weights=np.array([5.0, 6.0]), loss=np.nan)
+        assert cache.update(key, weights=np.array([7.0, 8.0]), loss=0.2)
+
+        np.testing.assert_array_equal(cache.get(key), [7.0, 8.0])
+        assert copy.deepcopy(cache) is cache
+        assert len(cache) == 1
+
+    def test_run_one_experiment_uses_warm_start_weights(self, runner_kwargs):
+        """Test run_one_experiment_ starts from cached weights once a fit of the same architecture and fold has finished."""
+        runner = NNGSRunner(**runner_kwargs, warm_start=True)
+        algorithm = runner.classifier.algorithm
+        total_args = {"hidden_layer_sizes": [2], "activation": mlrose_ky.relu, "bias": True}
+        fold_a, fold_b = np.array([0, 1]), np.array([2, 3])
+        fitted_weights = np.array([0.1, 0.2, 0.3])
+
+        def run(args, sample_ids):
+            runner.run_one_experiment_(
+                algorithm=algorithm, total_args=dict(args), problem="p", init_state=np.zeros(3), sample_ids=sample_ids
+            )
+            assert "sample_ids" not in mock_invoke.call_args.kwargs
+            return mock_invoke.call_args.kwargs["init_state"]
+
+        with patch.object(runner, "_invoke_algorithm", return_value=(fitted_weights, 0.4, None)) as mock_invoke:
+            np.testing.assert_array_equal(run(total_args, fold_a), np.zeros(3))
+            np.testing.assert_array_equal(run(total_args, fold_a), fitted_weights)
+            np.testing.assert_array_equal(run(total_args, fold_b), np.zeros(3))
+            np.testing.assert_array_equal(run({**total_args, "hidden_layer_sizes": [2, 2]}, fold_a), np.zeros(3))
+
+    def test_warm_start_key_depends_on_training_fold(self):
+        """Test warm-start keys differ between folds with different training rows, and not between fits of the same fold."""
+        total_args = {"hidden_layer_sizes": [2], "activation": mlrose_ky.relu, "bias": True}
+
+        assert NNGSRunner._get_warm_start_key(total_args, np.array([0, 1])) == NNGSRunner._get_warm_start_key(total_args, np.array([0, 1]))
+        assert NNGSRunner._get_warm_start_key(total_args, np.array([0, 1])) != NNGSRunner._get_warm_start_key(total_args, np.array([2, 3]))
+        assert NNGSRunner._get_warm_start_key(total_args, np.array([0, 1])) != NNGSRunner._get_warm_start_key(total_args, None)
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_run_with_warm_start_caches_weights_per_fold(self, runner_kwargs):
+        """Test a warm-started grid search keeps separate weights for each fold and for the refit on all the training rows."""
+        runner_kwargs["grid_search_parameters"] = {"max_iters": [1, 2], "hidden_layer_sizes": [[2]], "activation": [mlrose_ky.relu]}
+        runner_kwargs["generate_curves"] = False
+        runner = NNGSRunner(**runner_kwargs, warm_start=True, warm_start_scope="fold")
+
+        with patch.object(runner._warm_start_cache, "update", wraps=runner._warm_start_cache.update) as mock_update:
+            runner.run()
+
+        fold_keys = {call.args[0][3:] for call in mock_update.call_args_list}
+        assert len(fold_keys) == runner_kwargs["cv"] + 1
+        assert len(runner._warm_start_cache) == runner_kwargs["cv"] + 1
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_run_with_warm_start_scope_all_shares_weights_across_folds(self, runner_kwargs):
+        """Test a grid search with warm_start_scope='all' keeps one set of weights per architecture for every fold."""
+        runner_kwargs["grid_search_parameters"] = {"max_iters": [1, 2], "hidden_layer_sizes": [[2]], "activation": [mlrose_ky.relu]}
+        runner_kwargs["generate_curves"] = False
+        runner = NNGSRunner(**runner_kwargs, warm_start=True, warm_start_scope="all")
+
+        with patch.object(runner._warm_start_cache, "update", wraps=runner._warm_start_cache.update) as mock_update:
+            runner.run()
+
+        assert "fit_params" not in runner._get_search_arguments()
+        assert {call.args[0] for call in mock_update.call_args_list} == {((2,), "relu", True)}
+        assert len(runner._warm_start_cache) == 1
+
+    def test_run_one_experiment_with_warm_start_scope_all_ignores_fold(self, runner_kwargs):
+        """Test run_one_experiment_ with warm_start_scope='all' starts from weights found on another fold."""
+        runner = NNGSRunner(**runner_kwargs, warm_start=True, warm_start_scope="all")
+        algorithm = runner.classifier.algorithm
+        total_args = {"hidden_layer_sizes": [2], "activation": mlrose_ky.relu, "bias": True}
+        fitted_weights = np.array([0.1, 0.2, 0.3])
+
+        with patch.object(runner, "_invoke_algorithm", return_value=(fitted_weights, 0.4, None)) as mock_invoke:
+            for sample_ids in (np.array([0, 1]), np.array([2, 3])):
+                runner.run_one_experiment_(
+                    algorithm=algorithm, total_args=dict(total_args), problem="p", init_state=np.zeros(3), sample_ids=sample_ids
+                )
+
+        np.testing.assert_array_equal(mock_invoke.call_args.kwargs["init_state"], fitted_weights)
+
+    def test_invalid_warm_start_scope(self, runner_kwargs):
+        """Test NNGSRunner raises a ValueError for an unknown warm_start_scope."""
+        with pytest.raises(ValueError):
+            NNGSRunner(**runner_kwargs, warm_start=True, warm_start_scope="experiment")
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_run_with_halving_search_mode(self, runner_kwargs):
+        """Test a successive-halving run uses iteration_list as the budget and records every round in cv_results_df."""
+        runner_kwargs.update(
+            {
+                "x_train": np.array(runner_kwargs["x_train"] * 5),
+                "y_train": np.array(runner_kwargs["y_train"] * 5),
+                "algorithm": mlrose_ky.algorithms.rhc.random_hill_climb,
+                "iteration_list": [1, 2, 4],
+                "search_mode": "halving",
+                "halving_factor": 2,
+                "generate_curves": False,
+            }
+        )
+        runner = NNGSRunner(**runner_kwargs)
+
+        _, _, cv_results_df, search_results = runner.run()
+
+        assert list(search_results.n_resources_) == [1, 2, 4]
+        assert list(search_results.n_candidates_) == [8, 4, 2]
+        assert set(cv_results_df["param_max_iters"]) == {1, 2, 4}
+        assert "param_max_iter" not in cv_results_df
+        assert search_results.best_params_["max_iters"] == 4
+
+    def test_halving_search_uses_only_the_bounds_of_iteration_list(self, runner_kwargs):
+        """Test the halving search is given the bounds of iteration_list as its budget, not its intermediate values."""
+        runner_kwargs.update({"iteration_list": [50, 3, 1, 7], "search_mode": "halving", "halving_factor": 2})
+        runner = NNGSRunner(**runner_kwargs)
+
+        search_arguments = runner._get_search_arguments()
+
+        assert search_arguments["resource"] == "max_iters"
+        assert search_arguments["min_resources"] == 1
+        assert search_arguments["max_resources"] == 50
+        assert "max_iters" not in search_arguments["parameters"]
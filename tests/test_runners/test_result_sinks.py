@@ -0,0 +1,95 @@
+"""Unit tests for runners/result_sinks.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlrose_ky.runners import CSVSink, NpzSink, ParquetSink, PickleSink, ResultSink
+from mlrose_ky.runners.result_sinks import build_result_sinks
+
+
+class TestResultSinks:
+    """Tests for the result sinks and build_result_sinks."""
+
+    @pytest.fixture
+    def df(self):
+        """Fixture to provide a run statistics DataFrame with numeric, string and missing values."""
+        return pd.DataFrame(
+            {
+                "Iteration": [0, 1, 2],
+                "Fitness": [1.5, 2.5, 3.5],
+                "FEvals": pd.Series([None, 2, 4], dtype=object),
+                "State": ["[0, 1]", "[1, 1]", "[1, 0]"],
+                "schedule": ["geometric", "geometric", "geometric"],
+            }
+        )
+
+    @pytest.mark.parametrize("sink", [PickleSink(), CSVSink()])
+    def test_write_and_read_round_trip(self, sink, df, tmp_path):
+        """Test that the pickle and CSV sinks read back the DataFrame they wrote."""
+        filename = sink.write(df, str(tmp_path / "runner__experiment__run_stats_df"))
+
+        assert filename.endswith(sink.extension)
+        pd.testing.assert_frame_equal(sink.read(filename), df, check_dtype=False)
+
+    def test_npz_sink_stores_typed_columns(self, df, tmp_path):
+        """Test that the npz sink keeps numeric dtypes and the index, and exports other object columns as strings."""
+        sink = NpzSink()
+        df.index = [3, 4, 5]
+        df["State"] = [np.array([0, 1]), np.array([1, 1]), np.array([1, 0])]
+        filename = sink.write(df, str(tmp_path / "runner__experiment__run_stats_df"))
+
+        result = sink.read(filename)
+
+        assert list(result.columns) == list(df.columns)
+        assert result["Iteration"].dtype == np.int64
+        assert result["Fitness"].dtype == np.float64
+        assert result["FEvals"].dtype == np.float64 and np.isnan(result["FEvals"][3])
+        assert result["State"].tolist() == ["[0 1]", "[1 1]", "[1 0]"]
+        assert result.index.tolist() == [3, 4, 5]
+
+    def test_parquet_sink_round_trip(self, df, tmp_path):
+        """Test that the parquet sink reads back the values it wrote."""
+        pytest.importorskip("pyarrow")
+        sink = ParquetSink()
+        filename = sink.write(df, str(tmp_path / "runner__experiment__run_stats_df"))
+
+        result = sink.read(filename)
+
+        assert result["Fitness"].tolist() == df["Fitness"].tolist()
+        assert result["State"].tolist() == df["State"].tolist()
+
+    def test_parquet_sink_without_pyarrow_raises(self, df, tmp_path):
+        """Test that writing parquet files without pyarrow raises an ImportError with an install hint."""
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ImportError, match="pyarrow"):
+                ParquetSink().write(df, str(tmp_path / "runner__experiment__run_stats_df"))
+
+    def test_build_result_sinks(self):
+        """Test that build_result_sinks removes duplicates and keeps only the requested formats, in order."""
+        assert build_result_sinks("pickle") == [PickleSink()]
+        assert build_result_sinks(["npz", NpzSink(), "csv"]) == [NpzSink(), CSVSink()]
+        assert build_result_sinks(["csv", "pickle"]) == [CSVSink(), PickleSink()]
+
+    @pytest.mark.parametrize("result_formats", ["feather", [], [1]])
+    def test_build_result_sinks_invalid(self, result_formats):
+        """Test that build_result_sinks raises a ValueError for unknown or missing formats."""
+        with pytest.raises(ValueError):
+            build_result_sinks(result_formats)
+
+    def test_result_sink_is_abstract(self):
+        """Test that ResultSink cannot be instantiated, nor subclasses that do not implement read and write."""
+        with pytest.raises(TypeError):
+            ResultSink()
+
+        class WriteOnlySink(ResultSink):
+            def write(self, df, filename_root):
+                return filename_root
+
+        with pytest.raises(TypeError):
+            WriteOnlySink()
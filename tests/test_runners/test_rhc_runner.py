@@ -1,11 +1,15 @@
 """Unit tests for runners/rhc_runner.py"""
 
+import os
+
+import pandas as pd
 import pytest
 from unittest.mock import patch
 
 from tests.globals import SEED
 
 from mlrose_ky import RHCRunner, FlipFlopGenerator
+from mlrose_ky.runners._runner_base import _RunnerBase
 
 
 class TestRHCRunner:
@@ -75,3 +79,32 @@ class TestRHCRunner:
         assert runner.seed == runner_kwargs["seed"]
         assert runner.iteration_list == runner_kwargs["iteration_list"]
         assert runner.restart_list == runner_kwargs["restart_list"]
+
+    def test_replay_reads_npz_results(self, runner_kwargs, tmp_path):
+        """Test that an experiment saved only as npz files is replayed from them, without writing pickle files."""
+        runner_kwargs.update(output_directory=str(tmp_path), result_formats="npz", restart_list=[1], iteration_list=[1, 2])
+        run_stats_df, curves_df = RHCRunner(**runner_kwargs).run()
+
+        filenames = os.listdir(tmp_path / "test_experiment")
+        assert filenames and all(fn.endswith(".npz") for fn in filenames)
+
+        replay_runner = RHCRunner(**runner_kwargs, replay=True)
+        loaded = {}
+        load_df_from_disk = replay_runner._load_df_from_disk
+
+        def _load_df(df_name):
+            loaded[df_name] = load_df_from_disk(df_name)
+            return loaded[df_name]
+
+        try:
+            module_path = RHCRunner.__module__
+            with patch(f"{module_path}.random_hill_climb") as mock_rhc, patch.object(replay_runner, "_load_df_from_disk", _load_df):
+                replay_runner.run()
+        finally:
+            _RunnerBase._RunnerBase__replay.value = False
+
+        mock_rhc.assert_not_called()
+        assert not any(fn.endswith(".p") for fn in os.listdir(tmp_path / "test_experiment"))
+        pd.testing.assert_frame_equal(loaded["run_stats_df"].drop(columns="State"), run_stats_df.drop(columns="State"))
+        assert loaded["run_stats_df"]["State"].tolist() == run_stats_df["State"].astype(str).tolist()
+        pd.testing.assert_frame_equal(loaded["curves_df"], curves_df)
@@ -1,22 +1,25 @@
 """Unit tests for runners/_runner_base.py"""
 
 import copy
+import os
 
 # Authors: Kyle Nakamura
 # License: BSD 3-clause
 
 import pickle as pk
 import signal
-from unittest.mock import patch, Mock, mock_open
+import tracemalloc
+from unittest.mock import ANY, patch, Mock, mock_open
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from mlrose_ky import FlipFlopOpt
+from mlrose_ky import CustomFitness, DiscreteOpt, FlipFlopOpt, SARunner
 
 # noinspection PyProtectedMember
-from mlrose_ky.runners._runner_base import _RunnerBase
+from mlrose_ky.runners import CurveTable, NpzSink, load_journal, load_states
+from mlrose_ky.runners._runner_base import _RunnerBase, _StateCallback
 from tests.globals import SEED
 
 
@@ -124,7 +127,7 @@ class TestRunnerBase:
             runner._setup()
 
             assert runner._raw_run_stats == []
-            assert runner._fitness_curves == []
+            assert len(runner._fitness_curves) == 0
             assert runner._curve_base == 0
             assert runner._iteration_times == []
             assert runner._copy_zero_curve_fitness_from_first == runner._copy_zero_curve_fitness_from_first_original
@@ -272,9 +275,12 @@ class TestRunnerBase:
                 max_attempts=100,
                 curve=True,
                 random_state=runner.seed,
-                state_fitness_callback=runner._save_state,
+                state_fitness_callback=ANY,
                 callback_user_info={},
             )
+            state_fitness_callback = mock_algorithm_func.call_args.kwargs["state_fitness_callback"]
+            assert isinstance(state_fitness_callback, _StateCallback)
+            assert state_fitness_callback.runner is runner
 
             # Check the result
             assert result == {"result": "success"}
@@ -284,12 +290,7 @@ class TestRunnerBase:
         runner = _test_runner_fixture(iteration_list=[1, 2, 3])
         runner._setup()  # Initialize _run_start_time and other setups
         runner._start_run_timing()
-        with (
-            patch.object(runner, "_sanitize_value"),
-            patch("logging.debug"),
-            patch.object(runner, "_create_curve_stat"),
-            patch.object(runner, "_create_and_save_run_data_frames"),
-        ):
+        with patch.object(runner, "_sanitize_value"), patch("logging.debug"), patch.object(runner, "_create_and_save_run_data_frames"):
             # Mock perf_counter to return a fixed time
             with patch("time.perf_counter", side_effect=[100.0, 100.5]):
                 # Call _save_state with iteration=4 (not in [1,2,3]) and done=False
@@ -304,12 +305,7 @@ class TestRunnerBase:
         runner._setup()  # Initialize _run_start_time and other setups
         runner._start_run_timing()
 
-        with (
-            patch.object(runner, "_sanitize_value"),
-            patch("logging.debug"),
-            patch.object(runner, "_create_curve_stat"),
-            patch.object(runner, "_create_and_save_run_data_frames"),
-        ):
+        with patch.object(runner, "_sanitize_value"), patch("logging.debug"), patch.object(runner, "_create_and_save_run_data_frames"):
             # Mock perf_counter to return a fixed time
             with patch("time.perf_counter", side_effect=[100.0, 100.0]):
                 # Call _save_state with iteration=0 and curve=None
@@ -321,23 +317,6 @@ class TestRunnerBase:
                 # Check that _first_curve_synthesized is set to True
                 assert runner._first_curve_synthesized is True
 
-    def test_create_curve_stat_with_dict_curve_value(self, _test_runner_fixture):
-        """Test that _create_curve_stat correctly updates with dict curve_value."""
-        runner = _test_runner_fixture()
-
-        curve_value = {"Fitness": 0.95, "FEvals": 10}
-        curve_data = {"param1": "value1"}
-        iteration = 1
-
-        # Call _create_curve_stat
-        curve_stat = runner._create_curve_stat(iteration=iteration, curve_value=curve_value, curve_data=curve_data)
-
-        assert curve_stat["Iteration"] == 1
-        assert curve_stat["Time"] == 0.0
-        assert curve_stat["Fitness"] == 0.95
-        assert curve_stat["FEvals"] == 10
-        assert curve_stat["param1"] == "value1"
-
     def test_dump_pickle_to_disk_handles_no_output_directory(self, _test_runner_fixture):
         """Test that _dump_pickle_to_disk returns None when output_directory is None."""
         runner = _test_runner_fixture()
@@ -462,27 +441,49 @@ class TestRunnerBase:
                 )
 
     def test_dump_df_to_disk_saves_csv_and_logs_when_final_save_true(self, _test_runner_fixture):
-        """Test that _dump_df_to_disk saves CSV file and logs when final_save is True."""
-        runner = _test_runner_fixture()
+        """Test that _dump_df_to_disk saves a CSV file when CSV is one of the result formats, and logs when final_save is True."""
+        runner = _test_runner_fixture(result_formats=["pickle", "csv"])
         runner._output_directory = "test_output"
         df = pd.DataFrame({"A": [1]})
         df_name = "test_df"
 
         with (
-            patch.object(runner, "_dump_pickle_to_disk", return_value="test_output/test_df") as mock_dump_pickle,
+            patch.object(runner, "_get_pickle_filename_root", return_value="test_output/test_df") as mock_get_root,
+            patch("builtins.open", mock_open()),
+            patch("pickle.dump") as mock_pickle_dump,
             patch.object(df, "to_csv") as mock_to_csv,
             patch("logging.info") as mock_logging,
         ):
             runner._dump_df_to_disk(df, df_name=df_name, final_save=True)
 
-            # Check that _dump_pickle_to_disk was called
-            mock_dump_pickle.assert_called_once_with(object_to_pickle=df, name=df_name)
+            mock_get_root.assert_called_once_with(df_name)
+            mock_pickle_dump.assert_called_once()
 
             # Check that df.to_csv was called with correct filename
             mock_to_csv.assert_called_once_with("test_output/test_df.csv")
 
-            # Check that logging.info was called
-            mock_logging.assert_called_once_with("Saved: [test_output/test_df.csv]")
+            # Check that logging.info was called for both files
+            mock_logging.assert_any_call("Saved: [test_output/test_df.p]")
+            mock_logging.assert_any_call("Saved: [test_output/test_df.csv]")
+
+    def test_dump_df_to_disk_writes_only_pickle_by_default(self, _test_runner_fixture, tmp_path):
+        """Test that _dump_df_to_disk writes only a pickle file unless other result formats are requested."""
+        runner = _test_runner_fixture(output_directory=str(tmp_path))
+        runner._dump_df_to_disk(pd.DataFrame({"A": [1]}), df_name="test_df")
+
+        assert [fn.split("__")[-1] for fn in os.listdir(tmp_path / "test_experiment")] == ["test_df.p"]
+
+    def test_load_pickles_reads_the_first_readable_result_format(self, _test_runner_fixture, tmp_path):
+        """Test that _load_pickles skips result formats whose files are missing and reads the next one."""
+        runner = _test_runner_fixture(output_directory=str(tmp_path), result_formats=["csv", "npz"])
+        df = pd.DataFrame({"Iteration": [0, 1], "Fitness": [0.5, 1.5], "State": [np.array([0, 1]), np.array([1, 1])]}, index=[2, 3])
+        for df_name in ("run_stats_df", "curves_df"):
+            runner._dump_df_to_disk(df, df_name=df_name)
+            os.remove(f"{runner._get_pickle_filename_root(df_name)}.csv")
+
+        assert runner._load_pickles() is True
+        pd.testing.assert_frame_equal(runner.run_stats_df.drop(columns="State"), df.drop(columns="State"))
+        assert runner.curves_df["State"][3] == str(np.array([1, 1]))
 
     def test_save_state_copies_first_fitness_to_zeroth_iteration(self, _test_runner_fixture):
         """Test that _save_state copies first fitness to zeroth iteration when conditions are met."""
@@ -490,12 +491,7 @@ class TestRunnerBase:
         runner._setup()
         runner._start_run_timing()
 
-        with (
-            patch.object(runner, "_sanitize_value"),
-            patch("logging.debug"),
-            patch.object(runner, "_create_curve_stat"),
-            patch.object(runner, "_create_and_save_run_data_frames"),
-        ):
+        with patch.object(runner, "_sanitize_value"), patch("logging.debug"), patch.object(runner, "_create_and_save_run_data_frames"):
             # Mock perf_counter to return consistent time
             with patch("time.perf_counter", side_effect=[100.0, 100.1, 100.2]):
                 # First call to _save_state with iteration=0
@@ -506,7 +502,7 @@ class TestRunnerBase:
 
                 # Check that _fitness_curves[0]['Fitness'] has been updated to the first fitness value
                 assert len(runner._fitness_curves) >= 2
-                assert runner._fitness_curves[0]["Fitness"] == runner._fitness_curves[1]["Fitness"]
+                assert runner._fitness_curves.fitness[0] == runner._fitness_curves.fitness[1] == 0.9
                 # Check that _copy_zero_curve_fitness_from_first is set to False
                 assert not runner._copy_zero_curve_fitness_from_first
 
@@ -547,7 +543,8 @@ class TestRunnerBase:
         runner = _test_runner_fixture()
         runner._output_directory = "test_output"
         runner._raw_run_stats = [{"A": 1}]  # Make run_stats_df non-empty
-        runner._fitness_curves = [{"B": 2}]  # Make curves_df non-empty
+        runner._fitness_curves = CurveTable()
+        runner._fitness_curves.append(runner._fitness_curves.add_run({"B": 2}), [0], [0.0], [[1.0, 1.0]])  # Make curves_df non-empty
         extra_data_frames = {"extra_df": pd.DataFrame({"C": [3]})}
 
         from unittest.mock import ANY
@@ -616,3 +613,197 @@ class TestRunnerBase:
             # Verify that _current_logged_algorithm_args includes both total_args and additional_algorithm_args
             expected_logged_args = {"extra_arg1": "value1", "additional_arg1": "value2"}
             assert runner._current_logged_algorithm_args == expected_logged_args
+
+    @pytest.mark.parametrize("kwargs", [{"flush_rows": 0}, {"flush_rows": 2.5}, {"flush_interval": -1}])
+    def test_invalid_flush_policy_raises(self, _test_runner_fixture, kwargs):
+        """Test that an invalid flush policy raises a ValueError."""
+        with pytest.raises(ValueError):
+            _test_runner_fixture(**kwargs)
+
+    @pytest.mark.parametrize("n_jobs", [0, -2, 1.5, True])
+    def test_invalid_n_jobs_raises(self, _test_runner_fixture, n_jobs):
+        """Test that an invalid number of worker processes raises a ValueError."""
+        with pytest.raises(ValueError):
+            _test_runner_fixture(n_jobs=n_jobs)
+
+    def test_start_run_timing_resets_iteration_times(self, _test_runner_fixture):
+        """Test that each run starts with no iteration times, so runs after the first get their own curve times."""
+        runner = _test_runner_fixture()
+        runner._iteration_times = [0.1, 0.2]
+        runner._start_run_timing()
+
+        assert runner._iteration_times == []
+
+    def test_save_state_appends_to_journal_in_batches(self, _test_runner_fixture, tmp_path):
+        """Test that _save_state appends logged rows to the journal in batches instead of rewriting all results."""
+        runner = _test_runner_fixture(iteration_list=[0, 1, 2, 3], output_directory=str(tmp_path), generate_curves=False, flush_rows=3)
+        runner._setup()
+        runner._start_run_timing()
+        journal_filename = f"{runner._get_pickle_filename_root('run_stats_df')}.journal"
+
+        with patch.object(runner, "_dump_df_to_disk") as mock_dump_df_to_disk:
+            runner._save_state(iteration=0, state=[0], fitness=0.0, user_data={})
+            runner._save_state(iteration=1, state=[1], fitness=1.0, user_data={})
+            assert not os.path.exists(journal_filename)
+
+            runner._save_state(iteration=2, state=[2], fitness=2.0, user_data={})
+            mock_dump_df_to_disk.assert_not_called()
+
+        assert load_journal(journal_filename)["Iteration"].tolist() == [0, 1, 2]
+
+        # Rows logged after the last batch are appended when the runner is torn down
+        runner._save_state(iteration=3, state=[3], fitness=3.0, user_data={})
+        runner._tear_down()
+        assert load_journal(journal_filename)["Iteration"].tolist() == [0, 1, 2, 3]
+
+    def test_save_state_with_dict_curve_values(self, _test_runner_fixture):
+        """Test that _save_state accepts curve points given as dicts with Fitness and FEvals keys."""
+        runner = _test_runner_fixture(iteration_list=[0, 1], generate_curves=True)
+        runner._setup()
+        runner._start_run_timing()
+        runner._save_state(
+            iteration=1, state=[1], fitness=0.95, user_data={}, curve=[{"Fitness": 0.5, "FEvals": 1}, {"Fitness": 0.95, "FEvals": 10}]
+        )
+
+        curves_df = runner._fitness_curves.to_frame()
+
+        assert curves_df["Iteration"].tolist() == [0, 1]
+        assert curves_df["Fitness"].tolist() == [0.5, 0.95]
+        assert curves_df["FEvals"].tolist() == [1, 10]
+
+    def test_create_and_save_run_data_frames_removes_journals(self, _test_runner_fixture, tmp_path):
+        """Test that saving the results removes the journals holding the same rows."""
+        runner = _test_runner_fixture(iteration_list=[0, 1], output_directory=str(tmp_path), flush_rows=1)
+        runner._setup()
+        runner._start_run_timing()
+        runner._save_state(iteration=0, state=[0], fitness=0.0, user_data={})
+        runner._save_state(iteration=1, state=[1], fitness=1.0, user_data={}, curve=[(0.0, 0), (1.0, 1)])
+        journal_filenames = set(runner._journal_filenames)
+        assert len(journal_filenames) == 2 and all(os.path.exists(fn) for fn in journal_filenames)
+
+        runner._create_and_save_run_data_frames(final_save=True)
+
+        assert not any(os.path.exists(fn) for fn in journal_filenames)
+        assert pd.read_pickle(f"{runner._get_pickle_filename_root('run_stats_df')}.p")["Iteration"].tolist() == [0, 1]
+        runner._tear_down()
+        assert not any(fn.endswith(".journal") for fn in os.listdir(os.path.dirname(next(iter(journal_filenames)))))
+
+    def test_save_state_stores_states_out_of_band(self, _test_runner_fixture, tmp_path):
+        """Test that run statistics hold references into the state store when store_states is True."""
+        runner = _test_runner_fixture(iteration_list=[0, 1, 2], output_directory=str(tmp_path), store_states=True)
+        runner._setup()
+        runner._start_run_timing()
+
+        runner._save_state(iteration=0, state=np.array([0, 1, 0]), fitness=0.0, user_data={})
+        runner._save_state(iteration=1, state=np.array([1, 1, 0]), fitness=1.0, user_data={})
+        runner._save_state(iteration=2, state=np.array([0, 1, 0]), fitness=1.0, user_data={})
+        runner._create_and_save_run_data_frames(final_save=True)
+
+        assert runner.run_stats_df["State"].tolist() == [0, 1, 0]
+        states = load_states(f"{runner._get_pickle_filename_root('states')}.npy")
+        np.testing.assert_array_equal(states[runner.run_stats_df["State"]], [[0, 1, 0], [1, 1, 0], [0, 1, 0]])
+
+    def test_save_state_does_not_format_state_when_debug_logging_is_disabled(self, _test_runner_fixture):
+        """Test that _save_state does not stringify the state for debug messages that will not be logged."""
+        runner = _test_runner_fixture(iteration_list=[0], output_directory=None, store_states=True)
+        runner._setup()
+        runner._start_run_timing()
+        str_calls = Mock(return_value="state")
+        state = np.zeros(3).view(type("StrCountingState", (np.ndarray,), {"__str__": lambda self: str_calls()}))
+
+        with patch("logging.root.isEnabledFor", return_value=False):
+            runner._save_state(iteration=0, state=state, fitness=0.0, user_data={})
+        str_calls.assert_not_called()
+
+        with patch("logging.root.isEnabledFor", return_value=True):
+            runner._save_state(iteration=0, state=state, fitness=0.0, user_data={})
+        str_calls.assert_called()
+
+    def test_save_state_rejects_ragged_states_when_storing_states(self, _test_runner_fixture):
+        """Test that _save_state raises a ValueError for states the state store cannot hold, rather than logging strings."""
+        runner = _test_runner_fixture(iteration_list=[0], output_directory=None, store_states=True)
+        runner._setup()
+        runner._start_run_timing()
+
+        with pytest.raises(ValueError, match="state must be convertible to a numeric array"):
+            runner._save_state(iteration=0, state=[np.zeros(2), np.zeros(3)], fitness=0.0, user_data={})
+
+    def test_get_next_callback_iteration_returns_next_logged_iteration(self, _test_runner_fixture):
+        """Test that algorithms are asked to call back at the next iteration of iteration_list."""
+        runner = _test_runner_fixture(iteration_list=[0, 10, 5, 5000])
+
+        assert runner._get_next_callback_iteration(0) == 5
+        assert runner._get_next_callback_iteration(5) == 10
+        assert runner._get_next_callback_iteration(7) == 10
+        assert runner._get_next_callback_iteration(10) == 10 + runner._MAX_CALLBACK_INTERVAL
+        assert runner._get_next_callback_iteration(5000) == 5000 + runner._MAX_CALLBACK_INTERVAL
+
+    def test_abort_stops_algorithm_between_logged_iterations(self):
+        """Test that aborting the runner between two widely spaced logged iterations stops the algorithm at its next callback."""
+        runner = SARunner(
+            problem=DiscreteOpt(length=8, fitness_fn=CustomFitness(lambda state: float(state.sum()))),
+            experiment_name="test_abort",
+            seed=SEED,
+            iteration_list=[0, 5000],
+            temperature_list=[1.0],
+            max_attempts=10000,
+        )
+        runner._MAX_CALLBACK_INTERVAL = 10
+
+        def abort_after_25_evaluations(evaluate):
+            def evaluate_and_abort(state):
+                if runner.problem.fitness_evaluations == 25:
+                    runner.abort()
+                return evaluate(state)
+
+            return evaluate_and_abort
+
+        runner.problem.fitness_fn.evaluate = abort_after_25_evaluations(runner.problem.fitness_fn.evaluate)
+        runner.run()
+
+        assert runner.has_aborted()
+        assert runner.problem.fitness_evaluations <= 25 + runner._MAX_CALLBACK_INTERVAL + 1
+
+    def test_state_callback_delegates_to_runner(self, _test_runner_fixture):
+        """Test that the state callback calls _save_state and asks the runner for the next callback iteration."""
+        runner = _test_runner_fixture(iteration_list=[0, 3])
+        state_callback = _StateCallback(runner)
+
+        with patch.object(runner, "_save_state", return_value=True) as mock_save_state:
+            assert state_callback(iteration=1, state=[0], fitness=1.0, user_data={})
+            mock_save_state.assert_called_once_with(iteration=1, state=[0], fitness=1.0, user_data={})
+
+        assert state_callback.next_callback_iteration(1) == 3
+
+    def test_save_state_interpolates_times_of_skipped_iterations(self, _test_runner_fixture):
+        """Test that _save_state fills in the times of the iterations the algorithm did not call back at."""
+        runner = _test_runner_fixture(iteration_list=[0, 4], generate_curves=False, output_directory=None)
+        runner._setup()
+        runner._start_run_timing()
+
+        runner._save_state(iteration=0, state=[0], fitness=1.0, user_data={})
+        runner._save_state(iteration=4, state=[0], fitness=1.0, user_data={})
+
+        assert len(runner._iteration_times) == 5
+        assert runner._iteration_times == sorted(runner._iteration_times)
+        assert [stat["Iteration"] for stat in runner._raw_run_stats] == [0, 4]
+
+    def test_save_state_records_memory_and_tear_down_summarizes_it(self, _test_runner_fixture, tmp_path):
+        """Test that profile_memory adds memory columns to the run statistics and summarizes allocation sites."""
+        runner = _test_runner_fixture(iteration_list=[0, 1], generate_curves=False, output_directory=str(tmp_path), profile_memory=True)
+        runner._setup()
+        runner._start_run_timing()
+
+        assert tracemalloc.is_tracing()
+        runner._save_state(iteration=0, state=[0], fitness=1.0, user_data={})
+        allocation = np.ones(100_000)
+        runner._save_state(iteration=1, state=[0], fitness=1.0, user_data={}, done=True)
+        runner._tear_down()
+
+        first, last = runner._raw_run_stats
+        assert last["Memory_current"] >= first["Memory_current"] + allocation.nbytes
+        assert last["Memory_peak"] >= last["Memory_current"]
+        assert not tracemalloc.is_tracing()
+        assert list(runner.memory_summary_df.columns) == ["File", "Line", "Size", "Count"]
+        assert runner.memory_summary_df["Size"].iloc[0] >= allocation.nbytes
+        assert os.path.exists(f"{runner._get_pickle_filename_root('memory_summary_df')}.p")
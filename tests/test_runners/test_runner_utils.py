@@ -4,11 +4,12 @@
 # License: BSD 3-clause
 
 import os
+import pickle as pk
 from unittest.mock import patch
 
 import pytest
 
-from mlrose_ky.runners import build_data_filename
+from mlrose_ky.runners import build_data_filename, load_journal
 
 
 class TestRunnerUtils:
@@ -81,3 +82,17 @@ class TestRunnerUtils:
 
             mock_makedirs.assert_called_once_with(os.path.join(output_directory, experiment_name), exist_ok=True)
             assert result == expected_filename
+
+    def test_load_journal_ignores_truncated_batch(self, tmp_path):
+        """Test that load_journal returns the complete batches of a journal whose last batch was cut off mid-write."""
+        journal_filename = tmp_path / "runner__experiment__run_stats_df.journal"
+        with open(journal_filename, "wb") as journal_file:
+            pk.dump([{"Iteration": 0, "Fitness": 1.0}], journal_file)
+            pk.dump([{"Iteration": 1, "Fitness": 2.0}, {"Iteration": 2, "Fitness": 3.0}], journal_file)
+            truncated_batch = pk.dumps([{"Iteration": 3, "Fitness": 4.0}])
+            journal_file.write(truncated_batch[: len(truncated_batch) // 2])
+
+        df = load_journal(str(journal_filename))
+
+        assert df["Iteration"].tolist() == [0, 1, 2]
+        assert df["Fitness"].tolist() == [1.0, 2.0, 3.0]
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
 import mlrose_ky
@@ -99,3 +101,31 @@ class TestSARunner:
 
         runner = SARunner(**runner_kwargs)
         assert runner.decay_list == [GeomDecay]
+
+    def test_run_in_parallel_matches_sequential_run(self, runner_kwargs):
+        """Test that running the parameter combinations in worker processes gives the same results as running them sequentially."""
+        sequential_stats, sequential_curves = SARunner(**runner_kwargs).run()
+        parallel_stats, parallel_curves = SARunner(**runner_kwargs, n_jobs=2).run()
+
+        columns = ["Iteration", "Fitness", "FEvals", "State", "schedule_init_temp"]
+        pd.testing.assert_frame_equal(parallel_stats[columns], sequential_stats[columns])
+        pd.testing.assert_frame_equal(
+            parallel_curves[["Iteration", "Fitness", "FEvals"]], sequential_curves[["Iteration", "Fitness", "FEvals"]]
+        )
+
+    def test_run_in_parallel_records_memory(self, runner_kwargs):
+        """Test that worker processes trace their allocations when profile_memory is set."""
+        parallel_stats, _ = SARunner(**runner_kwargs, n_jobs=2, profile_memory=True).run()
+
+        assert (parallel_stats["Memory_current"] > 0).all()
+        assert (parallel_stats["Memory_peak"] >= parallel_stats["Memory_current"]).all()
+
+    def test_run_in_parallel_merges_stored_states(self, runner_kwargs):
+        """Test that states stored by worker processes are merged into the runner's state store."""
+        parallel_runner = SARunner(**runner_kwargs, n_jobs=2, store_states=True)
+        parallel_stats, _ = parallel_runner.run()
+        sequential_runner = SARunner(**runner_kwargs, store_states=True)
+        sequential_stats, _ = sequential_runner.run()
+
+        assert parallel_stats["State"].tolist() == sequential_stats["State"].tolist()
+        np.testing.assert_array_equal(parallel_runner._state_store.to_array(), sequential_runner._state_store.to_array())
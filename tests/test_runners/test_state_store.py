@@ -0,0 +1,121 @@
+"""Unit tests for runners/state_store.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import copy
+import os
+
+import numpy as np
+import pytest
+
+from mlrose_ky.runners import StateStore, load_states
+
+
+class TestStateStore:
+    """Tests for StateStore and load_states."""
+
+    def test_add_deduplicates_states(self):
+        """Test that identical states are stored once and share a reference."""
+        store = StateStore()
+
+        assert store.add(np.array([0, 1, 1])) == 0
+        assert store.add([1, 1, 0]) == 1
+        assert store.add(np.array([0, 1, 1])) == 0
+        assert len(store) == 2
+        np.testing.assert_array_equal(store.get(1), [1, 1, 0])
+
+    def test_add_copies_state(self):
+        """Test that modifying a state after adding it does not modify the stored state."""
+        store = StateStore()
+        state = np.array([0.5, 1.5])
+        ref = store.add(state)
+        state[0] = 9.0
+
+        np.testing.assert_array_equal(store.get(ref), [0.5, 1.5])
+        assert store.add(state) == 1
+
+    @pytest.mark.parametrize(
+        "state, match",
+        [
+            (np.array([0.5, 1.5, 2.5]), "state must have shape"),
+            (np.array(["a", "b"]), "state must be convertible to a numeric array"),
+            ([np.zeros(2), np.zeros(3)], "state must be convertible to a numeric array"),
+        ],
+    )
+    def test_add_rejects_states_that_cannot_be_stored(self, state, match):
+        """Test that states of another shape, non-numeric states and ragged states raise a ValueError."""
+        store = StateStore()
+        store.add(np.array([0.5, 1.5]))
+
+        with pytest.raises(ValueError, match=match):
+            store.add(state)
+        assert store.add(np.array([1, 2])) == 1
+        assert len(store) == 2
+
+    def test_add_grows_store(self):
+        """Test that the store keeps every state as its capacity grows."""
+        store = StateStore()
+        for i in range(1_000):
+            assert store.add(np.array([i, -i])) == i
+
+        assert len(store) == 1_000
+        np.testing.assert_array_equal(store.to_array()[:, 0], np.arange(1_000))
+
+    def test_save_and_load_states(self, tmp_path):
+        """Test that saved states can be memory-mapped with load_states."""
+        store = StateStore()
+        store.add(np.array([0, 1]))
+        store.add(np.array([1, 0]))
+        filename = str(tmp_path / "states.npy")
+
+        store.save(filename)
+        states = load_states(filename)
+
+        assert isinstance(states, np.memmap)
+        np.testing.assert_array_equal(states, [[0, 1], [1, 0]])
+
+    def test_states_added_after_save_are_written_to_file(self, tmp_path):
+        """Test that a saved store writes new states to its file, which later saves trim to the stored states."""
+        store = StateStore()
+        store.add(np.array([0.0, 1.0]))
+        filename = str(tmp_path / "states.npy")
+        store.save(filename)
+
+        for i in range(1, 200):
+            store.add(np.array([float(i), 1.0]))
+        assert isinstance(store.to_array(), np.memmap)
+        store.save(filename)
+
+        states = load_states(filename, mmap=False)
+        assert states.shape == (200, 2)
+        np.testing.assert_array_equal(states[:, 0], np.arange(200))
+        with open(filename, "rb") as f:
+            np.lib.format.read_magic(f)
+            np.lib.format.read_array_header_1_0(f)
+            assert os.path.getsize(filename) == f.tell() + states.nbytes
+
+    def test_copies_hold_states_in_memory(self, tmp_path):
+        """Test that copies of a saved store hold their states in memory and do not write to its file."""
+        store = StateStore()
+        store.add(np.array([0, 1]))
+        filename = str(tmp_path / "states.npy")
+        store.save(filename)
+
+        store_copy = copy.deepcopy(store)
+        store_copy.add(np.array([1, 1]))
+
+        assert not isinstance(store_copy.to_array(), np.memmap)
+        assert len(store) == 1
+        store_copy.save(str(tmp_path / "copy.npy"))
+        assert load_states(filename).shape == (1, 2)
+        assert load_states(str(tmp_path / "copy.npy")).shape == (2, 2)
+
+    def test_clear(self):
+        """Test that a cleared store accepts states of another shape."""
+        store = StateStore()
+        store.add(np.array([0, 1]))
+        store.clear()
+
+        assert len(store) == 0
+        assert store.add(np.array([0.5, 1.5, 2.5])) == 0
@@ -0,0 +1,133 @@
+"""Unit tests for utils/parallel.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+from multiprocessing.shared_memory import SharedMemory
+
+import pandas as pd
+import pytest
+
+from mlrose_ky import DiscreteOpt, FourPeaks, GeomDecay, ExpDecay
+from mlrose_ky.utils import parallel
+from mlrose_ky.utils.parallel import ALGORITHMS, SweepTask, build_tasks, run_sweep, sa_run, timeit
+
+
+class TestParallel:
+    """Tests for the parallel sweep functions."""
+
+    @pytest.fixture
+    def problem(self):
+        """Fixture to create an optimization problem instance for testing."""
+        return DiscreteOpt(length=12, fitness_fn=FourPeaks(), maximize=True)
+
+    def test_build_tasks_covers_every_combination_and_seed(self):
+        """Test that build_tasks builds one task per combination of parameters and seed."""
+        tasks = build_tasks("genetic_alg", {"pop_size": [10, 20], "mutation_prob": [0.1, 0.2]}, seeds=[1, 2, 3])
+
+        assert len(tasks) == 12
+        assert [task.task_id for task in tasks] == list(range(12))
+        assert [task.seed for task in tasks[:3]] == [1, 2, 3]
+        assert tasks[0].params == {"pop_size": 10, "mutation_prob": 0.1}
+
+    def test_sweep_task_rejects_unknown_algorithm(self):
+        """Test that a task for an unknown algorithm raises a ValueError."""
+        with pytest.raises(ValueError):
+            SweepTask(task_id=0, algorithm="unknown", seed=1)
+
+    def test_sweep_task_rejects_reserved_params(self):
+        """Test that a task whose params set the random state raises a ValueError."""
+        with pytest.raises(ValueError):
+            SweepTask(task_id=0, algorithm="mimic", seed=1, params={"random_state": 1})
+
+    def test_build_tasks_requires_seeds(self):
+        """Test that build_tasks raises a ValueError without seeds."""
+        with pytest.raises(ValueError):
+            build_tasks("mimic", {}, seeds=[])
+
+    def test_run_sweep_returns_tidy_results(self, problem):
+        """Test that run_sweep returns one row per curve iteration of each task, with the swept parameters as columns."""
+        tasks = build_tasks("simulated_annealing", {"schedule": [GeomDecay(), ExpDecay()], "max_iters": [10]}, seeds=[1, 2])
+        results = run_sweep(problem, tasks, n_jobs=1)
+
+        assert list(results.columns) == ["Task", "Algorithm", "Seed", "schedule", "max_iters", "Iteration", "Fitness", "FEvals"] + [
+            "Best Fitness",
+            "Best State",
+            "Time",
+        ]
+        assert sorted(results["Task"].unique()) == [0, 1, 2, 3]
+        for _, task_results in results.groupby("Task"):
+            assert task_results["Iteration"].tolist() == list(range(1, len(task_results) + 1))
+            assert task_results["Best Fitness"].nunique() == 1
+
+    def test_run_sweep_in_parallel_matches_sequential_sweep(self, problem):
+        """Test that running a sweep in worker processes, in chunks, gives the same results as running it sequentially."""
+        tasks = build_tasks("simulated_annealing", {"max_iters": [10, 20]}, seeds=[1, 2, 3])
+        columns = ["Task", "Seed", "max_iters", "Iteration", "Fitness", "FEvals", "Best Fitness"]
+
+        sequential_results = run_sweep(problem, tasks, n_jobs=1)
+        parallel_results = run_sweep(problem, tasks, n_jobs=2, chunk_size=2)
+
+        pd.testing.assert_frame_equal(parallel_results[columns], sequential_results[columns])
+
+    @pytest.mark.parametrize("algorithm", [name for name in ALGORITHMS if name != "gradient_descent"])
+    def test_run_sweep_covers_discrete_algorithms(self, problem, algorithm):
+        """Test that run_sweep runs every discrete optimization algorithm."""
+        params = {"max_iters": [5]} if algorithm in ("genetic_alg", "mimic") else {}
+        results = run_sweep(problem, build_tasks(algorithm, params, seeds=[1]), n_jobs=1)
+
+        assert not results.empty
+        assert (results["Algorithm"] == algorithm).all()
+
+    def test_run_sweep_rejects_invalid_chunk_size(self, problem):
+        """Test that an invalid chunk size raises a ValueError."""
+        with pytest.raises(ValueError):
+            run_sweep(problem, build_tasks("hill_climb", {}, seeds=[1]), chunk_size=0)
+
+    def test_run_sweep_unlinks_shared_memory_when_reading_fails(self, problem, monkeypatch):
+        """Test that every shared memory block, read or not, is unlinked when reading the curves of a chunk fails."""
+        names = []
+        run_chunk = parallel._run_chunk
+
+        def recording_run_chunk(*args):
+            result = run_chunk(*args)
+            names.append(result[1])
+            return result
+
+        def failing_read(name, n_rows):
+            raise RuntimeError("read failed")
+
+        monkeypatch.setattr(parallel, "_run_chunk", recording_run_chunk)
+        monkeypatch.setattr(parallel, "_read_shared_curves", failing_read)
+        tasks = build_tasks("random_hill_climb", {"max_iters": [5]}, seeds=[1, 2, 3])
+
+        with pytest.raises(RuntimeError, match="read failed"):
+            run_sweep(problem, tasks, n_jobs=1, chunk_size=1)
+
+        assert len(names) == 3
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                SharedMemory(name=name)
+
+    def test_timeit_does_not_mutate_result(self):
+        """Test that timeit adds the execution time to a copy of the returned DataFrame."""
+        result = pd.DataFrame({"a": [1]})
+        timed_result = timeit(lambda: result)()
+
+        assert "Time" in timed_result.columns
+        assert "Time" not in result.columns
+
+    def test_sa_run_does_not_share_callback_user_info(self, problem):
+        """Test that sa_run does not pass a shared mutable default as the callback user info."""
+        user_infos = []
+
+        def callback(iteration, user_data, **kwargs):
+            user_infos.append(user_data)
+            user_data["called"] = True
+            return False
+
+        param_dict = {"max_attempt": 5, "max_iter": 5, "decay": "geom", "problem": "four_peaks"}
+        for _ in range(2):
+            sa_run(problem, GeomDecay(), 5, 5, [1], param_dict=param_dict, state_fitness_call_back=callback)
+
+        assert user_infos[0] is not user_infos[-1]
@@ -0,0 +1,83 @@
+"""Unit tests for utils/shared_problem.py"""
+
+# Authors: Kyle Nakamura
+# License: BSD 3-clause
+
+import os
+import pickle as pk
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlrose_ky import TSPOpt
+from mlrose_ky.utils.parallel import build_tasks, run_sweep
+from mlrose_ky.utils.shared_problem import SharedProblem
+
+
+class TestSharedProblem:
+    """Tests for SharedProblem."""
+
+    @pytest.fixture
+    def problem(self):
+        """Fixture to create a TSP problem with a distance matrix."""
+        distances = [(0, 1, 3.1), (0, 2, 5.0), (0, 3, 1.0), (1, 2, 2.0), (1, 3, 4.5), (2, 3, 2.5)]
+        return TSPOpt(length=4, distances=distances, maximize=False)
+
+    def test_get_memory_maps_large_arrays_read_only(self, problem, tmp_path):
+        """Test that the arrays of the attached problem are read-only memory maps with the original values."""
+        with SharedProblem(problem, min_bytes=0, directory=str(tmp_path)) as shared_problem:
+            attached_problem = shared_problem.get()
+            distance_matrix = attached_problem.fitness_fn.distance_matrix
+
+            assert isinstance(distance_matrix, np.memmap)
+            assert not distance_matrix.flags.writeable
+            np.testing.assert_array_equal(distance_matrix, problem.fitness_fn.distance_matrix)
+            assert shared_problem.shared_nbytes >= problem.fitness_fn.distance_matrix.nbytes
+
+    def test_small_arrays_are_not_memory_mapped(self, problem, tmp_path):
+        """Test that arrays smaller than min_bytes are pickled with the rest of the problem."""
+        with SharedProblem(problem, directory=str(tmp_path)) as shared_problem:
+            assert shared_problem.shared_nbytes == 0
+            assert not isinstance(shared_problem.get().fitness_fn.distance_matrix, np.memmap)
+
+    def test_get_returns_a_copy_sharing_the_memory_mapped_arrays(self, problem, tmp_path):
+        """Test that the problem is unpickled once per process, and each call gets its own copy of it."""
+        with SharedProblem(problem, min_bytes=0, directory=str(tmp_path)) as shared_problem:
+            first, second = shared_problem.get(), pk.loads(pk.dumps(shared_problem)).get()
+            first.fitness_evaluations = 7
+
+            assert first is not second
+            assert first.fitness_fn is not second.fitness_fn
+            assert first.fitness_fn.distance_matrix is second.fitness_fn.distance_matrix
+            assert second.fitness_evaluations == problem.fitness_evaluations
+
+    def test_pickled_handle_does_not_contain_the_problem(self, problem, tmp_path):
+        """Test that pickling the handle does not pickle the problem's arrays."""
+        problem.fitness_fn.distance_matrix = np.zeros((500, 500))
+        with SharedProblem(problem, min_bytes=1024, directory=str(tmp_path)) as shared_problem:
+            assert len(pk.dumps(shared_problem)) < 1024
+
+    def test_close_removes_the_published_problem(self, problem, tmp_path):
+        """Test that closing the handle removes the directory the problem was published to."""
+        shared_problem = SharedProblem(problem, min_bytes=0, directory=str(tmp_path))
+        assert os.path.isdir(shared_problem.path)
+
+        shared_problem.close()
+        assert not os.path.exists(shared_problem.path)
+
+    def test_invalid_min_bytes_raises(self, problem):
+        """Test that a negative min_bytes raises a ValueError."""
+        with pytest.raises(ValueError):
+            SharedProblem(problem, min_bytes=-1)
+
+    def test_run_sweep_with_shared_problem_matches_unshared_problem(self, problem, tmp_path):
+        """Test that sweeping a shared problem in worker processes gives the same results as sweeping the problem."""
+        tasks = build_tasks("random_hill_climb", {"max_iters": [5]}, seeds=[1, 2])
+        columns = ["Task", "Iteration", "Fitness", "FEvals", "Best Fitness"]
+
+        expected_results = run_sweep(problem, tasks, n_jobs=1)
+        with SharedProblem(problem, min_bytes=0, directory=str(tmp_path)) as shared_problem:
+            results = run_sweep(shared_problem, tasks, n_jobs=2, chunk_size=1)
+
+        pd.testing.assert_frame_equal(results[columns], expected_results[columns])